@@ -0,0 +1,226 @@
+/*
+ * PyQuantLib: Python bindings for QuantLib
+ * https://github.com/quantales/pyquantlib
+ *
+ * Copyright (c) 2025 Yassine Idyiahia
+ * SPDX-License-Identifier: BSD-3-Clause
+ * See LICENSE for details.
+ *
+ * ---
+ * QuantLib is Copyright (c) 2000-2025 The QuantLib Authors
+ * https://www.quantlib.org/
+ */
+
+#pragma once
+
+#include <ql/cashflows/cashflows.hpp>
+#include <ql/cashflows/coupon.hpp>
+#include <ql/compounding.hpp>
+#include <ql/instruments/bond.hpp>
+#include <ql/patterns/observable.hpp>
+#include <ql/settings.hpp>
+#include <ql/shared_ptr.hpp>
+#include <ql/time/daycounter.hpp>
+#include <ql/time/frequency.hpp>
+#include <algorithm>
+#include <atomic>
+#include <cmath>
+#include <map>
+#include <mutex>
+#include <tuple>
+#include <utility>
+#include <vector>
+
+namespace pyquantlib {
+
+/**
+ * Remaining cash flows of a bond as flat arrays, per 100 of notional.
+ *
+ * Holds, for a settlement date and day counter, the year fraction between
+ * consecutive payment dates (with the coupon reference periods, as in
+ * CashFlows::npv at a flat yield) and the amount paid at the end of each
+ * period. Pricing at a yield is then a loop over two arrays.
+ *
+ * The object observes the cash flows and the evaluation date and marks
+ * itself stale when any of them changes.
+ */
+class BondCashFlows : public QuantLib::Observer {
+  public:
+    BondCashFlows(const QuantLib::Bond& bond, const QuantLib::Date& settlementDate,
+                  const QuantLib::DayCounter& dayCounter) {
+        using namespace QuantLib;
+        const Real notional = bond.notional(settlementDate);
+        QL_REQUIRE(notional != 0.0,
+                   "non tradable at " << settlementDate << " (maturity being "
+                   << bond.maturityDate() << ")");
+        const Real scale = 100.0 / notional;
+        const Leg& leg = bond.cashflows();
+        accrued_ = CashFlows::accruedAmount(leg, false, settlementDate) * scale;
+
+        registerWith(Settings::instance().evaluationDate());
+        Date lastDate = settlementDate;
+        for (const auto& cf : leg) {
+            registerWith(cf);
+            if (cf->hasOccurred(settlementDate, false))
+                continue;
+            const Date date = cf->date();
+            auto coupon = ext::dynamic_pointer_cast<Coupon>(cf);
+            Date refStart, refEnd;
+            if (coupon) {
+                refStart = coupon->referencePeriodStart();
+                refEnd = coupon->referencePeriodEnd();
+            } else {
+                refStart = lastDate == settlementDate ? date - 1 * Years : lastDate;
+                refEnd = date;
+            }
+            // Same stepwise discount time as CashFlows::npv at a flat yield.
+            if (coupon && lastDate != coupon->accrualStartDate()) {
+                const Date start = coupon->accrualStartDate();
+                periods_.push_back(
+                    dayCounter.yearFraction(start, date, refStart, refEnd) -
+                    dayCounter.yearFraction(start, lastDate, refStart, refEnd));
+            } else {
+                periods_.push_back(
+                    dayCounter.yearFraction(lastDate, date, refStart, refEnd));
+            }
+            amounts_.push_back(
+                cf->tradingExCoupon(settlementDate) ? 0.0 : cf->amount() * scale);
+            lastDate = date;
+        }
+    }
+
+    void update() override { valid_ = false; }
+    bool valid() const { return valid_; }
+
+    QuantLib::Real accruedAmount() const { return accrued_; }
+
+    //! Dirty price per 100 at the given yield.
+    QuantLib::Real dirtyPrice(QuantLib::Rate y, QuantLib::Compounding compounding,
+                              QuantLib::Frequency frequency) const {
+        return priceAndDerivative(y, compounding, frequency).first;
+    }
+
+    //! Dirty price per 100 and its derivative with respect to the yield.
+    std::pair<QuantLib::Real, QuantLib::Real>
+    priceAndDerivative(QuantLib::Rate y, QuantLib::Compounding compounding,
+                       QuantLib::Frequency frequency) const {
+        const double f = static_cast<double>(frequency);
+        double price = 0.0, dPrice = 0.0, discount = 1.0, dLog = 0.0;
+        for (std::size_t k = 0; k < periods_.size(); ++k) {
+            const double t = periods_[k];
+            const auto [factor, dLogFactor] =
+                compoundFactor(y, t, compounding, f);
+            discount /= factor;
+            dLog += dLogFactor;
+            price += amounts_[k] * discount;
+            dPrice -= amounts_[k] * discount * dLog;
+        }
+        return {price, dPrice};
+    }
+
+  private:
+    // Compound factor over t and the derivative of its log w.r.t. the
+    // rate; matches InterestRate::compoundFactor.
+    static std::pair<double, double>
+    compoundFactor(double r, double t, QuantLib::Compounding c, double f) {
+        using namespace QuantLib;
+        switch (c) {
+          case Simple:
+            return {1.0 + r * t, t / (1.0 + r * t)};
+          case Compounded:
+            return {std::pow(1.0 + r / f, f * t), t / (1.0 + r / f)};
+          case Continuous:
+            return {std::exp(r * t), t};
+          case SimpleThenCompounded:
+            return t <= 1.0 / f ? compoundFactor(r, t, Simple, f)
+                                : compoundFactor(r, t, Compounded, f);
+          case CompoundedThenSimple:
+            return t <= 1.0 / f ? compoundFactor(r, t, Compounded, f)
+                                : compoundFactor(r, t, Simple, f);
+          default:
+            QL_FAIL("unknown compounding convention (" << int(c) << ")");
+        }
+    }
+
+    QuantLib::Real accrued_;
+    std::vector<double> periods_, amounts_;
+    std::atomic<bool> valid_{true};
+};
+
+/**
+ * Process-wide cache of BondCashFlows, keyed by bond, settlement date and
+ * day-counter implementation (shared by the copies of a day counter), so
+ * day counters with the same name but different parameters get their own
+ * entries.
+ *
+ * Entries are built on first use and dropped once stale or once their bond
+ * has been destroyed. Lookups and insertions must happen on the calling
+ * thread (registering observers is not thread-safe); the entries themselves
+ * are read-only and can be shared by worker threads.
+ */
+class BondCashFlowCache {
+    // DayCounter::impl_ is protected.
+    struct Access : QuantLib::DayCounter {
+        static QuantLib::ext::shared_ptr<const void> impl(const QuantLib::DayCounter& dc) {
+            return dc.*&Access::impl_;
+        }
+    };
+
+  public:
+    static BondCashFlowCache& instance() {
+        static BondCashFlowCache cache;
+        return cache;
+    }
+
+    QuantLib::ext::shared_ptr<const BondCashFlows>
+    get(const QuantLib::ext::shared_ptr<QuantLib::Bond>& bond,
+        const QuantLib::Date& settlementDate,
+        const QuantLib::DayCounter& dayCounter) {
+        const auto impl = Access::impl(dayCounter);
+        const Key key(bond.get(), settlementDate.serialNumber(), impl.get());
+        std::lock_guard<std::mutex> lock(mutex_);
+        auto it = entries_.find(key);
+        // A destroyed bond or day counter may have left its address to a new one.
+        if (it != entries_.end() && it->second.cashflows->valid() &&
+            it->second.bond.lock() == bond && it->second.dayCounter.lock() == impl)
+            return it->second.cashflows;
+
+        auto cashflows =
+            QuantLib::ext::make_shared<BondCashFlows>(*bond, settlementDate, dayCounter);
+        entries_[key] = Entry{bond, impl, cashflows};
+        if (entries_.size() >= sweepAt_)
+            sweep();
+        return cashflows;
+    }
+
+    void clear() {
+        std::lock_guard<std::mutex> lock(mutex_);
+        entries_.clear();
+    }
+
+  private:
+    using Key = std::tuple<const QuantLib::Bond*, QuantLib::Date::serial_type,
+                           const void*>;
+    struct Entry {
+        QuantLib::ext::weak_ptr<QuantLib::Bond> bond;
+        QuantLib::ext::weak_ptr<const void> dayCounter;
+        QuantLib::ext::shared_ptr<BondCashFlows> cashflows;
+    };
+
+    void sweep() {
+        for (auto it = entries_.begin(); it != entries_.end();) {
+            if (it->second.bond.expired() || it->second.dayCounter.expired() ||
+                !it->second.cashflows->valid())
+                it = entries_.erase(it);
+            else
+                ++it;
+        }
+        sweepAt_ = std::max<std::size_t>(1024, 2 * entries_.size());
+    }
+
+    std::mutex mutex_;
+    std::map<Key, Entry> entries_;
+    std::size_t sweepAt_ = 1024;
+};
+
+} // namespace pyquantlib
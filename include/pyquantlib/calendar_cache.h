@@ -0,0 +1,204 @@
+/*
+ * PyQuantLib: Python bindings for QuantLib
+ * https://github.com/quantales/pyquantlib
+ *
+ * Copyright (c) 2025 Yassine Idyiahia
+ * SPDX-License-Identifier: BSD-3-Clause
+ * See LICENSE for details.
+ *
+ * ---
+ * QuantLib is Copyright (c) 2000-2025 The QuantLib Authors
+ * https://www.quantlib.org/
+ */
+
+#pragma once
+
+#include <ql/shared_ptr.hpp>
+#include <ql/time/calendar.hpp>
+#include <ql/time/date.hpp>
+#include <algorithm>
+#include <cstdint>
+#include <map>
+#include <mutex>
+#include <set>
+#include <string>
+#include <tuple>
+#include <utility>
+#include <vector>
+
+namespace pyquantlib {
+
+/**
+ * Business days of a calendar over a contiguous range of dates.
+ *
+ * The table is filled once from Calendar::isBusinessDay (so it includes
+ * added and removed holidays); afterwards business-day lookups and counts
+ * are array accesses. Tables are immutable and can be read without the GIL.
+ */
+class BusinessDayTable {
+  public:
+    using serial_type = QuantLib::Date::serial_type;
+
+    BusinessDayTable(const QuantLib::Calendar& calendar, serial_type first,
+                     serial_type last)
+    : first_(first), business_(static_cast<std::size_t>(last - first + 1)),
+      count_(business_.size() + 1, 0) {
+        for (std::size_t i = 0; i < business_.size(); ++i) {
+            const QuantLib::Date d(first_ + static_cast<serial_type>(i));
+            business_[i] = calendar.isBusinessDay(d) ? 1 : 0;
+            count_[i + 1] = count_[i] + business_[i];
+        }
+    }
+
+    serial_type first() const { return first_; }
+    serial_type last() const {
+        return first_ + static_cast<serial_type>(business_.size()) - 1;
+    }
+    bool covers(serial_type s) const { return s >= first() && s <= last(); }
+
+    bool isBusinessDay(serial_type s) const {
+        return business_[static_cast<std::size_t>(s - first_)] != 0;
+    }
+
+    //! Number of business days in [from, to); both must be covered.
+    serial_type count(serial_type from, serial_type to) const {
+        return count_[static_cast<std::size_t>(to - first_)] -
+               count_[static_cast<std::size_t>(from - first_)];
+    }
+
+  private:
+    serial_type first_;
+    std::vector<std::uint8_t> business_;
+    std::vector<serial_type> count_;
+};
+
+/**
+ * Calendar answering isBusinessDay from a BusinessDayTable.
+ *
+ * Dates outside the table fall back to the original calendar, so the
+ * QuantLib adjust/advance logic runs unchanged on top of it.
+ */
+class TableCalendar : public QuantLib::Calendar {
+    class Impl : public QuantLib::Calendar::Impl {
+      public:
+        Impl(QuantLib::Calendar calendar,
+             QuantLib::ext::shared_ptr<const BusinessDayTable> table)
+        : calendar_(std::move(calendar)), table_(std::move(table)) {}
+        std::string name() const override { return calendar_.name(); }
+        bool isWeekend(QuantLib::Weekday w) const override {
+            return calendar_.isWeekend(w);
+        }
+        bool isBusinessDay(const QuantLib::Date& d) const override {
+            const auto s = d.serialNumber();
+            return table_->covers(s) ? table_->isBusinessDay(s)
+                                     : calendar_.isBusinessDay(d);
+        }
+
+      private:
+        QuantLib::Calendar calendar_;
+        QuantLib::ext::shared_ptr<const BusinessDayTable> table_;
+    };
+
+  public:
+    TableCalendar(const QuantLib::Calendar& calendar,
+                  QuantLib::ext::shared_ptr<const BusinessDayTable> table) {
+        impl_ = QuantLib::ext::make_shared<Impl>(calendar, std::move(table));
+    }
+};
+
+/**
+ * Process-wide cache of business-day tables, one per calendar.
+ *
+ * Calendars are identified by their implementation object (shared by the
+ * copies of a calendar), weekend days and added and removed holidays, so calendars
+ * with the same name but different rules, such as two BespokeCalendars,
+ * get their own tables. Tables cover whole years and grow when a request
+ * falls outside them; entries whose implementation has been destroyed are
+ * dropped. Adding or removing holidays through the bindings also clears the
+ * cache, since a change to one calendar affects the joint calendars built
+ * on it.
+ */
+class BusinessDayCache {
+    // Calendar::impl_ is protected.
+    struct Access : QuantLib::Calendar {
+        static QuantLib::ext::shared_ptr<const void> impl(const QuantLib::Calendar& c) {
+            return c.*&Access::impl_;
+        }
+    };
+
+  public:
+    using serial_type = QuantLib::Date::serial_type;
+
+    static BusinessDayCache& instance() {
+        static BusinessDayCache cache;
+        return cache;
+    }
+
+    //! Table covering at least [from, to], clamped to the valid date range.
+    QuantLib::ext::shared_ptr<const BusinessDayTable>
+    table(const QuantLib::Calendar& calendar, serial_type from, serial_type to) {
+        using QuantLib::Date;
+        const serial_type minSerial = Date::minDate().serialNumber();
+        const serial_type maxSerial = Date::maxDate().serialNumber();
+        from = std::clamp(from, minSerial, maxSerial);
+        to = std::clamp(to, minSerial, maxSerial);
+
+        const auto impl = Access::impl(calendar);
+        std::uint8_t weekend = 0;
+        for (int w = 1; w <= 7; ++w)
+            weekend |= calendar.isWeekend(QuantLib::Weekday(w)) ? (1 << w) : 0;
+        const Key key(impl.get(), weekend, calendar.addedHolidays(),
+                      calendar.removedHolidays());
+
+        std::lock_guard<std::mutex> lock(mutex_);
+        auto& entry = tables_[key];
+        // A destroyed implementation may have left its address to a new one.
+        if (entry.table && entry.impl.lock() != impl)
+            entry.table.reset();
+        if (entry.table && entry.table->covers(from) && entry.table->covers(to))
+            return entry.table;
+
+        if (entry.table) {
+            from = std::min(from, entry.table->first());
+            to = std::max(to, entry.table->last());
+        }
+        const int y1 = std::max(Date(from).year() - 1, int(Date::minDate().year()));
+        const int y2 = std::min(Date(to).year() + 1, int(Date::maxDate().year()));
+        auto table = QuantLib::ext::make_shared<const BusinessDayTable>(
+            calendar, Date(1, QuantLib::January, y1).serialNumber(),
+            Date(31, QuantLib::December, y2).serialNumber());
+        entry = Entry{impl, table};
+        if (tables_.size() >= sweepAt_)
+            sweep();
+        return table;
+    }
+
+    void clear() {
+        std::lock_guard<std::mutex> lock(mutex_);
+        tables_.clear();
+    }
+
+  private:
+    using Key = std::tuple<const void*, std::uint8_t, std::set<QuantLib::Date>,
+                           std::set<QuantLib::Date>>;
+    struct Entry {
+        QuantLib::ext::weak_ptr<const void> impl;
+        QuantLib::ext::shared_ptr<const BusinessDayTable> table;
+    };
+
+    void sweep() {
+        for (auto it = tables_.begin(); it != tables_.end();) {
+            if (it->second.impl.expired())
+                it = tables_.erase(it);
+            else
+                ++it;
+        }
+        sweepAt_ = std::max<std::size_t>(256, 2 * tables_.size());
+    }
+
+    std::mutex mutex_;
+    std::map<Key, Entry> tables_;
+    std::size_t sweepAt_ = 256;
+};
+
+} // namespace pyquantlib
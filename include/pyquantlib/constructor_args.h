@@ -0,0 +1,41 @@
+/*
+ * PyQuantLib: Python bindings for QuantLib
+ * https://github.com/quantales/pyquantlib
+ *
+ * Copyright (c) 2025 Yassine Idyiahia
+ * SPDX-License-Identifier: BSD-3-Clause
+ * See LICENSE for details.
+ *
+ * ---
+ * QuantLib is Copyright (c) 2000-2025 The QuantLib Authors
+ * https://www.quantlib.org/
+ */
+
+#pragma once
+
+#include <tuple>
+#include <utility>
+
+namespace pyquantlib {
+
+/**
+ * Instrument keeping the arguments it was constructed with.
+ *
+ * Bonds do not keep their schedule or payment conventions, so they cannot
+ * be rebuilt from their inspectors. The Python constructors create this
+ * subclass instead, and pickling passes the stored arguments back to the
+ * constructor. Instances built elsewhere (e.g. in C++) hold no arguments.
+ */
+template <class T, class... Args>
+class WithConstructorArgs : public T {
+  public:
+    explicit WithConstructorArgs(Args... args)
+    : T(args...), args_(std::move(args)...) {}
+
+    const std::tuple<Args...>& constructorArgs() const { return args_; }
+
+  private:
+    std::tuple<Args...> args_;
+};
+
+} // namespace pyquantlib
@@ -0,0 +1,82 @@
+/*
+ * PyQuantLib: Python bindings for QuantLib
+ * https://github.com/quantales/pyquantlib
+ *
+ * Copyright (c) 2025 Yassine Idyiahia
+ * SPDX-License-Identifier: BSD-3-Clause
+ * See LICENSE for details.
+ *
+ * ---
+ * QuantLib is Copyright (c) 2000-2025 The QuantLib Authors
+ * https://www.quantlib.org/
+ */
+
+#pragma once
+
+#include "pyquantlib/numpy_utils.h"
+#include <ql/time/date.hpp>
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <pybind11/stl.h>
+#include <cstdint>
+#include <limits>
+#include <vector>
+
+namespace pyquantlib {
+
+/**
+ * Dates of a datetime64 or integer serial array, in C order. NaT and
+ * serial 0 become the null date.
+ */
+inline std::vector<QuantLib::Date> dates_from_numpy(const py::array& a) {
+    const bool datetime = a.dtype().kind() == 'M';
+    py::object values = datetime
+        ? a.attr("astype")("datetime64[D]").attr("view")("int64")
+        : py::object(date_serials(a));
+    auto flat = values.attr("ravel")()
+                    .cast<py::array_t<std::int64_t, py::array::c_style |
+                                                        py::array::forcecast>>();
+    std::vector<QuantLib::Date> result;
+    result.reserve(static_cast<std::size_t>(flat.size()));
+    const std::int64_t* v = flat.data();
+    for (py::ssize_t i = 0; i < flat.size(); ++i) {
+        std::int64_t s = v[i];
+        if (datetime)
+            s = s == std::numeric_limits<std::int64_t>::min()
+                    ? 0 : s + datetime64_epoch_serial;
+        result.push_back(s == 0 ? QuantLib::Date()
+                                : QuantLib::Date(static_cast<QuantLib::Date::serial_type>(s)));
+    }
+    return result;
+}
+
+} // namespace pyquantlib
+
+namespace pybind11 {
+namespace detail {
+
+/**
+ * std::vector<Date> arguments also accept datetime64 and integer serial
+ * arrays, read from the buffer without a Date object per element. Lists and
+ * other sequences go through the usual list conversion.
+ *
+ * Included by pyquantlib.h so that every translation unit sees the same
+ * caster.
+ */
+template <>
+struct type_caster<std::vector<QuantLib::Date>>
+    : list_caster<std::vector<QuantLib::Date>, QuantLib::Date> {
+    bool load(handle src, bool convert) {
+        if (isinstance<array>(src)) {
+            auto a = reinterpret_borrow<array>(src);
+            if (pyquantlib::holds_dates(a)) {
+                value = pyquantlib::dates_from_numpy(a);
+                return true;
+            }
+        }
+        return list_caster<std::vector<QuantLib::Date>, QuantLib::Date>::load(src, convert);
+    }
+};
+
+} // namespace detail
+} // namespace pybind11
@@ -0,0 +1,338 @@
+/*
+ * PyQuantLib: Python bindings for QuantLib
+ * https://github.com/quantales/pyquantlib
+ *
+ * Copyright (c) 2025 Yassine Idyiahia
+ * SPDX-License-Identifier: BSD-3-Clause
+ * See LICENSE for details.
+ *
+ * ---
+ * QuantLib is Copyright (c) 2000-2025 The QuantLib Authors
+ * https://www.quantlib.org/
+ */
+
+#pragma once
+
+#include <ql/math/interpolations/linearinterpolation.hpp>
+#include <ql/math/solvers1d/brent.hpp>
+#include <ql/math/solvers1d/finitedifferencenewtonsafe.hpp>
+#include <ql/patterns/observable.hpp>
+#include <ql/shared_ptr.hpp>
+#include <ql/termstructures/bootstraperror.hpp>
+#include <ql/termstructures/bootstraphelper.hpp>
+#include <ql/utilities/dataformatters.hpp>
+#include <ql/utilities/null.hpp>
+#include <algorithm>
+#include <cmath>
+#include <map>
+#include <utility>
+#include <vector>
+
+namespace pyquantlib {
+
+//! Statistics of the last bootstrap of a curve.
+struct BootstrapStats {
+    //! Objective evaluations, i.e. solver iterations over all pillars.
+    QuantLib::Size iterations = 0;
+    //! Index (into the curve dates) of the first node solved again.
+    QuantLib::Size firstPillar = 0;
+};
+
+//! Helpers of a bootstrapped curve, e.g. to check its dependencies.
+using BootstrapHelpers = std::vector<QuantLib::ext::shared_ptr<QuantLib::Observable>>;
+
+/**
+ * Curve that can list the helpers it is bootstrapped on.
+ *
+ * A curve reads other curves through its helpers' handles (discounting
+ * curves, index forwarding curves), so their notifications reach these
+ * helpers.
+ */
+class BootstrapInputs {
+  public:
+    virtual ~BootstrapInputs() = default;
+    virtual const BootstrapHelpers& bootstrapHelpers() const = 0;
+};
+
+/**
+ * Iterative bootstrap that can resume from the first moved pillar.
+ *
+ * Once the curve has been bootstrapped, a rebuild triggered by helper quotes
+ * keeps the nodes before the first helper whose quote moved and solves the
+ * later ones starting from their previous values. Otherwise it follows
+ * QuantLib's IterativeBootstrap with its default settings.
+ *
+ * The shortcut is only taken when it gives the same curve as a full
+ * bootstrap: the interpolation must be local and every pillar must be the
+ * latest relevant date of its helper (otherwise QuantLib needs its
+ * convergence loop), and only quotes may have changed. If a helper was
+ * notified for any other reason (a discounting or projection curve, the
+ * evaluation date) every pillar is solved again.
+ *
+ * This is not a bootstrap policy: the curve (a PiecewiseYieldCurve subclass
+ * befriending it) owns one and runs it from its own performCalculations(),
+ * reading its helpers from the curve's instruments_ member.
+ */
+template <class Curve>
+class IncrementalBootstrap {
+    using Traits = typename Curve::traits_type;
+    using Interpolator = typename Curve::interpolator_type;
+    using Helper = typename Traits::helper;
+
+    class Watch : public QuantLib::Observer {
+      public:
+        void update() override { notified = true; }
+        bool notified = false;
+    };
+
+    // Counts objective evaluations for BootstrapStats::iterations.
+    class CountingError {
+      public:
+        CountingError(const QuantLib::BootstrapError<Curve>& error,
+                      QuantLib::Size& count)
+        : error_(error), count_(count) {}
+        QuantLib::Real operator()(QuantLib::Real x) const {
+            ++count_;
+            return error_(x);
+        }
+
+      private:
+        const QuantLib::BootstrapError<Curve>& error_;
+        QuantLib::Size& count_;
+    };
+
+  public:
+    explicit IncrementalBootstrap(QuantLib::Real accuracy = 1.0e-12,
+                                  QuantLib::Size maxEvaluations = 100)
+    : accuracy_(accuracy) {
+        firstSolver_.setMaxEvaluations(maxEvaluations);
+        solver_.setMaxEvaluations(maxEvaluations);
+    }
+
+    const BootstrapStats& stats() const { return stats_; }
+
+    void setup(Curve* ts) {
+        ts_ = ts;
+        n_ = ts_->instruments_.size();
+        QL_REQUIRE(n_ > 0, "no bootstrap helpers given");
+        watches_.clear();
+        for (const auto& helper : ts_->instruments_) {
+            ts_->registerWith(helper);
+            auto watch = QuantLib::ext::make_shared<Watch>();
+            watch->registerWith(helper);
+            watches_[helper.get()] = watch;
+        }
+        // do not initialize yet: instruments could be invalid here
+        // but valid later when bootstrapping is actually required
+    }
+
+    void calculate() const {
+        stats_.iterations = 0;
+        bootstrap();
+    }
+
+  private:
+    void initialize() const {
+        using namespace QuantLib;
+        std::sort(ts_->instruments_.begin(), ts_->instruments_.end(),
+                  detail::BootstrapHelperSorter());
+
+        // skip expired helpers
+        const Date firstDate = Traits::initialDate(ts_);
+        QL_REQUIRE(ts_->instruments_[n_ - 1]->pillarDate() > firstDate,
+                   "all instruments expired");
+        firstAliveHelper_ = 0;
+        while (ts_->instruments_[firstAliveHelper_]->pillarDate() <= firstDate)
+            ++firstAliveHelper_;
+        alive_ = n_ - firstAliveHelper_;
+        QL_REQUIRE(alive_ >= Interpolator::requiredPoints - 1,
+                   "not enough alive instruments: " << alive_ << " provided, "
+                   << Interpolator::requiredPoints - 1 << " required");
+
+        std::vector<Date>& dates = ts_->dates_;
+        std::vector<Time>& times = ts_->times_;
+        dates.resize(alive_ + 1);
+        times.resize(alive_ + 1);
+        errors_.resize(alive_ + 1);
+        dates[0] = firstDate;
+        times[0] = ts_->timeFromReference(dates[0]);
+
+        loopRequired_ = Interpolator::global;
+        Date maxDate = firstDate;
+        for (Size i = 1, j = firstAliveHelper_; j < n_; ++i, ++j) {
+            const auto& helper = ts_->instruments_[j];
+            dates[i] = helper->pillarDate();
+            times[i] = ts_->timeFromReference(dates[i]);
+            QL_REQUIRE(dates[i - 1] != dates[i],
+                       "more than one instrument with pillar " << dates[i]);
+
+            const Date latestRelevantDate = helper->latestRelevantDate();
+            QL_REQUIRE(latestRelevantDate > maxDate,
+                       io::ordinal(j + 1) << " instrument (pillar: " << dates[i]
+                       << ") has latestRelevantDate (" << latestRelevantDate
+                       << ") before or equal to previous instrument's "
+                          "latestRelevantDate (" << maxDate << ")");
+            maxDate = latestRelevantDate;
+
+            // when a pillar date is different from the last relevant date
+            // the convergence loop is required even if the interpolation
+            // is local
+            if (dates[i] != latestRelevantDate)
+                loopRequired_ = true;
+
+            errors_[i] = ext::make_shared<BootstrapError<Curve>>(ts_, helper, i);
+        }
+        ts_->maxDate_ = maxDate;
+
+        // set initial guess only if the current curve cannot be used as guess
+        if (!validCurve_ || ts_->data_.size() != alive_ + 1) {
+            ts_->data_ = std::vector<Real>(alive_ + 1, Traits::initialValue(ts_));
+            validCurve_ = false;
+        }
+        initialized_ = true;
+    }
+
+    // First pillar to solve: the one of the first helper whose quote moved
+    // since the last bootstrap, or 1 when everything must be solved again.
+    QuantLib::Size firstPillar() const {
+        if (!validCurve_ || loopRequired_ ||
+            quotes_.size() != n_)
+            return 1;
+        QuantLib::Size first = 0;
+        for (QuantLib::Size j = firstAliveHelper_; j < n_; ++j) {
+            const auto& helper = ts_->instruments_[j];
+            if (helper.get() != quotes_[j].first)
+                return 1;
+            const bool moved = helper->quote()->value() != quotes_[j].second;
+            if (!moved && watches_.at(helper.get())->notified)
+                return 1;  // notified by something other than its quote
+            if (moved && first == 0)
+                first = j - firstAliveHelper_ + 1;
+        }
+        return first == 0 ? 1 : first;
+    }
+
+    void bootstrap() const {
+        using namespace QuantLib;
+        if (!initialized_ || ts_->moving_)
+            initialize();
+
+        for (Size j = firstAliveHelper_; j < n_; ++j) {
+            const auto& helper = ts_->instruments_[j];
+            QL_REQUIRE(helper->quote()->isValid(),
+                       io::ordinal(j + 1) << " instrument (maturity: "
+                       << helper->maturityDate() << ", pillar: "
+                       << helper->pillarDate() << ") has an invalid quote");
+            helper->setTermStructure(const_cast<Curve*>(ts_));
+        }
+
+        const std::vector<Time>& times = ts_->times_;
+        const std::vector<Real>& data = ts_->data_;
+        const Size maxIterations = Traits::maxIterations() - 1;
+        const Size first = firstPillar();
+        stats_.firstPillar = first;
+
+        // there might be a valid curve state to use as guess
+        bool validData = validCurve_;
+
+        for (Size iteration = 0;; ++iteration) {
+            previousData_ = ts_->data_;
+
+            for (Size i = iteration == 0 ? first : 1; i <= alive_; ++i) {
+                const Real minValue =
+                    Traits::minValueAfter(i, ts_, validData, firstAliveHelper_);
+                const Real maxValue =
+                    Traits::maxValueAfter(i, ts_, validData, firstAliveHelper_);
+                Real guess = Traits::guess(i, ts_, validData, firstAliveHelper_);
+                if (guess >= maxValue)
+                    guess = maxValue - (maxValue - minValue) / 5.0;
+                else if (guess <= minValue)
+                    guess = minValue + (maxValue - minValue) / 5.0;
+
+                if (!validData) {
+                    try {
+                        // extend interpolation a point at a time, including
+                        // the pillar to be bootstrapped
+                        ts_->interpolation_ = ts_->interpolator_.interpolate(
+                            times.begin(), times.begin() + i + 1, data.begin());
+                    } catch (...) {
+                        if (!Interpolator::global)
+                            throw;
+                        // use Linear while the target interpolation is not
+                        // usable yet
+                        ts_->interpolation_ = Linear().interpolate(
+                            times.begin(), times.begin() + i + 1, data.begin());
+                    }
+                    ts_->interpolation_.update();
+                }
+
+                const CountingError error(*errors_[i], stats_.iterations);
+                try {
+                    if (validData)
+                        solver_.solve(error, accuracy_, guess, minValue, maxValue);
+                    else
+                        firstSolver_.solve(error, accuracy_, guess, minValue, maxValue);
+                } catch (std::exception& e) {
+                    if (validCurve_) {
+                        // the previous curve state might have been a bad
+                        // guess, so we retry without using it, from a
+                        // freshly initialized curve
+                        validCurve_ = initialized_ = false;
+                        bootstrap();
+                        return;
+                    }
+                    QL_FAIL(io::ordinal(iteration + 1) << " iteration: failed at "
+                            << io::ordinal(i) << " alive instrument, pillar "
+                            << errors_[i]->helper()->pillarDate() << ", maturity "
+                            << errors_[i]->helper()->maturityDate()
+                            << ", reference date " << ts_->dates_[0] << ": "
+                            << e.what());
+                }
+            }
+
+            if (!Interpolator::global && !loopRequired_)
+                break;  // no need for convergence loop
+
+            Real change = std::fabs(data[1] - previousData_[1]);
+            for (Size i = 2; i <= alive_; ++i)
+                change = std::max(change, std::fabs(data[i] - previousData_[i]));
+            if (change <= accuracy_)
+                break;
+
+            QL_REQUIRE(iteration < maxIterations,
+                       "convergence not reached after " << iteration
+                       << " iterations; last improvement " << change
+                       << ", required accuracy " << accuracy_);
+            validData = true;
+        }
+        validCurve_ = true;
+
+        // Remember the quotes this state was solved for; notifications
+        // received so far (including any sent while bootstrapping) are
+        // accounted for.
+        quotes_.resize(n_);
+        for (Size j = 0; j < n_; ++j) {
+            const auto& helper = ts_->instruments_[j];
+            quotes_[j] = {helper.get(), j >= firstAliveHelper_
+                                            ? helper->quote()->value()
+                                            : Null<Real>()};
+        }
+        for (const auto& watch : watches_)
+            watch.second->notified = false;
+    }
+
+    Curve* ts_ = nullptr;
+    QuantLib::Size n_ = 0;
+    QuantLib::Real accuracy_;
+    QuantLib::Brent firstSolver_;
+    QuantLib::FiniteDifferenceNewtonSafe solver_;
+    mutable BootstrapStats stats_;
+    std::map<const Helper*, QuantLib::ext::shared_ptr<Watch>> watches_;
+    mutable bool initialized_ = false, validCurve_ = false, loopRequired_ = false;
+    mutable QuantLib::Size firstAliveHelper_ = 0, alive_ = 0;
+    mutable std::vector<QuantLib::Real> previousData_;
+    mutable std::vector<QuantLib::ext::shared_ptr<QuantLib::BootstrapError<Curve>>> errors_;
+    mutable std::vector<std::pair<const Helper*, QuantLib::Real>> quotes_;
+};
+
+} // namespace pyquantlib
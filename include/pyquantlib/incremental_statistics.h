@@ -0,0 +1,196 @@
+/*
+ * PyQuantLib: Python bindings for QuantLib
+ * https://github.com/quantales/pyquantlib
+ *
+ * Copyright (c) 2025 Yassine Idyiahia
+ * SPDX-License-Identifier: BSD-3-Clause
+ * See LICENSE for details.
+ *
+ * ---
+ * QuantLib is Copyright (c) 2000-2025 The QuantLib Authors
+ * https://www.quantlib.org/
+ */
+
+#pragma once
+
+#include <ql/errors.hpp>
+#include <ql/qldefines.hpp>
+#include <ql/types.hpp>
+#include <algorithm>
+#include <cmath>
+
+namespace pyquantlib {
+
+/**
+ * Incremental statistics that can be merged and saved.
+ *
+ * Same inspectors, bias corrections and error messages as QuantLib's
+ * IncrementalStatistics, whose boost accumulators can be neither combined
+ * nor restored. This class keeps the weight sum, the weighted mean and the
+ * weighted central moment sums M2, M3 and M4 instead, updated with the
+ * pairwise formulas of Pébay (2008). Merging two accumulators gives the
+ * moments of the combined sample, whatever the order of the merges.
+ */
+class IncrementalStatistics {
+  public:
+    typedef QuantLib::Real value_type;
+
+    //! Raw accumulator state, e.g. for pickling.
+    struct State {
+        QuantLib::Size samples = 0;
+        QuantLib::Real weightSum = 0.0, mean = 0.0, m2 = 0.0, m3 = 0.0, m4 = 0.0;
+        QuantLib::Real min = QL_MAX_REAL, max = QL_MIN_REAL;
+        QuantLib::Size downsideSamples = 0;
+        //! Weight sum and weighted sum of squares of the negative samples.
+        QuantLib::Real downsideWeightSum = 0.0, downsideSquareSum = 0.0;
+    };
+
+    IncrementalStatistics() = default;
+    explicit IncrementalStatistics(const State& state) : s_(state) {}
+
+    const State& state() const { return s_; }
+
+    //! \name Inspectors
+    //@{
+    QuantLib::Size samples() const { return s_.samples; }
+    QuantLib::Real weightSum() const { return s_.weightSum; }
+
+    QuantLib::Real mean() const {
+        QL_REQUIRE(s_.weightSum > 0.0, "sampleWeight_=0, unsufficient");
+        return s_.mean;
+    }
+
+    QuantLib::Real variance() const {
+        QL_REQUIRE(s_.weightSum > 0.0, "sampleWeight_=0, unsufficient");
+        const QuantLib::Real n = static_cast<QuantLib::Real>(s_.samples);
+        QL_REQUIRE(n > 1.0, "sample number <=1, unsufficient");
+        return n / (n - 1.0) * s_.m2 / s_.weightSum;
+    }
+
+    QuantLib::Real standardDeviation() const { return std::sqrt(variance()); }
+
+    QuantLib::Real errorEstimate() const {
+        return std::sqrt(variance() / static_cast<QuantLib::Real>(samples()));
+    }
+
+    QuantLib::Real skewness() const {
+        const QuantLib::Real n = static_cast<QuantLib::Real>(s_.samples);
+        QL_REQUIRE(n > 2.0, "sample number <=2, unsufficient");
+        const QuantLib::Real r1 = n / (n - 2.0);
+        const QuantLib::Real r2 = (n - 1.0) / (n - 2.0);
+        const QuantLib::Real m2 = s_.m2 / s_.weightSum;
+        const QuantLib::Real m3 = s_.m3 / s_.weightSum;
+        return std::sqrt(r1 * r2) * m3 / std::pow(m2, 1.5);
+    }
+
+    //! Excess kurtosis.
+    QuantLib::Real kurtosis() const {
+        const QuantLib::Real n = static_cast<QuantLib::Real>(s_.samples);
+        QL_REQUIRE(n > 3.0, "sample number <=3, unsufficient");
+        const QuantLib::Real r1 = (n - 1.0) / (n - 2.0);
+        const QuantLib::Real r2 = (n + 1.0) / (n - 3.0);
+        const QuantLib::Real r3 = (n - 1.0) / (n - 3.0);
+        const QuantLib::Real m2 = s_.m2 / s_.weightSum;
+        const QuantLib::Real m4 = s_.m4 / s_.weightSum;
+        return (m4 / (m2 * m2) * r2 - 3.0 * r3) * r1;
+    }
+
+    QuantLib::Real min() const {
+        QL_REQUIRE(s_.samples > 0, "empty sample set");
+        return s_.min;
+    }
+
+    QuantLib::Real max() const {
+        QL_REQUIRE(s_.samples > 0, "empty sample set");
+        return s_.max;
+    }
+
+    QuantLib::Size downsideSamples() const { return s_.downsideSamples; }
+    QuantLib::Real downsideWeightSum() const { return s_.downsideWeightSum; }
+
+    QuantLib::Real downsideVariance() const {
+        QL_REQUIRE(s_.downsideWeightSum > 0.0, "sampleWeight_=0, unsufficient");
+        const QuantLib::Real n = static_cast<QuantLib::Real>(s_.downsideSamples);
+        QL_REQUIRE(n > 1.0, "sample number below zero <=1, unsufficient");
+        return n / (n - 1.0) * s_.downsideSquareSum / s_.downsideWeightSum;
+    }
+
+    QuantLib::Real downsideDeviation() const { return std::sqrt(downsideVariance()); }
+    //@}
+
+    //! \name Modifiers
+    //@{
+    void add(QuantLib::Real value, QuantLib::Real weight = 1.0) {
+        QL_REQUIRE(weight >= 0.0, "negative weight (" << weight << ") not allowed");
+        ++s_.samples;
+        s_.min = std::min(s_.min, value);
+        s_.max = std::max(s_.max, value);
+        combine(weight, value, 0.0, 0.0, 0.0);
+        if (value < 0.0) {
+            ++s_.downsideSamples;
+            s_.downsideWeightSum += weight;
+            s_.downsideSquareSum += weight * value * value;
+        }
+    }
+
+    template <class DataIterator>
+    void addSequence(DataIterator begin, DataIterator end) {
+        for (; begin != end; ++begin)
+            add(*begin);
+    }
+
+    template <class DataIterator, class WeightIterator>
+    void addSequence(DataIterator begin, DataIterator end, WeightIterator wbegin) {
+        for (; begin != end; ++begin, ++wbegin)
+            add(*begin, *wbegin);
+    }
+
+    //! Adds the samples collected by another accumulator.
+    void merge(const IncrementalStatistics& other) {
+        const State o = other.s_;  // other may be *this
+        s_.samples += o.samples;
+        s_.min = std::min(s_.min, o.min);
+        s_.max = std::max(s_.max, o.max);
+        combine(o.weightSum, o.mean, o.m2, o.m3, o.m4);
+        s_.downsideSamples += o.downsideSamples;
+        s_.downsideWeightSum += o.downsideWeightSum;
+        s_.downsideSquareSum += o.downsideSquareSum;
+    }
+
+    void reset() { s_ = State(); }
+    //@}
+
+  private:
+    // Combines the weighted moments with those of a sample of weight wB.
+    void combine(QuantLib::Real wB, QuantLib::Real meanB, QuantLib::Real m2B,
+                 QuantLib::Real m3B, QuantLib::Real m4B) {
+        const QuantLib::Real wA = s_.weightSum;
+        if (wB == 0.0)
+            return;
+        if (wA == 0.0) {
+            s_.weightSum = wB;
+            s_.mean = meanB;
+            s_.m2 = m2B;
+            s_.m3 = m3B;
+            s_.m4 = m4B;
+            return;
+        }
+        const QuantLib::Real w = wA + wB;
+        const QuantLib::Real d = meanB - s_.mean;
+        const QuantLib::Real d2 = d * d;
+        const QuantLib::Real wAB = wA * wB;
+        // M4 and M3 use the previous lower moments.
+        s_.m4 += m4B + d2 * d2 * wAB * (wA * wA - wAB + wB * wB) / (w * w * w) +
+                 6.0 * d2 * (wA * wA * m2B + wB * wB * s_.m2) / (w * w) +
+                 4.0 * d * (wA * m3B - wB * s_.m3) / w;
+        s_.m3 += m3B + d2 * d * wAB * (wA - wB) / (w * w) +
+                 3.0 * d * (wA * m2B - wB * s_.m2) / w;
+        s_.m2 += m2B + d2 * wAB / w;
+        s_.mean += d * wB / w;
+        s_.weightSum = w;
+    }
+
+    State s_;
+};
+
+} // namespace pyquantlib
@@ -18,6 +18,7 @@
 #include <ql/shared_ptr.hpp>
 #include <ql/errors.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 #include <vector>
 #include <string>
@@ -90,6 +91,115 @@ ext::shared_ptr<T> make_safe_interpolation(
     return ext::shared_ptr<T>(ptr, std::move(holder));
 }
 
+namespace detail {
+
+    /**
+     * Deleter holding references to caller-owned NumPy arrays.
+     *
+     * The interpolation reads x and y straight from the array buffers, so
+     * the arrays are kept alive for as long as the interpolation. The
+     * interpolation may be released from a thread without the GIL (e.g.
+     * when a curve holding it is destroyed in C++), so the references are
+     * dropped under the GIL, or leaked if the interpreter is gone.
+     */
+    struct InterpolationBufferHolder {
+        mutable py::object x, y;
+
+        template <typename T>
+        void operator()(T* p) const {
+            delete p;
+            if (!Py_IsInitialized()) {
+                x.release();
+                y.release();
+                return;
+            }
+            py::gil_scoped_acquire gil;
+            x = py::object();
+            y = py::object();
+        }
+    };
+
+    /**
+     * Checks that `a` can be shared with an interpolation as it is: a 1-D,
+     * C-contiguous float64 array. Anything else would need a copy.
+     */
+    inline py::array_t<double> shared_buffer(const py::object& a,
+                                             const char* name) {
+        if (!py::isinstance<py::array_t<double>>(a))
+            throw py::type_error(std::string(name) + " must be a float64 NumPy "
+                                 "array when copy=False");
+        auto result = py::reinterpret_borrow<py::array_t<double>>(a);
+        if (result.ndim() != 1)
+            throw py::value_error(std::string(name) + " must be one-dimensional");
+        if (!(result.flags() & py::array::c_style))
+            throw py::value_error(std::string(name) + " must be C-contiguous "
+                                  "when copy=False");
+        return result;
+    }
+
+} // namespace detail
+
+/**
+ * Creates an interpolation reading x and y from caller-owned NumPy arrays.
+ *
+ * Unlike make_safe_interpolation nothing is copied: the interpolation
+ * iterates over the array buffers, and the arrays are kept alive by the
+ * shared_ptr's deleter. Values written into the arrays afterwards are
+ * picked up by the next update() of the interpolation. Holding a reference
+ * also prevents NumPy from resizing the arrays in place.
+ *
+ * @tparam T The interpolation type (e.g., CubicNaturalSpline)
+ * @tparam Args Additional constructor argument types
+ * @param x The x values (1-D, C-contiguous float64 array)
+ * @param y The y values (1-D, C-contiguous float64 array)
+ * @param requiredPoints Minimum number of points required
+ * @param args Additional constructor arguments (forwarded)
+ * @return A shared_ptr to the interpolation, keeping the arrays alive
+ */
+template <typename T, typename... Args>
+ext::shared_ptr<T> make_buffer_interpolation(
+    const py::object& x,
+    const py::object& y,
+    Size requiredPoints,
+    Args&&... args)
+{
+    auto xs = detail::shared_buffer(x, "x");
+    auto ys = detail::shared_buffer(y, "y");
+    const auto n = static_cast<Size>(xs.size());
+    QL_REQUIRE(n == static_cast<Size>(ys.size()), "x and y must have the same size");
+    QL_REQUIRE(n >= requiredPoints,
+               "at least " << requiredPoints << " points required, "
+               << n << " provided");
+
+    const Real* xBegin = xs.data();
+    auto* ptr = new T(xBegin, xBegin + n, ys.data(), std::forward<Args>(args)...);
+
+    return ext::shared_ptr<T>(
+        ptr, detail::InterpolationBufferHolder{std::move(xs), std::move(ys)});
+}
+
+/**
+ * Creates an interpolation from x and y arrays, either copying them
+ * (make_safe_interpolation) or sharing the caller's buffers
+ * (make_buffer_interpolation).
+ */
+template <typename T, typename... Args>
+ext::shared_ptr<T> make_interpolation(
+    const py::object& x,
+    const py::object& y,
+    bool copy,
+    Size requiredPoints,
+    Args&&... args)
+{
+    if (!copy)
+        return make_buffer_interpolation<T>(x, y, requiredPoints,
+                                            std::forward<Args>(args)...);
+    return make_safe_interpolation<T>(x.cast<std::vector<Real>>(),
+                                      y.cast<std::vector<Real>>(),
+                                      requiredPoints,
+                                      std::forward<Args>(args)...);
+}
+
 /**
  * Binds a simple interpolation class with the standard (x, y) constructor.
  *
@@ -115,7 +225,14 @@ void bind_simple_interpolation(
                 std::move(x), std::move(y), RequiredPoints);
         }),
         py::arg("x"), py::arg("y"),
-        "Constructs interpolation from x and y arrays.");
+        "Constructs interpolation from x and y arrays.")
+        .def(py::init([](const py::object& x, const py::object& y, bool copy) {
+            return make_interpolation<T>(x, y, copy, RequiredPoints);
+        }),
+        py::arg("x"), py::arg("y"), py::kw_only(), py::arg("copy"),
+        "Constructs interpolation from x and y arrays. With copy=False the "
+        "interpolation reads the given float64 NumPy arrays in place and "
+        "keeps them alive; call update() after writing to them.");
 }
 
 // ---------------------------------------------------------------------------
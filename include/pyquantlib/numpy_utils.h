@@ -0,0 +1,485 @@
+/*
+ * PyQuantLib: Python bindings for QuantLib
+ * https://github.com/quantales/pyquantlib
+ *
+ * Copyright (c) 2025 Yassine Idyiahia
+ * SPDX-License-Identifier: BSD-3-Clause
+ * See LICENSE for details.
+ *
+ * ---
+ * QuantLib is Copyright (c) 2000-2025 The QuantLib Authors
+ * https://www.quantlib.org/
+ */
+
+#pragma once
+
+#include <ql/time/date.hpp>
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <algorithm>
+#include <cstdint>
+#include <limits>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace py = pybind11;
+
+namespace pyquantlib {
+
+/**
+ * NumPy array types accepted by the vectorized bindings.
+ *
+ * forcecast lets callers pass lists, Python scalars or arrays of other
+ * dtypes; they are converted once, under the GIL, before the C++ loop.
+ */
+using DoubleArray = py::array_t<double, py::array::forcecast>;
+using IntArray = py::array_t<int, py::array::forcecast>;
+using SerialArray = py::array_t<std::int64_t, py::array::forcecast>;
+
+/**
+ * QuantLib serial number of 1970-01-01, the datetime64 epoch.
+ */
+constexpr std::int64_t datetime64_epoch_serial = 25569;
+
+/**
+ * True if the array holds dates: integer serial numbers or datetime64.
+ */
+inline bool holds_dates(const py::array& a) {
+    const char kind = a.dtype().kind();
+    return kind == 'i' || kind == 'u' || kind == 'M';
+}
+
+/**
+ * Array of dates from an array, a list or a scalar of integer serial numbers
+ * or datetime64 values, as numpy.asarray would build it.
+ */
+inline py::array date_array(const py::object& dates) {
+    auto a = py::array::ensure(dates);
+    if (!a)
+        throw py::type_error("dates must be integer serial numbers or datetime64 values");
+    return a;
+}
+
+/**
+ * Converts integer serial numbers or datetime64 values to QuantLib serial
+ * numbers. datetime64 values are truncated to whole days.
+ */
+inline SerialArray date_serials(const py::array& a) {
+    const char kind = a.dtype().kind();
+    if (kind == 'M') {
+        py::object days = a.attr("astype")("datetime64[D]").attr("astype")("int64");
+        return (days + py::int_(datetime64_epoch_serial)).cast<SerialArray>();
+    }
+    if (kind != 'i' && kind != 'u')
+        throw py::type_error("dates must be integer serial numbers or datetime64 values");
+    return a.cast<SerialArray>();
+}
+
+/**
+ * Returns QuantLib serial numbers in the date representation of `like`:
+ * datetime64[D] if `like` holds datetime64 values, integer serials otherwise.
+ */
+inline py::array serials_like(const SerialArray& serials, const py::array& like) {
+    if (like.dtype().kind() == 'M') {
+        py::object days = serials - py::int_(datetime64_epoch_serial);
+        return days.attr("astype")("datetime64[D]").cast<py::array>();
+    }
+    return serials;
+}
+
+/**
+ * Returns a 1-D datetime64[D] array of QuantLib serial numbers; serial 0
+ * (the null date) becomes NaT.
+ */
+inline py::array datetime64_from_serials(const std::vector<std::int64_t>& serials) {
+    py::array result(py::dtype("datetime64[D]"),
+                     {static_cast<py::ssize_t>(serials.size())});
+    auto* r = static_cast<std::int64_t*>(result.mutable_data());
+    for (std::size_t i = 0; i < serials.size(); ++i)
+        r[i] = serials[i] == 0 ? std::numeric_limits<std::int64_t>::min()
+                               : serials[i] - datetime64_epoch_serial;
+    return result;
+}
+
+/**
+ * Dates as a 1-D array of the given dtype: datetime64 (null dates become
+ * NaT) or integer serial numbers (null dates become 0). Builds no Python
+ * object per date.
+ */
+inline py::array dates_to_numpy(const std::vector<QuantLib::Date>& dates,
+                                const py::dtype& dtype) {
+    const bool datetime = dtype.kind() == 'M';
+    if (!datetime && dtype.kind() != 'i' && dtype.kind() != 'u')
+        throw py::type_error("dtype must be a datetime64 or integer dtype");
+
+    std::vector<std::int64_t> serials;
+    serials.reserve(dates.size());
+    for (const auto& d : dates)
+        serials.push_back(d.serialNumber());
+    py::array result = datetime
+        ? datetime64_from_serials(serials)
+        : py::array_t<std::int64_t>(static_cast<py::ssize_t>(serials.size()),
+                                    serials.data());
+    if (result.dtype().equal(dtype))
+        return result;
+    return result.attr("astype")(dtype).cast<py::array>();
+}
+
+/**
+ * Element-wise loop over NumPy arrays broadcast to a common shape.
+ *
+ * Inputs follow NumPy broadcasting rules. Broadcast dimensions get a zero
+ * stride, so scalar or lower-rank inputs are never expanded in memory.
+ * The loop itself touches no Python objects and can run with the GIL
+ * released; the arrays are kept alive by the loop object.
+ *
+ * Usage:
+ *   BroadcastLoop loop({strikes, forwards});
+ *   auto out = make_output(outObj, loop.shape());
+ *   double* res = out.mutable_data();
+ *   {
+ *       py::gil_scoped_release release;
+ *       loop.run([&](py::ssize_t i, const char* const* p) {
+ *           res[i] = f(element<double>(p[0]), element<double>(p[1]));
+ *       });
+ *   }
+ */
+class BroadcastLoop {
+  public:
+    explicit BroadcastLoop(std::vector<py::array> arrays)
+    : arrays_(std::move(arrays)) {
+        py::ssize_t ndim = 0;
+        for (const auto& a : arrays_)
+            ndim = std::max<py::ssize_t>(ndim, a.ndim());
+
+        shape_.assign(static_cast<std::size_t>(ndim), 1);
+        for (const auto& a : arrays_) {
+            const py::ssize_t offset = ndim - a.ndim();
+            for (py::ssize_t d = 0; d < a.ndim(); ++d) {
+                const py::ssize_t n = a.shape(d);
+                py::ssize_t& s = shape_[static_cast<std::size_t>(offset + d)];
+                if (n == s || n == 1)
+                    continue;
+                if (s != 1)
+                    throw py::value_error(
+                        "operands could not be broadcast together");
+                s = n;
+            }
+        }
+
+        size_ = 1;
+        for (py::ssize_t s : shape_)
+            size_ *= s;
+
+        strides_.resize(arrays_.size());
+        data_.resize(arrays_.size());
+        for (std::size_t k = 0; k < arrays_.size(); ++k) {
+            const py::array& a = arrays_[k];
+            const py::ssize_t offset = ndim - a.ndim();
+            strides_[k].assign(static_cast<std::size_t>(ndim), 0);
+            for (py::ssize_t d = 0; d < a.ndim(); ++d) {
+                if (a.shape(d) != 1)
+                    strides_[k][static_cast<std::size_t>(offset + d)] = a.strides(d);
+            }
+            data_[k] = static_cast<const char*>(a.data());
+        }
+    }
+
+    const std::vector<py::ssize_t>& shape() const { return shape_; }
+    py::ssize_t size() const { return size_; }
+    std::size_t inputs() const { return data_.size(); }
+
+    /**
+     * Calls f(i, p) for every element in C order, where i is the flat
+     * output index and p[k] points to the current element of input k.
+     */
+    template <typename F>
+    void run(F&& f) const {
+        const std::size_t ndim = shape_.size();
+        const std::size_t n = data_.size();
+        std::vector<const char*> p(data_);
+        std::vector<py::ssize_t> index(ndim, 0);
+
+        for (py::ssize_t i = 0; i < size_; ++i) {
+            f(i, p.data());
+            for (std::size_t d = ndim; d-- > 0;) {
+                for (std::size_t k = 0; k < n; ++k)
+                    p[k] += strides_[k][d];
+                if (++index[d] < shape_[d])
+                    break;
+                for (std::size_t k = 0; k < n; ++k)
+                    p[k] -= strides_[k][d] * shape_[d];
+                index[d] = 0;
+            }
+        }
+    }
+
+  private:
+    std::vector<py::array> arrays_;
+    std::vector<py::ssize_t> shape_;
+    py::ssize_t size_ = 1;
+    std::vector<std::vector<py::ssize_t>> strides_;
+    std::vector<const char*> data_;
+};
+
+/**
+ * Reads the element a BroadcastLoop pointer refers to.
+ */
+template <typename T>
+inline T element(const char* p) {
+    return *reinterpret_cast<const T*>(p);
+}
+
+/**
+ * Returns a C-contiguous array of the given shape to write results into.
+ *
+ * If `out` is None a new array is allocated; otherwise `out` must be a
+ * writeable, C-contiguous array of the right dtype and shape, and is
+ * returned as-is so repeated calls can reuse the same buffer.
+ */
+template <typename T = double>
+py::array_t<T> make_output(const py::object& out,
+                           const std::vector<py::ssize_t>& shape,
+                           const char* name = "out") {
+    if (out.is_none())
+        return py::array_t<T>(shape);
+
+    if (!py::isinstance<py::array_t<T>>(out))
+        throw py::type_error(std::string(name) + " must be a NumPy array of dtype " +
+                             py::str(py::dtype::of<T>()).cast<std::string>());
+    auto result = py::reinterpret_borrow<py::array_t<T>>(out);
+    if (!(result.flags() & py::array::c_style))
+        throw py::value_error(std::string(name) + " must be C-contiguous");
+    if (!result.writeable())
+        throw py::value_error(std::string(name) + " must be writeable");
+    if (static_cast<std::size_t>(result.ndim()) != shape.size() ||
+        !std::equal(shape.begin(), shape.end(), result.shape()))
+        throw py::value_error(std::string(name) + " has the wrong shape");
+    return result;
+}
+
+/**
+ * Copies a vector of doubles into a new 1-D float64 array.
+ */
+inline py::array_t<double> to_numpy(const std::vector<double>& values) {
+    return py::array_t<double>(static_cast<py::ssize_t>(values.size()),
+                               values.data());
+}
+
+/**
+ * 1-D float64 view of n doubles owned by a Python object.
+ *
+ * No data is copied: the view refers to `data` and holds a reference to
+ * `owner`, which must keep the memory alive and in place for as long as
+ * the view exists.
+ */
+inline py::array_t<double> view_of(const double* data, std::size_t n,
+                                   py::handle owner, bool writeable) {
+    if (n == 0)
+        return py::array_t<double>(0);
+    py::array_t<double> result({static_cast<py::ssize_t>(n)},
+                               {static_cast<py::ssize_t>(sizeof(double))},
+                               data, owner);
+    if (!writeable)
+        result.attr("setflags")(py::arg("write") = false);
+    return result;
+}
+
+/**
+ * Values of a per-item parameter for n items. A scalar (or one-element
+ * array) applies to every item; otherwise the array must be 1-D of length n.
+ */
+inline std::vector<double> per_item(const DoubleArray& a, std::size_t n,
+                                    const char* name) {
+    const double* v = a.data();
+    if (a.size() == 1)
+        return std::vector<double>(n, v[0]);
+    if (a.ndim() != 1 || static_cast<std::size_t>(a.size()) != n)
+        throw py::value_error(std::string(name) + " must be a scalar or have one "
+                              "value per item (" + std::to_string(n) + ")");
+    const auto values = a.unchecked<1>();
+    std::vector<double> result(n);
+    for (std::size_t i = 0; i < n; ++i)
+        result[i] = values(static_cast<py::ssize_t>(i));
+    return result;
+}
+
+/**
+ * Weights of n statistics samples: 1.0 each if `weights` is None, otherwise
+ * as per_item. Negative weights are rejected before any sample is added.
+ */
+inline std::vector<double> sample_weights(const py::object& weights, std::size_t n) {
+    if (weights.is_none())
+        return std::vector<double>(n, 1.0);
+    auto result = per_item(weights.cast<DoubleArray>(), n, "weights");
+    for (double w : result) {
+        if (!(w >= 0.0))
+            throw py::value_error("negative weight (" + std::to_string(w) +
+                                  ") not allowed");
+    }
+    return result;
+}
+
+/**
+ * Shape of a caller-supplied output array, before make_output validates it.
+ */
+inline std::vector<py::ssize_t> output_shape(const py::object& out,
+                                             const char* name = "out") {
+    if (!py::isinstance<py::array>(out))
+        throw py::type_error(std::string(name) + " must be a NumPy array");
+    auto a = py::reinterpret_borrow<py::array>(out);
+    return {a.shape(), a.shape() + a.ndim()};
+}
+
+/**
+ * Adds fill(out) and nextBatch(n) to the binding of a QuantLib sequence
+ * generator (a class with dimension() and nextSequence()).
+ *
+ * Row i of the (n, dimension) result is the i-th draw. Draws are copied
+ * straight into the NumPy buffer with the GIL released.
+ */
+template <typename Rsg, typename... Options>
+void def_sequence_batch(py::class_<Rsg, Options...>& cls) {
+    auto draw = [](Rsg& rsg, const py::object& out, py::ssize_t n) {
+        const auto dim = static_cast<py::ssize_t>(rsg.dimension());
+        auto result = make_output(out, {n, dim});
+        double* r = result.mutable_data();
+        {
+            py::gil_scoped_release release;
+            for (py::ssize_t i = 0; i < n; ++i) {
+                const auto& sequence = rsg.nextSequence().value;
+                std::copy(sequence.begin(), sequence.end(), r + i * dim);
+            }
+        }
+        return result;
+    };
+    cls.def("fill",
+            [draw](Rsg& self, const py::object& out) {
+                auto shape = output_shape(out);
+                if (shape.size() != 2 ||
+                    shape[1] != static_cast<py::ssize_t>(self.dimension()))
+                    throw py::value_error("out must have shape (n, " +
+                                          std::to_string(self.dimension()) + ")");
+                return draw(self, out, shape[0]);
+            },
+            py::arg("out"),
+            "Fills the rows of an (n, dimension) float64 array with the next n "
+            "sequences and returns it.")
+        .def("nextBatch",
+            [draw](Rsg& self, py::ssize_t n) {
+                if (n < 0)
+                    throw py::value_error("n must be non-negative");
+                return draw(self, py::none(), n);
+            },
+            py::arg("n"),
+            "Returns the next n sequences as an (n, dimension) array.");
+}
+
+/**
+ * Adds fill(out) and nextBatch(n) to the binding of a scalar QuantLib
+ * generator; next(rng) returns one variate.
+ */
+template <typename Rng, typename... Options, typename Next>
+void def_variate_batch(py::class_<Rng, Options...>& cls, Next next) {
+    auto draw = [next](Rng& rng, const py::object& out,
+                       const std::vector<py::ssize_t>& shape) {
+        auto result = make_output(out, shape);
+        double* r = result.mutable_data();
+        const py::ssize_t n = result.size();
+        {
+            py::gil_scoped_release release;
+            for (py::ssize_t i = 0; i < n; ++i)
+                r[i] = next(rng);
+        }
+        return result;
+    };
+    cls.def("fill",
+            [draw](Rng& self, const py::object& out) {
+                return draw(self, out, output_shape(out));
+            },
+            py::arg("out"),
+            "Fills a float64 array of any shape with the next variates and "
+            "returns it.")
+        .def("nextBatch",
+            [draw](Rng& self, py::ssize_t n) {
+                if (n < 0)
+                    throw py::value_error("n must be non-negative");
+                return draw(self, py::none(), {n});
+            },
+            py::arg("n"),
+            "Returns the next n variates as a 1-D array.");
+}
+
+/**
+ * Evaluates f(x[i], y[j]) over the grid spanned by two 1-D arrays, without
+ * the GIL. The result has shape (len(x), len(y)) and is written into `out`
+ * when one is given.
+ */
+template <typename F>
+py::array_t<double> evaluate_grid(const DoubleArray& x, const DoubleArray& y,
+                                  const py::object& out, F f,
+                                  const char* xname = "x",
+                                  const char* yname = "y") {
+    if (x.ndim() != 1)
+        throw py::value_error(std::string(xname) + " must be one-dimensional");
+    if (y.ndim() != 1)
+        throw py::value_error(std::string(yname) + " must be one-dimensional");
+    auto xs = x.unchecked<1>();
+    auto ys = y.unchecked<1>();
+    const py::ssize_t nx = xs.shape(0), ny = ys.shape(0);
+    auto result = make_output(out, {nx, ny});
+    double* r = result.mutable_data();
+    {
+        py::gil_scoped_release release;
+        for (py::ssize_t i = 0; i < nx; ++i)
+            for (py::ssize_t j = 0; j < ny; ++j)
+                r[i * ny + j] = f(xs(i), ys(j));
+    }
+    return result;
+}
+
+/**
+ * Evaluates f(x) element-wise without the GIL. `out` may be `x` itself for
+ * in-place evaluation.
+ */
+template <typename F>
+py::array_t<double> evaluate_unary(const DoubleArray& x, const py::object& out, F f) {
+    std::vector<py::ssize_t> shape(x.shape(), x.shape() + x.ndim());
+    auto result = make_output(out, shape);
+    double* r = result.mutable_data();
+    if (x.flags() & py::array::c_style) {
+        const double* xs = x.data();
+        const py::ssize_t n = x.size();
+        py::gil_scoped_release release;
+        for (py::ssize_t i = 0; i < n; ++i)
+            r[i] = f(xs[i]);
+    } else {
+        BroadcastLoop loop({x});
+        py::gil_scoped_release release;
+        loop.run([&](py::ssize_t i, const char* const* p) {
+            r[i] = f(element<double>(p[0]));
+        });
+    }
+    return result;
+}
+
+/**
+ * Evaluates f(x, y) over two broadcast arrays, without the GIL.
+ */
+template <typename F>
+py::array_t<double> evaluate_pairs(const DoubleArray& x, const DoubleArray& y,
+                                   const py::object& out, F f) {
+    BroadcastLoop loop({x, y});
+    auto result = make_output(out, loop.shape());
+    double* r = result.mutable_data();
+    {
+        py::gil_scoped_release release;
+        loop.run([&](py::ssize_t i, const char* const* p) {
+            r[i] = f(element<double>(p[0]), element<double>(p[1]));
+        });
+    }
+    return result;
+}
+
+} // namespace pyquantlib
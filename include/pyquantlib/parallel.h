@@ -0,0 +1,244 @@
+/*
+ * PyQuantLib: Python bindings for QuantLib
+ * https://github.com/quantales/pyquantlib
+ *
+ * Copyright (c) 2025 Yassine Idyiahia
+ * SPDX-License-Identifier: BSD-3-Clause
+ * See LICENSE for details.
+ *
+ * ---
+ * QuantLib is Copyright (c) 2000-2025 The QuantLib Authors
+ * https://www.quantlib.org/
+ */
+
+#pragma once
+
+#include <ql/cashflow.hpp>
+#include <ql/cashflows/fixedratecoupon.hpp>
+#include <ql/cashflows/simplecashflow.hpp>
+#include <ql/patterns/lazyobject.hpp>
+#include <ql/settings.hpp>
+#include <algorithm>
+#include <condition_variable>
+#include <cstddef>
+#include <deque>
+#include <exception>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace pyquantlib {
+
+namespace detail {
+
+    // Copies the caller's Settings into worker threads under
+    // QL_ENABLE_SESSIONS, where Settings are per thread; a no-op otherwise.
+    class SettingsSnapshot {
+      public:
+        SettingsSnapshot() {
+#ifdef QL_ENABLE_SESSIONS
+            auto& settings = QuantLib::Settings::instance();
+            today_ = settings.evaluationDate();
+            includeReferenceDateEvents_ = settings.includeReferenceDateEvents();
+            includeTodaysCashFlows_ = settings.includeTodaysCashFlows();
+            enforcesTodaysHistoricFixings_ =
+                settings.enforcesTodaysHistoricFixings();
+#endif
+        }
+        void apply() const {
+#ifdef QL_ENABLE_SESSIONS
+            auto& s = QuantLib::Settings::instance();
+            s.evaluationDate() = today_;
+            s.includeReferenceDateEvents() = includeReferenceDateEvents_;
+            s.includeTodaysCashFlows() = includeTodaysCashFlows_;
+            s.enforcesTodaysHistoricFixings() = enforcesTodaysHistoricFixings_;
+#endif
+        }
+
+      private:
+#ifdef QL_ENABLE_SESSIONS
+        QuantLib::Date today_;
+        bool includeReferenceDateEvents_ = false;
+        QuantLib::ext::optional<bool> includeTodaysCashFlows_;
+        bool enforcesTodaysHistoricFixings_ = false;
+#endif
+    };
+
+}
+
+/**
+ * Calls f(i) for every i in [0, n) on up to nThreads threads.
+ *
+ * Indices are split into contiguous chunks, one per thread; with
+ * nThreads <= 1 the loop runs on the calling thread. Under
+ * QL_ENABLE_SESSIONS the workers run with the caller's Settings. The first
+ * exception thrown by a worker is rethrown once all threads have joined.
+ * The GIL must be released by the caller if f does not touch Python.
+ */
+template <class F>
+void parallelFor(std::size_t n, std::size_t nThreads, F&& f) {
+    nThreads = std::min(nThreads, n);
+    if (nThreads <= 1) {
+        for (std::size_t i = 0; i < n; ++i)
+            f(i);
+        return;
+    }
+
+    const detail::SettingsSnapshot settings;
+    std::vector<std::exception_ptr> errors(nThreads);
+    std::vector<std::thread> threads;
+    threads.reserve(nThreads);
+    for (std::size_t t = 0; t < nThreads; ++t) {
+        const std::size_t begin = n * t / nThreads;
+        const std::size_t end = n * (t + 1) / nThreads;
+        threads.emplace_back([&, t, begin, end]() {
+            try {
+                settings.apply();
+                for (std::size_t i = begin; i < end; ++i)
+                    f(i);
+            } catch (...) {
+                errors[t] = std::current_exception();
+            }
+        });
+    }
+    for (auto& thread : threads)
+        thread.join();
+    for (const auto& e : errors) {
+        if (e)
+            std::rethrow_exception(e);
+    }
+}
+
+/**
+ * Calls f(i) for every node i of a dependency graph on up to nThreads
+ * threads, starting each node once all of dependencies[i] are done.
+ *
+ * Nodes whose dependencies are complete run as soon as a thread is free,
+ * so independent strands proceed concurrently. The graph must be acyclic
+ * (e.g. every node depending only on lower indices). After an exception no
+ * further node is started; the first exception is rethrown once all
+ * threads have joined. Settings and the GIL are handled as in parallelFor.
+ */
+template <class F>
+void parallelForGraph(const std::vector<std::vector<std::size_t>>& dependencies,
+                      std::size_t nThreads, F&& f) {
+    const std::size_t n = dependencies.size();
+    std::vector<std::size_t> pending(n);
+    std::vector<std::vector<std::size_t>> dependents(n);
+    std::deque<std::size_t> ready;
+    for (std::size_t i = 0; i < n; ++i) {
+        pending[i] = dependencies[i].size();
+        for (std::size_t d : dependencies[i])
+            dependents[d].push_back(i);
+        if (pending[i] == 0)
+            ready.push_back(i);
+    }
+
+    nThreads = std::min(nThreads, n);
+    if (nThreads <= 1) {
+        while (!ready.empty()) {
+            const std::size_t i = ready.front();
+            ready.pop_front();
+            f(i);
+            for (std::size_t j : dependents[i]) {
+                if (--pending[j] == 0)
+                    ready.push_back(j);
+            }
+        }
+        return;
+    }
+
+    const detail::SettingsSnapshot settings;
+    std::mutex mutex;
+    std::condition_variable cv;
+    std::size_t finished = 0;
+    std::exception_ptr error;
+    std::vector<std::thread> threads;
+    threads.reserve(nThreads);
+    for (std::size_t t = 0; t < nThreads; ++t) {
+        threads.emplace_back([&]() {
+            settings.apply();
+            std::unique_lock<std::mutex> lock(mutex);
+            for (;;) {
+                cv.wait(lock, [&]() {
+                    return !ready.empty() || finished == n || error;
+                });
+                if (error || ready.empty())
+                    return;
+                const std::size_t i = ready.front();
+                ready.pop_front();
+                lock.unlock();
+                std::exception_ptr e;
+                try {
+                    f(i);
+                } catch (...) {
+                    e = std::current_exception();
+                }
+                lock.lock();
+                if (e) {
+                    if (!error)
+                        error = e;
+                } else {
+                    ++finished;
+                    for (std::size_t j : dependents[i]) {
+                        if (--pending[j] == 0)
+                            ready.push_back(j);
+                    }
+                }
+                cv.notify_all();
+            }
+        });
+    }
+    for (auto& thread : threads)
+        thread.join();
+    if (error)
+        std::rethrow_exception(error);
+}
+
+/**
+ * Prepares a leg for evaluation on worker threads; returns false if it
+ * must be evaluated on the calling thread instead.
+ *
+ * The amount of every cash flow is computed here, on the calling thread.
+ * Floating coupons are lazy objects: the first amount() runs the coupon
+ * pricer, whose initialize() writes state shared by the coupons using it,
+ * and calculates the forecasting curve. Afterwards the rate is cached and
+ * workers only read it. Cash flows that are neither lazy, fixed-rate
+ * coupons nor simple cash flows recompute their amount on every call, and
+ * a failed amount (e.g. a missing fixing) would run the pricer again, so
+ * legs holding either are not prepared.
+ */
+inline bool prepareLeg(const QuantLib::Leg& leg) {
+    using namespace QuantLib;
+    for (const auto& cf : leg) {
+        if (!cf)
+            return false;
+        if (!ext::dynamic_pointer_cast<LazyObject>(cf) &&
+            !ext::dynamic_pointer_cast<FixedRateCoupon>(cf) &&
+            !ext::dynamic_pointer_cast<SimpleCashFlow>(cf))
+            return false;
+        try {
+            cf->amount();
+        } catch (const std::exception&) {
+            return false;
+        }
+    }
+    return true;
+}
+
+/**
+ * Number of threads for evaluating legs(i), i in [0, n): nThreads if every
+ * leg could be prepared with prepareLeg, 1 otherwise.
+ */
+template <class Legs>
+std::size_t threadsForLegs(std::size_t n, std::size_t nThreads, Legs&& legs) {
+    if (std::min(nThreads, n) <= 1)
+        return 1;
+    for (std::size_t i = 0; i < n; ++i) {
+        if (!prepareLeg(legs(i)))
+            return 1;
+    }
+    return nThreads;
+}
+
+} // namespace pyquantlib
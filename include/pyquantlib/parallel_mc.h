@@ -0,0 +1,322 @@
+/*
+ * PyQuantLib: Python bindings for QuantLib
+ * https://github.com/quantales/pyquantlib
+ *
+ * Copyright (c) 2025 Yassine Idyiahia
+ * SPDX-License-Identifier: BSD-3-Clause
+ * See LICENSE for details.
+ *
+ * ---
+ * QuantLib is Copyright (c) 2000-2025 The QuantLib Authors
+ * https://www.quantlib.org/
+ */
+
+#pragma once
+
+#include "pyquantlib/parallel.h"
+#include <ql/errors.hpp>
+#include <ql/instrument.hpp>
+#include <ql/math/randomnumbers/mt19937uniformrng.hpp>
+#include <ql/math/randomnumbers/rngtraits.hpp>
+#include <ql/math/randomnumbers/seedgenerator.hpp>
+#include <ql/math/randomnumbers/sobolrsg.hpp>
+#include <ql/pricingengine.hpp>
+#include <ql/pricingengines/mclongstaffschwartzengine.hpp>
+#include <ql/processes/blackscholesprocess.hpp>
+#include <ql/processes/hestonprocess.hpp>
+#include <ql/processes/stochasticprocessarray.hpp>
+#include <ql/shared_ptr.hpp>
+#include <ql/utilities/null.hpp>
+#include <cmath>
+#include <cstdint>
+#include <functional>
+#include <map>
+#include <string>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+namespace pyquantlib {
+
+/**
+ * Sobol policy whose sequences start at a per-thread offset.
+ *
+ * The MC engine factories use it in place of QuantLib::LowDiscrepancy so
+ * that each worker of a ParallelMcEngine draws its own block of the
+ * sequence. On a thread that never sets the offset it behaves exactly like
+ * LowDiscrepancy.
+ */
+struct BlockLowDiscrepancy : QuantLib::LowDiscrepancy {
+    static std::uint32_t& blockOffset() {
+        static thread_local std::uint32_t offset = 0;
+        return offset;
+    }
+
+    static rsg_type make_sequence_generator(QuantLib::Size dimension,
+                                            QuantLib::BigNatural seed) {
+        QuantLib::SobolRsg sobol(dimension, seed);
+        if (blockOffset() != 0)
+            sobol.skipTo(blockOffset());
+        return rsg_type(sobol);
+    }
+};
+
+/**
+ * Sampling options shared by the MC engine factories.
+ */
+struct McSampling {
+    QuantLib::Size requiredSamples = QuantLib::Null<QuantLib::Size>();
+    QuantLib::Real requiredTolerance = QuantLib::Null<QuantLib::Real>();
+    QuantLib::Size maxSamples = QuantLib::Null<QuantLib::Size>();
+    QuantLib::BigNatural seed = 0;
+    QuantLib::Size nThreads = 1;
+};
+
+/**
+ * Whether warmUpProcess() can prepare the process for concurrent reads:
+ * Black-Scholes and Heston processes, and StochasticProcessArrays of them.
+ */
+inline bool canWarmUpProcess(const QuantLib::ext::shared_ptr<QuantLib::StochasticProcess>& process) {
+    using namespace QuantLib;
+    if (auto array = ext::dynamic_pointer_cast<StochasticProcessArray>(process)) {
+        for (Size i = 0; i < array->size(); ++i) {
+            if (!canWarmUpProcess(array->process(i)))
+                return false;
+        }
+        return true;
+    }
+    return ext::dynamic_pointer_cast<GeneralizedBlackScholesProcess>(process) ||
+           ext::dynamic_pointer_cast<HestonProcess>(process);
+}
+
+/**
+ * Runs the lazy calculations of a process's term structures on the calling
+ * thread, so that Monte Carlo workers only read them: bootstrapped risk-free
+ * and dividend curves, calibrated volatility surfaces and the local
+ * volatility a Black-Scholes process builds on first use. The members of a
+ * StochasticProcessArray are warmed up in turn. Other processes are left
+ * alone; see canWarmUpProcess().
+ */
+inline void warmUpProcess(const QuantLib::ext::shared_ptr<QuantLib::StochasticProcess>& process) {
+    using namespace QuantLib;
+    if (auto array = ext::dynamic_pointer_cast<StochasticProcessArray>(process)) {
+        for (Size i = 0; i < array->size(); ++i)
+            warmUpProcess(array->process(i));
+    } else if (auto bs = ext::dynamic_pointer_cast<GeneralizedBlackScholesProcess>(process)) {
+        bs->riskFreeRate()->discount(0.0);
+        bs->dividendYield()->discount(0.0);
+        bs->blackVolatility()->blackVol(0.0, bs->x0(), true);
+        bs->localVolatility();
+    } else if (auto heston = ext::dynamic_pointer_cast<HestonProcess>(process)) {
+        heston->riskFreeRate()->discount(0.0);
+        heston->dividendYield()->discount(0.0);
+    }
+}
+
+namespace detail {
+
+// Whether Engine is a Longstaff-Schwartz engine (MCAmericanEngine,
+// MCAmericanBasketEngine).
+template <class G, template <class> class MC, class RNG, class S, class RC>
+std::true_type isLsm(const QuantLib::MCLongstaffSchwartzEngine<G, MC, RNG, S, RC>*);
+std::false_type isLsm(...);
+
+template <class Engine>
+constexpr bool isLsmEngine = decltype(isLsm(std::declval<const Engine*>()))::value;
+
+} // namespace detail
+
+/**
+ * Monte Carlo engine running its sample budget on several threads.
+ *
+ * Each worker is a copy of Engine built with its own seed (pseudo-random)
+ * or Sobol block offset (low-discrepancy) and its share of the samples or
+ * a tolerance scaled by sqrt(nThreads). On calculate() the workers run
+ * concurrently on copies of the arguments; their sample accumulators are
+ * merged, in worker order, into one statistics object that gives the value
+ * and error estimate. Numeric additional results are averaged over the
+ * workers, weighted by their sample counts. Results depend only on the seed
+ * and thread count.
+ *
+ * The class derives from Engine (built as a copy of the first worker) so
+ * that it can be returned wherever Engine is expected.
+ */
+template <class Engine>
+class ParallelMcEngine : public Engine {
+  public:
+    ParallelMcEngine(std::vector<QuantLib::ext::shared_ptr<Engine>> workers,
+                     std::vector<std::uint32_t> offsets,
+                     std::function<void()> prepare = {})
+    : Engine(*workers.front()), workers_(std::move(workers)),
+      offsets_(std::move(offsets)), prepare_(std::move(prepare)) {}
+
+    void calculate() const override {
+        using arguments_type = std::decay_t<decltype(this->arguments_)>;
+        using results_type = std::decay_t<decltype(this->results_)>;
+
+        if (prepare_)
+            prepare_();
+
+        for (const auto& w : workers_) {
+            auto* args = dynamic_cast<arguments_type*>(w->getArguments());
+            QL_REQUIRE(args != nullptr, "wrong argument type");
+            *args = this->arguments_;
+            w->reset();
+        }
+
+        parallelFor(workers_.size(), workers_.size(), [&](std::size_t i) {
+            BlockLowDiscrepancy::blockOffset() = offsets_[i];
+            workers_[i]->calculate();
+        });
+
+        typename Engine::stats_type stats;
+        for (const auto& w : workers_) {
+            for (const auto& sample : w->sampleAccumulator().data())
+                stats.add(sample.first, sample.second);
+        }
+        this->results_.value = stats.mean();
+        const auto* first =
+            dynamic_cast<const results_type*>(workers_.front()->getResults());
+        if (first != nullptr &&
+            first->errorEstimate != QuantLib::Null<QuantLib::Real>())
+            this->results_.errorEstimate = stats.errorEstimate();
+
+        // Numbers are averaged over the workers, weighted by their sample
+        // counts; other entries come from the first worker reporting them.
+        std::map<std::string, std::pair<QuantLib::Real, QuantLib::Real>> sums;
+        for (const auto& w : workers_) {
+            const auto* r = dynamic_cast<const results_type*>(w->getResults());
+            if (r == nullptr)
+                continue;
+            const auto n = static_cast<QuantLib::Real>(w->sampleAccumulator().samples());
+            for (const auto& entry : r->additionalResults) {
+                if (const auto* x = QuantLib::ext::any_cast<QuantLib::Real>(&entry.second)) {
+                    auto& sum = sums[entry.first];
+                    sum.first += n * *x;
+                    sum.second += n;
+                } else {
+                    this->results_.additionalResults.insert(entry);
+                }
+            }
+        }
+        for (const auto& sum : sums) {
+            if (sum.second.second > 0.0)
+                this->results_.additionalResults[sum.first] =
+                    sum.second.first / sum.second.second;
+        }
+    }
+
+  private:
+    std::vector<QuantLib::ext::shared_ptr<Engine>> workers_;
+    std::vector<std::uint32_t> offsets_;
+    std::function<void()> prepare_;
+};
+
+/**
+ * Builds an MC engine, split over sampling.nThreads workers when > 1.
+ *
+ * build(samples, tolerance, maxSamples, seed) returns a single-threaded
+ * engine; Null values mean "not set". Pseudo-random workers get seeds drawn
+ * from a Mersenne Twister seeded with sampling.seed; with sobolBlocks the
+ * workers share the seed and start at consecutive blocks of the sequence.
+ *
+ * The workers share process, which is warmed up before each calculation;
+ * nThreads > 1 is refused for processes that cannot be (see
+ * canWarmUpProcess()) and for Longstaff-Schwartz engines, whose calibrated
+ * exercise policy cannot be shared between workers.
+ */
+template <class Engine, class Build>
+QuantLib::ext::shared_ptr<Engine>
+makeParallelMcEngine(const McSampling& sampling, bool sobolBlocks, Build build,
+                     const QuantLib::ext::shared_ptr<QuantLib::StochasticProcess>& process) {
+    using QuantLib::Null;
+    using QuantLib::Real;
+    using QuantLib::Size;
+
+    if (sampling.nThreads <= 1)
+        return build(sampling.requiredSamples, sampling.requiredTolerance,
+                     sampling.maxSamples, sampling.seed);
+
+    QL_REQUIRE(!detail::isLsmEngine<Engine>,
+               "nThreads > 1 is not supported by Longstaff-Schwartz engines");
+    QL_REQUIRE(canWarmUpProcess(process),
+               "nThreads > 1 is not supported for this process: its term "
+               "structures cannot be prepared for concurrent reads");
+
+    const Size n = sampling.nThreads;
+    QL_REQUIRE(sampling.requiredSamples != Null<Size>() ||
+               sampling.requiredTolerance != Null<Real>(),
+               "nThreads > 1 requires requiredSamples or requiredTolerance");
+    QL_REQUIRE(sampling.requiredSamples == Null<Size>() ||
+               sampling.requiredSamples >= n,
+               "requiredSamples (" << sampling.requiredSamples
+               << ") must be at least nThreads (" << n << ")");
+
+    const QuantLib::BigNatural base =
+        sampling.seed != 0 ? sampling.seed
+                           : QuantLib::SeedGenerator::instance().get();
+    QuantLib::MersenneTwisterUniformRng seeder(base);
+
+    std::vector<QuantLib::ext::shared_ptr<Engine>> workers;
+    std::vector<std::uint32_t> offsets;
+    Size offset = 0;
+    for (Size i = 0; i < n; ++i) {
+        Size samples = Null<Size>();
+        if (sampling.requiredSamples != Null<Size>())
+            samples = sampling.requiredSamples / n +
+                      (i < sampling.requiredSamples % n ? 1 : 0);
+        const Real tolerance =
+            sampling.requiredTolerance == Null<Real>()
+                ? Null<Real>()
+                : sampling.requiredTolerance * std::sqrt(Real(n));
+        const Size maxSamples =
+            sampling.maxSamples == Null<Size>()
+                ? Null<Size>()
+                : (sampling.maxSamples + n - 1) / n;
+        QuantLib::BigNatural seed = base;
+        if (!sobolBlocks) {
+            seed = seeder.nextInt32();
+            if (seed == 0)
+                seed = 1;
+        }
+        workers.push_back(build(samples, tolerance, maxSamples, seed));
+        offsets.push_back(static_cast<std::uint32_t>(offset));
+        if (samples != Null<Size>())
+            offset += samples;
+    }
+    return QuantLib::ext::make_shared<ParallelMcEngine<Engine>>(
+        std::move(workers), std::move(offsets),
+        [process]() { warmUpProcess(process); });
+}
+
+/**
+ * makeParallelMcEngine for engines built through a QuantLib MakeMC* class.
+ * The maker must not have samples, tolerance, max samples or seed set.
+ */
+template <class Engine, class RNG, class Maker>
+QuantLib::ext::shared_ptr<QuantLib::PricingEngine>
+makeMcEngine(const Maker& maker, const McSampling& sampling,
+             const QuantLib::ext::shared_ptr<QuantLib::StochasticProcess>& process) {
+    constexpr bool sobolBlocks = std::is_same_v<RNG, BlockLowDiscrepancy>;
+    return makeParallelMcEngine<Engine>(
+        sampling, sobolBlocks,
+        [&maker](QuantLib::Size samples, QuantLib::Real tolerance,
+                 QuantLib::Size maxSamples, QuantLib::BigNatural seed) {
+            Maker m = maker;
+            if (samples != QuantLib::Null<QuantLib::Size>())
+                m.withSamples(samples);
+            if (tolerance != QuantLib::Null<QuantLib::Real>())
+                m.withAbsoluteTolerance(tolerance);
+            if (maxSamples != QuantLib::Null<QuantLib::Size>())
+                m.withMaxSamples(maxSamples);
+            if (seed != 0)
+                m.withSeed(seed);
+            auto engine = QuantLib::ext::dynamic_pointer_cast<Engine>(
+                QuantLib::ext::shared_ptr<QuantLib::PricingEngine>(m));
+            QL_REQUIRE(engine, "unexpected Monte Carlo engine type");
+            return engine;
+        },
+        process);
+}
+
+} // namespace pyquantlib
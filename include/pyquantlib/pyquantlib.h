@@ -15,6 +15,7 @@
 
 #include <pybind11/pybind11.h>
 #include "pyquantlib/binding_manager.h"
+#include "pyquantlib/date_vector.h"
 
 // PyQuantLib requires QuantLib built with std::shared_ptr.
 // See CONTRIBUTING.md § "QuantLib Build Requirements" for details.
@@ -57,6 +58,7 @@ namespace ql_patterns {
     void observable(py::module_&);
     void observer(py::module_&);
     void lazyobject(py::module_&);
+    void observablesettings(py::module_&);
 }
 
 namespace ql_utilities {
@@ -210,6 +212,8 @@ namespace ql_cashflows {
     void conundrumpricer(py::module_&);
     void overnightindexedcouponpricer(py::module_&);
     void averagebmacoupon(py::module_&);
+    void cashflowarrays(py::module_&);
+    void cashflows(py::module_&);
 }
 
 namespace ql_indexes {
@@ -324,6 +328,8 @@ namespace ql_termstructures {
     void andreasenhugelocalvoladapter(py::module_&);
     void compositezeroyieldstructure(py::module_&);
     void multicurve(py::module_&);
+    void curvebuilder(py::module_&);
+    void bucketedsensitivity(py::module_&);
     void globalbootstrap(py::module_&);
 }
 
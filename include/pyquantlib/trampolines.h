@@ -61,6 +61,12 @@ namespace py = pybind11;
 // NOTE: PYBIND11_OVERRIDE_PURE macros use a trailing comma after the function name
 // (e.g., `value,` instead of `value`). This is intentional — it prevents C++20
 // warnings about variadic macros when there are no function arguments.
+//
+// NOTE: Pricing entry points (Instrument.NPV, PricingEngine.calculate, greeks)
+// release the GIL. The PYBIND11_OVERRIDE* macros re-acquire it before looking
+// up the Python override, so a trampoline reached from a GIL-free calculation
+// is safe. Any hand-written code that calls into Python from a QuantLib
+// virtual must do the same with py::gil_scoped_acquire.
 
 // -----------------------------------------------------------------------------
 // Observer Trampoline
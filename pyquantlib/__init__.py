@@ -30,6 +30,9 @@ from .builders import MakeSwaption as MakeSwaption  # noqa: E402, F811
 from .builders import MakeVanillaSwap as MakeVanillaSwap  # noqa: E402, F811
 from .builders import MakeYoYInflationCapFloor as MakeYoYInflationCapFloor  # noqa: E402, F811
 
+# Pickle support for calendars and day counters (rebuilt by name)
+from . import _pickling as _pickling  # noqa: E402, F401
+
 
 # Helpers for readable Boost version
 def boost_version_tuple() -> tuple[int, int, int]:
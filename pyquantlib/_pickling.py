@@ -0,0 +1,202 @@
+"""
+Pickle support for calendars, day counters and currencies.
+
+Calendars, day counters and currencies are handles to shared
+implementations that QuantLib only identifies by name (or ISO code). They
+are pickled by name and rebuilt from a lookup table of the classes exported
+by the extension, so that ``pickle.loads`` returns e.g. a ``TARGET`` for a
+pickled ``TARGET()``. Day counters whose parameters do not show in their
+name (e.g. an ``ActualActual(ISMA)`` with a schedule) refuse to pickle.
+Value types, instruments and term structures define their own pickle
+support in the extension module.
+
+Installed on import of ``pyquantlib``; there is nothing to call.
+"""
+
+import functools
+
+from . import _pyquantlib as _ql
+
+# ---------------------------------------------------------------------------
+# Lookup tables
+# ---------------------------------------------------------------------------
+
+def _instances(base, enum_name):
+    """Yield (instance, factory, args) for every exported subclass of base.
+
+    Each class is tried with no arguments and with every member of its
+    nested enum (``Market`` or ``Convention``), if any. Constructors that
+    need other arguments are skipped.
+    """
+    for attr in dir(_ql):
+        cls = getattr(_ql, attr)
+        if not isinstance(cls, type) or not issubclass(cls, base) or cls is base:
+            continue
+        enum = getattr(cls, enum_name, None) if enum_name else None
+        candidates = [()]
+        if enum is not None:
+            candidates += [(value,) for value in enum.__members__.values()]
+        for args in candidates:
+            try:
+                instance = cls(*args)
+            except (TypeError, RuntimeError, ValueError):
+                continue
+            yield instance, cls, args
+
+
+@functools.cache
+def _calendar_table():
+    table = {}
+    for cal, cls, args in _instances(_ql.Calendar, "Market"):
+        if cls in (_ql.BespokeCalendar, _ql.JointCalendar) or cal.empty():
+            continue
+        table.setdefault(cal.name(), (cls, args))
+    return table
+
+
+@functools.cache
+def _day_counter_table():
+    table = {}
+    for dc, cls, args in _instances(_ql.DayCounter, "Convention"):
+        if cls is _ql.Business252 or dc.empty():
+            continue
+        table.setdefault(dc.name(), (cls, args))
+    return table
+
+
+def _split_names(names):
+    """Split 'A, B(C, D), E' at top-level commas."""
+    parts, depth, start = [], 0, 0
+    for i, ch in enumerate(names):
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(names[start:i].strip())
+            start = i + 1
+    parts.append(names[start:].strip())
+    return parts
+
+
+@functools.cache
+def _currency_table():
+    table = {}
+    for ccy, cls, args in _instances(_ql.Currency, None):
+        if ccy.empty():
+            continue
+        table.setdefault(ccy.code(), (cls, args))
+    return table
+
+
+# ---------------------------------------------------------------------------
+# Calendar
+# ---------------------------------------------------------------------------
+
+_JOINT_RULES = {
+    "JoinHolidays": _ql.JointCalendarRule.JoinHolidays,
+    "JoinBusinessDays": _ql.JointCalendarRule.JoinBusinessDays,
+}
+
+
+def _calendar_from_name(name):
+    entry = _calendar_table().get(name)
+    if entry is not None:
+        cls, args = entry
+        return cls(*args)
+    for prefix, rule in _JOINT_RULES.items():
+        if name.startswith(prefix + "(") and name.endswith(")"):
+            parts = _split_names(name[len(prefix) + 1:-1])
+            return _ql.JointCalendar([_calendar_from_name(p) for p in parts], rule)
+    return None
+
+
+def _calendar(name, added, removed, weekends=None):
+    """Rebuild a pickled calendar."""
+    if name is None:
+        return _ql.Calendar()
+    if weekends is not None:
+        cal = _ql.BespokeCalendar(name)
+        for w in weekends:
+            cal.addWeekend(w)
+    else:
+        cal = _calendar_from_name(name)
+        if cal is None:
+            raise ValueError(f"unknown calendar {name!r}")
+    for d in added:
+        cal.addHoliday(d)
+    for d in removed:
+        cal.removeHoliday(d)
+    return cal
+
+
+def _reduce_calendar(cal):
+    if cal.empty():
+        return _calendar, (None, [], [])
+    name = cal.name()
+    added = sorted(cal.addedHolidays())
+    removed = sorted(cal.removedHolidays())
+    if _calendar_from_name(name) is None:
+        # Bespoke calendar: keep its weekend days as well
+        weekends = [w for w in _ql.Weekday.__members__.values() if cal.isWeekend(w)]
+        return _calendar, (name, added, removed, weekends)
+    return _calendar, (name, added, removed)
+
+
+# ---------------------------------------------------------------------------
+# DayCounter
+# ---------------------------------------------------------------------------
+
+def _day_counter(name):
+    """Rebuild a pickled day counter."""
+    if name is None:
+        return _ql.DayCounter()
+    entry = _day_counter_table().get(name)
+    if entry is not None:
+        cls, args = entry
+        return cls(*args)
+    if name.startswith("Business/252(") and name.endswith(")"):
+        cal = _calendar_from_name(name[len("Business/252("):-1])
+        if cal is not None:
+            return _ql.Business252(cal)
+    raise ValueError(f"unknown day counter {name!r}")
+
+
+def _reduce_day_counter(dc):
+    if dc.empty():
+        return _day_counter, (None,)
+    name = dc.name()
+    try:
+        rebuilt = _day_counter(name)
+    except ValueError:
+        rebuilt = None
+    if rebuilt is None or not dc._sameConventions(rebuilt):
+        # e.g. ActualActual(ISMA) with a schedule, or a Business252 on a
+        # calendar that cannot be rebuilt
+        raise TypeError(f"cannot pickle day counter {name!r}: its parameters "
+                        "cannot be recovered from its name")
+    return _day_counter, (name,)
+
+
+# ---------------------------------------------------------------------------
+# Currency
+# ---------------------------------------------------------------------------
+
+def _currency(code):
+    """Rebuild a pickled currency."""
+    if code is None:
+        return _ql.Currency()
+    entry = _currency_table().get(code)
+    if entry is None:
+        raise ValueError(f"unknown currency {code!r}")
+    cls, args = entry
+    return cls(*args)
+
+
+def _reduce_currency(ccy):
+    return _currency, (None if ccy.empty() else ccy.code(),)
+
+
+_ql.Calendar.__reduce__ = _reduce_calendar
+_ql.DayCounter.__reduce__ = _reduce_day_counter
+_ql.Currency.__reduce__ = _reduce_currency
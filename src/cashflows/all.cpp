@@ -33,6 +33,8 @@ DECLARE_MODULE_BINDINGS(cashflows_bindings) {
         "OvernightIndexedCoupon, OvernightLeg");
     ADD_MAIN_BINDING(ql_cashflows::duration,
         "Duration::Type enum");
+    ADD_MAIN_BINDING(ql_cashflows::cashflows,
+        "CashFlows");
 
     ADD_BASE_BINDING(ql_cashflows::cmscouponpricer,
         "CmsCouponPricer, MeanRevertingPricer ABCs");
@@ -80,4 +82,7 @@ DECLARE_MODULE_BINDINGS(cashflows_bindings) {
 
     ADD_MAIN_BINDING(ql_cashflows::averagebmacoupon,
         "AverageBMACoupon, AverageBMALeg");
+
+    ADD_MAIN_BINDING(ql_cashflows::cashflowarrays,
+        "leg_to_arrays");
 }
@@ -0,0 +1,143 @@
+/*
+ * PyQuantLib: Python bindings for QuantLib
+ * https://github.com/quantales/pyquantlib
+ *
+ * Copyright (c) 2025 Yassine Idyiahia
+ * SPDX-License-Identifier: BSD-3-Clause
+ * See LICENSE for details.
+ *
+ * ---
+ * QuantLib is Copyright (c) 2000-2025 The QuantLib Authors
+ * https://www.quantlib.org/
+ */
+
+#include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
+#include <ql/cashflow.hpp>
+#include <ql/cashflows/coupon.hpp>
+#include <ql/cashflows/floatingratecoupon.hpp>
+#include <ql/cashflows/overnightindexedcoupon.hpp>
+#include <ql/instruments/bond.hpp>
+#include <ql/instruments/swap.hpp>
+#include <ql/settings.hpp>
+#include <ql/termstructures/yieldtermstructure.hpp>
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <pybind11/stl.h>
+#include <algorithm>
+#include <cstdint>
+#include <limits>
+#include <vector>
+
+namespace py = pybind11;
+using namespace QuantLib;
+
+namespace {
+
+    using pyquantlib::to_numpy;
+
+    // True if the coupon needs a past fixing that its index does not have.
+    // Other errors (no pricer, a broken curve) are not masked.
+    bool missesFixing(const FloatingRateCoupon& coupon) {
+        const Date today = Settings::instance().evaluationDate();
+        const bool enforce = Settings::instance().enforcesTodaysHistoricFixings();
+        const auto& index = coupon.index();
+        auto missing = [&](const Date& d) {
+            return (d < today || (d == today && enforce)) &&
+                   !index->hasHistoricalFixing(d);
+        };
+        if (const auto* on = dynamic_cast<const OvernightIndexedCoupon*>(&coupon)) {
+            const auto& dates = on->fixingDates();
+            return std::any_of(dates.begin(), dates.end(), missing);
+        }
+        return missing(coupon.fixingDate());
+    }
+
+    // Reads every cash flow once, with the GIL released, and returns the
+    // columns as NumPy arrays. Fields that do not apply to a cash flow
+    // (accrual dates of a redemption, spread of a fixed coupon, ...) are
+    // NaT or NaN, as are amounts and rates of coupons missing a past fixing.
+    py::dict legToArrays(const Leg& leg,
+                         const ext::shared_ptr<YieldTermStructure>& curve) {
+        const Real nan = std::numeric_limits<Real>::quiet_NaN();
+        const std::size_t n = leg.size();
+        std::vector<std::int64_t> date, accrualStart, accrualEnd, fixingDate;
+        std::vector<double> amount, nominal, rate, spread, gearing, discount;
+        for (auto* v : {&date, &accrualStart, &accrualEnd, &fixingDate})
+            v->reserve(n);
+        for (auto* v : {&amount, &nominal, &rate, &spread, &gearing, &discount})
+            v->reserve(n);
+
+        {
+            py::gil_scoped_release release;
+            const Date referenceDate = curve ? curve->referenceDate() : Date();
+            for (const auto& cf : leg) {
+                QL_REQUIRE(cf, "null cash flow");
+                const Date d = cf->date();
+                date.push_back(d.serialNumber());
+                auto floating = ext::dynamic_pointer_cast<FloatingRateCoupon>(cf);
+                const bool missing = floating && missesFixing(*floating);
+                amount.push_back(missing ? nan : cf->amount());
+
+                auto coupon = ext::dynamic_pointer_cast<Coupon>(cf);
+                accrualStart.push_back(coupon ? coupon->accrualStartDate().serialNumber() : 0);
+                accrualEnd.push_back(coupon ? coupon->accrualEndDate().serialNumber() : 0);
+                nominal.push_back(coupon ? coupon->nominal() : nan);
+                rate.push_back(coupon && !missing ? coupon->rate() : nan);
+
+                fixingDate.push_back(floating ? floating->fixingDate().serialNumber() : 0);
+                spread.push_back(floating ? floating->spread() : nan);
+                gearing.push_back(floating ? floating->gearing() : nan);
+
+                if (curve)
+                    discount.push_back(d >= referenceDate ? curve->discount(d) : nan);
+            }
+        }
+
+        py::dict result;
+        result["date"] = pyquantlib::datetime64_from_serials(date);
+        result["amount"] = to_numpy(amount);
+        result["accrualStartDate"] = pyquantlib::datetime64_from_serials(accrualStart);
+        result["accrualEndDate"] = pyquantlib::datetime64_from_serials(accrualEnd);
+        result["nominal"] = to_numpy(nominal);
+        result["rate"] = to_numpy(rate);
+        result["fixingDate"] = pyquantlib::datetime64_from_serials(fixingDate);
+        result["spread"] = to_numpy(spread);
+        result["gearing"] = to_numpy(gearing);
+        if (curve)
+            result["discount"] = to_numpy(discount);
+        return result;
+    }
+}
+
+void ql_cashflows::cashflowarrays(py::module_& m) {
+    m.def("leg_to_arrays",
+        &legToArrays,
+        py::arg("leg"), py::arg("curve") = ext::shared_ptr<YieldTermStructure>(),
+        "Returns the cash flows of a leg as a dict of NumPy columns: date, "
+        "amount, accrualStartDate, accrualEndDate, nominal, rate, fixingDate, "
+        "spread, gearing and, when a curve is given, discount. Dates are "
+        "datetime64[D]; fields that do not apply to a cash flow are NaT or NaN, "
+        "as are amounts and rates of coupons missing a past fixing and "
+        "discount factors for flows before the curve reference "
+        "date.");
+
+    m.def("leg_to_arrays",
+        [](const Bond& bond, const ext::shared_ptr<YieldTermStructure>& curve) {
+            return legToArrays(bond.cashflows(), curve);
+        },
+        py::arg("bond"), py::arg("curve") = ext::shared_ptr<YieldTermStructure>(),
+        "Returns the cash flows of a bond as a dict of NumPy columns.");
+
+    m.def("leg_to_arrays",
+        [](const Swap& swap, Size legIndex,
+           const ext::shared_ptr<YieldTermStructure>& curve) {
+            QL_REQUIRE(legIndex < swap.legs().size(),
+                       "leg index (" << legIndex << ") out of range [0-"
+                       << swap.legs().size() - 1 << "]");
+            return legToArrays(swap.leg(legIndex), curve);
+        },
+        py::arg("swap"), py::arg("legIndex"),
+        py::arg("curve") = ext::shared_ptr<YieldTermStructure>(),
+        "Returns the cash flows of a swap leg as a dict of NumPy columns.");
+}
@@ -0,0 +1,255 @@
+/*
+ * PyQuantLib: Python bindings for QuantLib
+ * https://github.com/quantales/pyquantlib
+ *
+ * Copyright (c) 2025 Yassine Idyiahia
+ * SPDX-License-Identifier: BSD-3-Clause
+ * See LICENSE for details.
+ *
+ * ---
+ * QuantLib is Copyright (c) 2000-2025 The QuantLib Authors
+ * https://www.quantlib.org/
+ */
+
+#include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
+#include "pyquantlib/parallel.h"
+#include <ql/cashflows/cashflows.hpp>
+#include <ql/termstructures/yieldtermstructure.hpp>
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <pybind11/stl.h>
+#include <limits>
+#include <vector>
+
+namespace py = pybind11;
+using namespace QuantLib;
+
+namespace {
+
+    using pyquantlib::to_numpy;
+
+    py::dict curveAnalytics(const std::vector<Leg>& legs,
+                            const YieldTermStructure& discountCurve,
+                            bool includeSettlementDateFlows,
+                            const Date& settlementDate, const Date& npvDate,
+                            Size nThreads) {
+        const std::size_t n = legs.size();
+        std::vector<double> npv(n), bps(n), accrued(n);
+        {
+            py::gil_scoped_release release;
+            // Shared curve and coupons: calculate them before the workers
+            // start.
+            discountCurve.discount(0.0, true);
+            const Size threads = pyquantlib::threadsForLegs(
+                n, nThreads, [&](std::size_t i) -> const Leg& { return legs[i]; });
+            pyquantlib::parallelFor(n, threads, [&](std::size_t i) {
+                npv[i] = CashFlows::npv(legs[i], discountCurve,
+                                        includeSettlementDateFlows,
+                                        settlementDate, npvDate);
+                bps[i] = CashFlows::bps(legs[i], discountCurve,
+                                        includeSettlementDateFlows,
+                                        settlementDate, npvDate);
+                accrued[i] = CashFlows::accruedAmount(
+                    legs[i], includeSettlementDateFlows, settlementDate);
+            });
+        }
+        py::dict result;
+        result["npv"] = to_numpy(npv);
+        result["bps"] = to_numpy(bps);
+        result["accruedAmount"] = to_numpy(accrued);
+        return result;
+    }
+
+    py::dict yieldAnalytics(const std::vector<Leg>& legs,
+                            const pyquantlib::DoubleArray& yields,
+                            const DayCounter& dayCounter,
+                            Compounding compounding, Frequency frequency,
+                            bool includeSettlementDateFlows,
+                            const Date& settlementDate, const Date& npvDate,
+                            Size nThreads) {
+        const std::size_t n = legs.size();
+        const auto y = pyquantlib::per_item(yields, n, "yields");
+        std::vector<double> npv(n), bps(n), modified(n), macaulay(n),
+            convexity(n), accrued(n);
+        {
+            py::gil_scoped_release release;
+            const Size threads = pyquantlib::threadsForLegs(
+                n, nThreads, [&](std::size_t i) -> const Leg& { return legs[i]; });
+            pyquantlib::parallelFor(n, threads, [&](std::size_t i) {
+                const InterestRate rate(y[i], dayCounter, compounding, frequency);
+                npv[i] = CashFlows::npv(legs[i], rate, includeSettlementDateFlows,
+                                        settlementDate, npvDate);
+                bps[i] = CashFlows::bps(legs[i], rate, includeSettlementDateFlows,
+                                        settlementDate, npvDate);
+                modified[i] = CashFlows::duration(
+                    legs[i], rate, Duration::Modified,
+                    includeSettlementDateFlows, settlementDate, npvDate);
+                // Macaulay duration is only defined for compounded rates.
+                macaulay[i] = compounding == Compounded
+                    ? CashFlows::duration(legs[i], rate, Duration::Macaulay,
+                                          includeSettlementDateFlows,
+                                          settlementDate, npvDate)
+                    : std::numeric_limits<double>::quiet_NaN();
+                convexity[i] = CashFlows::convexity(
+                    legs[i], rate, includeSettlementDateFlows, settlementDate,
+                    npvDate);
+                accrued[i] = CashFlows::accruedAmount(
+                    legs[i], includeSettlementDateFlows, settlementDate);
+            });
+        }
+        py::dict result;
+        result["npv"] = to_numpy(npv);
+        result["bps"] = to_numpy(bps);
+        result["modifiedDuration"] = to_numpy(modified);
+        result["macaulayDuration"] = to_numpy(macaulay);
+        result["convexity"] = to_numpy(convexity);
+        result["accruedAmount"] = to_numpy(accrued);
+        return result;
+    }
+
+    py::tuple yieldRates(const std::vector<Leg>& legs,
+                         const pyquantlib::DoubleArray& npvs,
+                         const DayCounter& dayCounter, Compounding compounding,
+                         Frequency frequency, bool includeSettlementDateFlows,
+                         const Date& settlementDate, const Date& npvDate,
+                         Real accuracy, Size maxIterations, Rate guess,
+                         Size nThreads) {
+        const std::size_t n = legs.size();
+        const auto target = pyquantlib::per_item(npvs, n, "npvs");
+        std::vector<double> yields(n);
+        py::array_t<bool> failed(static_cast<py::ssize_t>(n));
+        bool* f = failed.mutable_data();
+        {
+            py::gil_scoped_release release;
+            const Size threads = pyquantlib::threadsForLegs(
+                n, nThreads, [&](std::size_t i) -> const Leg& { return legs[i]; });
+            pyquantlib::parallelFor(n, threads, [&](std::size_t i) {
+                try {
+                    yields[i] = CashFlows::yield(
+                        legs[i], target[i], dayCounter, compounding, frequency,
+                        includeSettlementDateFlows, settlementDate, npvDate,
+                        accuracy, maxIterations, guess);
+                    f[i] = false;
+                } catch (const std::exception&) {
+                    yields[i] = std::numeric_limits<double>::quiet_NaN();
+                    f[i] = true;
+                }
+            });
+        }
+        return py::make_tuple(to_numpy(yields), failed);
+    }
+}
+
+void ql_cashflows::cashflows(py::module_& m) {
+    py::class_<CashFlows>(m, "CashFlows",
+        "Static cash flow analytics on legs.")
+        // Date inspectors
+        .def_static("startDate", &CashFlows::startDate,
+            py::arg("leg"), "Earliest accrual start or payment date.")
+        .def_static("maturityDate", &CashFlows::maturityDate,
+            py::arg("leg"), "Latest accrual end or payment date.")
+        .def_static("accruedAmount", &CashFlows::accruedAmount,
+            py::arg("leg"), py::arg("includeSettlementDateFlows"),
+            py::arg("settlementDate") = Date(),
+            "Accrued amount at the settlement date.")
+        // Discount curve analytics
+        .def_static("npv",
+            static_cast<Real (*)(const Leg&, const YieldTermStructure&, bool,
+                                 Date, Date)>(&CashFlows::npv),
+            py::arg("leg"), py::arg("discountCurve"),
+            py::arg("includeSettlementDateFlows"),
+            py::arg("settlementDate") = Date(), py::arg("npvDate") = Date(),
+            "NPV of the leg on a discount curve.")
+        .def_static("bps",
+            static_cast<Real (*)(const Leg&, const YieldTermStructure&, bool,
+                                 Date, Date)>(&CashFlows::bps),
+            py::arg("leg"), py::arg("discountCurve"),
+            py::arg("includeSettlementDateFlows"),
+            py::arg("settlementDate") = Date(), py::arg("npvDate") = Date(),
+            "Basis-point sensitivity of the leg on a discount curve.")
+        // Yield analytics
+        .def_static("npv",
+            static_cast<Real (*)(const Leg&, Rate, const DayCounter&,
+                                 Compounding, Frequency, bool, Date, Date)>(
+                &CashFlows::npv),
+            py::arg("leg"), py::arg("yield"), py::arg("dayCounter"),
+            py::arg("compounding"), py::arg("frequency"),
+            py::arg("includeSettlementDateFlows"),
+            py::arg("settlementDate") = Date(), py::arg("npvDate") = Date(),
+            "NPV of the leg at a flat yield.")
+        .def_static("bps",
+            static_cast<Real (*)(const Leg&, Rate, const DayCounter&,
+                                 Compounding, Frequency, bool, Date, Date)>(
+                &CashFlows::bps),
+            py::arg("leg"), py::arg("yield"), py::arg("dayCounter"),
+            py::arg("compounding"), py::arg("frequency"),
+            py::arg("includeSettlementDateFlows"),
+            py::arg("settlementDate") = Date(), py::arg("npvDate") = Date(),
+            "Basis-point sensitivity of the leg at a flat yield.")
+        .def_static("yieldRate",
+            static_cast<Rate (*)(const Leg&, Real, const DayCounter&,
+                                 Compounding, Frequency, bool, Date, Date,
+                                 Real, Size, Rate)>(&CashFlows::yield),
+            py::arg("leg"), py::arg("npv"), py::arg("dayCounter"),
+            py::arg("compounding"), py::arg("frequency"),
+            py::arg("includeSettlementDateFlows"),
+            py::arg("settlementDate") = Date(), py::arg("npvDate") = Date(),
+            py::arg("accuracy") = 1.0e-10, py::arg("maxIterations") = 100,
+            py::arg("guess") = 0.05,
+            "Yield (IRR) giving the target NPV.")
+        .def_static("duration",
+            static_cast<Time (*)(const Leg&, Rate, const DayCounter&,
+                                 Compounding, Frequency, Duration::Type, bool,
+                                 Date, Date)>(&CashFlows::duration),
+            py::arg("leg"), py::arg("yield"), py::arg("dayCounter"),
+            py::arg("compounding"), py::arg("frequency"), py::arg("type"),
+            py::arg("includeSettlementDateFlows"),
+            py::arg("settlementDate") = Date(), py::arg("npvDate") = Date(),
+            "Duration of the leg at a flat yield.")
+        .def_static("convexity",
+            static_cast<Real (*)(const Leg&, Rate, const DayCounter&,
+                                 Compounding, Frequency, bool, Date, Date)>(
+                &CashFlows::convexity),
+            py::arg("leg"), py::arg("yield"), py::arg("dayCounter"),
+            py::arg("compounding"), py::arg("frequency"),
+            py::arg("includeSettlementDateFlows"),
+            py::arg("settlementDate") = Date(), py::arg("npvDate") = Date(),
+            "Convexity of the leg at a flat yield.")
+        // Batch analytics
+        .def_static("analytics",
+            &curveAnalytics,
+            py::arg("legs"), py::arg("discountCurve"),
+            py::arg("includeSettlementDateFlows") = true,
+            py::arg("settlementDate") = Date(), py::arg("npvDate") = Date(),
+            py::kw_only(), py::arg("nThreads") = 1,
+            "NPV, BPS and accrued amount of many legs on a shared discount "
+            "curve, as a dict of arrays. Computed without the GIL, on up to "
+            "nThreads threads. The curve and the coupon amounts are computed "
+            "on the calling thread first; if a leg holds a cash flow whose "
+            "amount cannot be cached or computed, all legs are evaluated on "
+            "the calling thread.")
+        .def_static("yieldAnalytics",
+            &yieldAnalytics,
+            py::arg("legs"), py::arg("yields"), py::arg("dayCounter"),
+            py::arg("compounding"), py::arg("frequency"),
+            py::arg("includeSettlementDateFlows") = true,
+            py::arg("settlementDate") = Date(), py::arg("npvDate") = Date(),
+            py::kw_only(), py::arg("nThreads") = 1,
+            "NPV, BPS, modified and Macaulay duration, convexity and accrued "
+            "amount of many legs at a shared yield or one yield per leg, as a "
+            "dict of arrays. Macaulay duration is NaN unless compounding is "
+            "Compounded. Threads are used as in analytics().")
+        .def_static("yieldRates",
+            &yieldRates,
+            py::arg("legs"), py::arg("npvs"), py::arg("dayCounter"),
+            py::arg("compounding"), py::arg("frequency"),
+            py::arg("includeSettlementDateFlows") = true,
+            py::arg("settlementDate") = Date(), py::arg("npvDate") = Date(),
+            py::arg("accuracy") = 1.0e-10, py::arg("maxIterations") = 100,
+            py::arg("guess") = 0.05,
+            py::kw_only(), py::arg("nThreads") = 1,
+            "Yields giving the target NPVs of many legs. Returns (yields, "
+            "failed); legs whose solve fails are NaN and flagged True. Threads "
+            "are used as in analytics().");
+}
@@ -32,18 +32,42 @@ void ql_core::exercise(py::module_& m) {
         m, "EuropeanExercise", "European-style exercise (single date).")
         .def(py::init<const Date&>(),
             py::arg("date"),
-            "Constructs with the exercise date.");
+            "Constructs with the exercise date.")
+        .def(py::pickle(
+            [](const EuropeanExercise& e) {
+                return py::make_tuple(e.lastDate());
+            },
+            [](const py::tuple& state) {
+                return ext::make_shared<EuropeanExercise>(state[0].cast<Date>());
+            }));
 
     py::class_<AmericanExercise, Exercise, ext::shared_ptr<AmericanExercise>>(
         m, "AmericanExercise", "American-style exercise (date range).")
         .def(py::init<const Date&, const Date&, bool>(),
             py::arg("earliestDate"), py::arg("latestDate"),
             py::arg("payoffAtExpiry") = false,
-            "Constructs with earliest and latest exercise dates.");
+            "Constructs with earliest and latest exercise dates.")
+        .def(py::pickle(
+            [](const AmericanExercise& e) {
+                return py::make_tuple(e.date(0), e.lastDate(), e.payoffAtExpiry());
+            },
+            [](const py::tuple& state) {
+                return ext::make_shared<AmericanExercise>(
+                    state[0].cast<Date>(), state[1].cast<Date>(),
+                    state[2].cast<bool>());
+            }));
 
     py::class_<BermudanExercise, Exercise, ext::shared_ptr<BermudanExercise>>(
         m, "BermudanExercise", "Bermudan-style exercise (discrete dates).")
         .def(py::init<const std::vector<Date>&>(),
             py::arg("dates"),
-            "Constructs with a list of exercise dates.");
+            "Constructs with a list of exercise dates.")
+        .def(py::pickle(
+            [](const BermudanExercise& e) {
+                return py::make_tuple(e.dates(), e.payoffAtExpiry());
+            },
+            [](const py::tuple& state) {
+                return ext::make_shared<BermudanExercise>(
+                    state[0].cast<std::vector<Date>>(), state[1].cast<bool>());
+            }));
 }
@@ -25,7 +25,11 @@ void ql_core::instrument(py::module_& m) {
         "Abstract base class for financial instruments.")
         .def(py::init_alias<>())
         .def("NPV", &Instrument::NPV,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns the net present value of the instrument.")
+        .def("errorEstimate", &Instrument::errorEstimate,
+            py::call_guard<py::gil_scoped_release>(),
+            "Returns the error estimate on the NPV, if the engine provides one.")
         .def("isExpired", &Instrument::isExpired,
             "Returns true if the instrument has expired.")
         .def("setPricingEngine", &Instrument::setPricingEngine,
@@ -37,5 +41,7 @@ void ql_core::instrument(py::module_& m) {
         "Results from instrument valuation.")
         .def(py::init<>())
         .def_readwrite("value", &Instrument::results::value,
-            "The calculated NPV.");
+            "The calculated NPV.")
+        .def_readwrite("errorEstimate", &Instrument::results::errorEstimate,
+            "The error estimate on the NPV.");
 }
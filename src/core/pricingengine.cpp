@@ -33,6 +33,7 @@ void ql_core::pricingengine(py::module_& m) {
         .def("reset", &PricingEngine::reset,
             "Resets the engine results.")
         .def("calculate", &PricingEngine::calculate,
+            py::call_guard<py::gil_scoped_release>(),
             "Performs the calculation.");
 
     py::class_<PricingEngine::arguments, PyPricingEngineArguments,
@@ -15,45 +15,160 @@
 #include <ql/settings.hpp>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <optional>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
+namespace {
+
+// SavedSettings restores in its destructor, which Python cannot trigger
+// deterministically; holding it in an optional lets __exit__ restore.
+class PySavedSettings {
+  public:
+    PySavedSettings() : saved_(std::in_place) {}
+    void restore() { saved_.reset(); }
+
+  private:
+    std::optional<SavedSettings> saved_;
+};
+
+// Applies the given settings on entry and restores the previous ones on
+// exit. Settings is per-thread when QuantLib is built with sessions.
+class SettingsContext {
+  public:
+    SettingsContext(std::optional<Date> evaluationDate,
+                    std::optional<bool> includeReferenceDateEvents,
+                    std::optional<bool> includeTodaysCashFlows,
+                    std::optional<bool> enforcesTodaysHistoricFixings)
+    : evaluationDate_(evaluationDate),
+      includeReferenceDateEvents_(includeReferenceDateEvents),
+      includeTodaysCashFlows_(includeTodaysCashFlows),
+      enforcesTodaysHistoricFixings_(enforcesTodaysHistoricFixings) {}
+
+    void enter() {
+        QL_REQUIRE(!saved_, "settings context already entered");
+        saved_.emplace();
+        Settings& settings = Settings::instance();
+        if (evaluationDate_)
+            settings.evaluationDate() = *evaluationDate_;
+        if (includeReferenceDateEvents_)
+            settings.includeReferenceDateEvents() = *includeReferenceDateEvents_;
+        if (includeTodaysCashFlows_)
+            settings.includeTodaysCashFlows() = *includeTodaysCashFlows_;
+        if (enforcesTodaysHistoricFixings_)
+            settings.enforcesTodaysHistoricFixings() = *enforcesTodaysHistoricFixings_;
+    }
+
+    void exit() { saved_.reset(); }
+
+  private:
+    std::optional<Date> evaluationDate_;
+    std::optional<bool> includeReferenceDateEvents_;
+    std::optional<bool> includeTodaysCashFlows_;
+    std::optional<bool> enforcesTodaysHistoricFixings_;
+    std::optional<SavedSettings> saved_;
+};
+
+}  // namespace
+
 void ql_core::settings(py::module_& m) {
+    // Properties go through Settings::instance() rather than `self` so that
+    // the exported ql.Settings object follows the calling thread's instance
+    // when QuantLib is built with QL_ENABLE_SESSIONS.
     py::class_<Settings, std::unique_ptr<Settings, py::nodelete>>(m, "Settings",
         "Global repository for run-time library settings.")
         .def_static("instance", &Settings::instance, py::return_value_policy::reference,
             "Returns the singleton instance.")
         .def_property("evaluationDate",
-            [](const Settings& self) { return static_cast<Date>(self.evaluationDate()); },
-            [](Settings& self, const Date& d) { self.evaluationDate() = d; },
+            [](const Settings&) {
+                return static_cast<Date>(Settings::instance().evaluationDate());
+            },
+            [](Settings&, const Date& d) { Settings::instance().evaluationDate() = d; },
             "The evaluation date for pricing calculations.")
         .def("setEvaluationDate",
-            [](Settings& self, const Date& d) { self.evaluationDate() = d; },
+            [](Settings&, const Date& d) { Settings::instance().evaluationDate() = d; },
             py::arg("date"),
             "Sets the evaluation date.")
-        .def("anchorEvaluationDate", &Settings::anchorEvaluationDate,
+        .def("anchorEvaluationDate",
+            [](Settings&) { Settings::instance().anchorEvaluationDate(); },
             "Prevents the evaluation date from advancing automatically.")
-        .def("resetEvaluationDate", &Settings::resetEvaluationDate,
+        .def("resetEvaluationDate",
+            [](Settings&) { Settings::instance().resetEvaluationDate(); },
             "Resets the evaluation date to today and allows automatic advancement.")
         .def_property("includeReferenceDateEvents",
-            [](const Settings& self) { return self.includeReferenceDateEvents(); },
-            [](Settings& self, bool value) { self.includeReferenceDateEvents() = value; },
+            [](const Settings&) {
+                return Settings::instance().includeReferenceDateEvents();
+            },
+            [](Settings&, bool value) {
+                Settings::instance().includeReferenceDateEvents() = value;
+            },
             "Whether events on the reference date are included.")
         .def_property("includeTodaysCashFlows",
-            [](const Settings& self) { return self.includeTodaysCashFlows(); },
-            [](Settings& self, const std::optional<bool>& value) {
-                self.includeTodaysCashFlows() = value;
+            [](const Settings&) { return Settings::instance().includeTodaysCashFlows(); },
+            [](Settings&, const std::optional<bool>& value) {
+                Settings::instance().includeTodaysCashFlows() = value;
             },
             "Whether to include today's cash flows (optional).")
         .def_property("enforcesTodaysHistoricFixings",
-            [](const Settings& self) { return self.enforcesTodaysHistoricFixings(); },
-            [](Settings& self, bool value) { self.enforcesTodaysHistoricFixings() = value; },
+            [](const Settings&) {
+                return Settings::instance().enforcesTodaysHistoricFixings();
+            },
+            [](Settings&, bool value) {
+                Settings::instance().enforcesTodaysHistoricFixings() = value;
+            },
             "Whether to enforce historic fixings for today.");
 
-    py::class_<SavedSettings>(m, "SavedSettings",
+    py::class_<PySavedSettings>(m, "SavedSettings",
         "Temporarily stores and restores global settings.")
-        .def(py::init<>())
-        .def("__enter__", [](SavedSettings& self) -> SavedSettings& { return self; })
-        .def("__exit__", [](SavedSettings&, py::object, py::object, py::object) {});
+        .def(py::init<>(),
+            "Saves the current settings.")
+        .def("restore", &PySavedSettings::restore,
+            "Restores the saved settings (at most once).")
+        .def("__enter__", [](PySavedSettings& self) -> PySavedSettings& { return self; })
+        .def("__exit__", [](PySavedSettings& self, py::object, py::object, py::object) {
+            self.restore();
+        });
+
+    py::class_<SettingsContext>(m, "SettingsContext",
+        "Context manager applying settings on entry and restoring them on exit.\n\n"
+        "Settings are per-thread when QuantLib is built with QL_ENABLE_SESSIONS "
+        "(see QL_ENABLE_SESSIONS); otherwise they are process-wide.")
+        .def(py::init<std::optional<Date>, std::optional<bool>,
+                      std::optional<bool>, std::optional<bool>>(),
+            py::kw_only(),
+            py::arg("evaluationDate") = py::none(),
+            py::arg("includeReferenceDateEvents") = py::none(),
+            py::arg("includeTodaysCashFlows") = py::none(),
+            py::arg("enforcesTodaysHistoricFixings") = py::none(),
+            "Creates a context; None leaves the corresponding setting unchanged.")
+        .def("__enter__", [](SettingsContext& self) -> SettingsContext& {
+                self.enter();
+                return self;
+            })
+        .def("__exit__", [](SettingsContext& self, py::object, py::object, py::object) {
+            self.exit();
+        });
+
+    m.def("settings_context",
+        [](std::optional<Date> evaluationDate,
+           std::optional<bool> includeReferenceDateEvents,
+           std::optional<bool> includeTodaysCashFlows,
+           std::optional<bool> enforcesTodaysHistoricFixings) {
+            return SettingsContext(evaluationDate, includeReferenceDateEvents,
+                                   includeTodaysCashFlows,
+                                   enforcesTodaysHistoricFixings);
+        },
+        py::kw_only(),
+        py::arg("evaluationDate") = py::none(),
+        py::arg("includeReferenceDateEvents") = py::none(),
+        py::arg("includeTodaysCashFlows") = py::none(),
+        py::arg("enforcesTodaysHistoricFixings") = py::none(),
+        "Returns a SettingsContext for use in a with-statement.");
+
+#ifdef QL_ENABLE_SESSIONS
+    m.attr("QL_ENABLE_SESSIONS") = true;
+#else
+    m.attr("QL_ENABLE_SESSIONS") = false;
+#endif
 }
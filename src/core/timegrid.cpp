@@ -12,15 +12,18 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/timegrid.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
 void ql_core::timegrid(py::module_& m) {
-    py::class_<TimeGrid>(m, "TimeGrid", "Time grid for discretized models.")
+    py::class_<TimeGrid>(m, "TimeGrid", py::buffer_protocol(),
+        "Time grid for discretized models.")
         .def(py::init<>(),
             "Default constructor.")
         .def(py::init<Time, Size>(),
@@ -68,5 +71,23 @@ void ql_core::timegrid(py::module_& m) {
             py::arg("i"))
         .def("__iter__", [](const TimeGrid& tg) {
                 return py::make_iterator(tg.begin(), tg.end());
-            }, py::keep_alive<0, 1>());
+            }, py::keep_alive<0, 1>())
+        .def_property_readonly("times",
+            [](py::object self) {
+                const auto& tg = self.cast<const TimeGrid&>();
+                return pyquantlib::view_of(tg.empty() ? nullptr : &tg[0],
+                                           tg.size(), self, false);
+            },
+            "Read-only NumPy view of the grid times, keeping the grid alive.")
+        .def_buffer([](const TimeGrid& tg) -> py::buffer_info {
+            return py::buffer_info(
+                tg.empty() ? nullptr : const_cast<Time*>(&tg[0]),
+                static_cast<py::ssize_t>(sizeof(Time)),
+                py::format_descriptor<Time>::format(),
+                1,
+                { static_cast<py::ssize_t>(tg.size()) },
+                { static_cast<py::ssize_t>(sizeof(Time)) },
+                true
+            );
+        });
 }
@@ -85,7 +85,28 @@ void ql_indexes::iborindex(py::module_& m) {
             "Returns the forwarding term structure handle.")
         .def("clone", &IborIndex::clone,
             py::arg("forwardingTermStructure"),
-            "Returns a copy linked to a different forwarding curve.");
+            "Returns a copy linked to a different forwarding curve.")
+        // Pickle support: rebuilt as an IborIndex with a snapshot of the
+        // forwarding curve, if any (the curve must itself be picklable)
+        .def("__reduce__", [](const IborIndex& index) {
+            if (dynamic_cast<const OvernightIndex*>(&index) != nullptr)
+                throw py::type_error("cannot pickle " + index.name() +
+                                     ": overnight indexes are not picklable");
+            py::object cls = py::type::of<IborIndex>();
+            const Handle<YieldTermStructure>& h = index.forwardingTermStructure();
+            if (h.empty())
+                return py::make_tuple(cls, py::make_tuple(
+                    index.familyName(), index.tenor(), index.fixingDays(),
+                    index.currency(), index.fixingCalendar(),
+                    index.businessDayConvention(), index.endOfMonth(),
+                    index.dayCounter()));
+            return py::make_tuple(cls, py::make_tuple(
+                index.familyName(), index.tenor(), index.fixingDays(),
+                index.currency(), index.fixingCalendar(),
+                index.businessDayConvention(), index.endOfMonth(),
+                index.dayCounter(), h.currentLink()));
+        },
+            "Pickles the index conventions and a snapshot of the forwarding curve.");
 
     // OvernightIndex class
     py::class_<OvernightIndex, IborIndex, ext::shared_ptr<OvernightIndex>>(
@@ -12,6 +12,7 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/constructor_args.h"
 #include <ql/instruments/bonds/fixedratebond.hpp>
 #include <ql/time/schedule.hpp>
 #include <pybind11/pybind11.h>
@@ -20,6 +21,15 @@
 namespace py = pybind11;
 using namespace QuantLib;
 
+namespace {
+
+using PicklableFixedRateBond = pyquantlib::WithConstructorArgs<
+    FixedRateBond, Natural, Real, Schedule, std::vector<Rate>, DayCounter,
+    BusinessDayConvention, Real, Date, Calendar, Period, Calendar,
+    BusinessDayConvention, bool, DayCounter>;
+
+}  // anonymous namespace
+
 void ql_instruments::fixedratebond(py::module_& m) {
     py::class_<FixedRateBond, Bond, ext::shared_ptr<FixedRateBond>>(
         m, "FixedRateBond",
@@ -45,11 +55,12 @@ void ql_instruments::fixedratebond(py::module_& m) {
             DayCounter fpdc;
             if (!firstPeriodDayCounter.is_none())
                 fpdc = firstPeriodDayCounter.cast<DayCounter>();
-            return ext::make_shared<FixedRateBond>(
-                settlementDays, faceAmount, std::move(schedule), coupons,
-                accrualDayCounter, paymentConvention, redemption,
-                issueDate, payCal, exCouponPeriod, exCal,
-                exCouponConvention, exCouponEndOfMonth, fpdc);
+            return ext::shared_ptr<FixedRateBond>(
+                ext::make_shared<PicklableFixedRateBond>(
+                    settlementDays, faceAmount, std::move(schedule), coupons,
+                    accrualDayCounter, paymentConvention, redemption,
+                    issueDate, payCal, exCouponPeriod, exCal,
+                    exCouponConvention, exCouponEndOfMonth, fpdc));
         }),
             py::arg("settlementDays"),
             py::arg("faceAmount"),
@@ -70,5 +81,15 @@ void ql_instruments::fixedratebond(py::module_& m) {
             "Returns the coupon frequency.")
         .def("dayCounter", &FixedRateBond::dayCounter,
             py::return_value_policy::reference_internal,
-            "Returns the accrual day counter.");
+            "Returns the accrual day counter.")
+        // Pickle support: the constructor arguments; engines are not pickled
+        .def("__reduce__", [](const FixedRateBond& bond) {
+            auto p = dynamic_cast<const PicklableFixedRateBond*>(&bond);
+            if (p == nullptr)
+                throw py::type_error(
+                    "cannot pickle a FixedRateBond not constructed from Python");
+            return py::make_tuple(py::type::of<FixedRateBond>(),
+                                  py::cast(p->constructorArgs()));
+        },
+            "Pickles the constructor arguments.");
 }
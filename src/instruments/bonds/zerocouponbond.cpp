@@ -12,18 +12,34 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/constructor_args.h"
 #include <ql/instruments/bonds/zerocouponbond.hpp>
 #include <pybind11/pybind11.h>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
+namespace {
+
+using PicklableZeroCouponBond = pyquantlib::WithConstructorArgs<
+    ZeroCouponBond, Natural, Calendar, Real, Date, BusinessDayConvention,
+    Real, Date>;
+
+}  // anonymous namespace
+
 void ql_instruments::zerocouponbond(py::module_& m) {
     py::class_<ZeroCouponBond, Bond, ext::shared_ptr<ZeroCouponBond>>(
         m, "ZeroCouponBond",
         "Zero coupon bond.")
-        .def(py::init<Natural, const Calendar&, Real, const Date&,
-                       BusinessDayConvention, Real, const Date&>(),
+        .def(py::init([](Natural settlementDays, const Calendar& calendar,
+                         Real faceAmount, const Date& maturityDate,
+                         BusinessDayConvention paymentConvention,
+                         Real redemption, const Date& issueDate) {
+            return ext::shared_ptr<ZeroCouponBond>(
+                ext::make_shared<PicklableZeroCouponBond>(
+                    settlementDays, calendar, faceAmount, maturityDate,
+                    paymentConvention, redemption, issueDate));
+        }),
             py::arg("settlementDays"),
             py::arg("calendar"),
             py::arg("faceAmount"),
@@ -31,5 +47,15 @@ void ql_instruments::zerocouponbond(py::module_& m) {
             py::arg("paymentConvention") = Following,
             py::arg("redemption") = 100.0,
             py::arg("issueDate") = Date(),
-            "Constructs a zero coupon bond.");
+            "Constructs a zero coupon bond.")
+        // Pickle support: the constructor arguments; engines are not pickled
+        .def("__reduce__", [](const ZeroCouponBond& bond) {
+            auto p = dynamic_cast<const PicklableZeroCouponBond*>(&bond);
+            if (p == nullptr)
+                throw py::type_error(
+                    "cannot pickle a ZeroCouponBond not constructed from Python");
+            return py::make_tuple(py::type::of<ZeroCouponBond>(),
+                                  py::cast(p->constructorArgs()));
+        },
+            "Pickles the constructor arguments.");
 }
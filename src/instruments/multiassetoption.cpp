@@ -31,16 +31,22 @@ void ql_instruments::multiassetoption(py::module_& m) {
         .def("isExpired", &MultiAssetOption::isExpired,
             "Returns whether the option has expired.")
         .def("delta", &MultiAssetOption::delta,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns delta.")
         .def("gamma", &MultiAssetOption::gamma,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns gamma.")
         .def("theta", &MultiAssetOption::theta,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns theta.")
         .def("vega", &MultiAssetOption::vega,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns vega.")
         .def("rho", &MultiAssetOption::rho,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns rho.")
         .def("dividendRho", &MultiAssetOption::dividendRho,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns dividend rho.");
 
     py::class_<MultiAssetOption::results, Instrument::results, Greeks,
@@ -31,26 +31,37 @@ void ql_instruments::oneassetoption(py::module_& m) {
         .def(py::init<ext::shared_ptr<Payoff>, ext::shared_ptr<Exercise>>(),
              py::arg("payoff"), py::arg("exercise"))
         .def("delta", &OneAssetOption::delta,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns delta sensitivity.")
         .def("deltaForward", &OneAssetOption::deltaForward,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns forward delta.")
         .def("elasticity", &OneAssetOption::elasticity,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns elasticity (leverage).")
         .def("gamma", &OneAssetOption::gamma,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns gamma sensitivity.")
         .def("theta", &OneAssetOption::theta,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns theta sensitivity.")
         .def("thetaPerDay", &OneAssetOption::thetaPerDay,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns theta per day.")
         .def("vega", &OneAssetOption::vega,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns vega sensitivity.")
         .def("rho", &OneAssetOption::rho,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns rho sensitivity.")
         .def("dividendRho", &OneAssetOption::dividendRho,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns dividend rho sensitivity.")
         .def("strikeSensitivity", &OneAssetOption::strikeSensitivity,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns strike sensitivity.")
         .def("itmCashProbability", &OneAssetOption::itmCashProbability,
+            py::call_guard<py::gil_scoped_release>(),
             "Returns probability of finishing in the money.");
 
     // OneAssetOption::results nested class
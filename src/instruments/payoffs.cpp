@@ -40,7 +40,15 @@ void ql_instruments::payoffs(py::module_& m) {
         m, "PlainVanillaPayoff",
         "Plain vanilla payoff (max(S-K,0) for call, max(K-S,0) for put).")
         .def(py::init<Option::Type, Real>(),
-             py::arg("type"), py::arg("strike"));
+             py::arg("type"), py::arg("strike"))
+        .def(py::pickle(
+            [](const PlainVanillaPayoff& p) {
+                return py::make_tuple(p.optionType(), p.strike());
+            },
+            [](const py::tuple& state) {
+                return ext::make_shared<PlainVanillaPayoff>(
+                    state[0].cast<Option::Type>(), state[1].cast<Real>());
+            }));
 
     py::class_<CashOrNothingPayoff, StrikedTypePayoff,
                ext::shared_ptr<CashOrNothingPayoff>>(
@@ -49,14 +57,31 @@ void ql_instruments::payoffs(py::module_& m) {
         .def(py::init<Option::Type, Real, Real>(),
              py::arg("type"), py::arg("strike"), py::arg("cashPayoff"))
         .def("cashPayoff", &CashOrNothingPayoff::cashPayoff,
-            "Returns the cash payoff amount.");
+            "Returns the cash payoff amount.")
+        .def(py::pickle(
+            [](const CashOrNothingPayoff& p) {
+                return py::make_tuple(p.optionType(), p.strike(), p.cashPayoff());
+            },
+            [](const py::tuple& state) {
+                return ext::make_shared<CashOrNothingPayoff>(
+                    state[0].cast<Option::Type>(), state[1].cast<Real>(),
+                    state[2].cast<Real>());
+            }));
 
     py::class_<AssetOrNothingPayoff, StrikedTypePayoff,
                ext::shared_ptr<AssetOrNothingPayoff>>(
         m, "AssetOrNothingPayoff",
         "Binary payoff: asset value if in the money, zero otherwise.")
         .def(py::init<Option::Type, Real>(),
-             py::arg("type"), py::arg("strike"));
+             py::arg("type"), py::arg("strike"))
+        .def(py::pickle(
+            [](const AssetOrNothingPayoff& p) {
+                return py::make_tuple(p.optionType(), p.strike());
+            },
+            [](const py::tuple& state) {
+                return ext::make_shared<AssetOrNothingPayoff>(
+                    state[0].cast<Option::Type>(), state[1].cast<Real>());
+            }));
 
     py::class_<GapPayoff, StrikedTypePayoff,
                ext::shared_ptr<GapPayoff>>(
@@ -65,14 +90,31 @@ void ql_instruments::payoffs(py::module_& m) {
         .def(py::init<Option::Type, Real, Real>(),
              py::arg("type"), py::arg("strike"), py::arg("secondStrike"))
         .def("secondStrike", &GapPayoff::secondStrike,
-            "Returns the second (payoff) strike.");
+            "Returns the second (payoff) strike.")
+        .def(py::pickle(
+            [](const GapPayoff& p) {
+                return py::make_tuple(p.optionType(), p.strike(), p.secondStrike());
+            },
+            [](const py::tuple& state) {
+                return ext::make_shared<GapPayoff>(
+                    state[0].cast<Option::Type>(), state[1].cast<Real>(),
+                    state[2].cast<Real>());
+            }));
 
     py::class_<PercentageStrikePayoff, StrikedTypePayoff,
                ext::shared_ptr<PercentageStrikePayoff>>(
         m, "PercentageStrikePayoff",
         "Payoff with strike expressed as moneyness percentage.")
         .def(py::init<Option::Type, Real>(),
-             py::arg("type"), py::arg("moneyness"));
+             py::arg("type"), py::arg("moneyness"))
+        .def(py::pickle(
+            [](const PercentageStrikePayoff& p) {
+                return py::make_tuple(p.optionType(), p.strike());
+            },
+            [](const py::tuple& state) {
+                return ext::make_shared<PercentageStrikePayoff>(
+                    state[0].cast<Option::Type>(), state[1].cast<Real>());
+            }));
 
     py::class_<SuperFundPayoff, StrikedTypePayoff,
                ext::shared_ptr<SuperFundPayoff>>(
@@ -81,7 +123,15 @@ void ql_instruments::payoffs(py::module_& m) {
         .def(py::init<Real, Real>(),
              py::arg("strike"), py::arg("secondStrike"))
         .def("secondStrike", &SuperFundPayoff::secondStrike,
-            "Returns the second strike.");
+            "Returns the second strike.")
+        .def(py::pickle(
+            [](const SuperFundPayoff& p) {
+                return py::make_tuple(p.strike(), p.secondStrike());
+            },
+            [](const py::tuple& state) {
+                return ext::make_shared<SuperFundPayoff>(
+                    state[0].cast<Real>(), state[1].cast<Real>());
+            }));
 
     py::class_<SuperSharePayoff, StrikedTypePayoff,
                ext::shared_ptr<SuperSharePayoff>>(
@@ -92,12 +142,29 @@ void ql_instruments::payoffs(py::module_& m) {
         .def("secondStrike", &SuperSharePayoff::secondStrike,
             "Returns the second strike.")
         .def("cashPayoff", &SuperSharePayoff::cashPayoff,
-            "Returns the cash payoff amount.");
+            "Returns the cash payoff amount.")
+        .def(py::pickle(
+            [](const SuperSharePayoff& p) {
+                return py::make_tuple(p.strike(), p.secondStrike(), p.cashPayoff());
+            },
+            [](const py::tuple& state) {
+                return ext::make_shared<SuperSharePayoff>(
+                    state[0].cast<Real>(), state[1].cast<Real>(),
+                    state[2].cast<Real>());
+            }));
 
     py::class_<FloatingTypePayoff, Payoff,
                ext::shared_ptr<FloatingTypePayoff>>(
         m, "FloatingTypePayoff",
         "Floating-strike payoff (for lookback options).")
         .def(py::init<Option::Type>(),
-             py::arg("type"));
+             py::arg("type"))
+        .def(py::pickle(
+            [](const FloatingTypePayoff& p) {
+                return py::make_tuple(p.optionType());
+            },
+            [](const py::tuple& state) {
+                return ext::make_shared<FloatingTypePayoff>(
+                    state[0].cast<Option::Type>());
+            }));
 }
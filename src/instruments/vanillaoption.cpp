@@ -27,5 +27,17 @@ void ql_instruments::vanillaoption(py::module_& m) {
         "Plain vanilla option on a single asset.")
         .def(py::init<const ext::shared_ptr<StrikedTypePayoff>&,
                       const ext::shared_ptr<Exercise>&>(),
-             py::arg("payoff"), py::arg("exercise"));
+             py::arg("payoff"), py::arg("exercise"))
+        // Pickle support: payoff and exercise only; engines are not pickled
+        .def(py::pickle(
+            [](const VanillaOption& o) {
+                return py::make_tuple(o.payoff(), o.exercise());
+            },
+            [](const py::tuple& state) {
+                auto payoff = ext::dynamic_pointer_cast<StrikedTypePayoff>(
+                    state[0].cast<ext::shared_ptr<Payoff>>());
+                QL_REQUIRE(payoff, "VanillaOption state needs a striked payoff");
+                return ext::make_shared<VanillaOption>(
+                    payoff, state[1].cast<ext::shared_ptr<Exercise>>());
+            }));
 }
@@ -40,5 +40,18 @@ void ql_instruments::vanillaswap(py::module_& m) {
             py::arg("floatingDayCount"),
             py::arg("paymentConvention") = ext::nullopt,
             py::arg("useIndexedCoupons") = ext::nullopt,
-            "Constructs a vanilla swap.");
+            "Constructs a vanilla swap.")
+        // Pickle support: rebuilt from the inspectors, so swaps built with
+        // MakeVanillaSwap pickle as well; engines are not pickled
+        .def("__reduce__", [](const VanillaSwap& swap) {
+            return py::make_tuple(
+                py::type::of<VanillaSwap>(),
+                py::make_tuple(swap.type(), swap.nominal(),
+                               swap.fixedSchedule(), swap.fixedRate(),
+                               swap.fixedDayCount(), swap.floatingSchedule(),
+                               swap.iborIndex(), swap.spread(),
+                               swap.floatingDayCount(),
+                               swap.paymentConvention()));
+        },
+            "Pickles the swap terms and its index.");
 }
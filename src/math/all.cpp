@@ -43,7 +43,7 @@ DECLARE_MODULE_BINDINGS(math_bindings) {
     ADD_MAIN_BINDING(ql_math::statistics,
         "Statistics - empirical-distribution risk measures");
     ADD_MAIN_BINDING(ql_math::incrementalstatistics,
-        "IncrementalStatistics - online statistics via boost accumulators");
+        "IncrementalStatistics - mergeable online statistics");
     ADD_MAIN_BINDING(ql_math::sequencestatistics,
         "SequenceStatistics - N-dimensional statistics with covariance");
 
@@ -17,6 +17,7 @@
 #include <pybind11/stl.h>
 #include <pybind11/operators.h>
 #include <pybind11/numpy.h>
+#include <algorithm>
 #include <sstream>
 
 namespace py = pybind11;
@@ -178,6 +179,20 @@ void ql_math::array(py::module_& m) {
         .def(py::self == py::self)
         .def(py::self != py::self);
 
+    // Pickle support
+    pyArray.def(py::pickle(
+        [](const Array& a) {
+            return py::make_tuple(
+                py::array_t<Real>(static_cast<py::ssize_t>(a.size()), a.begin()));
+        },
+        [](const py::tuple& state) {
+            auto values = state[0].cast<
+                py::array_t<Real, py::array::c_style | py::array::forcecast>>();
+            Array a(values.size());
+            std::copy_n(values.data(), values.size(), a.begin());
+            return a;
+        }));
+
     // Mathematical functions
     m.def("DotProduct", static_cast<Real (*)(const Array&, const Array&)>(&DotProduct),
         py::arg("a1"), py::arg("a2"),
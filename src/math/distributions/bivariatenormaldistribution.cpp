@@ -12,11 +12,14 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/math/distributions/bivariatenormaldistribution.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 
 namespace py = pybind11;
 using namespace QuantLib;
+using pyquantlib::DoubleArray;
 
 void ql_math::bivariatenormaldistribution(py::module_& m) {
     py::class_<BivariateCumulativeNormalDistributionWe04DP>(
@@ -27,5 +30,13 @@ void ql_math::bivariatenormaldistribution(py::module_& m) {
             "Constructs BivariateCumulativeNormalDistribution with correlation rho.")
         .def("__call__", &BivariateCumulativeNormalDistributionWe04DP::operator(),
             py::arg("x"), py::arg("y"),
-            "Returns the cumulative bivariate normal probability.");
+            "Returns the cumulative bivariate normal probability.")
+        .def("__call__",
+            [](const BivariateCumulativeNormalDistributionWe04DP& self,
+               const DoubleArray& x, const DoubleArray& y, const py::object& out) {
+                return pyquantlib::evaluate_pairs(x, y, out,
+                    [&](Real a, Real b) { return self(a, b); });
+            },
+            py::arg("x"), py::arg("y"), py::kw_only(), py::arg("out") = py::none(),
+            "Returns the cumulative bivariate normal probability over broadcast arrays.");
 }
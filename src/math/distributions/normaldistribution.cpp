@@ -12,11 +12,14 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/math/distributions/normaldistribution.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 
 namespace py = pybind11;
 using namespace QuantLib;
+using pyquantlib::DoubleArray;
 
 void ql_math::normaldistribution(py::module_& m) {
     py::class_<NormalDistribution>(
@@ -29,9 +32,23 @@ void ql_math::normaldistribution(py::module_& m) {
         .def("__call__", &NormalDistribution::operator(),
             py::arg("x"),
             "Returns the probability density at x.")
+        .def("__call__",
+            [](const NormalDistribution& self, const DoubleArray& x, const py::object& out) {
+                return pyquantlib::evaluate_unary(x, out,
+                    [&](Real v) { return self(v); });
+            },
+            py::arg("x"), py::kw_only(), py::arg("out") = py::none(),
+            "Returns the probability density element-wise.")
         .def("derivative", &NormalDistribution::derivative,
             py::arg("x"),
-            "Returns the derivative of the density at x.");
+            "Returns the derivative of the density at x.")
+        .def("derivative",
+            [](const NormalDistribution& self, const DoubleArray& x, const py::object& out) {
+                return pyquantlib::evaluate_unary(x, out,
+                    [&](Real v) { return self.derivative(v); });
+            },
+            py::arg("x"), py::kw_only(), py::arg("out") = py::none(),
+            "Returns the derivative of the density element-wise.");
 
     py::class_<CumulativeNormalDistribution>(
         m, "CumulativeNormalDistribution",
@@ -43,9 +60,23 @@ void ql_math::normaldistribution(py::module_& m) {
         .def("__call__", &CumulativeNormalDistribution::operator(),
             py::arg("x"),
             "Returns the cumulative probability at x.")
+        .def("__call__",
+            [](const CumulativeNormalDistribution& self, const DoubleArray& x, const py::object& out) {
+                return pyquantlib::evaluate_unary(x, out,
+                    [&](Real v) { return self(v); });
+            },
+            py::arg("x"), py::kw_only(), py::arg("out") = py::none(),
+            "Returns the cumulative probability element-wise.")
         .def("derivative", &CumulativeNormalDistribution::derivative,
             py::arg("x"),
-            "Returns the derivative (density) at x.");
+            "Returns the derivative (density) at x.")
+        .def("derivative",
+            [](const CumulativeNormalDistribution& self, const DoubleArray& x, const py::object& out) {
+                return pyquantlib::evaluate_unary(x, out,
+                    [&](Real v) { return self.derivative(v); });
+            },
+            py::arg("x"), py::kw_only(), py::arg("out") = py::none(),
+            "Returns the derivative (density) element-wise.");
 
     py::class_<InverseCumulativeNormal>(
         m, "InverseCumulativeNormal",
@@ -57,7 +88,21 @@ void ql_math::normaldistribution(py::module_& m) {
         .def("__call__", &InverseCumulativeNormal::operator(),
             py::arg("x"),
             "Returns the inverse cumulative normal at x.")
+        .def("__call__",
+            [](const InverseCumulativeNormal& self, const DoubleArray& x, const py::object& out) {
+                return pyquantlib::evaluate_unary(x, out,
+                    [&](Real v) { return self(v); });
+            },
+            py::arg("x"), py::kw_only(), py::arg("out") = py::none(),
+            "Returns the inverse cumulative normal element-wise.")
         .def_static("standard_value", &InverseCumulativeNormal::standard_value,
             py::arg("x"),
-            "Returns the inverse for standard normal (average=0, sigma=1).");
+            "Returns the inverse for standard normal (average=0, sigma=1).")
+        .def_static("standard_value",
+            [](const DoubleArray& x, const py::object& out) {
+                return pyquantlib::evaluate_unary(x, out,
+                    [](Real v) { return InverseCumulativeNormal::standard_value(v); });
+            },
+            py::arg("x"), py::kw_only(), py::arg("out") = py::none(),
+            "Returns the standard normal inverse element-wise.");
 }
@@ -65,7 +65,31 @@ void ql_math::cubicinterpolation(py::module_& m) {
         py::arg("leftConditionValue") = 0.0,
         py::arg("rightCondition") = CubicInterpolation::SecondDerivative,
         py::arg("rightConditionValue") = 0.0,
-        "Constructs cubic interpolation from x and y arrays.");
+        "Constructs cubic interpolation from x and y arrays.")
+        .def(py::init([](const py::object& x, const py::object& y,
+                        CubicInterpolation::DerivativeApprox da,
+                        bool monotonic,
+                        CubicInterpolation::BoundaryCondition leftCond,
+                        Real leftConditionValue,
+                        CubicInterpolation::BoundaryCondition rightCond,
+                        Real rightConditionValue,
+                        bool copy) {
+            return pyquantlib::make_interpolation<CubicInterpolation>(
+                x, y, copy, 2,
+                da, monotonic, leftCond, leftConditionValue,
+                rightCond, rightConditionValue);
+        }),
+        py::arg("x"), py::arg("y"),
+        py::arg("derivativeApprox") = CubicInterpolation::Kruger,
+        py::arg("monotonic") = false,
+        py::arg("leftCondition") = CubicInterpolation::SecondDerivative,
+        py::arg("leftConditionValue") = 0.0,
+        py::arg("rightCondition") = CubicInterpolation::SecondDerivative,
+        py::arg("rightConditionValue") = 0.0,
+        py::kw_only(), py::arg("copy"),
+        "Constructs cubic interpolation from x and y arrays. With copy=False "
+        "the given float64 NumPy arrays are read in place and kept alive; "
+        "call update() after writing to them.");
 
     // Convenience classes - use simple binding helper
     pyquantlib::bind_simple_interpolation<CubicNaturalSpline>(
@@ -12,12 +12,59 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/math/interpolation.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <algorithm>
+#include <limits>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
+namespace {
+
+    using pyquantlib::DoubleArray;
+    using pyquantlib::element;
+
+    // Elements of a batch are evaluated with extrapolation allowed, so the
+    // range is checked once, against the smallest and largest points,
+    // before anything is written to the output.
+    void checkBatchRange(const Interpolation& f, const DoubleArray& x,
+                         bool allowExtrapolation) {
+        if (allowExtrapolation || f.allowsExtrapolation() || x.size() == 0)
+            return;
+        double lo = std::numeric_limits<double>::infinity();
+        double hi = -lo;
+        {
+            pyquantlib::BroadcastLoop loop({x});
+            py::gil_scoped_release release;
+            loop.run([&](py::ssize_t, const char* const* p) {
+                const double xi = element<double>(p[0]);
+                lo = std::min(lo, xi);
+                hi = std::max(hi, xi);
+            });
+        }
+        for (double xi : {lo, hi})
+            QL_REQUIRE(f.isInRange(xi),
+                       "interpolation range is [" << f.xMin() << ", "
+                       << f.xMax() << "]: extrapolation at " << xi
+                       << " not allowed");
+    }
+
+    // Array overload of a scalar Interpolation method.
+    template <Real (Interpolation::*Method)(Real, bool) const>
+    py::array_t<double> evaluateBatch(const Interpolation& self,
+                                      const DoubleArray& x,
+                                      bool allowExtrapolation,
+                                      const py::object& out) {
+        checkBatchRange(self, x, allowExtrapolation);
+        return pyquantlib::evaluate_unary(x, out, [&](double xi) {
+            return (self.*Method)(xi, true);
+        });
+    }
+}
+
 void ql_math::interpolation(py::module_& m) {
     py::class_<Interpolation, Extrapolator, ext::shared_ptr<Interpolation>>(
         m, "Interpolation",
@@ -26,18 +73,42 @@ void ql_math::interpolation(py::module_& m) {
             py::arg("x"),
             py::arg("allowExtrapolation") = false,
             "Returns interpolated value at x.")
+        .def("__call__", &evaluateBatch<&Interpolation::operator()>,
+            py::arg("x"),
+            py::arg("allowExtrapolation") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns interpolated values at each point of a float "
+            "array; evaluated without the GIL.")
         .def("primitive", &Interpolation::primitive,
             py::arg("x"),
             py::arg("allowExtrapolation") = false,
             "Returns primitive (integral) at x.")
+        .def("primitive", &evaluateBatch<&Interpolation::primitive>,
+            py::arg("x"),
+            py::arg("allowExtrapolation") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns primitives (integrals) at each point of a float "
+            "array; evaluated without the GIL.")
         .def("derivative", &Interpolation::derivative,
             py::arg("x"),
             py::arg("allowExtrapolation") = false,
             "Returns first derivative at x.")
+        .def("derivative", &evaluateBatch<&Interpolation::derivative>,
+            py::arg("x"),
+            py::arg("allowExtrapolation") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns first derivatives at each point of a float "
+            "array; evaluated without the GIL.")
         .def("secondDerivative", &Interpolation::secondDerivative,
             py::arg("x"),
             py::arg("allowExtrapolation") = false,
             "Returns second derivative at x.")
+        .def("secondDerivative", &evaluateBatch<&Interpolation::secondDerivative>,
+            py::arg("x"),
+            py::arg("allowExtrapolation") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns second derivatives at each point of a float "
+            "array; evaluated without the GIL.")
         .def("xMin", &Interpolation::xMin,
             "Returns minimum x value.")
         .def("xMax", &Interpolation::xMax,
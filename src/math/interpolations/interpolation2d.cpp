@@ -12,13 +12,55 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/math/interpolations/interpolation2d.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
+#include <algorithm>
+#include <limits>
+#include <utility>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
+namespace {
+
+    using pyquantlib::DoubleArray;
+    using pyquantlib::element;
+
+    std::pair<double, double> bounds(const DoubleArray& a) {
+        double lo = std::numeric_limits<double>::infinity();
+        double hi = -lo;
+        pyquantlib::BroadcastLoop loop({a});
+        py::gil_scoped_release release;
+        loop.run([&](py::ssize_t, const char* const* p) {
+            const double v = element<double>(p[0]);
+            lo = std::min(lo, v);
+            hi = std::max(hi, v);
+        });
+        return {lo, hi};
+    }
+
+    // Points are evaluated with extrapolation allowed; the range is a
+    // rectangle, so checking the bounds of xs and ys once is enough.
+    void checkBatchRange(const Interpolation2D& f, const DoubleArray& xs,
+                         const DoubleArray& ys, bool allowExtrapolation) {
+        if (allowExtrapolation || f.allowsExtrapolation() ||
+            xs.size() == 0 || ys.size() == 0)
+            return;
+        const auto [xLo, xHi] = bounds(xs);
+        const auto [yLo, yHi] = bounds(ys);
+        for (const auto& [x, y] : {std::make_pair(xLo, yLo),
+                                   std::make_pair(xHi, yHi)})
+            QL_REQUIRE(f.isInRange(x, y),
+                       "interpolation range is [" << f.xMin() << ", "
+                       << f.xMax() << "] x [" << f.yMin() << ", " << f.yMax()
+                       << "]: extrapolation at (" << x << ", " << y
+                       << ") not allowed");
+    }
+}
+
 void ql_math::interpolation2d(py::module_& m) {
     py::class_<Interpolation2D, Extrapolator,
                ext::shared_ptr<Interpolation2D>>(
@@ -28,6 +70,33 @@ void ql_math::interpolation2d(py::module_& m) {
             py::arg("x"), py::arg("y"),
             py::arg("allowExtrapolation") = false,
             "Returns the interpolated value at (x, y).")
+        .def("evaluateGrid",
+            [](const Interpolation2D& self, const DoubleArray& xs,
+               const DoubleArray& ys, bool allowExtrapolation,
+               const py::object& out) {
+                checkBatchRange(self, xs, ys, allowExtrapolation);
+                // Rows follow y and columns follow x, as in zData().
+                return pyquantlib::evaluate_grid(ys, xs, out,
+                    [&](Real y, Real x) { return self(x, y, true); },
+                    "ys", "xs");
+            },
+            py::arg("xs"), py::arg("ys"), py::arg("allowExtrapolation") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns the values on the grid spanned by 1-D arrays xs and ys, "
+            "with shape (len(ys), len(xs)) like zData(). Evaluated without "
+            "the GIL.")
+        .def("evaluatePoints",
+            [](const Interpolation2D& self, const DoubleArray& xs,
+               const DoubleArray& ys, bool allowExtrapolation,
+               const py::object& out) {
+                checkBatchRange(self, xs, ys, allowExtrapolation);
+                return pyquantlib::evaluate_pairs(xs, ys, out,
+                    [&](Real x, Real y) { return self(x, y, true); });
+            },
+            py::arg("xs"), py::arg("ys"), py::arg("allowExtrapolation") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns the values at broadcast (x, y) points. Evaluated without "
+            "the GIL.")
         .def("xMin", &Interpolation2D::xMin,
             "Returns the minimum x value.")
         .def("xMax", &Interpolation2D::xMax,
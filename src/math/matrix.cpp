@@ -17,6 +17,7 @@
 #include <pybind11/stl.h>
 #include <pybind11/numpy.h>
 #include <pybind11/operators.h>
+#include <algorithm>
 #include <sstream>
 
 namespace py = pybind11;
@@ -211,7 +212,27 @@ void ql_math::matrix(py::module_& m) {
 
         // String representation
         .def("__repr__", &matrix_repr)
-        .def("__str__", &matrix_repr);
+        .def("__str__", &matrix_repr)
+
+        // Pickle support
+        .def(py::pickle(
+            [](const Matrix& m) {
+                py::array_t<Real> values(std::vector<py::ssize_t>{
+                    static_cast<py::ssize_t>(m.rows()),
+                    static_cast<py::ssize_t>(m.columns())});
+                std::copy(m.begin(), m.end(), values.mutable_data());
+                return py::make_tuple(values);
+            },
+            [](const py::tuple& state) {
+                auto values = state[0].cast<
+                    py::array_t<Real, py::array::c_style | py::array::forcecast>>();
+                if (values.ndim() != 2)
+                    throw py::value_error("Matrix state must be 2-dimensional");
+                Matrix m(static_cast<Size>(values.shape(0)),
+                         static_cast<Size>(values.shape(1)));
+                std::copy_n(values.data(), values.size(), m.begin());
+                return ext::make_shared<Matrix>(std::move(m));
+            }));
 
     // Free functions
     m.def("outerProduct", static_cast<Matrix (*)(const Array&, const Array&)>(&outerProduct),
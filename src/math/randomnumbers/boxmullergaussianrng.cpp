@@ -12,9 +12,11 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/math/randomnumbers/boxmullergaussianrng.hpp>
 #include <ql/math/randomnumbers/mt19937uniformrng.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 
 namespace py = pybind11;
 using namespace QuantLib;
@@ -22,7 +24,7 @@ using namespace QuantLib;
 void ql_math::boxmullergaussianrng(py::module_& m) {
     using BoxMullerMT = BoxMullerGaussianRng<MersenneTwisterUniformRng>;
 
-    py::class_<BoxMullerMT>(m, "BoxMullerGaussianRng",
+    auto cls = py::class_<BoxMullerMT>(m, "BoxMullerGaussianRng",
         "Box-Muller Gaussian random number generator (uses Mersenne Twister).")
         .def(py::init<const MersenneTwisterUniformRng&>(),
             py::arg("uniformGenerator"),
@@ -34,4 +36,8 @@ void ql_math::boxmullergaussianrng(py::module_& m) {
             "Constructs with seed (0 for clock-based random seed).")
         .def("next", &BoxMullerMT::next,
             "Returns a sample with Gaussian deviate and weight.");
+
+    pyquantlib::def_variate_batch(cls, [](BoxMullerMT& rng) {
+        return rng.next().value;
+    });
 }
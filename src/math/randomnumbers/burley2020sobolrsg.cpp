@@ -12,15 +12,17 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/math/randomnumbers/burley2020sobolrsg.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
 void ql_math::burley2020sobolrsg(py::module_& m) {
-    py::class_<Burley2020SobolRsg>(m, "Burley2020SobolRsg",
+    auto cls = py::class_<Burley2020SobolRsg>(m, "Burley2020SobolRsg",
         "Scrambled Sobol sequence (Burley 2020 hash-based Owen scrambling).")
         .def(py::init<Size, unsigned long, SobolRsg::DirectionIntegers,
                       unsigned long>(),
@@ -42,4 +44,6 @@ void ql_math::burley2020sobolrsg(py::module_& m) {
             },
             py::arg("n"),
             "Skips to the n-th sample in the sequence.");
+
+    pyquantlib::def_sequence_batch(cls);
 }
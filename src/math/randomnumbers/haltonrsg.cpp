@@ -12,15 +12,17 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/math/randomnumbers/haltonrsg.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
 void ql_math::haltonrsg(py::module_& m) {
-    py::class_<HaltonRsg>(m, "HaltonRsg",
+    auto cls = py::class_<HaltonRsg>(m, "HaltonRsg",
         "Halton low-discrepancy sequence generator.")
         .def(py::init<Size, unsigned long, bool, bool>(),
             py::arg("dimensionality"),
@@ -36,4 +38,6 @@ void ql_math::haltonrsg(py::module_& m) {
             "Returns the last generated sequence.")
         .def("dimension", &HaltonRsg::dimension,
             "Returns the dimensionality.");
+
+    pyquantlib::def_sequence_batch(cls);
 }
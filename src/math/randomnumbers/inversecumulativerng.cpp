@@ -12,10 +12,12 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/math/randomnumbers/inversecumulativerng.hpp>
 #include <ql/math/randomnumbers/mt19937uniformrng.hpp>
 #include <ql/math/distributions/normaldistribution.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 
 namespace py = pybind11;
 using namespace QuantLib;
@@ -24,7 +26,7 @@ void ql_math::inversecumulativerng(py::module_& m) {
     using GaussianRng = InverseCumulativeRng<MersenneTwisterUniformRng,
                                              InverseCumulativeNormal>;
 
-    py::class_<GaussianRng>(m, "GaussianRandomGenerator",
+    auto cls = py::class_<GaussianRng>(m, "GaussianRandomGenerator",
         "Gaussian random number generator via inverse cumulative normal "
         "(uses Mersenne Twister).")
         .def(py::init<const MersenneTwisterUniformRng&>(),
@@ -37,4 +39,8 @@ void ql_math::inversecumulativerng(py::module_& m) {
             "Constructs with seed (0 for clock-based random seed).")
         .def("next", &GaussianRng::next,
             "Returns a sample with Gaussian deviate and weight.");
+
+    pyquantlib::def_variate_batch(cls, [](GaussianRng& rng) {
+        return rng.next().value;
+    });
 }
@@ -12,12 +12,14 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/math/randomnumbers/inversecumulativersg.hpp>
 #include <ql/math/randomnumbers/randomsequencegenerator.hpp>
 #include <ql/math/randomnumbers/mt19937uniformrng.hpp>
 #include <ql/math/randomnumbers/sobolrsg.hpp>
 #include <ql/math/distributions/normaldistribution.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 
 namespace py = pybind11;
@@ -28,7 +30,7 @@ void ql_math::inversecumulativersg(py::module_& m) {
     using UniformRsg = RandomSequenceGenerator<MersenneTwisterUniformRng>;
     using GaussianRsg = InverseCumulativeRsg<UniformRsg, InverseCumulativeNormal>;
 
-    py::class_<GaussianRsg>(m, "GaussianRandomSequenceGenerator",
+    auto rsg = py::class_<GaussianRsg>(m, "GaussianRandomSequenceGenerator",
         "Gaussian random sequence generator via inverse cumulative normal "
         "(uses Mersenne Twister).")
         .def(py::init<const UniformRsg&>(),
@@ -49,10 +51,12 @@ void ql_math::inversecumulativersg(py::module_& m) {
         .def("dimension", &GaussianRsg::dimension,
             "Returns the dimensionality.");
 
+    pyquantlib::def_sequence_batch(rsg);
+
     // Gaussian low-discrepancy sequence generator (Sobol-based)
     using GaussianLdsg = InverseCumulativeRsg<SobolRsg, InverseCumulativeNormal>;
 
-    py::class_<GaussianLdsg>(m, "GaussianLowDiscrepancySequenceGenerator",
+    auto ldsg = py::class_<GaussianLdsg>(m, "GaussianLowDiscrepancySequenceGenerator",
         "Gaussian low-discrepancy sequence generator via inverse cumulative "
         "normal (uses Sobol).")
         .def(py::init<const SobolRsg&>(),
@@ -75,4 +79,6 @@ void ql_math::inversecumulativersg(py::module_& m) {
             "Returns the last generated sequence.")
         .def("dimension", &GaussianLdsg::dimension,
             "Returns the dimensionality.");
+
+    pyquantlib::def_sequence_batch(ldsg);
 }
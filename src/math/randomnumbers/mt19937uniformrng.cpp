@@ -12,15 +12,17 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/math/randomnumbers/mt19937uniformrng.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
 void ql_math::mt19937uniformrng(py::module_& m) {
-    py::class_<MersenneTwisterUniformRng>(m, "MersenneTwisterUniformRng",
+    auto cls = py::class_<MersenneTwisterUniformRng>(m, "MersenneTwisterUniformRng",
         "Mersenne Twister uniform random number generator (period 2^19937-1).")
         .def(py::init<unsigned long>(),
             py::arg("seed") = 0,
@@ -34,4 +36,8 @@ void ql_math::mt19937uniformrng(py::module_& m) {
             "Returns a random number in (0, 1).")
         .def("nextInt32", &MersenneTwisterUniformRng::nextInt32,
             "Returns a random 32-bit unsigned integer.");
+
+    pyquantlib::def_variate_batch(cls, [](MersenneTwisterUniformRng& rng) {
+        return rng.nextReal();
+    });
 }
@@ -12,9 +12,11 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/math/randomnumbers/randomsequencegenerator.hpp>
 #include <ql/math/randomnumbers/mt19937uniformrng.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 
 namespace py = pybind11;
@@ -23,7 +25,7 @@ using namespace QuantLib;
 void ql_math::randomsequencegenerator(py::module_& m) {
     using UniformRsg = RandomSequenceGenerator<MersenneTwisterUniformRng>;
 
-    py::class_<UniformRsg>(m, "UniformRandomSequenceGenerator",
+    auto cls = py::class_<UniformRsg>(m, "UniformRandomSequenceGenerator",
         "Uniform random sequence generator (uses Mersenne Twister).")
         .def(py::init<Size, const MersenneTwisterUniformRng&>(),
             py::arg("dimensionality"),
@@ -43,4 +45,6 @@ void ql_math::randomsequencegenerator(py::module_& m) {
             "Returns next sequence of 32-bit unsigned integers.")
         .def("dimension", &UniformRsg::dimension,
             "Returns the dimensionality.");
+
+    pyquantlib::def_sequence_batch(cls);
 }
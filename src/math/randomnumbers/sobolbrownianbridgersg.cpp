@@ -12,15 +12,17 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/math/randomnumbers/sobolbrownianbridgersg.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
 void ql_math::sobolbrownianbridgersg(py::module_& m) {
-    py::class_<SobolBrownianBridgeRsg>(m, "SobolBrownianBridgeRsg",
+    auto sobol = py::class_<SobolBrownianBridgeRsg>(m, "SobolBrownianBridgeRsg",
         "Sobol quasi-random sequence generator with Brownian bridge ordering.")
         .def(py::init<Size, Size, SobolBrownianGenerator::Ordering,
                       unsigned long, SobolRsg::DirectionIntegers>(),
@@ -39,7 +41,9 @@ void ql_math::sobolbrownianbridgersg(py::module_& m) {
         .def("dimension", &SobolBrownianBridgeRsg::dimension,
             "Returns the dimensionality (factors x steps).");
 
-    py::class_<Burley2020SobolBrownianBridgeRsg>(m,
+    pyquantlib::def_sequence_batch(sobol);
+
+    auto burley = py::class_<Burley2020SobolBrownianBridgeRsg>(m,
         "Burley2020SobolBrownianBridgeRsg",
         "Scrambled Sobol quasi-random sequence generator with Brownian bridge "
         "ordering (Burley 2020 hash-based Owen scrambling).")
@@ -63,4 +67,6 @@ void ql_math::sobolbrownianbridgersg(py::module_& m) {
             "Returns the last generated sequence.")
         .def("dimension", &Burley2020SobolBrownianBridgeRsg::dimension,
             "Returns the dimensionality (factors x steps).");
+
+    pyquantlib::def_sequence_batch(burley);
 }
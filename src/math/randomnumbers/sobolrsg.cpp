@@ -12,8 +12,10 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/math/randomnumbers/sobolrsg.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 
 namespace py = pybind11;
@@ -57,4 +59,6 @@ void ql_math::sobolrsg(py::module_& m) {
             },
             py::arg("n"),
             "Skips to the n-th sample in the sequence.");
+
+    pyquantlib::def_sequence_batch(cls);
 }
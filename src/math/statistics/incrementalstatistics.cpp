@@ -12,60 +12,87 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
-#include <ql/math/statistics/incrementalstatistics.hpp>
+#include "pyquantlib/incremental_statistics.h"
+#include "pyquantlib/numpy_utils.h"
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
+namespace {
+
+    void addSamples(pyquantlib::IncrementalStatistics& self,
+                    const pyquantlib::DoubleArray& values,
+                    const py::object& weights) {
+        if (values.ndim() != 1)
+            throw py::value_error("values must be 1-dimensional");
+        const auto n = static_cast<std::size_t>(values.shape(0));
+        const auto w = pyquantlib::sample_weights(weights, n);
+        const auto x = values.unchecked<1>();
+        py::gil_scoped_release release;
+        for (std::size_t i = 0; i < n; ++i)
+            self.add(x(static_cast<py::ssize_t>(i)), w[i]);
+    }
+}
+
 void ql_math::incrementalstatistics(py::module_& m) {
-    py::class_<IncrementalStatistics>(
+    // QuantLib's IncrementalStatistics keeps boost accumulators that can be
+    // neither merged nor restored; the moment-based equivalent can.
+    py::class_<pyquantlib::IncrementalStatistics>(
         m, "IncrementalStatistics",
-        "Statistics tool based on incremental accumulation (boost accumulators).")
+        "Statistics tool based on incremental accumulation of weighted moments. "
+        "Accumulators can be merged and pickled.")
         .def(py::init<>())
         // Inspectors
-        .def("samples", &IncrementalStatistics::samples,
+        .def("samples", &pyquantlib::IncrementalStatistics::samples,
             "Returns the number of samples collected.")
-        .def("weightSum", &IncrementalStatistics::weightSum,
+        .def("weightSum", &pyquantlib::IncrementalStatistics::weightSum,
             "Returns the sum of data weights.")
-        .def("mean", &IncrementalStatistics::mean,
+        .def("mean", &pyquantlib::IncrementalStatistics::mean,
             "Returns the mean.")
-        .def("variance", &IncrementalStatistics::variance,
+        .def("variance", &pyquantlib::IncrementalStatistics::variance,
             "Returns the variance.")
-        .def("standardDeviation", &IncrementalStatistics::standardDeviation,
+        .def("standardDeviation", &pyquantlib::IncrementalStatistics::standardDeviation,
             "Returns the standard deviation.")
-        .def("errorEstimate", &IncrementalStatistics::errorEstimate,
+        .def("errorEstimate", &pyquantlib::IncrementalStatistics::errorEstimate,
             "Returns the error estimate on the mean value.")
-        .def("skewness", &IncrementalStatistics::skewness,
+        .def("skewness", &pyquantlib::IncrementalStatistics::skewness,
             "Returns the skewness.")
-        .def("kurtosis", &IncrementalStatistics::kurtosis,
+        .def("kurtosis", &pyquantlib::IncrementalStatistics::kurtosis,
             "Returns the excess kurtosis.")
-        .def("min", &IncrementalStatistics::min,
+        .def("min", &pyquantlib::IncrementalStatistics::min,
             "Returns the minimum sample value.")
-        .def("max", &IncrementalStatistics::max,
+        .def("max", &pyquantlib::IncrementalStatistics::max,
             "Returns the maximum sample value.")
-        .def("downsideSamples", &IncrementalStatistics::downsideSamples,
+        .def("downsideSamples", &pyquantlib::IncrementalStatistics::downsideSamples,
             "Returns the number of negative samples collected.")
-        .def("downsideWeightSum", &IncrementalStatistics::downsideWeightSum,
+        .def("downsideWeightSum", &pyquantlib::IncrementalStatistics::downsideWeightSum,
             "Returns the sum of data weights for negative samples.")
-        .def("downsideVariance", &IncrementalStatistics::downsideVariance,
+        .def("downsideVariance", &pyquantlib::IncrementalStatistics::downsideVariance,
             "Returns the downside variance.")
-        .def("downsideDeviation", &IncrementalStatistics::downsideDeviation,
+        .def("downsideDeviation", &pyquantlib::IncrementalStatistics::downsideDeviation,
             "Returns the downside deviation.")
         // Modifiers
-        .def("add", &IncrementalStatistics::add,
+        .def("add", &pyquantlib::IncrementalStatistics::add,
             py::arg("value"),
             py::arg("weight") = 1.0,
             "Adds a datum to the set, possibly with a weight.")
+        .def("add",
+            &addSamples,
+            py::arg("values"),
+            py::arg("weights") = py::none(),
+            "Adds a 1-D array of data, with unit weights, a common weight or "
+            "one weight per datum. The loop runs without the GIL.")
         .def("addSequence",
-            [](IncrementalStatistics& self, const std::vector<Real>& values) {
+            [](pyquantlib::IncrementalStatistics& self, const std::vector<Real>& values) {
                 self.addSequence(values.begin(), values.end());
             },
             py::arg("values"),
             "Adds a sequence of data to the set.")
         .def("addSequence",
-            [](IncrementalStatistics& self, const std::vector<Real>& values,
+            [](pyquantlib::IncrementalStatistics& self, const std::vector<Real>& values,
                const std::vector<Real>& weights) {
                 self.addSequence(values.begin(), values.end(),
                                  weights.begin());
@@ -73,6 +100,34 @@ void ql_math::incrementalstatistics(py::module_& m) {
             py::arg("values"),
             py::arg("weights"),
             "Adds a sequence of data with weights.")
-        .def("reset", &IncrementalStatistics::reset,
-            "Resets the data to a null set.");
+        .def("merge", &pyquantlib::IncrementalStatistics::merge,
+            py::arg("other"),
+            "Adds the data collected by another accumulator. The moments are "
+            "those of the combined data set.")
+        .def("reset", &pyquantlib::IncrementalStatistics::reset,
+            "Resets the data to a null set.")
+        .def(py::pickle(
+            [](const pyquantlib::IncrementalStatistics& self) {
+                const auto& s = self.state();
+                return py::make_tuple(s.samples, s.weightSum, s.mean, s.m2, s.m3,
+                                      s.m4, s.min, s.max, s.downsideSamples,
+                                      s.downsideWeightSum, s.downsideSquareSum);
+            },
+            [](const py::tuple& state) {
+                if (state.size() != 11)
+                    throw py::value_error("invalid IncrementalStatistics state");
+                pyquantlib::IncrementalStatistics::State s;
+                s.samples = state[0].cast<Size>();
+                s.weightSum = state[1].cast<Real>();
+                s.mean = state[2].cast<Real>();
+                s.m2 = state[3].cast<Real>();
+                s.m3 = state[4].cast<Real>();
+                s.m4 = state[5].cast<Real>();
+                s.min = state[6].cast<Real>();
+                s.max = state[7].cast<Real>();
+                s.downsideSamples = state[8].cast<Size>();
+                s.downsideWeightSum = state[9].cast<Real>();
+                s.downsideSquareSum = state[10].cast<Real>();
+                return pyquantlib::IncrementalStatistics(s);
+            }));
 }
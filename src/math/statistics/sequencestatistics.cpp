@@ -12,13 +12,128 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/math/statistics/sequencestatistics.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
+#include <algorithm>
+#include <vector>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
+namespace {
+
+    // Merging and pickling need the per-dimension statistics and the sum of
+    // weighted outer products, which QuantLib keeps protected.
+    struct SequenceStatisticsAccess : SequenceStatistics {
+        static std::vector<Statistics>& stats(SequenceStatistics& s) {
+            return s.*&SequenceStatisticsAccess::stats_;
+        }
+        static const std::vector<Statistics>& stats(const SequenceStatistics& s) {
+            return s.*&SequenceStatisticsAccess::stats_;
+        }
+        static Matrix& quadraticSum(SequenceStatistics& s) {
+            return s.*&SequenceStatisticsAccess::quadraticSum_;
+        }
+        static const Matrix& quadraticSum(const SequenceStatistics& s) {
+            return s.*&SequenceStatisticsAccess::quadraticSum_;
+        }
+    };
+
+    void addSamples(SequenceStatistics& self, const pyquantlib::DoubleArray& samples,
+                    const py::object& weights) {
+        if (samples.ndim() != 2)
+            throw py::value_error("samples must be 2-dimensional (samples x dimension)");
+        const auto n = static_cast<std::size_t>(samples.shape(0));
+        const auto w = pyquantlib::sample_weights(weights, n);
+        const auto x = samples.unchecked<2>();
+        std::vector<Real> row(static_cast<std::size_t>(samples.shape(1)));
+        py::gil_scoped_release release;
+        for (std::size_t i = 0; i < n; ++i) {
+            for (std::size_t j = 0; j < row.size(); ++j)
+                row[j] = x(static_cast<py::ssize_t>(i), static_cast<py::ssize_t>(j));
+            self.add(row.begin(), row.end(), w[i]);
+        }
+    }
+
+    // Adds the samples of each dimension and the outer products of the other
+    // accumulator. The samples of a dimension may have been sorted (by
+    // percentile queries), so they are merged per dimension, not per row.
+    void mergeSamples(SequenceStatistics& self, const SequenceStatistics& other) {
+        if (other.size() == 0)
+            return;
+        if (self.size() == 0)
+            self.reset(other.size());
+        QL_REQUIRE(self.size() == other.size(),
+                   "dimension mismatch: " << self.size() << " vs " << other.size());
+        // Copies, since other may be self.
+        const std::vector<Statistics> stats = SequenceStatisticsAccess::stats(other);
+        const Matrix quadraticSum = SequenceStatisticsAccess::quadraticSum(other);
+        auto& target = SequenceStatisticsAccess::stats(self);
+        for (Size i = 0; i < target.size(); ++i) {
+            const auto& samples = stats[i].data();
+            target[i].reserve(target[i].samples() + samples.size());
+            for (const auto& sample : samples)
+                target[i].add(sample.first, sample.second);
+        }
+        SequenceStatisticsAccess::quadraticSum(self) += quadraticSum;
+    }
+
+    // (values, weights, quadraticSum): per-dimension samples as
+    // (dimension, samples) arrays and the (dimension, dimension) sums.
+    py::tuple getState(const SequenceStatistics& self) {
+        const auto& stats = SequenceStatisticsAccess::stats(self);
+        const auto d = static_cast<py::ssize_t>(stats.size());
+        const auto n = static_cast<py::ssize_t>(self.samples());
+        py::array_t<Real> values({d, n}), weights({d, n}), quadraticSum({d, d});
+        Real* v = values.mutable_data();
+        Real* w = weights.mutable_data();
+        for (const auto& s : stats) {
+            for (const auto& sample : s.data()) {
+                *v++ = sample.first;
+                *w++ = sample.second;
+            }
+        }
+        if (d > 0) {
+            const Matrix& q = SequenceStatisticsAccess::quadraticSum(self);
+            std::copy(q.begin(), q.end(), quadraticSum.mutable_data());
+        }
+        return py::make_tuple(values, weights, quadraticSum);
+    }
+
+    SequenceStatistics setState(const py::tuple& state) {
+        using Array2 = py::array_t<Real, py::array::c_style | py::array::forcecast>;
+        if (state.size() != 3)
+            throw py::value_error("invalid SequenceStatistics state");
+        const auto values = state[0].cast<Array2>();
+        const auto weights = state[1].cast<Array2>();
+        const auto quadraticSum = state[2].cast<Array2>();
+        if (values.ndim() != 2 || weights.ndim() != 2 || quadraticSum.ndim() != 2 ||
+            weights.shape(0) != values.shape(0) || weights.shape(1) != values.shape(1) ||
+            quadraticSum.shape(0) != values.shape(0) ||
+            quadraticSum.shape(1) != values.shape(0))
+            throw py::value_error("invalid SequenceStatistics state");
+        const auto d = static_cast<Size>(values.shape(0));
+        const auto n = static_cast<Size>(values.shape(1));
+        SequenceStatistics self(d);
+        auto& stats = SequenceStatisticsAccess::stats(self);
+        const Real* v = values.data();
+        const Real* w = weights.data();
+        for (auto& s : stats) {
+            s.reserve(n);
+            for (Size k = 0; k < n; ++k)
+                s.add(*v++, *w++);
+        }
+        if (d > 0) {
+            Matrix& q = SequenceStatisticsAccess::quadraticSum(self);
+            std::copy_n(quadraticSum.data(), d * d, q.begin());
+        }
+        return self;
+    }
+}
+
 void ql_math::sequencestatistics(py::module_& m) {
     // SequenceStatistics = GenericSequenceStatistics<Statistics>
     py::class_<SequenceStatistics>(
@@ -113,7 +228,19 @@ void ql_math::sequencestatistics(py::module_& m) {
             py::arg("sample"),
             py::arg("weight") = 1.0,
             "Adds an N-dimensional sample, possibly with a weight.")
+        .def("add",
+            &addSamples,
+            py::arg("samples"),
+            py::arg("weights") = py::none(),
+            "Adds a (samples, dimension) array of samples, with unit weights, "
+            "a common weight or one weight per sample. The loop runs without "
+            "the GIL.")
+        .def("merge", &mergeSamples,
+            py::arg("other"),
+            "Adds the data collected by another SequenceStatistics of the "
+            "same dimension.")
         .def("reset", &SequenceStatistics::reset,
             py::arg("dimension") = 0,
-            "Resets the data, optionally with a new dimension.");
+            "Resets the data, optionally with a new dimension.")
+        .def(py::pickle(&getState, &setState));
 }
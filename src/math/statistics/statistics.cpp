@@ -12,13 +12,42 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/math/statistics/statistics.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
+#include <utility>
+#include <vector>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
+namespace {
+
+    void addSamples(Statistics& self, const pyquantlib::DoubleArray& values,
+                    const py::object& weights) {
+        if (values.ndim() != 1)
+            throw py::value_error("values must be 1-dimensional");
+        const auto n = static_cast<std::size_t>(values.shape(0));
+        const auto w = pyquantlib::sample_weights(weights, n);
+        const auto x = values.unchecked<1>();
+        py::gil_scoped_release release;
+        self.reserve(self.samples() + n);
+        for (std::size_t i = 0; i < n; ++i)
+            self.add(x(static_cast<py::ssize_t>(i)), w[i]);
+    }
+
+    // Statistics keeps every sample, so merging adds the other's samples.
+    void mergeSamples(Statistics& self, const Statistics& other) {
+        // A copy, since other may be self.
+        const std::vector<std::pair<Real, Real>> samples = other.data();
+        self.reserve(self.samples() + samples.size());
+        for (const auto& sample : samples)
+            self.add(sample.first, sample.second);
+    }
+}
+
 void ql_math::statistics(py::module_& m) {
     // Statistics = RiskStatistics = GenericRiskStatistics<GaussianStatistics>
     // Inherits: GeneralStatistics -> GaussianStatistics -> RiskStatistics
@@ -115,6 +144,12 @@ void ql_math::statistics(py::module_& m) {
             py::arg("value"),
             py::arg("weight") = 1.0,
             "Adds a datum to the set, possibly with a weight.")
+        .def("add",
+            &addSamples,
+            py::arg("values"),
+            py::arg("weights") = py::none(),
+            "Adds a 1-D array of data, with unit weights, a common weight or "
+            "one weight per datum. The loop runs without the GIL.")
         .def("addSequence",
             [](Statistics& self, const std::vector<Real>& values) {
                 self.addSequence(values.begin(), values.end());
@@ -133,5 +168,28 @@ void ql_math::statistics(py::module_& m) {
         .def("reset", &Statistics::reset,
             "Resets the data to a null set.")
         .def("sort", &Statistics::sort,
-            "Sorts the data set in increasing order.");
+            "Sorts the data set in increasing order.")
+        .def("merge", &mergeSamples,
+            py::arg("other"),
+            "Adds the data collected by another Statistics.")
+        .def(py::pickle(
+            [](const Statistics& self) {
+                const auto& samples = self.data();
+                const auto n = static_cast<py::ssize_t>(samples.size());
+                py::array_t<Real> values(n), weights(n);
+                Real* v = values.mutable_data();
+                Real* w = weights.mutable_data();
+                for (const auto& sample : samples) {
+                    *v++ = sample.first;
+                    *w++ = sample.second;
+                }
+                return py::make_tuple(values, weights);
+            },
+            [](const py::tuple& state) {
+                if (state.size() != 2)
+                    throw py::value_error("invalid Statistics state");
+                Statistics self;
+                addSamples(self, state[0].cast<pyquantlib::DoubleArray>(), state[1]);
+                return self;
+            }));
 }
@@ -12,6 +12,7 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/methods/montecarlo/multipathgenerator.hpp>
 #include <ql/math/randomnumbers/inversecumulativersg.hpp>
 #include <ql/math/randomnumbers/randomsequencegenerator.hpp>
@@ -19,7 +20,9 @@
 #include <ql/math/randomnumbers/sobolrsg.hpp>
 #include <ql/math/distributions/normaldistribution.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
+#include <algorithm>
 
 namespace py = pybind11;
 using namespace QuantLib;
@@ -35,6 +38,54 @@ using GaussianMultiPathGenerator =
 using GaussianSobolMultiPathGenerator =
     MultiPathGenerator<GaussianLowDiscrepancySequenceGenerator>;
 
+namespace {
+
+    // Draws nPaths multi-paths into a (rows, assets, timeGrid.size())
+    // array. With antithetic = true every multi-path is followed by its
+    // antithetic, so rows = 2 * nPaths. The generator does not expose its
+    // process or time grid, so the shape is read off a draw from a copy:
+    // g is not advanced until out has been checked.
+    template <class MPG>
+    py::tuple generateMultiPaths(const MPG& g, Size nPaths, bool antithetic,
+                                 const py::object& out) {
+        const auto rows = static_cast<py::ssize_t>(antithetic ? 2 * nPaths : nPaths);
+        py::ssize_t assets, length;
+        {
+            const MPG probe(g);
+            const MultiPath& first = probe.next().value;
+            assets = static_cast<py::ssize_t>(first.assetNumber());
+            length = static_cast<py::ssize_t>(first.pathSize());
+        }
+        auto values = pyquantlib::make_output(out, {rows, assets, length});
+        py::array_t<double> weights(rows);
+        double* v = values.mutable_data();
+        double* w = weights.mutable_data();
+        {
+            py::gil_scoped_release release;
+            auto store = [&](const typename MPG::sample_type& s) {
+                for (Size j = 0; j < s.value.assetNumber(); ++j) {
+                    const Path& path = s.value[j];
+                    std::copy(path.begin(), path.end(), v);
+                    v += length;
+                }
+                *w++ = s.weight;
+            };
+            for (Size i = 0; i < nPaths; ++i) {
+                store(g.next());
+                if (antithetic)
+                    store(g.antithetic());
+            }
+        }
+        return py::make_tuple(values, weights);
+    }
+
+    constexpr const char* generateDoc =
+        "Generates nPaths multi-paths into a (rows, assets, timeSteps + 1) "
+        "float64 array and returns (values, weights). With antithetic=True "
+        "each multi-path is followed by its antithetic, giving 2 * nPaths rows.";
+
+}
+
 void ql_methods::multipathgenerator(py::module_& m) {
     py::class_<GaussianMultiPathGenerator>(m, "GaussianMultiPathGenerator",
         "Multi-factor path generator using pseudo-random Gaussian variates.")
@@ -44,6 +95,10 @@ void ql_methods::multipathgenerator(py::module_& m) {
             py::arg("process"), py::arg("timeGrid"),
             py::arg("generator"), py::arg("brownianBridge") = false,
             "Constructs from process, time grid, and generator.")
+        .def("generate", &generateMultiPaths<GaussianMultiPathGenerator>,
+            py::arg("nPaths"), py::arg("antithetic") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            generateDoc)
         .def("next",
             [](const GaussianMultiPathGenerator& g) { return g.next(); },
             "Generates the next multi-path sample.")
@@ -60,6 +115,10 @@ void ql_methods::multipathgenerator(py::module_& m) {
             py::arg("process"), py::arg("timeGrid"),
             py::arg("generator"), py::arg("brownianBridge") = false,
             "Constructs from process, time grid, and generator.")
+        .def("generate", &generateMultiPaths<GaussianSobolMultiPathGenerator>,
+            py::arg("nPaths"), py::arg("antithetic") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            generateDoc)
         .def("next",
             [](const GaussianSobolMultiPathGenerator& g) { return g.next(); },
             "Generates the next multi-path sample.")
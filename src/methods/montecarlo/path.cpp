@@ -12,15 +12,17 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/methods/montecarlo/path.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
 void ql_methods::path(py::module_& m) {
-    py::class_<Path>(m, "Path",
+    py::class_<Path>(m, "Path", py::buffer_protocol(),
         "Single-factor random walk.")
         .def(py::init<const TimeGrid&, Array>(),
             py::arg("timeGrid"), py::arg("values") = Array(),
@@ -45,6 +47,31 @@ void ql_methods::path(py::module_& m) {
         .def("timeGrid", &Path::timeGrid,
             py::return_value_policy::reference_internal,
             "Returns the underlying time grid.")
+        .def_property_readonly("values",
+            [](py::object self) {
+                auto& p = self.cast<Path&>();
+                return pyquantlib::view_of(p.empty() ? nullptr : &p.front(),
+                                           p.length(), self, true);
+            },
+            "Writeable NumPy view of the path values, sharing the path's "
+            "memory and keeping the path alive.")
+        .def_property_readonly("times",
+            [](py::object self) {
+                const auto& grid = self.cast<const Path&>().timeGrid();
+                return pyquantlib::view_of(grid.empty() ? nullptr : &grid[0],
+                                           grid.size(), self, false);
+            },
+            "Read-only NumPy view of the path's time grid.")
+        .def_buffer([](Path& p) -> py::buffer_info {
+            return py::buffer_info(
+                p.empty() ? nullptr : &p.front(),
+                sizeof(Real),
+                py::format_descriptor<Real>::format(),
+                1,
+                { p.length() },
+                { sizeof(Real) }
+            );
+        })
         .def("__repr__", [](const Path& p) {
             return "Path(length=" + std::to_string(p.length()) + ")";
         });
@@ -12,6 +12,7 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/methods/montecarlo/pathgenerator.hpp>
 #include <ql/math/randomnumbers/inversecumulativersg.hpp>
 #include <ql/math/randomnumbers/randomsequencegenerator.hpp>
@@ -19,7 +20,9 @@
 #include <ql/math/randomnumbers/sobolrsg.hpp>
 #include <ql/math/distributions/normaldistribution.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
+#include <algorithm>
 
 namespace py = pybind11;
 using namespace QuantLib;
@@ -34,6 +37,43 @@ using GaussianPathGenerator = PathGenerator<GaussianRandomSequenceGenerator>;
 using GaussianSobolPathGenerator =
     PathGenerator<GaussianLowDiscrepancySequenceGenerator>;
 
+namespace {
+
+    // Draws nPaths paths into the rows of a (rows, timeGrid.size()) array.
+    // With antithetic = true every path is followed by its antithetic, so
+    // rows = 2 * nPaths.
+    template <class PG>
+    py::tuple generatePaths(const PG& g, Size nPaths, bool antithetic,
+                            const py::object& out) {
+        const auto rows = static_cast<py::ssize_t>(antithetic ? 2 * nPaths : nPaths);
+        const auto length = static_cast<py::ssize_t>(g.timeGrid().size());
+        auto values = pyquantlib::make_output(out, {rows, length});
+        py::array_t<double> weights(rows);
+        double* v = values.mutable_data();
+        double* w = weights.mutable_data();
+        {
+            py::gil_scoped_release release;
+            auto store = [&](const typename PG::sample_type& sample) {
+                std::copy(sample.value.begin(), sample.value.end(), v);
+                v += length;
+                *w++ = sample.weight;
+            };
+            for (Size i = 0; i < nPaths; ++i) {
+                store(g.next());
+                if (antithetic)
+                    store(g.antithetic());
+            }
+        }
+        return py::make_tuple(values, weights);
+    }
+
+    constexpr const char* generateDoc =
+        "Generates nPaths paths into a (rows, timeGrid.size()) float64 array "
+        "and returns (values, weights). With antithetic=True each path is "
+        "followed by its antithetic, giving 2 * nPaths rows.";
+
+}
+
 void ql_methods::pathgenerator(py::module_& m) {
     py::class_<GaussianPathGenerator>(m, "GaussianPathGenerator",
         "Single-factor path generator using pseudo-random Gaussian variates.")
@@ -52,6 +92,10 @@ void ql_methods::pathgenerator(py::module_& m) {
         .def("antithetic",
             [](const GaussianPathGenerator& g) { return g.antithetic(); },
             "Generates the antithetic path sample.")
+        .def("generate", &generatePaths<GaussianPathGenerator>,
+            py::arg("nPaths"), py::arg("antithetic") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            generateDoc)
         .def("size", &GaussianPathGenerator::size,
             "Generator dimensionality.")
         .def("timeGrid", &GaussianPathGenerator::timeGrid,
@@ -78,6 +122,10 @@ void ql_methods::pathgenerator(py::module_& m) {
         .def("antithetic",
             [](const GaussianSobolPathGenerator& g) { return g.antithetic(); },
             "Generates the antithetic path sample.")
+        .def("generate", &generatePaths<GaussianSobolPathGenerator>,
+            py::arg("nPaths"), py::arg("antithetic") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            generateDoc)
         .def("size", &GaussianSobolPathGenerator::size,
             "Generator dimensionality.")
         .def("timeGrid", &GaussianSobolPathGenerator::timeGrid,
@@ -18,5 +18,7 @@
 DECLARE_MODULE_BINDINGS(patterns_bindings) {
     ADD_BASE_BINDING(ql_patterns::observer, "Observer ABC");
     ADD_MAIN_BINDING(ql_patterns::observable, "Observable");
+    ADD_MAIN_BINDING(ql_patterns::observablesettings,
+        "ObservableSettings, batch_updates");
     ADD_BASE_BINDING(ql_patterns::lazyobject, "LazyObject ABC");
 }
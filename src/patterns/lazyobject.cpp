@@ -30,6 +30,7 @@ void ql_patterns::lazyobject(py::module_& m) {
         .def(py::init_alias<>())
         
         .def("recalculate", &LazyObject::recalculate,
+            py::call_guard<py::gil_scoped_release>(),
             "Force recalculation of the object.")
         .def("freeze", &LazyObject::freeze,
             "Freeze the object, preventing automatic recalculation.")
@@ -0,0 +1,88 @@
+/*
+ * PyQuantLib: Python bindings for QuantLib
+ * https://github.com/quantales/pyquantlib
+ *
+ * Copyright (c) 2025 Yassine Idyiahia
+ * SPDX-License-Identifier: BSD-3-Clause
+ * See LICENSE for details.
+ *
+ * ---
+ * QuantLib is Copyright (c) 2000-2025 The QuantLib Authors
+ * https://www.quantlib.org/
+ */
+
+#include "pyquantlib/pyquantlib.h"
+#include <ql/patterns/observable.hpp>
+#include <pybind11/pybind11.h>
+
+namespace py = pybind11;
+using namespace QuantLib;
+
+namespace {
+
+// Defers notifications on entry and re-enables them on exit, at which point
+// each observer notified in the meantime receives a single update. Inside
+// an enclosing batch (or with updates already disabled) it does nothing,
+// so batches nest.
+class BatchUpdates {
+  public:
+    void enter() {
+        QL_REQUIRE(!entered_, "batch_updates context already entered");
+        auto& settings = ObservableSettings::instance();
+        owner_ = settings.updatesEnabled();
+        if (owner_)
+            settings.disableUpdates(true);
+        entered_ = true;
+    }
+
+    void exit() {
+        entered_ = false;
+        if (owner_) {
+            owner_ = false;
+            ObservableSettings::instance().enableUpdates();
+        }
+    }
+
+  private:
+    bool entered_ = false;
+    bool owner_ = false;
+};
+
+}  // namespace
+
+void ql_patterns::observablesettings(py::module_& m) {
+    py::class_<ObservableSettings, std::unique_ptr<ObservableSettings, py::nodelete>>(
+        m, "ObservableSettings",
+        "Global switch for observer notifications.")
+        .def_static("instance", &ObservableSettings::instance,
+            py::return_value_policy::reference,
+            "Returns the singleton instance.")
+        .def("disableUpdates", &ObservableSettings::disableUpdates,
+            py::arg("deferred") = false,
+            "Disables notifications. If deferred, observers notified while "
+            "disabled are updated once when updates are enabled again.")
+        .def("enableUpdates", &ObservableSettings::enableUpdates,
+            "Enables notifications and sends the deferred ones.")
+        .def("updatesEnabled", &ObservableSettings::updatesEnabled,
+            "Whether notifications are enabled.")
+        .def("updatesDeferred", &ObservableSettings::updatesDeferred,
+            "Whether notifications are being deferred.");
+
+    py::class_<BatchUpdates>(m, "BatchUpdates",
+        "Context manager deferring observer notifications until exit.")
+        .def(py::init<>(),
+            "Creates a context; notifications are deferred once entered.")
+        .def("__enter__", [](BatchUpdates& self) -> BatchUpdates& {
+                self.enter();
+                return self;
+            })
+        .def("__exit__", [](BatchUpdates& self, py::object, py::object, py::object) {
+            self.exit();
+        });
+
+    m.def("batch_updates",
+        []() { return BatchUpdates(); },
+        "Returns a BatchUpdates context for use in a with-statement. Quote "
+        "changes inside the block are collected and each observer is updated "
+        "once on exit.");
+}
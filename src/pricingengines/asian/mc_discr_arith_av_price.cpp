@@ -13,6 +13,7 @@
 
 #include "pyquantlib/pyquantlib.h"
 #include "pyquantlib/null_utils.h"
+#include "pyquantlib/parallel_mc.h"
 #include <ql/pricingengines/asian/mc_discr_arith_av_price.hpp>
 #include <ql/processes/blackscholesprocess.hpp>
 #include <pybind11/pybind11.h>
@@ -30,32 +31,31 @@ void ql_pricingengines::mcdiscretearithmeticapengine(py::module_& m) {
            py::object requiredSamples,
            py::object requiredTolerance,
            py::object maxSamples,
-           BigNatural seed) -> ext::shared_ptr<PricingEngine> {
+           BigNatural seed,
+           Size nThreads) -> ext::shared_ptr<PricingEngine> {
 
-            Size requiredSamplesVal = from_python_with_null<Size>(requiredSamples);
-            Real requiredToleranceVal = from_python_with_null<Real>(requiredTolerance);
-            Size maxSamplesVal = from_python_with_null<Size>(maxSamples);
+            pyquantlib::McSampling sampling;
+            sampling.requiredSamples = from_python_with_null<Size>(requiredSamples);
+            sampling.requiredTolerance = from_python_with_null<Real>(requiredTolerance);
+            sampling.maxSamples = from_python_with_null<Size>(maxSamples);
+            sampling.seed = seed;
+            sampling.nThreads = nThreads;
 
             if (rngType == "lowdiscrepancy") {
-                auto maker = MakeMCDiscreteArithmeticAPEngine<LowDiscrepancy>(process);
+                auto maker = MakeMCDiscreteArithmeticAPEngine<pyquantlib::BlockLowDiscrepancy>(process);
                 if (brownianBridge) maker.withBrownianBridge(brownianBridge);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
                 if (controlVariate) maker.withControlVariate(controlVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
-                if (seed != 0) maker.withSeed(seed);
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<
+                    MCDiscreteArithmeticAPEngine<pyquantlib::BlockLowDiscrepancy>,
+                    pyquantlib::BlockLowDiscrepancy>(maker, sampling, process);
             } else {
                 auto maker = MakeMCDiscreteArithmeticAPEngine<PseudoRandom>(process);
                 if (brownianBridge) maker.withBrownianBridge(brownianBridge);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
                 if (controlVariate) maker.withControlVariate(controlVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
-                if (seed != 0) maker.withSeed(seed);
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<MCDiscreteArithmeticAPEngine<PseudoRandom>, PseudoRandom>(
+                    maker, sampling, process);
             }
         },
         py::arg("process"),
@@ -67,5 +67,6 @@ void ql_pricingengines::mcdiscretearithmeticapengine(py::module_& m) {
         py::arg("requiredTolerance") = py::none(),
         py::arg("maxSamples") = py::none(),
         py::arg("seed") = 0,
+        py::arg("nThreads") = 1,
         "Monte Carlo discrete arithmetic average price Asian engine.");
 }
@@ -13,6 +13,7 @@
 
 #include "pyquantlib/pyquantlib.h"
 #include "pyquantlib/null_utils.h"
+#include "pyquantlib/parallel_mc.h"
 #include <ql/pricingengines/asian/mc_discr_arith_av_price_heston.hpp>
 #include <ql/processes/hestonprocess.hpp>
 #include <pybind11/pybind11.h>
@@ -42,13 +43,18 @@ void ql_pricingengines::mcdiscretearithmeticaphestonengine(py::module_& m) {
            py::object maxSamples,
            BigNatural seed,
            py::object timeSteps,
-           py::object timeStepsPerYear) -> ext::shared_ptr<PricingEngine> {
+           py::object timeStepsPerYear,
+           Size nThreads) -> ext::shared_ptr<PricingEngine> {
 
             std::string lowerRngType = to_lower(rngType);
 
-            Size requiredSamplesVal = from_python_with_null<Size>(requiredSamples);
-            Real requiredToleranceVal = from_python_with_null<Real>(requiredTolerance);
-            Size maxSamplesVal = from_python_with_null<Size>(maxSamples);
+            pyquantlib::McSampling sampling;
+            sampling.requiredSamples = from_python_with_null<Size>(requiredSamples);
+            sampling.requiredTolerance = from_python_with_null<Real>(requiredTolerance);
+            sampling.maxSamples = from_python_with_null<Size>(maxSamples);
+            sampling.seed = seed;
+            sampling.nThreads = nThreads;
+
             Size timeStepsVal = from_python_with_null<Size>(timeSteps);
             Size timeStepsPerYearVal = from_python_with_null<Size>(timeStepsPerYear);
 
@@ -56,24 +62,19 @@ void ql_pricingengines::mcdiscretearithmeticaphestonengine(py::module_& m) {
                 auto maker = MakeMCDiscreteArithmeticAPHestonEngine<PseudoRandom>(process);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
                 if (controlVariate) maker.withControlVariate(controlVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
-                if (seed != 0) maker.withSeed(seed);
                 if (!is_null<Size>(timeSteps)) maker.withSteps(timeStepsVal);
                 if (!is_null<Size>(timeStepsPerYear)) maker.withStepsPerYear(timeStepsPerYearVal);
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<MCDiscreteArithmeticAPHestonEngine<PseudoRandom>, PseudoRandom>(
+                    maker, sampling, process);
             } else if (lowerRngType == "lowdiscrepancy") {
-                auto maker = MakeMCDiscreteArithmeticAPHestonEngine<LowDiscrepancy>(process);
+                auto maker = MakeMCDiscreteArithmeticAPHestonEngine<pyquantlib::BlockLowDiscrepancy>(process);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
                 if (controlVariate) maker.withControlVariate(controlVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
-                if (seed != 0) maker.withSeed(seed);
                 if (!is_null<Size>(timeSteps)) maker.withSteps(timeStepsVal);
                 if (!is_null<Size>(timeStepsPerYear)) maker.withStepsPerYear(timeStepsPerYearVal);
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<
+                    MCDiscreteArithmeticAPHestonEngine<pyquantlib::BlockLowDiscrepancy>,
+                    pyquantlib::BlockLowDiscrepancy>(maker, sampling, process);
             } else {
                 throw std::runtime_error(
                     "Unsupported RNG type. Use 'pseudorandom' or 'lowdiscrepancy'.");
@@ -89,5 +90,6 @@ void ql_pricingengines::mcdiscretearithmeticaphestonengine(py::module_& m) {
         py::arg("seed") = 0,
         py::arg("timeSteps") = py::none(),
         py::arg("timeStepsPerYear") = py::none(),
+        py::arg("nThreads") = 1,
         "Monte Carlo discrete arithmetic average price Asian engine (Heston).");
 }
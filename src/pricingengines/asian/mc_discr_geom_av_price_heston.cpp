@@ -13,6 +13,7 @@
 
 #include "pyquantlib/pyquantlib.h"
 #include "pyquantlib/null_utils.h"
+#include "pyquantlib/parallel_mc.h"
 #include <ql/pricingengines/asian/mc_discr_geom_av_price_heston.hpp>
 #include <ql/processes/hestonprocess.hpp>
 #include <pybind11/pybind11.h>
@@ -41,36 +42,36 @@ void ql_pricingengines::mcdiscretegeometricaphestonengine(py::module_& m) {
            py::object maxSamples,
            BigNatural seed,
            py::object timeSteps,
-           py::object timeStepsPerYear) -> ext::shared_ptr<PricingEngine> {
+           py::object timeStepsPerYear,
+           Size nThreads) -> ext::shared_ptr<PricingEngine> {
 
             std::string lowerRngType = to_lower(rngType);
 
-            Size requiredSamplesVal = from_python_with_null<Size>(requiredSamples);
-            Real requiredToleranceVal = from_python_with_null<Real>(requiredTolerance);
-            Size maxSamplesVal = from_python_with_null<Size>(maxSamples);
+            pyquantlib::McSampling sampling;
+            sampling.requiredSamples = from_python_with_null<Size>(requiredSamples);
+            sampling.requiredTolerance = from_python_with_null<Real>(requiredTolerance);
+            sampling.maxSamples = from_python_with_null<Size>(maxSamples);
+            sampling.seed = seed;
+            sampling.nThreads = nThreads;
+
             Size timeStepsVal = from_python_with_null<Size>(timeSteps);
             Size timeStepsPerYearVal = from_python_with_null<Size>(timeStepsPerYear);
 
             if (lowerRngType == "pseudorandom") {
                 auto maker = MakeMCDiscreteGeometricAPHestonEngine<PseudoRandom>(process);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
-                if (seed != 0) maker.withSeed(seed);
                 if (!is_null<Size>(timeSteps)) maker.withSteps(timeStepsVal);
                 if (!is_null<Size>(timeStepsPerYear)) maker.withStepsPerYear(timeStepsPerYearVal);
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<MCDiscreteGeometricAPHestonEngine<PseudoRandom>, PseudoRandom>(
+                    maker, sampling, process);
             } else if (lowerRngType == "lowdiscrepancy") {
-                auto maker = MakeMCDiscreteGeometricAPHestonEngine<LowDiscrepancy>(process);
+                auto maker = MakeMCDiscreteGeometricAPHestonEngine<pyquantlib::BlockLowDiscrepancy>(process);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
-                if (seed != 0) maker.withSeed(seed);
                 if (!is_null<Size>(timeSteps)) maker.withSteps(timeStepsVal);
                 if (!is_null<Size>(timeStepsPerYear)) maker.withStepsPerYear(timeStepsPerYearVal);
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<
+                    MCDiscreteGeometricAPHestonEngine<pyquantlib::BlockLowDiscrepancy>,
+                    pyquantlib::BlockLowDiscrepancy>(maker, sampling, process);
             } else {
                 throw std::runtime_error(
                     "Unsupported RNG type. Use 'pseudorandom' or 'lowdiscrepancy'.");
@@ -85,5 +86,6 @@ void ql_pricingengines::mcdiscretegeometricaphestonengine(py::module_& m) {
         py::arg("seed") = 0,
         py::arg("timeSteps") = py::none(),
         py::arg("timeStepsPerYear") = py::none(),
+        py::arg("nThreads") = 1,
         "Monte Carlo discrete geometric average price Asian engine (Heston).");
 }
@@ -13,6 +13,7 @@
 
 #include "pyquantlib/pyquantlib.h"
 #include "pyquantlib/null_utils.h"
+#include "pyquantlib/parallel_mc.h"
 #include <ql/pricingengines/barrier/mcbarrierengine.hpp>
 #include <ql/processes/blackscholesprocess.hpp>
 #include <pybind11/pybind11.h>
@@ -43,15 +44,19 @@ void ql_pricingengines::mcbarrierengine(py::module_& m) {
            py::object requiredTolerance,
            py::object maxSamples,
            bool isBiased,
-           BigNatural seed) -> ext::shared_ptr<PricingEngine> {
+           BigNatural seed,
+           Size nThreads) -> ext::shared_ptr<PricingEngine> {
 
             std::string lowerRngType = to_lower(rngType);
 
             Size timeStepsVal = from_python_with_null<Size>(timeSteps);
             Size timeStepsPerYearVal = from_python_with_null<Size>(timeStepsPerYear);
-            Size requiredSamplesVal = from_python_with_null<Size>(requiredSamples);
-            Real requiredToleranceVal = from_python_with_null<Real>(requiredTolerance);
-            Size maxSamplesVal = from_python_with_null<Size>(maxSamples);
+            pyquantlib::McSampling sampling;
+            sampling.requiredSamples = from_python_with_null<Size>(requiredSamples);
+            sampling.requiredTolerance = from_python_with_null<Real>(requiredTolerance);
+            sampling.maxSamples = from_python_with_null<Size>(maxSamples);
+            sampling.seed = seed;
+            sampling.nThreads = nThreads;
 
             if (lowerRngType == "pseudorandom") {
                 auto maker = MakeMCBarrierEngine<PseudoRandom>(process);
@@ -60,28 +65,23 @@ void ql_pricingengines::mcbarrierengine(py::module_& m) {
                 if (!is_null<Size>(timeStepsPerYear)) maker.withStepsPerYear(timeStepsPerYearVal);
                 if (brownianBridge) maker.withBrownianBridge(brownianBridge);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
                 if (isBiased) maker.withBias(isBiased);
-                if (seed != 0) maker.withSeed(seed);
 
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<MCBarrierEngine<PseudoRandom>, PseudoRandom>(
+                    maker, sampling, process);
 
             } else if (lowerRngType == "lowdiscrepancy") {
-                auto maker = MakeMCBarrierEngine<LowDiscrepancy>(process);
+                auto maker = MakeMCBarrierEngine<pyquantlib::BlockLowDiscrepancy>(process);
 
                 if (!is_null<Size>(timeSteps)) maker.withSteps(timeStepsVal);
                 if (!is_null<Size>(timeStepsPerYear)) maker.withStepsPerYear(timeStepsPerYearVal);
                 if (brownianBridge) maker.withBrownianBridge(brownianBridge);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
                 if (isBiased) maker.withBias(isBiased);
-                if (seed != 0) maker.withSeed(seed);
 
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<
+                    MCBarrierEngine<pyquantlib::BlockLowDiscrepancy>,
+                    pyquantlib::BlockLowDiscrepancy>(maker, sampling, process);
 
             } else {
                 throw std::runtime_error(
@@ -99,6 +99,7 @@ void ql_pricingengines::mcbarrierengine(py::module_& m) {
         py::arg("maxSamples") = py::none(),
         py::arg("isBiased") = false,
         py::arg("seed") = 0,
+        py::arg("nThreads") = 1,
         "Monte Carlo barrier option pricing engine.\n\n"
         "Uses Brownian-bridge correction for the barrier by default.\n"
         "Set isBiased=True for the simpler (biased) path pricer.");
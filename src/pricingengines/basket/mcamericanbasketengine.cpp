@@ -13,7 +13,9 @@
 
 #include "pyquantlib/pyquantlib.h"
 #include "pyquantlib/null_utils.h"
+#include "pyquantlib/parallel_mc.h"
 #include <ql/pricingengines/basket/mcamericanbasketengine.hpp>
+#include <ql/processes/blackscholesprocess.hpp>
 #include <ql/processes/stochasticprocessarray.hpp>
 #include <pybind11/pybind11.h>
 
@@ -33,41 +35,41 @@ void ql_pricingengines::mcamericanbasketengine(py::module_& m) {
            py::object maxSamples,
            BigNatural seed,
            py::object calibrationSamples,
-           Size polynomialOrder) -> ext::shared_ptr<PricingEngine> {
+           Size polynomialOrder,
+           Size nThreads) -> ext::shared_ptr<PricingEngine> {
 
             Size timeStepsVal = from_python_with_null<Size>(timeSteps);
             Size timeStepsPerYearVal = from_python_with_null<Size>(timeStepsPerYear);
-            Size requiredSamplesVal = from_python_with_null<Size>(requiredSamples);
-            Real requiredToleranceVal = from_python_with_null<Real>(requiredTolerance);
-            Size maxSamplesVal = from_python_with_null<Size>(maxSamples);
+            pyquantlib::McSampling sampling;
+            sampling.requiredSamples = from_python_with_null<Size>(requiredSamples);
+            sampling.requiredTolerance = from_python_with_null<Real>(requiredTolerance);
+            sampling.maxSamples = from_python_with_null<Size>(maxSamples);
+            sampling.seed = seed;
+            sampling.nThreads = nThreads;
             Size calibrationSamplesVal = from_python_with_null<Size>(calibrationSamples);
 
+
             if (rngType == "lowdiscrepancy") {
-                auto maker = MakeMCAmericanBasketEngine<LowDiscrepancy>(process);
+                auto maker = MakeMCAmericanBasketEngine<pyquantlib::BlockLowDiscrepancy>(process);
                 if (!is_null<Size>(timeSteps)) maker.withSteps(timeStepsVal);
                 if (!is_null<Size>(timeStepsPerYear)) maker.withStepsPerYear(timeStepsPerYearVal);
                 if (brownianBridge) maker.withBrownianBridge(brownianBridge);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
-                if (seed != 0) maker.withSeed(seed);
                 if (!is_null<Size>(calibrationSamples)) maker.withCalibrationSamples(calibrationSamplesVal);
                 maker.withPolynomialOrder(polynomialOrder);
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<
+                    MCAmericanBasketEngine<pyquantlib::BlockLowDiscrepancy>,
+                    pyquantlib::BlockLowDiscrepancy>(maker, sampling, process);
             } else {
                 auto maker = MakeMCAmericanBasketEngine<PseudoRandom>(process);
                 if (!is_null<Size>(timeSteps)) maker.withSteps(timeStepsVal);
                 if (!is_null<Size>(timeStepsPerYear)) maker.withStepsPerYear(timeStepsPerYearVal);
                 if (brownianBridge) maker.withBrownianBridge(brownianBridge);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
-                if (seed != 0) maker.withSeed(seed);
                 if (!is_null<Size>(calibrationSamples)) maker.withCalibrationSamples(calibrationSamplesVal);
                 maker.withPolynomialOrder(polynomialOrder);
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<MCAmericanBasketEngine<PseudoRandom>, PseudoRandom>(
+                    maker, sampling, process);
             }
         },
         py::arg("process"),
@@ -82,5 +84,7 @@ void ql_pricingengines::mcamericanbasketengine(py::module_& m) {
         py::arg("seed") = 0,
         py::arg("calibrationSamples") = py::none(),
         py::arg("polynomialOrder") = 2,
-        "Monte Carlo American basket option engine (Longstaff-Schwartz).");
+        py::arg("nThreads") = 1,
+        "Monte Carlo American basket option engine (Longstaff-Schwartz). "
+        "Single-threaded: nThreads must be 1.");
 }
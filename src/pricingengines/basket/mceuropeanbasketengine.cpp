@@ -12,7 +12,9 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/parallel_mc.h"
 #include <ql/pricingengines/basket/mceuropeanbasketengine.hpp>
+#include <ql/processes/blackscholesprocess.hpp>
 #include <ql/processes/stochasticprocessarray.hpp>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
@@ -20,6 +22,25 @@
 namespace py = pybind11;
 using namespace QuantLib;
 
+namespace {
+    template <class RNG>
+    ext::shared_ptr<MCEuropeanBasketEngine<RNG>> makeBasketEngine(
+            const ext::shared_ptr<StochasticProcessArray>& process,
+            Size timeSteps, Size timeStepsPerYear,
+            bool brownianBridge, bool antitheticVariate,
+            const pyquantlib::McSampling& sampling) {
+        using Engine = MCEuropeanBasketEngine<RNG>;
+        return pyquantlib::makeParallelMcEngine<Engine>(
+            sampling, std::is_same_v<RNG, pyquantlib::BlockLowDiscrepancy>,
+            [&](Size samples, Real tolerance, Size maxSamples, BigNatural seed) {
+                return ext::make_shared<Engine>(
+                    process, timeSteps, timeStepsPerYear, brownianBridge,
+                    antitheticVariate, samples, tolerance, maxSamples, seed);
+            },
+            process);
+    }
+}
+
 void ql_pricingengines::mceuropeanbasketengine(py::module_& m) {
 
     // MCEuropeanBasketEngine with PseudoRandom
@@ -35,17 +56,17 @@ void ql_pricingengines::mceuropeanbasketengine(py::module_& m) {
                          Size requiredSamples,
                          Real requiredTolerance,
                          Size maxSamples,
-                         BigNatural seed) {
-                return ext::make_shared<MCEuropeanBasketEnginePR>(
-                    process,
-                    timeSteps,
-                    timeStepsPerYear,
-                    brownianBridge,
-                    antitheticVariate,
-                    requiredSamples,
-                    requiredTolerance,
-                    maxSamples,
-                    seed);
+                         BigNatural seed,
+                         Size nThreads) {
+                pyquantlib::McSampling sampling;
+                sampling.requiredSamples = requiredSamples;
+                sampling.requiredTolerance = requiredTolerance;
+                sampling.maxSamples = maxSamples;
+                sampling.seed = seed;
+                sampling.nThreads = nThreads;
+                return makeBasketEngine<PseudoRandom>(
+                    process, timeSteps, timeStepsPerYear, brownianBridge,
+                    antitheticVariate, sampling);
             }),
             py::arg("process"),
             py::arg("timeSteps") = Null<Size>(),
@@ -56,10 +77,11 @@ void ql_pricingengines::mceuropeanbasketengine(py::module_& m) {
             py::arg("requiredTolerance") = Null<Real>(),
             py::arg("maxSamples") = Null<Size>(),
             py::arg("seed") = BigNatural(0),
+            py::arg("nThreads") = Size(1),
             "Constructs MC European basket engine with pseudo-random numbers.");
 
     // MCEuropeanBasketEngine with LowDiscrepancy (Sobol)
-    using MCEuropeanBasketEngineLD = MCEuropeanBasketEngine<LowDiscrepancy>;
+    using MCEuropeanBasketEngineLD = MCEuropeanBasketEngine<pyquantlib::BlockLowDiscrepancy>;
     py::class_<MCEuropeanBasketEngineLD, ext::shared_ptr<MCEuropeanBasketEngineLD>, PricingEngine>(
         m, "MCLDEuropeanBasketEngine",
         "Monte Carlo pricing engine for European basket options (low-discrepancy/Sobol).")
@@ -71,17 +93,17 @@ void ql_pricingengines::mceuropeanbasketengine(py::module_& m) {
                          Size requiredSamples,
                          Real requiredTolerance,
                          Size maxSamples,
-                         BigNatural seed) {
-                return ext::make_shared<MCEuropeanBasketEngineLD>(
-                    process,
-                    timeSteps,
-                    timeStepsPerYear,
-                    brownianBridge,
-                    antitheticVariate,
-                    requiredSamples,
-                    requiredTolerance,
-                    maxSamples,
-                    seed);
+                         BigNatural seed,
+                         Size nThreads) {
+                pyquantlib::McSampling sampling;
+                sampling.requiredSamples = requiredSamples;
+                sampling.requiredTolerance = requiredTolerance;
+                sampling.maxSamples = maxSamples;
+                sampling.seed = seed;
+                sampling.nThreads = nThreads;
+                return makeBasketEngine<pyquantlib::BlockLowDiscrepancy>(
+                    process, timeSteps, timeStepsPerYear, brownianBridge,
+                    antitheticVariate, sampling);
             }),
             py::arg("process"),
             py::arg("timeSteps") = Null<Size>(),
@@ -92,5 +114,6 @@ void ql_pricingengines::mceuropeanbasketengine(py::module_& m) {
             py::arg("requiredTolerance") = Null<Real>(),
             py::arg("maxSamples") = Null<Size>(),
             py::arg("seed") = BigNatural(0),
+            py::arg("nThreads") = Size(1),
             "Constructs MC European basket engine with low-discrepancy sequences.");
 }
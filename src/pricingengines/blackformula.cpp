@@ -12,11 +12,88 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/pricingengines/blackformula.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <cmath>
+#include <limits>
 
 namespace py = pybind11;
 using namespace QuantLib;
+using pyquantlib::BroadcastLoop;
+using pyquantlib::DoubleArray;
+using pyquantlib::element;
+
+namespace {
+
+// Option types as an int array (Call = 1, Put = -1). Accepts a single
+// OptionType or anything NumPy can turn into integers.
+py::array optionTypes(const py::object& obj) {
+    using TypeArray = py::array_t<int, py::array::c_style | py::array::forcecast>;
+    TypeArray types;
+    if (py::isinstance<Option::Type>(obj)) {
+        types = TypeArray(std::vector<py::ssize_t>{});
+        *types.mutable_data() = static_cast<int>(obj.cast<Option::Type>());
+    } else {
+        types = obj.cast<TypeArray>();
+    }
+    const int* t = types.data();
+    for (py::ssize_t i = 0; i < types.size(); ++i) {
+        if (t[i] != Option::Call && t[i] != Option::Put)
+            throw py::value_error("optionType values must be OptionType.Call (1) "
+                                  "or OptionType.Put (-1)");
+    }
+    return types;
+}
+
+Option::Type typeAt(const char* p) {
+    return static_cast<Option::Type>(element<int>(p));
+}
+
+// Evaluates f element-wise without the GIL. A failing element raises,
+// reporting its flat index.
+template <typename F>
+py::array_t<double> evaluate(const BroadcastLoop& loop, const py::object& out, F f) {
+    auto result = pyquantlib::make_output(out, loop.shape());
+    double* r = result.mutable_data();
+    {
+        py::gil_scoped_release release;
+        loop.run([&](py::ssize_t i, const char* const* p) {
+            try {
+                r[i] = f(p);
+            } catch (const std::exception& e) {
+                QL_FAIL("element " << i << ": " << e.what());
+            }
+        });
+    }
+    return result;
+}
+
+// Evaluates f element-wise without the GIL. Failing elements are set to
+// NaN and flagged in the returned boolean mask instead of raising.
+template <typename F>
+py::tuple evaluateMasked(const BroadcastLoop& loop, const py::object& out, F f) {
+    auto result = pyquantlib::make_output(out, loop.shape());
+    py::array_t<bool> failed(loop.shape());
+    double* r = result.mutable_data();
+    bool* fail = failed.mutable_data();
+    {
+        py::gil_scoped_release release;
+        loop.run([&](py::ssize_t i, const char* const* p) {
+            try {
+                r[i] = f(p);
+                fail[i] = false;
+            } catch (const std::exception&) {
+                r[i] = std::numeric_limits<double>::quiet_NaN();
+                fail[i] = true;
+            }
+        });
+    }
+    return py::make_tuple(result, failed);
+}
+
+}  // namespace
 
 void ql_pricingengines::blackformula(py::module_& m) {
 
@@ -32,6 +109,29 @@ void ql_pricingengines::blackformula(py::module_& m) {
         py::arg("displacement") = 0.0,
         "Black 1976 formula. stdDev = volatility * sqrt(T).");
 
+    m.def("blackFormula",
+        [](const py::object& optionType, const DoubleArray& strike,
+           const DoubleArray& forward, const DoubleArray& stdDev,
+           const DoubleArray& discount, const DoubleArray& displacement,
+           const py::object& out) {
+            BroadcastLoop loop({optionTypes(optionType), strike, forward,
+                                stdDev, discount, displacement});
+            return evaluate(loop, out, [](const char* const* p) {
+                return blackFormula(typeAt(p[0]), element<double>(p[1]),
+                                    element<double>(p[2]), element<double>(p[3]),
+                                    element<double>(p[4]), element<double>(p[5]));
+            });
+        },
+        py::arg("optionType"),
+        py::arg("strike"),
+        py::arg("forward"),
+        py::arg("stdDev"),
+        py::arg("discount") = 1.0,
+        py::arg("displacement") = 0.0,
+        py::kw_only(),
+        py::arg("out") = py::none(),
+        "Black 1976 formula over broadcast NumPy arrays (GIL released).");
+
     // Black implied standard deviation
     m.def("blackFormulaImpliedStdDev",
         py::overload_cast<Option::Type, Real, Real, Real, Real, Real, Real, Real, Natural>(
@@ -47,6 +147,36 @@ void ql_pricingengines::blackformula(py::module_& m) {
         py::arg("maxIterations") = 100,
         "Black 1976 implied standard deviation (volatility * sqrt(T)).");
 
+    m.def("blackFormulaImpliedStdDev",
+        [](const py::object& optionType, const DoubleArray& strike,
+           const DoubleArray& forward, const DoubleArray& blackPrice,
+           const DoubleArray& discount, const DoubleArray& displacement,
+           Real guess, Real accuracy, Natural maxIterations,
+           const py::object& out) {
+            BroadcastLoop loop({optionTypes(optionType), strike, forward,
+                                blackPrice, discount, displacement});
+            return evaluateMasked(loop, out, [=](const char* const* p) {
+                return blackFormulaImpliedStdDev(
+                    typeAt(p[0]), element<double>(p[1]), element<double>(p[2]),
+                    element<double>(p[3]), element<double>(p[4]),
+                    element<double>(p[5]), guess, accuracy, maxIterations);
+            });
+        },
+        py::arg("optionType"),
+        py::arg("strike"),
+        py::arg("forward"),
+        py::arg("blackPrice"),
+        py::arg("discount") = 1.0,
+        py::arg("displacement") = 0.0,
+        py::arg("guess") = Null<Real>(),
+        py::arg("accuracy") = 1.0e-6,
+        py::arg("maxIterations") = 100,
+        py::kw_only(),
+        py::arg("out") = py::none(),
+        "Black implied stdDev over broadcast NumPy arrays (GIL released).\n\n"
+        "Returns (stdDev, failed): elements whose solve fails are NaN and "
+        "flagged True in the boolean mask instead of raising.");
+
     // Black implied standard deviation approximation (faster, no iteration)
     m.def("blackFormulaImpliedStdDevApproximation",
         py::overload_cast<Option::Type, Real, Real, Real, Real, Real>(
@@ -126,6 +256,27 @@ void ql_pricingengines::blackformula(py::module_& m) {
         py::arg("discount") = 1.0,
         "Bachelier (normal) formula. stdDev = absoluteVol * sqrt(T).");
 
+    m.def("bachelierBlackFormula",
+        [](const py::object& optionType, const DoubleArray& strike,
+           const DoubleArray& forward, const DoubleArray& stdDev,
+           const DoubleArray& discount, const py::object& out) {
+            BroadcastLoop loop({optionTypes(optionType), strike, forward,
+                                stdDev, discount});
+            return evaluate(loop, out, [](const char* const* p) {
+                return bachelierBlackFormula(
+                    typeAt(p[0]), element<double>(p[1]), element<double>(p[2]),
+                    element<double>(p[3]), element<double>(p[4]));
+            });
+        },
+        py::arg("optionType"),
+        py::arg("strike"),
+        py::arg("forward"),
+        py::arg("stdDev"),
+        py::arg("discount") = 1.0,
+        py::kw_only(),
+        py::arg("out") = py::none(),
+        "Bachelier formula over broadcast NumPy arrays (GIL released).");
+
     // Bachelier implied volatility
     m.def("bachelierBlackFormulaImpliedVol",
         &bachelierBlackFormulaImpliedVol,
@@ -137,6 +288,32 @@ void ql_pricingengines::blackformula(py::module_& m) {
         py::arg("discount") = 1.0,
         "Bachelier implied volatility (exact, Jaeckel 2017).");
 
+    m.def("bachelierBlackFormulaImpliedVol",
+        [](const py::object& optionType, const DoubleArray& strike,
+           const DoubleArray& forward, const DoubleArray& tte,
+           const DoubleArray& bachelierPrice, const DoubleArray& discount,
+           const py::object& out) {
+            BroadcastLoop loop({optionTypes(optionType), strike, forward,
+                                tte, bachelierPrice, discount});
+            return evaluateMasked(loop, out, [](const char* const* p) {
+                return bachelierBlackFormulaImpliedVol(
+                    typeAt(p[0]), element<double>(p[1]), element<double>(p[2]),
+                    element<double>(p[3]), element<double>(p[4]),
+                    element<double>(p[5]));
+            });
+        },
+        py::arg("optionType"),
+        py::arg("strike"),
+        py::arg("forward"),
+        py::arg("tte"),
+        py::arg("bachelierPrice"),
+        py::arg("discount") = 1.0,
+        py::kw_only(),
+        py::arg("out") = py::none(),
+        "Bachelier implied vol over broadcast NumPy arrays (GIL released).\n\n"
+        "Returns (vol, failed): elements whose solve fails are NaN and "
+        "flagged True in the boolean mask instead of raising.");
+
     // Bachelier stdDev derivative
     m.def("bachelierBlackFormulaStdDevDerivative",
         py::overload_cast<Real, Real, Real, Real>(
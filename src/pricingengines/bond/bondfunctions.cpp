@@ -12,13 +12,216 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/bond_cache.h"
+#include "pyquantlib/numpy_utils.h"
+#include "pyquantlib/parallel.h"
+#include <ql/math/solvers1d/brent.hpp>
 #include <ql/pricingengines/bond/bondfunctions.hpp>
 #include <ql/termstructures/yieldtermstructure.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <pybind11/stl.h>
+#include <cmath>
+#include <limits>
+#include <vector>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
+namespace {
+
+    using pyquantlib::to_numpy;
+    using Bonds = std::vector<ext::shared_ptr<Bond>>;
+
+    void checkBonds(const Bonds& bonds) {
+        for (std::size_t i = 0; i < bonds.size(); ++i)
+            QL_REQUIRE(bonds[i], "null bond at index " << i);
+    }
+
+    py::dict curveAnalytics(const Bonds& bonds,
+                            const YieldTermStructure& discountCurve,
+                            const Date& settlementDate, Size nThreads) {
+        checkBonds(bonds);
+        const std::size_t n = bonds.size();
+        std::vector<double> clean(n), dirty(n), bps(n), accrued(n);
+        {
+            py::gil_scoped_release release;
+            // Shared curve and coupons: calculate them before the workers
+            // start.
+            discountCurve.discount(0.0, true);
+            const Size threads = pyquantlib::threadsForLegs(
+                n, nThreads, [&](std::size_t i) -> const Leg& { return bonds[i]->cashflows(); });
+            pyquantlib::parallelFor(n, threads, [&](std::size_t i) {
+                const Bond& bond = *bonds[i];
+                clean[i] = BondFunctions::cleanPrice(bond, discountCurve,
+                                                     settlementDate);
+                dirty[i] = BondFunctions::dirtyPrice(bond, discountCurve,
+                                                     settlementDate);
+                bps[i] = BondFunctions::bps(bond, discountCurve, settlementDate);
+                accrued[i] = BondFunctions::accruedAmount(bond, settlementDate);
+            });
+        }
+        py::dict result;
+        result["cleanPrice"] = to_numpy(clean);
+        result["dirtyPrice"] = to_numpy(dirty);
+        result["bps"] = to_numpy(bps);
+        result["accruedAmount"] = to_numpy(accrued);
+        return result;
+    }
+
+    py::dict yieldAnalytics(const Bonds& bonds,
+                            const pyquantlib::DoubleArray& yields,
+                            const DayCounter& dayCounter,
+                            Compounding compounding, Frequency frequency,
+                            const Date& settlementDate, Size nThreads) {
+        checkBonds(bonds);
+        const std::size_t n = bonds.size();
+        const auto y = pyquantlib::per_item(yields, n, "yields");
+        std::vector<double> clean(n), dirty(n), bpv(n), modified(n),
+            macaulay(n), convexity(n), accrued(n);
+        {
+            py::gil_scoped_release release;
+            const Size threads = pyquantlib::threadsForLegs(
+                n, nThreads, [&](std::size_t i) -> const Leg& { return bonds[i]->cashflows(); });
+            pyquantlib::parallelFor(n, threads, [&](std::size_t i) {
+                const Bond& bond = *bonds[i];
+                const InterestRate rate(y[i], dayCounter, compounding, frequency);
+                clean[i] = BondFunctions::cleanPrice(bond, rate, settlementDate);
+                dirty[i] = BondFunctions::dirtyPrice(bond, rate, settlementDate);
+                bpv[i] = BondFunctions::basisPointValue(bond, rate, settlementDate);
+                modified[i] = BondFunctions::duration(
+                    bond, rate, Duration::Modified, settlementDate);
+                // Macaulay duration is only defined for compounded rates.
+                macaulay[i] = compounding == Compounded
+                    ? BondFunctions::duration(bond, rate, Duration::Macaulay,
+                                              settlementDate)
+                    : std::numeric_limits<double>::quiet_NaN();
+                convexity[i] = BondFunctions::convexity(bond, rate, settlementDate);
+                accrued[i] = BondFunctions::accruedAmount(bond, settlementDate);
+            });
+        }
+        py::dict result;
+        result["cleanPrice"] = to_numpy(clean);
+        result["dirtyPrice"] = to_numpy(dirty);
+        result["basisPointValue"] = to_numpy(bpv);
+        result["modifiedDuration"] = to_numpy(modified);
+        result["macaulayDuration"] = to_numpy(macaulay);
+        result["convexity"] = to_numpy(convexity);
+        result["accruedAmount"] = to_numpy(accrued);
+        return result;
+    }
+
+    using CachedCashFlows =
+        std::vector<ext::shared_ptr<const pyquantlib::BondCashFlows>>;
+
+    // Looked up (and built if needed) on the calling thread, with the GIL
+    // held, since building an entry registers observers; see
+    // BondCashFlowCache. Bonds that are not tradable at the settlement date
+    // (e.g. matured) get a null entry; other errors are raised.
+    CachedCashFlows cachedCashFlows(const Bonds& bonds,
+                                    const Date& settlementDate,
+                                    const DayCounter& dayCounter) {
+        auto& cache = pyquantlib::BondCashFlowCache::instance();
+        CachedCashFlows result(bonds.size());
+        for (std::size_t i = 0; i < bonds.size(); ++i) {
+            try {
+                const Date settlement = settlementDate == Date()
+                    ? bonds[i]->settlementDate() : settlementDate;
+                if (BondFunctions::isTradable(*bonds[i], settlement))
+                    result[i] = cache.get(bonds[i], settlement, dayCounter);
+            } catch (const std::exception& e) {
+                QL_FAIL("bond " << i << ": " << e.what());
+            }
+        }
+        return result;
+    }
+
+    // Newton from the guess; if it leaves the domain or does not converge,
+    // bracket the root around the guess and fall back to Brent.
+    Rate solveYield(const pyquantlib::BondCashFlows& cashflows, Real dirtyPrice,
+                    Compounding compounding, Frequency frequency,
+                    Real accuracy, Size maxIterations, Rate guess) {
+        Rate y = guess;
+        for (Size i = 0; i < maxIterations; ++i) {
+            const auto [price, dPrice] =
+                cashflows.priceAndDerivative(y, compounding, frequency);
+            if (!std::isfinite(price) || !std::isfinite(dPrice) || dPrice == 0.0)
+                break;
+            const Real step = (price - dirtyPrice) / dPrice;
+            y -= step;
+            if (!std::isfinite(y))
+                break;
+            if (std::fabs(step) < accuracy)
+                return y;
+        }
+        Brent solver;
+        solver.setMaxEvaluations(maxIterations);
+        return solver.solve(
+            [&](Rate r) {
+                return cashflows.dirtyPrice(r, compounding, frequency) - dirtyPrice;
+            },
+            accuracy, guess, 0.01);
+    }
+
+    py::tuple batchYields(const Bonds& bonds,
+                          const pyquantlib::DoubleArray& cleanPrices,
+                          const DayCounter& dayCounter, Compounding compounding,
+                          Frequency frequency, const Date& settlementDate,
+                          Real accuracy, Size maxIterations, Rate guess,
+                          Size nThreads) {
+        checkBonds(bonds);
+        const std::size_t n = bonds.size();
+        const auto prices = pyquantlib::per_item(cleanPrices, n, "cleanPrices");
+        // Checks compounding and frequency once for the whole batch.
+        InterestRate(guess, dayCounter, compounding, frequency);
+        std::vector<double> yields(n);
+        py::array_t<bool> failed(static_cast<py::ssize_t>(n));
+        bool* f = failed.mutable_data();
+        const auto cashflows = cachedCashFlows(bonds, settlementDate, dayCounter);
+        {
+            py::gil_scoped_release release;
+            pyquantlib::parallelFor(n, nThreads, [&](std::size_t i) {
+                try {
+                    QL_REQUIRE(cashflows[i], "cash flows not available");
+                    yields[i] = solveYield(
+                        *cashflows[i], prices[i] + cashflows[i]->accruedAmount(),
+                        compounding, frequency, accuracy, maxIterations, guess);
+                    f[i] = false;
+                } catch (const std::exception&) {
+                    yields[i] = std::numeric_limits<double>::quiet_NaN();
+                    f[i] = true;
+                }
+            });
+        }
+        return py::make_tuple(to_numpy(yields), failed);
+    }
+
+    py::array_t<double> batchCleanPrices(const Bonds& bonds,
+                                         const pyquantlib::DoubleArray& yields,
+                                         const DayCounter& dayCounter,
+                                         Compounding compounding,
+                                         Frequency frequency,
+                                         const Date& settlementDate,
+                                         Size nThreads) {
+        checkBonds(bonds);
+        const std::size_t n = bonds.size();
+        const auto y = pyquantlib::per_item(yields, n, "yields");
+        InterestRate(y.empty() ? 0.0 : y[0], dayCounter, compounding, frequency);
+        std::vector<double> prices(n);
+        const auto cashflows = cachedCashFlows(bonds, settlementDate, dayCounter);
+        {
+            py::gil_scoped_release release;
+            pyquantlib::parallelFor(n, nThreads, [&](std::size_t i) {
+                prices[i] = cashflows[i]
+                    ? cashflows[i]->dirtyPrice(y[i], compounding, frequency)
+                        - cashflows[i]->accruedAmount()
+                    : std::numeric_limits<double>::quiet_NaN();
+            });
+        }
+        return to_numpy(prices);
+    }
+}
+
 void ql_pricingengines::bondfunctions(py::module_& m) {
     py::class_<BondFunctions>(m, "BondFunctions",
         "Static bond analytics functions.")
@@ -173,5 +376,51 @@ void ql_pricingengines::bondfunctions(py::module_& m) {
             py::arg("accuracy") = 1.0e-10,
             py::arg("maxIterations") = 100,
             py::arg("guess") = 0.0,
-            "Z-spread over a discount curve.");
+            "Z-spread over a discount curve.")
+        // Batch analytics
+        .def_static("analytics",
+            &curveAnalytics,
+            py::arg("bonds"), py::arg("discountCurve"),
+            py::arg("settlementDate") = Date(),
+            py::kw_only(), py::arg("nThreads") = 1,
+            "Clean and dirty price, BPS and accrued amount of many bonds on a "
+            "shared discount curve, as a dict of arrays. Computed without the "
+            "GIL, on up to nThreads threads. The curve and the coupon amounts "
+            "are computed on the calling thread first; if a bond holds a cash "
+            "flow whose amount cannot be cached or computed, all bonds are "
+            "evaluated on the calling thread.")
+        .def_static("yieldAnalytics",
+            &yieldAnalytics,
+            py::arg("bonds"), py::arg("yields"), py::arg("dayCounter"),
+            py::arg("compounding"), py::arg("frequency"),
+            py::arg("settlementDate") = Date(),
+            py::kw_only(), py::arg("nThreads") = 1,
+            "Clean and dirty price, basis point value, modified and Macaulay "
+            "duration, convexity and accrued amount of many bonds at a shared "
+            "yield or one yield per bond, as a dict of arrays. Macaulay "
+            "duration is NaN unless compounding is Compounded. Threads are "
+            "used as in analytics().")
+        .def_static("yields",
+            &batchYields,
+            py::arg("bonds"), py::arg("cleanPrices"), py::arg("dayCounter"),
+            py::arg("compounding"), py::arg("frequency"),
+            py::arg("settlementDate") = Date(),
+            py::arg("accuracy") = 1.0e-10,
+            py::arg("maxIterations") = 100,
+            py::arg("guess") = 0.05,
+            py::kw_only(), py::arg("nThreads") = 1,
+            "Yields of many bonds from clean prices. Returns (yields, failed); "
+            "bonds whose solve fails, or that are not tradable at the "
+            "settlement date (e.g. matured), are NaN and flagged True; other "
+            "errors reading the cash flows are raised. Cash-flow times and "
+            "amounts are cached per bond between calls.")
+        .def_static("cleanPrices",
+            &batchCleanPrices,
+            py::arg("bonds"), py::arg("yields"), py::arg("dayCounter"),
+            py::arg("compounding"), py::arg("frequency"),
+            py::arg("settlementDate") = Date(),
+            py::kw_only(), py::arg("nThreads") = 1,
+            "Clean prices of many bonds at a shared yield or one yield per "
+            "bond, using the same cached cash flows as yields(). Bonds that are "
+            "not tradable at the settlement date (e.g. matured) are NaN.");
 }
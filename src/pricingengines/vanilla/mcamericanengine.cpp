@@ -13,6 +13,7 @@
 
 #include "pyquantlib/pyquantlib.h"
 #include "pyquantlib/null_utils.h"
+#include "pyquantlib/parallel_mc.h"
 #include <ql/pricingengines/vanilla/mcamericanengine.hpp>
 #include <ql/processes/blackscholesprocess.hpp>
 #include <pybind11/pybind11.h>
@@ -48,15 +49,19 @@ void ql_pricingengines::mcamericanengine(py::module_& m) {
            BigNatural seed,
            Size polynomialOrder,
            LsmBasisSystem::PolynomialType polynomialType,
-           Size calibrationSamples) -> ext::shared_ptr<PricingEngine> {
+           Size calibrationSamples,
+           Size nThreads) -> ext::shared_ptr<PricingEngine> {
 
             std::string lowerRngType = to_lower(rngType);
 
             Size timeStepsVal = from_python_with_null<Size>(timeSteps);
             Size timeStepsPerYearVal = from_python_with_null<Size>(timeStepsPerYear);
-            Size requiredSamplesVal = from_python_with_null<Size>(requiredSamples);
-            Real requiredToleranceVal = from_python_with_null<Real>(requiredTolerance);
-            Size maxSamplesVal = from_python_with_null<Size>(maxSamples);
+            pyquantlib::McSampling sampling;
+            sampling.requiredSamples = from_python_with_null<Size>(requiredSamples);
+            sampling.requiredTolerance = from_python_with_null<Real>(requiredTolerance);
+            sampling.maxSamples = from_python_with_null<Size>(maxSamples);
+            sampling.seed = seed;
+            sampling.nThreads = nThreads;
 
             if (lowerRngType == "pseudorandom") {
                 auto maker = MakeMCAmericanEngine<PseudoRandom>(process);
@@ -65,32 +70,27 @@ void ql_pricingengines::mcamericanengine(py::module_& m) {
                 if (!is_null<Size>(timeStepsPerYear)) maker.withStepsPerYear(timeStepsPerYearVal);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
                 if (controlVariate) maker.withControlVariate(controlVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
-                if (seed != 0) maker.withSeed(seed);
                 maker.withPolynomialOrder(polynomialOrder);
                 maker.withBasisSystem(polynomialType);
                 maker.withCalibrationSamples(calibrationSamples);
 
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<MCAmericanEngine<PseudoRandom>, PseudoRandom>(
+                    maker, sampling, process);
 
             } else if (lowerRngType == "lowdiscrepancy") {
-                auto maker = MakeMCAmericanEngine<LowDiscrepancy>(process);
+                auto maker = MakeMCAmericanEngine<pyquantlib::BlockLowDiscrepancy>(process);
 
                 if (!is_null<Size>(timeSteps)) maker.withSteps(timeStepsVal);
                 if (!is_null<Size>(timeStepsPerYear)) maker.withStepsPerYear(timeStepsPerYearVal);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
                 if (controlVariate) maker.withControlVariate(controlVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
-                if (seed != 0) maker.withSeed(seed);
                 maker.withPolynomialOrder(polynomialOrder);
                 maker.withBasisSystem(polynomialType);
                 maker.withCalibrationSamples(calibrationSamples);
 
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<
+                    MCAmericanEngine<pyquantlib::BlockLowDiscrepancy>,
+                    pyquantlib::BlockLowDiscrepancy>(maker, sampling, process);
 
             } else {
                 throw std::runtime_error(
@@ -110,6 +110,7 @@ void ql_pricingengines::mcamericanengine(py::module_& m) {
         py::arg("polynomialOrder") = 2,
         py::arg("polynomialType") = LsmBasisSystem::Monomial,
         py::arg("calibrationSamples") = 2048,
+        py::arg("nThreads") = 1,
         "Monte Carlo American option pricing engine (Longstaff-Schwartz).\n\n"
         "Parameters:\n"
         "  process: Black-Scholes process\n"
@@ -124,5 +125,6 @@ void ql_pricingengines::mcamericanengine(py::module_& m) {
         "  seed: Random seed (0 for random)\n"
         "  polynomialOrder: Order of regression polynomial\n"
         "  polynomialType: Polynomial basis type (Monomial, Laguerre, etc.)\n"
-        "  calibrationSamples: Samples for regression calibration");
+        "  calibrationSamples: Samples for regression calibration\n"
+        "  nThreads: Must be 1; Longstaff-Schwartz engines are single-threaded");
 }
@@ -13,6 +13,7 @@
 
 #include "pyquantlib/pyquantlib.h"
 #include "pyquantlib/null_utils.h"
+#include "pyquantlib/parallel_mc.h"
 #include <ql/pricingengines/vanilla/mceuropeanengine.hpp>
 #include <ql/processes/blackscholesprocess.hpp>
 #include <ql/exercise.hpp>
@@ -44,15 +45,19 @@ void ql_pricingengines::mceuropeanengine(py::module_& m) {
            py::object requiredSamples,
            py::object requiredTolerance,
            py::object maxSamples,
-           BigNatural seed) -> ext::shared_ptr<PricingEngine> {
+           BigNatural seed,
+           Size nThreads) -> ext::shared_ptr<PricingEngine> {
 
             std::string lowerRngType = to_lower(rngType);
 
             Size timeStepsVal = from_python_with_null<Size>(timeSteps);
             Size timeStepsPerYearVal = from_python_with_null<Size>(timeStepsPerYear);
-            Size requiredSamplesVal = from_python_with_null<Size>(requiredSamples);
-            Real requiredToleranceVal = from_python_with_null<Real>(requiredTolerance);
-            Size maxSamplesVal = from_python_with_null<Size>(maxSamples);
+            pyquantlib::McSampling sampling;
+            sampling.requiredSamples = from_python_with_null<Size>(requiredSamples);
+            sampling.requiredTolerance = from_python_with_null<Real>(requiredTolerance);
+            sampling.maxSamples = from_python_with_null<Size>(maxSamples);
+            sampling.seed = seed;
+            sampling.nThreads = nThreads;
 
             if (lowerRngType == "pseudorandom") {
                 auto maker = MakeMCEuropeanEngine<PseudoRandom>(process);
@@ -61,26 +66,22 @@ void ql_pricingengines::mceuropeanengine(py::module_& m) {
                 if (!is_null<Size>(timeStepsPerYear)) maker.withStepsPerYear(timeStepsPerYearVal);
                 if (brownianBridge) maker.withBrownianBridge(brownianBridge);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
-                if (seed != 0) maker.withSeed(seed);
 
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<
+                    MCEuropeanEngine<PseudoRandom>, PseudoRandom>(
+                    maker, sampling, process);
 
             } else if (lowerRngType == "lowdiscrepancy") {
-                auto maker = MakeMCEuropeanEngine<LowDiscrepancy>(process);
+                auto maker = MakeMCEuropeanEngine<pyquantlib::BlockLowDiscrepancy>(process);
 
                 if (!is_null<Size>(timeSteps)) maker.withSteps(timeStepsVal);
                 if (!is_null<Size>(timeStepsPerYear)) maker.withStepsPerYear(timeStepsPerYearVal);
                 if (brownianBridge) maker.withBrownianBridge(brownianBridge);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
-                if (seed != 0) maker.withSeed(seed);
 
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<
+                    MCEuropeanEngine<pyquantlib::BlockLowDiscrepancy>,
+                    pyquantlib::BlockLowDiscrepancy>(maker, sampling, process);
 
             } else {
                 throw std::runtime_error(
@@ -97,6 +98,7 @@ void ql_pricingengines::mceuropeanengine(py::module_& m) {
         py::arg("requiredTolerance") = py::none(),
         py::arg("maxSamples") = py::none(),
         py::arg("seed") = 0,
+        py::arg("nThreads") = 1,
         "Monte Carlo European option pricing engine.\n\n"
         "Parameters:\n"
         "  process: Black-Scholes process\n"
@@ -108,5 +110,6 @@ void ql_pricingengines::mceuropeanengine(py::module_& m) {
         "  requiredSamples: Number of samples\n"
         "  requiredTolerance: Target tolerance (alternative to requiredSamples)\n"
         "  maxSamples: Maximum samples\n"
-        "  seed: Random seed (0 for random)");
+        "  seed: Random seed (0 for random)\n"
+        "  nThreads: Worker threads sharing the sample budget (1 for serial)");
 }
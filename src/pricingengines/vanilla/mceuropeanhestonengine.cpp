@@ -13,6 +13,7 @@
 
 #include "pyquantlib/pyquantlib.h"
 #include "pyquantlib/null_utils.h"
+#include "pyquantlib/parallel_mc.h"
 #include <ql/exercise.hpp>
 #include <ql/pricingengines/vanilla/mceuropeanhestonengine.hpp>
 #include <ql/processes/hestonprocess.hpp>
@@ -42,15 +43,19 @@ void ql_pricingengines::mceuropeanhestonengine(py::module_& m) {
            py::object requiredSamples,
            py::object requiredTolerance,
            py::object maxSamples,
-           BigNatural seed) -> ext::shared_ptr<PricingEngine> {
+           BigNatural seed,
+           Size nThreads) -> ext::shared_ptr<PricingEngine> {
 
             std::string lowerRngType = to_lower(rngType);
 
             Size timeStepsVal = from_python_with_null<Size>(timeSteps);
             Size timeStepsPerYearVal = from_python_with_null<Size>(timeStepsPerYear);
-            Size requiredSamplesVal = from_python_with_null<Size>(requiredSamples);
-            Real requiredToleranceVal = from_python_with_null<Real>(requiredTolerance);
-            Size maxSamplesVal = from_python_with_null<Size>(maxSamples);
+            pyquantlib::McSampling sampling;
+            sampling.requiredSamples = from_python_with_null<Size>(requiredSamples);
+            sampling.requiredTolerance = from_python_with_null<Real>(requiredTolerance);
+            sampling.maxSamples = from_python_with_null<Size>(maxSamples);
+            sampling.seed = seed;
+            sampling.nThreads = nThreads;
 
             if (lowerRngType == "pseudorandom") {
                 auto maker = MakeMCEuropeanHestonEngine<PseudoRandom>(process);
@@ -58,25 +63,20 @@ void ql_pricingengines::mceuropeanhestonengine(py::module_& m) {
                 if (!is_null<Size>(timeSteps)) maker.withSteps(timeStepsVal);
                 if (!is_null<Size>(timeStepsPerYear)) maker.withStepsPerYear(timeStepsPerYearVal);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
-                if (seed != 0) maker.withSeed(seed);
 
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<MCEuropeanHestonEngine<PseudoRandom>, PseudoRandom>(
+                    maker, sampling, process);
 
             } else if (lowerRngType == "lowdiscrepancy") {
-                auto maker = MakeMCEuropeanHestonEngine<LowDiscrepancy>(process);
+                auto maker = MakeMCEuropeanHestonEngine<pyquantlib::BlockLowDiscrepancy>(process);
 
                 if (!is_null<Size>(timeSteps)) maker.withSteps(timeStepsVal);
                 if (!is_null<Size>(timeStepsPerYear)) maker.withStepsPerYear(timeStepsPerYearVal);
                 if (antitheticVariate) maker.withAntitheticVariate(antitheticVariate);
-                if (!is_null<Size>(requiredSamples)) maker.withSamples(requiredSamplesVal);
-                if (!is_null<Real>(requiredTolerance)) maker.withAbsoluteTolerance(requiredToleranceVal);
-                if (!is_null<Size>(maxSamples)) maker.withMaxSamples(maxSamplesVal);
-                if (seed != 0) maker.withSeed(seed);
 
-                return static_cast<ext::shared_ptr<PricingEngine>>(maker);
+                return pyquantlib::makeMcEngine<
+                    MCEuropeanHestonEngine<pyquantlib::BlockLowDiscrepancy>,
+                    pyquantlib::BlockLowDiscrepancy>(maker, sampling, process);
 
             } else {
                 throw std::runtime_error(
@@ -92,6 +92,7 @@ void ql_pricingengines::mceuropeanhestonengine(py::module_& m) {
         py::arg("requiredTolerance") = py::none(),
         py::arg("maxSamples") = py::none(),
         py::arg("seed") = 0,
+        py::arg("nThreads") = 1,
         "Monte Carlo European Heston option pricing engine.\n\n"
         "Parameters:\n"
         "  process: Heston process\n"
@@ -102,5 +103,6 @@ void ql_pricingengines::mceuropeanhestonengine(py::module_& m) {
         "  requiredSamples: Number of samples\n"
         "  requiredTolerance: Target tolerance (alternative to requiredSamples)\n"
         "  maxSamples: Maximum samples\n"
-        "  seed: Random seed (0 for random)");
+        "  seed: Random seed (0 for random)\n"
+        "  nThreads: Worker threads sharing the sample budget (1 for serial)");
 }
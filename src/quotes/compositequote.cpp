@@ -32,6 +32,8 @@ struct PyBinaryFunction {
     }
 
     Real operator()(Real x, Real y) const {
+        // May be reached from a pricing call that released the GIL
+        py::gil_scoped_acquire gil;
         try {
             py::object result = func(x, y);
             return result.cast<Real>();
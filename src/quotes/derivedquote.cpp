@@ -32,6 +32,8 @@ struct PyUnaryFunction {
     }
 
     Real operator()(Real x) const {
+        // May be reached from a pricing call that released the GIL
+        py::gil_scoped_acquire gil;
         try {
             py::object result = func(x);
             return result.cast<Real>();
@@ -12,12 +12,44 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
+#include <ql/patterns/observable.hpp>
 #include <ql/quotes/simplequote.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <pybind11/stl.h>
+#include <vector>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
+namespace {
+
+    // Sets all values with notifications deferred, so that each observer is
+    // updated once at the end rather than once per quote.
+    void setQuoteValues(const std::vector<ext::shared_ptr<SimpleQuote>>& quotes,
+                        const pyquantlib::DoubleArray& values) {
+        const auto v = pyquantlib::per_item(values, quotes.size(), "values");
+        for (std::size_t i = 0; i < quotes.size(); ++i)
+            QL_REQUIRE(quotes[i], "null quote at index " << i);
+
+        auto& settings = ObservableSettings::instance();
+        const bool owner = settings.updatesEnabled();
+        if (owner)
+            settings.disableUpdates(true);
+        try {
+            for (std::size_t i = 0; i < quotes.size(); ++i)
+                quotes[i]->setValue(v[i]);
+        } catch (...) {
+            if (owner)
+                settings.enableUpdates();
+            throw;
+        }
+        if (owner)
+            settings.enableUpdates();
+    }
+}
+
 void ql_quotes::simplequote(py::module_& m) {
     py::class_<SimpleQuote, Quote, ext::shared_ptr<SimpleQuote>>(m, "SimpleQuote",
         "Simple quote for market data.")
@@ -34,5 +66,20 @@ void ql_quotes::simplequote(py::module_& m) {
         .def("isValid", &SimpleQuote::isValid,
             "Returns true if the quote holds a valid value.")
         .def("reset", &SimpleQuote::reset,
-            "Resets the quote to an invalid state.");
+            "Resets the quote to an invalid state.")
+        .def(py::pickle(
+            [](const SimpleQuote& q) {
+                return py::make_tuple(q.isValid() ? py::cast(q.value()) : py::none());
+            },
+            [](const py::tuple& state) {
+                if (state[0].is_none())
+                    return ext::make_shared<SimpleQuote>();
+                return ext::make_shared<SimpleQuote>(state[0].cast<Real>());
+            }));
+
+    m.def("set_quote_values",
+        &setQuoteValues,
+        py::arg("quotes"), py::arg("values"),
+        "Sets the values of many SimpleQuotes (one value each, or a scalar for "
+        "all) and notifies each affected observer once.");
 }
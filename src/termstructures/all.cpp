@@ -88,6 +88,10 @@ DECLARE_MODULE_BINDINGS(termstructures_bindings) {
         "PiecewiseYieldCurve with GlobalBootstrap instantiations");
     ADD_MAIN_BINDING(ql_termstructures::multicurve,
         "MultiCurve - simultaneous multi-curve bootstrap");
+    ADD_MAIN_BINDING(ql_termstructures::curvebuilder,
+        "CurveBuilder - dependency-ordered concurrent curve builds");
+    ADD_MAIN_BINDING(ql_termstructures::bucketedsensitivity,
+        "BucketedSensitivity - bump-and-reprice curve risk");
 
     ADD_MAIN_BINDING(ql_termstructures::zerocurve,
         "ZeroCurve - zero rate curve with linear interpolation");
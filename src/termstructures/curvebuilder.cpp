@@ -0,0 +1,226 @@
+/*
+ * PyQuantLib: Python bindings for QuantLib
+ * https://github.com/quantales/pyquantlib
+ *
+ * Copyright (c) 2025 Yassine Idyiahia
+ * SPDX-License-Identifier: BSD-3-Clause
+ * See LICENSE for details.
+ *
+ * ---
+ * QuantLib is Copyright (c) 2000-2025 The QuantLib Authors
+ * https://www.quantlib.org/
+ */
+
+#include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/incremental_bootstrap.h"
+#include "pyquantlib/parallel.h"
+#include <ql/handle.hpp>
+#include <ql/patterns/observable.hpp>
+#include <ql/termstructures/yieldtermstructure.hpp>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+#include <algorithm>
+#include <chrono>
+#include <map>
+#include <set>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace py = pybind11;
+using namespace QuantLib;
+
+namespace {
+
+class Watch : public Observer {
+  public:
+    void update() override { notified = true; }
+    bool notified = false;
+};
+
+// True if a notification from source reaches target or the helpers it is
+// bootstrapped on, i.e. if target reads source.
+bool reads(const Handle<YieldTermStructure>& target,
+           const Handle<YieldTermStructure>& source) {
+    auto watch = ext::make_shared<Watch>();
+    watch->registerWith(target.currentLink());
+    if (auto inputs = ext::dynamic_pointer_cast<pyquantlib::BootstrapInputs>(
+            target.currentLink())) {
+        for (const auto& helper : inputs->bootstrapHelpers())
+            watch->registerWith(helper);
+    }
+    source->notifyObservers();
+    return watch->notified;
+}
+
+// Builds a set of curves in dependency order, running curves whose
+// dependencies are built concurrently. Curves are added after the curves
+// they depend on, so the graph is acyclic by construction. dependsOn is
+// trusted; on request, add() also checks it by sending notifications from
+// the other curves and seeing which reach the new curve's helpers.
+class CurveBuilder {
+  public:
+    void add(const std::string& name, Handle<YieldTermStructure> curve,
+             const std::vector<std::string>& dependsOn, bool check) {
+        QL_REQUIRE(!curve.empty(), "empty curve handle for '" << name << "'");
+        QL_REQUIRE(index_.find(name) == index_.end(),
+                   "curve '" << name << "' already added");
+        std::vector<std::size_t> dependencies;
+        for (const auto& d : dependsOn) {
+            auto it = index_.find(d);
+            QL_REQUIRE(it != index_.end(),
+                       "curve '" << name << "' depends on '" << d
+                       << "', which must be added first");
+            dependencies.push_back(it->second);
+        }
+        if (check)
+            checkDependencies(name, curve, dependencies);
+        index_[name] = names_.size();
+        names_.push_back(name);
+        curves_.push_back(std::move(curve));
+        dependencies_.push_back(std::move(dependencies));
+        times_.clear();
+    }
+
+    py::dict build(Size nThreads) {
+        std::vector<double> times(curves_.size(), 0.0);
+        {
+            py::gil_scoped_release release;
+            pyquantlib::parallelForGraph(dependencies_, nThreads, [&](std::size_t i) {
+                const auto start = std::chrono::steady_clock::now();
+                try {
+                    // Triggers the bootstrap if the curve is not up to date.
+                    curves_[i]->discount(0.0, true);
+                } catch (std::exception& e) {
+                    QL_FAIL("building curve '" << names_[i] << "': " << e.what());
+                }
+                times[i] = std::chrono::duration<double>(
+                    std::chrono::steady_clock::now() - start).count();
+            });
+        }
+        times_ = std::move(times);
+        return buildTimes();
+    }
+
+    py::dict buildTimes() const {
+        py::dict result;
+        for (std::size_t i = 0; i < times_.size(); ++i)
+            result[py::str(names_[i])] = times_[i];
+        return result;
+    }
+
+    std::vector<std::string> dependencies(const std::string& name) const {
+        auto it = index_.find(name);
+        QL_REQUIRE(it != index_.end(), "unknown curve '" << name << "'");
+        std::vector<std::string> result;
+        for (std::size_t d : dependencies_[it->second])
+            result.push_back(names_[d]);
+        return result;
+    }
+
+    // Groups of curves that can be built together: each level only
+    // depends on the previous ones.
+    std::vector<std::vector<std::string>> levels() const {
+        std::vector<std::size_t> level(names_.size(), 0);
+        std::vector<std::vector<std::string>> result;
+        for (std::size_t i = 0; i < names_.size(); ++i) {
+            for (std::size_t d : dependencies_[i])
+                level[i] = std::max(level[i], level[d] + 1);
+            if (level[i] >= result.size())
+                result.resize(level[i] + 1);
+            result[level[i]].push_back(names_[i]);
+        }
+        return result;
+    }
+
+    Handle<YieldTermStructure> curve(const std::string& name) const {
+        auto it = index_.find(name);
+        QL_REQUIRE(it != index_.end(), "unknown curve '" << name << "'");
+        return curves_[it->second];
+    }
+
+    const std::vector<std::string>& names() const { return names_; }
+    Size size() const { return names_.size(); }
+
+  private:
+    // Curves built concurrently must not read curves they do not depend on.
+    // The notifications invalidate the curves and instruments observing the
+    // builder's curves, so this only runs when asked for.
+    void checkDependencies(const std::string& name,
+                           const Handle<YieldTermStructure>& curve,
+                           const std::vector<std::size_t>& dependencies) const {
+        QL_REQUIRE(ObservableSettings::instance().updatesEnabled(),
+                   "cannot check the dependencies of curve '" << name
+                   << "' while updates are disabled");
+        std::set<std::size_t> ancestors;
+        std::vector<std::size_t> stack(dependencies);
+        while (!stack.empty()) {
+            const std::size_t i = stack.back();
+            stack.pop_back();
+            if (ancestors.insert(i).second)
+                stack.insert(stack.end(), dependencies_[i].begin(),
+                             dependencies_[i].end());
+        }
+        for (std::size_t i = 0; i < curves_.size(); ++i) {
+            if (curves_[i].empty() || curves_[i].currentLink() == curve.currentLink())
+                continue;
+            QL_REQUIRE(ancestors.count(i) != 0 || !reads(curve, curves_[i]),
+                       "curve '" << name << "' reads curve '" << names_[i]
+                       << "', which is missing from its dependsOn");
+            QL_REQUIRE(!reads(curves_[i], curve),
+                       "curve '" << names_[i] << "' reads curve '" << name
+                       << "', which must be added first");
+        }
+    }
+
+    std::vector<std::string> names_;
+    std::vector<Handle<YieldTermStructure>> curves_;
+    std::vector<std::vector<std::size_t>> dependencies_;
+    std::map<std::string, std::size_t> index_;
+    std::vector<double> times_;
+};
+
+}  // namespace
+
+void ql_termstructures::curvebuilder(py::module_& m) {
+    py::class_<CurveBuilder>(m, "CurveBuilder",
+        "Builds curves in dependency order, bootstrapping independent "
+        "curves concurrently.")
+        .def(py::init<>())
+        .def("add", &CurveBuilder::add,
+            py::arg("name"), py::arg("curve"),
+            py::arg("dependsOn") = std::vector<std::string>(),
+            py::kw_only(), py::arg("check") = false,
+            "Adds a curve (or a MultiCurve external handle) after the curves "
+            "it depends on. With check=True, raises if the curve reads a "
+            "curve of the builder missing from dependsOn; the check sends "
+            "notifications from the other curves, so built curves and "
+            "instruments observing them are recalculated.")
+        .def("add",
+            [](CurveBuilder& self, const std::string& name,
+               const ext::shared_ptr<YieldTermStructure>& curve,
+               const std::vector<std::string>& dependsOn, bool check) {
+                self.add(name, Handle<YieldTermStructure>(curve), dependsOn, check);
+            },
+            py::arg("name"), py::arg("curve"),
+            py::arg("dependsOn") = std::vector<std::string>(),
+            py::kw_only(), py::arg("check") = false,
+            "Adds a curve after the curves it depends on; see the handle "
+            "overload for check.")
+        .def("build", &CurveBuilder::build,
+            py::kw_only(), py::arg("nThreads") = 1,
+            "Bootstraps the curves that are not up to date, without the GIL "
+            "and on up to nThreads threads. Returns the build time of each "
+            "curve in seconds.")
+        .def("buildTimes", &CurveBuilder::buildTimes,
+            "Build time in seconds of each curve in the last build().")
+        .def("dependencies", &CurveBuilder::dependencies,
+            py::arg("name"), "Direct dependencies of a curve.")
+        .def("levels", &CurveBuilder::levels,
+            "Curves grouped by depth in the dependency graph.")
+        .def("curve", &CurveBuilder::curve,
+            py::arg("name"), "Handle to the named curve.")
+        .def("names", &CurveBuilder::names,
+            "Curve names in the order they were added.")
+        .def("__len__", &CurveBuilder::size);
+}
@@ -13,12 +13,15 @@
 
 #include "pyquantlib/pyquantlib.h"
 #include "pyquantlib/trampolines.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/termstructures/volatility/equityfx/blackvoltermstructure.hpp>
 #include <ql/time/daycounters/actual365fixed.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 
 namespace py = pybind11;
 using namespace QuantLib;
+using pyquantlib::DoubleArray;
 
 void ql_termstructures::blackvoltermstructure(py::module_& m) {
     // BlackVolTermStructure - base class for Black volatility term structures
@@ -53,6 +56,16 @@ void ql_termstructures::blackvoltermstructure(py::module_& m) {
                 &BlackVolTermStructure::blackVol, py::const_),
             py::arg("time"), py::arg("strike"), py::arg("extrapolate") = false,
             "Returns the Black volatility for the given time and strike.")
+        .def("blackVol",
+            [](const BlackVolTermStructure& self, const DoubleArray& times,
+               const DoubleArray& strikes, bool extrapolate,
+               const py::object& out) {
+                return pyquantlib::evaluate_pairs(times, strikes, out,
+                    [&](Time t, Real k) { return self.blackVol(t, k, extrapolate); });
+            },
+            py::arg("times"), py::arg("strikes"), py::arg("extrapolate") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns Black volatilities at broadcast (time, strike) points.")
         // Black variance by date
         .def("blackVariance",
             py::overload_cast<const Date&, Real, bool>(
@@ -65,6 +78,39 @@ void ql_termstructures::blackvoltermstructure(py::module_& m) {
                 &BlackVolTermStructure::blackVariance, py::const_),
             py::arg("time"), py::arg("strike"), py::arg("extrapolate") = false,
             "Returns the Black variance for the given time and strike.")
+        .def("blackVariance",
+            [](const BlackVolTermStructure& self, const DoubleArray& times,
+               const DoubleArray& strikes, bool extrapolate,
+               const py::object& out) {
+                return pyquantlib::evaluate_pairs(times, strikes, out,
+                    [&](Time t, Real k) { return self.blackVariance(t, k, extrapolate); });
+            },
+            py::arg("times"), py::arg("strikes"), py::arg("extrapolate") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns Black variances at broadcast (time, strike) points.")
+        // Grids
+        .def("blackVolGrid",
+            [](const BlackVolTermStructure& self, const DoubleArray& times,
+               const DoubleArray& strikes, bool extrapolate,
+               const py::object& out) {
+                return pyquantlib::evaluate_grid(times, strikes, out,
+                    [&](Time t, Real k) { return self.blackVol(t, k, extrapolate); },
+                    "times", "strikes");
+            },
+            py::arg("times"), py::arg("strikes"), py::arg("extrapolate") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns Black volatilities on a times x strikes grid.")
+        .def("blackVarianceGrid",
+            [](const BlackVolTermStructure& self, const DoubleArray& times,
+               const DoubleArray& strikes, bool extrapolate,
+               const py::object& out) {
+                return pyquantlib::evaluate_grid(times, strikes, out,
+                    [&](Time t, Real k) { return self.blackVariance(t, k, extrapolate); },
+                    "times", "strikes");
+            },
+            py::arg("times"), py::arg("strikes"), py::arg("extrapolate") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns Black variances on a times x strikes grid.")
         // Forward variance
         .def("blackForwardVol",
             py::overload_cast<const Date&, const Date&, Real, bool>(
@@ -13,12 +13,15 @@
 
 #include "pyquantlib/pyquantlib.h"
 #include "pyquantlib/trampolines.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/termstructures/volatility/equityfx/localvoltermstructure.hpp>
 #include <ql/time/daycounters/actual365fixed.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 
 namespace py = pybind11;
 using namespace QuantLib;
+using pyquantlib::DoubleArray;
 
 void ql_termstructures::localvoltermstructure(py::module_& m) {
     py::class_<LocalVolTermStructure, PyLocalVolTermStructure,
@@ -59,7 +62,30 @@ void ql_termstructures::localvoltermstructure(py::module_& m) {
                 &LocalVolTermStructure::localVol, py::const_),
             py::arg("time"), py::arg("underlyingLevel"),
             py::arg("extrapolate") = false,
-            "Returns the local volatility for the given time and underlying level.");
+            "Returns the local volatility for the given time and underlying level.")
+        .def("localVol",
+            [](const LocalVolTermStructure& self, const DoubleArray& times,
+               const DoubleArray& underlyingLevels, bool extrapolate,
+               const py::object& out) {
+                return pyquantlib::evaluate_pairs(times, underlyingLevels, out,
+                    [&](Time t, Real s) { return self.localVol(t, s, extrapolate); });
+            },
+            py::arg("times"), py::arg("underlyingLevels"),
+            py::arg("extrapolate") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns local volatilities at broadcast (time, underlying level) points.")
+        .def("localVolGrid",
+            [](const LocalVolTermStructure& self, const DoubleArray& times,
+               const DoubleArray& underlyingLevels, bool extrapolate,
+               const py::object& out) {
+                return pyquantlib::evaluate_grid(times, underlyingLevels, out,
+                    [&](Time t, Real s) { return self.localVol(t, s, extrapolate); },
+                    "times", "underlyingLevels");
+            },
+            py::arg("times"), py::arg("underlyingLevels"),
+            py::arg("extrapolate") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns local volatilities on a times x underlying levels grid.");
 }
 
 void ql_termstructures::localvoltermstructurehandle(py::module_& m) {
@@ -18,6 +18,16 @@
 namespace py = pybind11;
 using namespace QuantLib;
 
+namespace {
+
+// TermStructure::moving_ is protected; it is set when the curve was built
+// from settlement days and a calendar.
+struct Access : FlatForward {
+    static bool moving(const FlatForward& ts) { return ts.*&Access::moving_; }
+};
+
+}  // anonymous namespace
+
 void ql_termstructures::flatforward(py::module_& m) {
     py::class_<FlatForward, ext::shared_ptr<FlatForward>, YieldTermStructure>(
         m, "FlatForward",
@@ -88,5 +98,39 @@ void ql_termstructures::flatforward(py::module_& m) {
         .def("compounding", &FlatForward::compounding,
             "Returns the compounding convention.")
         .def("compoundingFrequency", &FlatForward::compoundingFrequency,
-            "Returns the compounding frequency.");
+            "Returns the compounding frequency.")
+        // Pickle support: the current rate is stored, so quote-driven curves
+        // are restored as a snapshot. Moving curves keep their settlement
+        // days and calendar.
+        .def(py::pickle(
+            [](const FlatForward& ts) {
+                Rate rate = ts.zeroRate(1.0, ts.compounding(),
+                                        ts.compoundingFrequency()).rate();
+                if (Access::moving(ts))
+                    return py::make_tuple(ts.settlementDays(), ts.calendar(), rate,
+                                          ts.dayCounter(), ts.compounding(),
+                                          ts.compoundingFrequency(),
+                                          ts.allowsExtrapolation());
+                return py::make_tuple(ts.referenceDate(), rate, ts.dayCounter(),
+                                      ts.compounding(), ts.compoundingFrequency(),
+                                      ts.allowsExtrapolation());
+            },
+            [](const py::tuple& state) {
+                ext::shared_ptr<FlatForward> ts;
+                if (state.size() == 7)
+                    ts = ext::make_shared<FlatForward>(
+                        state[0].cast<Natural>(), state[1].cast<Calendar>(),
+                        state[2].cast<Rate>(), state[3].cast<DayCounter>(),
+                        state[4].cast<Compounding>(), state[5].cast<Frequency>());
+                else if (state.size() == 6)
+                    ts = ext::make_shared<FlatForward>(
+                        state[0].cast<Date>(), state[1].cast<Rate>(),
+                        state[2].cast<DayCounter>(), state[3].cast<Compounding>(),
+                        state[4].cast<Frequency>());
+                else
+                    throw py::value_error("invalid FlatForward state");
+                if (state[state.size() - 1].cast<bool>())
+                    ts->enableExtrapolation();
+                return ts;
+            }));
 }
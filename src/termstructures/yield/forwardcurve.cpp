@@ -12,6 +12,7 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/termstructures/yield/forwardcurve.hpp>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
@@ -46,6 +47,14 @@ void ql_termstructures::forwardcurve(py::module_& m) {
         .def("dates", &ForwardCurve::dates,
              py::return_value_policy::reference_internal,
              "Returns the curve dates.")
+        .def("dates",
+             [](const ForwardCurve& curve, const py::object& dtype) {
+                 return pyquantlib::dates_to_numpy(curve.dates(),
+                                                   py::dtype::from_args(dtype));
+             },
+             py::kw_only(), py::arg("dtype"),
+             "Returns the curve dates as a 1-D array of the given dtype "
+             "(datetime64 or integer serial numbers).")
         .def("data", &ForwardCurve::data,
              py::return_value_policy::reference_internal,
              "Returns the forward rates.")
@@ -56,5 +65,22 @@ void ql_termstructures::forwardcurve(py::module_& m) {
              py::return_value_policy::reference_internal,
              "Returns the curve times.")
         .def("nodes", &ForwardCurve::nodes,
-             "Returns the (date, forward rate) pairs.");
+             "Returns the (date, forward rate) pairs.")
+        .def(py::pickle(
+            [](const ForwardCurve& ts) {
+                return py::make_tuple(ts.dates(), ts.data(), ts.dayCounter(),
+                                      ts.calendar(), ts.allowsExtrapolation());
+            },
+            [](const py::tuple& state) {
+                if (state.size() != 5)
+                    throw py::value_error("invalid ForwardCurve state");
+                auto ts = ext::make_shared<ForwardCurve>(
+                    state[0].cast<std::vector<Date>>(),
+                    state[1].cast<std::vector<Real>>(),
+                    state[2].cast<DayCounter>(), state[3].cast<Calendar>(),
+                    BackwardFlat());
+                if (state[4].cast<bool>())
+                    ts->enableExtrapolation();
+                return ts;
+            }));
 }
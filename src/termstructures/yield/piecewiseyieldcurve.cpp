@@ -12,6 +12,8 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/incremental_bootstrap.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/termstructures/yield/piecewiseyieldcurve.hpp>
 #include <ql/termstructures/yield/ratehelpers.hpp>
 #include <ql/termstructures/yield/bootstraptraits.hpp>
@@ -21,52 +23,191 @@
 #include <ql/math/interpolations/cubicinterpolation.hpp>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <string>
+#include <type_traits>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
 namespace {
 
+// Name of the interpolated curve with the same nodes and interpolation,
+// used to pickle a bootstrapped curve as a snapshot of its nodes.
+template <typename Traits, typename Interpolator>
+const char* snapshotCurveName() {
+    if constexpr (std::is_same_v<Traits, Discount> &&
+                  std::is_same_v<Interpolator, LogLinear>)
+        return "DiscountCurve";
+    else if constexpr (std::is_same_v<Traits, ZeroYield> &&
+                       std::is_same_v<Interpolator, Linear>)
+        return "ZeroCurve";
+    else if constexpr (std::is_same_v<Traits, ForwardRate> &&
+                       std::is_same_v<Interpolator, BackwardFlat>)
+        return "ForwardCurve";
+    else
+        return nullptr;
+}
+
+using Helpers = std::vector<ext::shared_ptr<RateHelper>>;
+
+// Piecewise curve bootstrapped by QuantLib's IterativeBootstrap. The curve
+// keeps its helpers private, so a copy is held here for BootstrapInputs.
+template <typename Traits, typename Interpolator>
+class BootstrappedCurve : public PiecewiseYieldCurve<Traits, Interpolator>,
+                          public pyquantlib::BootstrapInputs {
+    using base = PiecewiseYieldCurve<Traits, Interpolator>;
+
+  public:
+    BootstrappedCurve(const Date& referenceDate, const Helpers& instruments,
+                      const DayCounter& dayCounter)
+    : base(referenceDate, instruments, dayCounter),
+      helpers_(instruments.begin(), instruments.end()) {}
+
+    BootstrappedCurve(Natural settlementDays, const Calendar& calendar,
+                      const Helpers& instruments, const DayCounter& dayCounter)
+    : base(settlementDays, calendar, instruments, dayCounter),
+      helpers_(instruments.begin(), instruments.end()) {}
+
+    const pyquantlib::BootstrapHelpers& bootstrapHelpers() const override {
+        return helpers_;
+    }
+
+  private:
+    pyquantlib::BootstrapHelpers helpers_;
+};
+
+// Piecewise curve built with incremental=True: the same curve, calculated by
+// pyquantlib::IncrementalBootstrap instead of the IterativeBootstrap of its
+// base. The bootstrap reads the helpers from instruments_ (the base's own are
+// private) and the nodes through the friend declarations below.
+template <typename Traits, typename Interpolator>
+class IncrementalCurve : public BootstrappedCurve<Traits, Interpolator> {
+    using base = BootstrappedCurve<Traits, Interpolator>;
+    friend class pyquantlib::IncrementalBootstrap<IncrementalCurve>;
+    friend class BootstrapError<IncrementalCurve>;
+
+  public:
+    IncrementalCurve(const Date& referenceDate, const Helpers& instruments,
+                     const DayCounter& dayCounter)
+    : base(referenceDate, instruments, dayCounter), instruments_(instruments) {
+        incrementalBootstrap_.setup(this);
+    }
+
+    IncrementalCurve(Natural settlementDays, const Calendar& calendar,
+                     const Helpers& instruments, const DayCounter& dayCounter)
+    : base(settlementDays, calendar, instruments, dayCounter),
+      instruments_(instruments) {
+        incrementalBootstrap_.setup(this);
+    }
+
+    const pyquantlib::BootstrapStats& bootstrapStats() const {
+        return incrementalBootstrap_.stats();
+    }
+
+  private:
+    void performCalculations() const override { incrementalBootstrap_.calculate(); }
+
+    Helpers instruments_;
+    pyquantlib::IncrementalBootstrap<IncrementalCurve> incrementalBootstrap_;
+};
+
+// Statistics of the last bootstrap, bootstrapping first if needed.
+template <typename Traits, typename Interpolator>
+const pyquantlib::BootstrapStats&
+bootstrapStats(const BootstrappedCurve<Traits, Interpolator>& curve) {
+    const auto* incremental =
+        dynamic_cast<const IncrementalCurve<Traits, Interpolator>*>(&curve);
+    QL_REQUIRE(incremental != nullptr,
+               "bootstrap statistics are only kept by curves built with "
+               "incremental=True");
+    curve.dates();
+    return incremental->bootstrapStats();
+}
+
 template <typename Traits, typename Interpolator>
 void bindPiecewiseCurve(py::module_& m, const char* name, const char* doc) {
-    using Curve = PiecewiseYieldCurve<Traits, Interpolator>;
-    using Helpers = std::vector<ext::shared_ptr<RateHelper>>;
+    using Curve = BootstrappedCurve<Traits, Interpolator>;
+    using Incremental = IncrementalCurve<Traits, Interpolator>;
 
     py::class_<Curve, YieldTermStructure, ext::shared_ptr<Curve>>(m, name, doc)
         // Reference date constructor
         .def(py::init([](const Date& referenceDate,
                          const Helpers& instruments,
-                         const DayCounter& dayCounter) {
+                         const DayCounter& dayCounter,
+                         bool incremental) {
+            if (incremental)
+                return ext::shared_ptr<Curve>(ext::make_shared<Incremental>(
+                    referenceDate, instruments, dayCounter));
             return ext::make_shared<Curve>(referenceDate, instruments, dayCounter);
         }),
              py::arg("referenceDate"),
              py::arg("instruments"),
              py::arg("dayCounter"),
-             "Constructs from reference date, instruments, and day counter.")
+             py::kw_only(),
+             py::arg("incremental") = false,
+             "Constructs from reference date, instruments, and day counter. "
+             "With incremental=True, a rebuild after helper quotes move only "
+             "solves the pillars from the first moved helper onwards.")
         // Settlement days constructor
         .def(py::init([](Natural settlementDays,
                          const Calendar& calendar,
                          const Helpers& instruments,
-                         const DayCounter& dayCounter) {
-            return ext::make_shared<Curve>(
-                settlementDays, calendar, instruments, dayCounter);
+                         const DayCounter& dayCounter,
+                         bool incremental) {
+            if (incremental)
+                return ext::shared_ptr<Curve>(ext::make_shared<Incremental>(
+                    settlementDays, calendar, instruments, dayCounter));
+            return ext::make_shared<Curve>(settlementDays, calendar, instruments,
+                                           dayCounter);
         }),
              py::arg("settlementDays"),
              py::arg("calendar"),
              py::arg("instruments"),
              py::arg("dayCounter"),
+             py::kw_only(),
+             py::arg("incremental") = false,
              "Constructs from settlement days, calendar, instruments, and day counter.")
+        .def("solverIterations",
+             [](const Curve& curve) { return bootstrapStats(curve).iterations; },
+             "Solver iterations (objective evaluations, summed over pillars) "
+             "in the last bootstrap. Only kept with incremental=True.")
+        .def("firstBootstrappedPillar",
+             [](const Curve& curve) { return bootstrapStats(curve).firstPillar; },
+             "Index into dates() of the first node solved in the last "
+             "bootstrap: 1 for a full bootstrap, larger when an incremental "
+             "rebuild kept the earlier nodes. Only kept with incremental=True.")
         .def("times", &Curve::times,
              py::return_value_policy::copy,
              "Returns the interpolation times.")
         .def("dates", &Curve::dates,
              py::return_value_policy::copy,
              "Returns the interpolation dates.")
+        .def("dates",
+             [](const Curve& curve, const py::object& dtype) {
+                 return pyquantlib::dates_to_numpy(curve.dates(),
+                                                   py::dtype::from_args(dtype));
+             },
+             py::kw_only(), py::arg("dtype"),
+             "Returns the interpolation dates as a 1-D array of the given "
+             "dtype (datetime64 or integer serial numbers).")
         .def("data", &Curve::data,
              py::return_value_policy::copy,
              "Returns the interpolated data values.")
         .def("nodes", &Curve::nodes,
-             "Returns (date, value) pairs for all nodes.");
+             "Returns (date, value) pairs for all nodes.")
+        .def("__reduce__", [name](const Curve& curve) {
+            const char* snapshot = snapshotCurveName<Traits, Interpolator>();
+            if (snapshot == nullptr)
+                throw py::type_error(std::string("cannot pickle ") + name +
+                                     ": no interpolated curve with the same interpolation");
+            py::object cls = py::module_::import("pyquantlib").attr(snapshot);
+            py::object copy = cls(curve.dates(), curve.data(), curve.dayCounter(),
+                                  curve.calendar());
+            if (curve.allowsExtrapolation())
+                copy.attr("enableExtrapolation")();
+            return copy.attr("__reduce_ex__")(2);
+        },
+             "Pickles the bootstrapped nodes as an equivalent interpolated curve.");
 }
 
 }  // anonymous namespace
@@ -12,6 +12,7 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/termstructures/yield/zerocurve.hpp>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
@@ -55,6 +56,14 @@ void ql_termstructures::zerocurve(py::module_& m) {
         .def("dates", &ZeroCurve::dates,
              py::return_value_policy::reference_internal,
              "Returns the curve dates.")
+        .def("dates",
+             [](const ZeroCurve& curve, const py::object& dtype) {
+                 return pyquantlib::dates_to_numpy(curve.dates(),
+                                                   py::dtype::from_args(dtype));
+             },
+             py::kw_only(), py::arg("dtype"),
+             "Returns the curve dates as a 1-D array of the given dtype "
+             "(datetime64 or integer serial numbers).")
         .def("data", &ZeroCurve::data,
              py::return_value_policy::reference_internal,
              "Returns the zero rates.")
@@ -65,5 +74,22 @@ void ql_termstructures::zerocurve(py::module_& m) {
              py::return_value_policy::reference_internal,
              "Returns the curve times.")
         .def("nodes", &ZeroCurve::nodes,
-             "Returns the (date, rate) pairs.");
+             "Returns the (date, rate) pairs.")
+        .def(py::pickle(
+            [](const ZeroCurve& ts) {
+                return py::make_tuple(ts.dates(), ts.data(), ts.dayCounter(),
+                                      ts.calendar(), ts.allowsExtrapolation());
+            },
+            [](const py::tuple& state) {
+                if (state.size() != 5)
+                    throw py::value_error("invalid ZeroCurve state");
+                auto ts = ext::make_shared<ZeroCurve>(
+                    state[0].cast<std::vector<Date>>(),
+                    state[1].cast<std::vector<Real>>(),
+                    state[2].cast<DayCounter>(), state[3].cast<Calendar>(),
+                    Linear());
+                if (state[4].cast<bool>())
+                    ts->enableExtrapolation();
+                return ts;
+            }));
 }
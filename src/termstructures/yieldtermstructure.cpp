@@ -13,14 +13,92 @@
 
 #include "pyquantlib/pyquantlib.h"
 #include "pyquantlib/trampolines.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/termstructures/yieldtermstructure.hpp>
+#include <ql/math/comparison.hpp>
 #include <ql/time/daycounters/actual365fixed.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
+#include <array>
+#include <type_traits>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
+namespace {
+
+    using pyquantlib::element;
+
+    // Elements of a batch are evaluated with extrapolate = true, so the
+    // range is checked once, against the earliest and latest times, before
+    // anything is written to the output.
+    void checkBatchRange(const YieldTermStructure& ts, Time tMin, Time tMax,
+                         bool extrapolate) {
+        QL_REQUIRE(tMin >= 0.0, "negative time (" << tMin << ") given");
+        QL_REQUIRE(extrapolate || ts.allowsExtrapolation() ||
+                   tMax <= ts.maxTime() || close_enough(tMax, ts.maxTime()),
+                   "time (" << tMax << ") is past max curve time ("
+                   << ts.maxTime() << ")");
+    }
+
+    // Point of a batch element: Time (float input) or Date (integer serial
+    // numbers or datetime64 input).
+    template <class Point>
+    Point batchPoint(const char* p) {
+        if constexpr (std::is_same_v<Point, Date>)
+            return Date(static_cast<Date::serial_type>(element<std::int64_t>(p)));
+        else
+            return element<double>(p);
+    }
+
+    // Evaluates f over broadcast arrays of points without holding the GIL.
+    template <class Point, std::size_t N, class F>
+    py::array_t<double> evaluateBatch(const YieldTermStructure& ts,
+                                      const std::array<py::array, N>& points,
+                                      bool extrapolate, const py::object& out,
+                                      F f) {
+        constexpr bool dates = std::is_same_v<Point, Date>;
+        std::vector<py::array> inputs;
+        for (const auto& p : points) {
+            if constexpr (dates)
+                inputs.emplace_back(pyquantlib::date_serials(p));
+            else
+                inputs.emplace_back(p.cast<pyquantlib::DoubleArray>());
+        }
+        pyquantlib::BroadcastLoop loop(std::move(inputs));
+        auto result = pyquantlib::make_output(out, loop.shape());
+        double* r = result.mutable_data();
+        if (loop.size() == 0)
+            return result;
+
+        py::gil_scoped_release release;
+        Point earliest = Point(), latest = Point();
+        bool first = true;
+        loop.run([&](py::ssize_t, const char* const* p) {
+            for (std::size_t k = 0; k < N; ++k) {
+                const Point x = batchPoint<Point>(p[k]);
+                earliest = first ? x : std::min(earliest, x);
+                latest = first ? x : std::max(latest, x);
+                first = false;
+            }
+        });
+        if constexpr (dates)
+            checkBatchRange(ts, ts.timeFromReference(earliest),
+                            ts.timeFromReference(latest), extrapolate);
+        else
+            checkBatchRange(ts, earliest, latest, extrapolate);
+
+        loop.run([&](py::ssize_t i, const char* const* p) {
+            std::array<Point, N> x;
+            for (std::size_t k = 0; k < N; ++k)
+                x[k] = batchPoint<Point>(p[k]);
+            r[i] = f(x);
+        });
+        return result;
+    }
+}
+
 void ql_termstructures::yieldtermstructure(py::module_& m) {
     py::class_<YieldTermStructure, PyYieldTermStructure,
                ext::shared_ptr<YieldTermStructure>, TermStructure>(
@@ -54,6 +132,18 @@ void ql_termstructures::yieldtermstructure(py::module_& m) {
             py::overload_cast<Time, bool>(&YieldTermStructure::discount, py::const_),
             py::arg("time"), py::arg("extrapolate") = false,
             "Returns the discount factor for the given time.")
+        .def("discount",
+            [](const YieldTermStructure& self, const py::array& points,
+               bool extrapolate, const py::object& out) {
+                auto f = [&](const auto& x) { return self.discount(x[0], true); };
+                if (pyquantlib::holds_dates(points))
+                    return evaluateBatch<Date, 1>(self, {points}, extrapolate, out, f);
+                return evaluateBatch<Time, 1>(self, {points}, extrapolate, out, f);
+            },
+            py::arg("points"), py::arg("extrapolate") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns discount factors for an array of times (float dtype) or "
+            "dates (integer serial numbers or datetime64).")
         // Zero rate methods
         .def("zeroRate",
             py::overload_cast<const Date&, const DayCounter&, Compounding, Frequency, bool>(
@@ -67,6 +157,33 @@ void ql_termstructures::yieldtermstructure(py::module_& m) {
             py::arg("time"), py::arg("compounding"),
             py::arg("frequency") = Annual, py::arg("extrapolate") = false,
             "Returns the zero rate for the given time.")
+        .def("zeroRate",
+            [](const YieldTermStructure& self, const py::array& dates,
+               const DayCounter& dc, Compounding comp, Frequency freq,
+               bool extrapolate, const py::object& out) {
+                return evaluateBatch<Date, 1>(self, {dates}, extrapolate, out,
+                    [&](const std::array<Date, 1>& d) {
+                        return self.zeroRate(d[0], dc, comp, freq, true).rate();
+                    });
+            },
+            py::arg("dates"), py::arg("dayCounter"), py::arg("compounding"),
+            py::arg("frequency") = Annual, py::arg("extrapolate") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns zero rates for an array of dates (integer serial numbers "
+            "or datetime64).")
+        .def("zeroRate",
+            [](const YieldTermStructure& self, const py::array& times,
+               Compounding comp, Frequency freq, bool extrapolate,
+               const py::object& out) {
+                return evaluateBatch<Time, 1>(self, {times}, extrapolate, out,
+                    [&](const std::array<Time, 1>& t) {
+                        return self.zeroRate(t[0], comp, freq, true).rate();
+                    });
+            },
+            py::arg("times"), py::arg("compounding"),
+            py::arg("frequency") = Annual, py::arg("extrapolate") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns zero rates for an array of times.")
         // Forward rate methods
         .def("forwardRate",
             py::overload_cast<const Date&, const Date&, const DayCounter&,
@@ -90,6 +207,37 @@ void ql_termstructures::yieldtermstructure(py::module_& m) {
             py::arg("time1"), py::arg("time2"), py::arg("compounding"),
             py::arg("frequency") = Annual, py::arg("extrapolate") = false,
             "Returns the forward rate between two times.")
+        .def("forwardRate",
+            [](const YieldTermStructure& self, const py::array& dates1,
+               const py::array& dates2, const DayCounter& dc,
+               Compounding comp, Frequency freq, bool extrapolate,
+               const py::object& out) {
+                return evaluateBatch<Date, 2>(self, {dates1, dates2},
+                    extrapolate, out, [&](const std::array<Date, 2>& d) {
+                        return self.forwardRate(d[0], d[1], dc, comp, freq,
+                                                true).rate();
+                    });
+            },
+            py::arg("dates1"), py::arg("dates2"), py::arg("dayCounter"),
+            py::arg("compounding"), py::arg("frequency") = Annual,
+            py::arg("extrapolate") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns forward rates between broadcast arrays of dates "
+            "(integer serial numbers or datetime64).")
+        .def("forwardRate",
+            [](const YieldTermStructure& self, const py::array& times1,
+               const py::array& times2, Compounding comp, Frequency freq,
+               bool extrapolate, const py::object& out) {
+                return evaluateBatch<Time, 2>(self, {times1, times2},
+                    extrapolate, out, [&](const std::array<Time, 2>& t) {
+                        return self.forwardRate(t[0], t[1], comp, freq,
+                                                true).rate();
+                    });
+            },
+            py::arg("times1"), py::arg("times2"), py::arg("compounding"),
+            py::arg("frequency") = Annual, py::arg("extrapolate") = false,
+            py::kw_only(), py::arg("out") = py::none(),
+            "Returns forward rates between broadcast arrays of times.")
         // Jump methods
         .def("jumpDates", &YieldTermStructure::jumpDates,
             "Returns the jump dates.")
@@ -12,14 +12,101 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/calendar_cache.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/time/calendar.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 #include <pybind11/stl_bind.h>
+#include <algorithm>
+#include <cstdint>
+#include <cstdlib>
+#include <limits>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
+namespace {
+
+    using pyquantlib::BusinessDayCache;
+    using pyquantlib::element;
+    using serial_type = Date::serial_type;
+
+    // Validated serial number of an element of a date batch.
+    serial_type checkedSerial(std::int64_t s) {
+        QL_REQUIRE(s >= Date::minDate().serialNumber() &&
+                   s <= Date::maxDate().serialNumber(),
+                   "date serial number (" << s << ") outside allowed range ["
+                   << Date::minDate().serialNumber() << "-"
+                   << Date::maxDate().serialNumber() << "]");
+        return static_cast<serial_type>(s);
+    }
+
+    // Smallest and largest date of a batch; throws on invalid serials.
+    std::pair<serial_type, serial_type> serialRange(const pyquantlib::BroadcastLoop& loop) {
+        serial_type lo = std::numeric_limits<serial_type>::max();
+        serial_type hi = std::numeric_limits<serial_type>::min();
+        loop.run([&](py::ssize_t, const char* const* p) {
+            for (std::size_t k = 0; k < loop.inputs(); ++k) {
+                const serial_type s = checkedSerial(element<std::int64_t>(p[k]));
+                lo = std::min(lo, s);
+                hi = std::max(hi, s);
+            }
+        });
+        return {lo, hi};
+    }
+
+    // Dates that adjust/advance may visit beyond the input range.
+    serial_type advanceMargin(Integer n, TimeUnit unit) {
+        const serial_type k = std::abs(n);
+        switch (unit) {
+          case Days:
+            return 2 * k + 31;
+          case Weeks:
+            return 7 * k + 31;
+          case Months:
+            return 31 * k + 31;
+          case Years:
+            return 366 * k + 31;
+          default:
+            return 31;
+        }
+    }
+
+    // Applies f(calendar, date) to a batch of dates without the GIL. The
+    // calendar passed to f answers business-day queries from the cached
+    // table for the batch range widened by `margin` days.
+    template <class Result, class F>
+    Result mapDates(const Calendar& calendar, const py::array& dates,
+                    serial_type margin, F f) {
+        pyquantlib::BroadcastLoop loop({pyquantlib::date_serials(dates)});
+        Result result(loop.shape());
+        auto* r = result.mutable_data();
+        if (loop.size() == 0)
+            return result;
+
+        const auto range = serialRange(loop);
+        const pyquantlib::TableCalendar cached(
+            calendar, BusinessDayCache::instance().table(
+                          calendar, range.first - margin, range.second + margin));
+        py::gil_scoped_release release;
+        loop.run([&](py::ssize_t i, const char* const* p) {
+            r[i] = f(cached, Date(static_cast<serial_type>(element<std::int64_t>(p[0]))));
+        });
+        return result;
+    }
+
+    // Clears the business-day tables after a holiday change.
+    template <class F>
+    auto invalidating(F f) {
+        return [f](Calendar& self, const Date& d) {
+            (self.*f)(d);
+            BusinessDayCache::instance().clear();
+        };
+    }
+}
+
 PYBIND11_MAKE_OPAQUE(std::vector<Calendar>);
 
 void ql_time::calendarvector(py::module_& m)
@@ -43,11 +130,25 @@ void ql_time::calendar(py::module_& m)
             "Returns the set of added holidays for the given calendar.")
         .def("removedHolidays", &QuantLib::Calendar::removedHolidays,
             "Returns the set of removed holidays for the given calendar.")
-        .def("resetAddedAndRemovedHolidays", &QuantLib::Calendar::resetAddedAndRemovedHolidays,
+        .def("resetAddedAndRemovedHolidays",
+            [](QuantLib::Calendar& self) {
+                self.resetAddedAndRemovedHolidays();
+                BusinessDayCache::instance().clear();
+            },
             "Clear the set of added and removed holidays.")
         .def("isBusinessDay", &QuantLib::Calendar::isBusinessDay,
             py::arg("d"),
             "Returns True if the date is a business day.")
+        .def("isBusinessDay",
+            [](const QuantLib::Calendar& self, const py::array& dates) {
+                return mapDates<py::array_t<bool>>(self, dates, 0,
+                    [](const QuantLib::Calendar& cal, const Date& d) {
+                        return cal.isBusinessDay(d);
+                    });
+            },
+            py::arg("dates"),
+            "Returns a boolean array flagging the business days in an array of "
+            "dates (integer serial numbers or datetime64).")
         .def("isHoliday", &QuantLib::Calendar::isHoliday,
             py::arg("d"),
             "Returns True if the date is a holiday.")
@@ -66,21 +167,53 @@ void ql_time::calendar(py::module_& m)
         .def("endOfMonth", &QuantLib::Calendar::endOfMonth,
             py::arg("d"),
             "Last business day of the month to which the given date belongs.")
-        .def("addHoliday", &QuantLib::Calendar::addHoliday,
+        .def("addHoliday", invalidating(&QuantLib::Calendar::addHoliday),
             py::arg("d"),
             "Adds a date to the set of holidays for the given calendar.")
-        .def("removeHoliday", &QuantLib::Calendar::removeHoliday,
+        .def("removeHoliday", invalidating(&QuantLib::Calendar::removeHoliday),
             py::arg("d"),
             "Removes a date from the set of holidays for the given calendar.")
         .def("holidayList", &QuantLib::Calendar::holidayList,
             py::arg("from_"), py::arg("to"), py::arg("includeWeekEnds") = false,
             "Returns the holidays between two dates.")
+        .def("holidayList",
+            [](const QuantLib::Calendar& self, const Date& from, const Date& to,
+               bool includeWeekEnds, const py::object& dtype) {
+                return pyquantlib::dates_to_numpy(
+                    self.holidayList(from, to, includeWeekEnds),
+                    py::dtype::from_args(dtype));
+            },
+            py::arg("from_"), py::arg("to"), py::arg("includeWeekEnds") = false,
+            py::kw_only(), py::arg("dtype"),
+            "Returns the holidays between two dates as a 1-D array of the "
+            "given dtype (datetime64 or integer serial numbers).")
         .def("businessDayList", &QuantLib::Calendar::businessDayList,
             py::arg("from_"), py::arg("to"),
             "Returns the business days between two dates.")
+        .def("businessDayList",
+            [](const QuantLib::Calendar& self, const Date& from, const Date& to,
+               const py::object& dtype) {
+                return pyquantlib::dates_to_numpy(self.businessDayList(from, to),
+                                                  py::dtype::from_args(dtype));
+            },
+            py::arg("from_"), py::arg("to"), py::kw_only(), py::arg("dtype"),
+            "Returns the business days between two dates as a 1-D array of "
+            "the given dtype (datetime64 or integer serial numbers).")
         .def("adjust", &QuantLib::Calendar::adjust,
             py::arg("d"), py::arg("convention") = Following,
             "Adjusts a non-business day to the appropriate nearby business day.")
+        .def("adjust",
+            [](const QuantLib::Calendar& self, const py::array& dates,
+               BusinessDayConvention convention) {
+                auto serials = mapDates<pyquantlib::SerialArray>(self, dates, 31,
+                    [convention](const QuantLib::Calendar& cal, const Date& d) {
+                        return std::int64_t(cal.adjust(d, convention).serialNumber());
+                    });
+                return pyquantlib::serials_like(serials, dates);
+            },
+            py::arg("dates"), py::arg("convention") = Following,
+            "Adjusts an array of dates (integer serial numbers or datetime64); "
+            "returns dates in the same representation.")
         .def("advance",
             py::overload_cast<const Date &, Integer, TimeUnit, BusinessDayConvention, bool>(&QuantLib::Calendar::advance, py::const_),
             py::arg("d"), py::arg("n"), py::arg("unit"), py::arg("convention") = Following, py::arg("endOfMonth") = false,
@@ -89,9 +222,74 @@ void ql_time::calendar(py::module_& m)
             py::overload_cast<const Date &, const Period &, BusinessDayConvention, bool>(&QuantLib::Calendar::advance, py::const_),
             py::arg("d"), py::arg("period"), py::arg("convention") = Following, py::arg("endOfMonth") = false,
             "Advances the date by the given period.")
+        .def("advance",
+            [](const QuantLib::Calendar& self, const py::array& dates, Integer n,
+               TimeUnit unit, BusinessDayConvention convention, bool endOfMonth) {
+                auto serials = mapDates<pyquantlib::SerialArray>(
+                    self, dates, advanceMargin(n, unit),
+                    [=](const QuantLib::Calendar& cal, const Date& d) {
+                        return std::int64_t(
+                            cal.advance(d, n, unit, convention, endOfMonth).serialNumber());
+                    });
+                return pyquantlib::serials_like(serials, dates);
+            },
+            py::arg("dates"), py::arg("n"), py::arg("unit"),
+            py::arg("convention") = Following, py::arg("endOfMonth") = false,
+            "Advances an array of dates by the given number of time units.")
+        .def("advance",
+            [](const QuantLib::Calendar& self, const py::array& dates,
+               const Period& period, BusinessDayConvention convention, bool endOfMonth) {
+                auto serials = mapDates<pyquantlib::SerialArray>(
+                    self, dates, advanceMargin(period.length(), period.units()),
+                    [&](const QuantLib::Calendar& cal, const Date& d) {
+                        return std::int64_t(
+                            cal.advance(d, period, convention, endOfMonth).serialNumber());
+                    });
+                return pyquantlib::serials_like(serials, dates);
+            },
+            py::arg("dates"), py::arg("period"),
+            py::arg("convention") = Following, py::arg("endOfMonth") = false,
+            "Advances an array of dates by the given period.")
         .def("businessDaysBetween", &QuantLib::Calendar::businessDaysBetween,
             py::arg("from_"), py::arg("to"), py::arg("includeFirst") = true, py::arg("includeLast") = false,
             "Calculates the number of business days between two dates.")
+        .def("businessDaysBetween",
+            [](const QuantLib::Calendar& self, const py::object& from,
+               const py::object& to, bool includeFirst, bool includeLast) {
+                pyquantlib::BroadcastLoop loop(
+                    {pyquantlib::date_serials(pyquantlib::date_array(from)),
+                     pyquantlib::date_serials(pyquantlib::date_array(to))});
+                py::array_t<std::int64_t> result(loop.shape());
+                std::int64_t* r = result.mutable_data();
+                if (loop.size() == 0)
+                    return result;
+
+                const auto range = serialRange(loop);
+                const auto table =
+                    BusinessDayCache::instance().table(self, range.first, range.second);
+                // Business days in (a, b), plus the end points as requested.
+                auto between = [&](serial_type a, serial_type b, bool first, bool last) {
+                    return table->count(first ? a : a + 1, b) +
+                           ((last && table->isBusinessDay(b)) ? 1 : 0);
+                };
+                py::gil_scoped_release release;
+                loop.run([&](py::ssize_t i, const char* const* p) {
+                    const auto a = static_cast<serial_type>(element<std::int64_t>(p[0]));
+                    const auto b = static_cast<serial_type>(element<std::int64_t>(p[1]));
+                    if (a < b)
+                        r[i] = between(a, b, includeFirst, includeLast);
+                    else if (a > b)
+                        r[i] = -between(b, a, includeLast, includeFirst);
+                    else
+                        r[i] = (includeFirst && includeLast && table->isBusinessDay(a)) ? 1 : 0;
+                });
+                return result;
+            },
+            py::arg("from_"), py::arg("to"), py::arg("includeFirst") = true,
+            py::arg("includeLast") = false,
+            "Business days between two broadcast arrays of dates (integer serial "
+            "numbers or datetime64; scalars and lists are accepted), as an int64 "
+            "array.")
 
         .def(py::self == py::self)
         .def(py::self != py::self)
@@ -12,6 +12,7 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/calendar_cache.h"
 #include <ql/time/calendars/all.hpp>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
@@ -80,7 +81,10 @@ void ql_time::calendars(py::module_& m)
         .def(py::init<const std::string &>(),
             py::arg("name") = "")
         .def("addWeekend",
-            &QuantLib::BespokeCalendar::addWeekend,
+            [](QuantLib::BespokeCalendar& self, QuantLib::Weekday w) {
+                self.addWeekend(w);
+                pyquantlib::BusinessDayCache::instance().clear();
+            },
             py::arg("param_0"),
             "! marks the passed day as part of the weekend")
         ;
@@ -12,10 +12,14 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/time/date.hpp>
+#include <ql/time/schedule.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/operators.h>
 #include <pybind11/stl.h>
+#include <vector>
 
 namespace py = pybind11;
 using namespace QuantLib;
@@ -162,6 +166,15 @@ void ql_time::date(py::module_& m)
     .def(py::self > py::self)
     .def(py::self >= py::self)
 
+    .def(py::pickle(
+        [](const Date& d) {
+            return py::make_tuple(d.serialNumber());
+        },
+        [](const py::tuple& state) {
+            auto serial = state[0].cast<Date::serial_type>();
+            return serial == 0 ? Date() : Date(serial);
+        }))
+
     .def("to_date", [](const Date& d) {
         return py::module_::import("datetime").attr("date")(d.year(), d.month(), d.dayOfMonth());
     })
@@ -197,6 +210,32 @@ void ql_time::date(py::module_& m)
         py::arg("d1"), py::arg("d2"),
         "Difference in days (including fraction) between dates.");
 
+    m.def("dates_to_numpy",
+        [](const py::object& dates, const py::object& dtype) {
+            const auto dt = py::dtype::from_args(dtype);
+            if (py::isinstance<Schedule>(dates))
+                return pyquantlib::dates_to_numpy(dates.cast<const Schedule&>().dates(), dt);
+            if (py::isinstance<py::array>(dates)) {
+                auto a = py::reinterpret_borrow<py::array>(dates);
+                return pyquantlib::dates_to_numpy(pyquantlib::dates_from_numpy(a), dt);
+            }
+            return pyquantlib::dates_to_numpy(dates.cast<std::vector<Date>>(), dt);
+        },
+        py::arg("dates"), py::arg("dtype") = "datetime64[D]",
+        "Converts a sequence of dates (or a Schedule) to a 1-D NumPy array of "
+        "datetime64 values or integer serial numbers. Null dates become NaT "
+        "or 0.");
+
+    m.def("dates_from_numpy",
+        [](const py::array& dates) {
+            return pyquantlib::dates_from_numpy(dates);
+        },
+        py::arg("dates"),
+        "Converts an array of datetime64 values or integer serial numbers to "
+        "a Python list with one Date per element. NaT and serial 0 become "
+        "the null date. Functions taking a list of dates accept the array "
+        "directly, without this conversion.");
+
     // Enable implicit conversion from Python datetime.date/datetime to QuantLib::Date
     // This allows passing datetime objects directly to functions expecting Date
     py::implicitly_convertible<py::object, QuantLib::Date>();
@@ -12,13 +12,87 @@
  */
 
 #include "pyquantlib/pyquantlib.h"
+#include "pyquantlib/numpy_utils.h"
 #include <ql/time/daycounter.hpp>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/operators.h>
+#include <cstdint>
+#include <typeinfo>
 
 namespace py = pybind11;
 using namespace QuantLib;
 
+namespace {
+
+    using pyquantlib::element;
+
+    // Date of a serial number in a batch; 0 stands for the null date.
+    Date batchDate(const char* p) {
+        const auto s = element<std::int64_t>(p);
+        return s == 0 ? Date() : Date(static_cast<Date::serial_type>(s));
+    }
+
+    py::array_t<double> yearFractions(const DayCounter& dc, const py::object& starts,
+                                      const py::object& ends,
+                                      const py::object& refStarts,
+                                      const py::object& refEnds,
+                                      const py::object& out) {
+        QL_REQUIRE(!dc.empty(), "no day counter implementation provided");
+        using pyquantlib::date_array;
+        using pyquantlib::date_serials;
+        std::vector<py::array> inputs{date_serials(date_array(starts)),
+                                      date_serials(date_array(ends))};
+        // Positions of the reference dates in the loop, or -1 if not given.
+        int refStart = -1, refEnd = -1;
+        if (!refStarts.is_none()) {
+            refStart = static_cast<int>(inputs.size());
+            inputs.push_back(date_serials(date_array(refStarts)));
+        }
+        if (!refEnds.is_none()) {
+            refEnd = static_cast<int>(inputs.size());
+            inputs.push_back(date_serials(date_array(refEnds)));
+        }
+
+        pyquantlib::BroadcastLoop loop(std::move(inputs));
+        auto result = pyquantlib::make_output(out, loop.shape());
+        double* r = result.mutable_data();
+        py::gil_scoped_release release;
+        loop.run([&](py::ssize_t i, const char* const* p) {
+            r[i] = dc.yearFraction(batchDate(p[0]), batchDate(p[1]),
+                                   refStart < 0 ? Date() : batchDate(p[refStart]),
+                                   refEnd < 0 ? Date() : batchDate(p[refEnd]));
+        });
+        return result;
+    }
+
+    // DayCounter::impl_ is protected.
+    struct Access : DayCounter {
+        static const std::type_info& implType(const DayCounter& dc) {
+            return typeid(*(dc.*&Access::impl_));
+        }
+    };
+
+    // Whether other counts days as dc does, e.g. when rebuilt from its name.
+    // Some day counters keep parameters that their name does not show:
+    // ActualActual(ISMA) with a schedule uses another implementation class,
+    // and Thirty360(ISDA) with a termination date differs from the one
+    // without only when that date is the end of February.
+    bool sameConventions(const DayCounter& dc, const DayCounter& other) {
+        if (dc.empty() || other.empty())
+            return dc.empty() == other.empty();
+        if (Access::implType(dc) != Access::implType(other))
+            return false;
+        for (Year y = Date::minDate().year(); y <= Date::maxDate().year(); ++y) {
+            const Date start(1, February, y);
+            const Date end = Date::endOfMonth(start);
+            if (dc.dayCount(start, end) != other.dayCount(start, end))
+                return false;
+        }
+        return true;
+    }
+}
+
 void ql_time::daycounter(py::module_& m)
 {
     py::class_<DayCounter, ext::shared_ptr<QuantLib::DayCounter>>(m, "DayCounter",
@@ -43,6 +117,23 @@ void ql_time::daycounter(py::module_& m)
          py::arg("refPeriodEnd") = Date(),
          "Returns the period between two dates as a fraction of year.")
 
+    .def("yearFractions",
+         &yearFractions,
+         py::arg("starts"),
+         py::arg("ends"),
+         py::arg("refStarts") = py::none(),
+         py::arg("refEnds") = py::none(),
+         py::kw_only(),
+         py::arg("out") = py::none(),
+         "Returns year fractions for broadcast arrays of start and end dates "
+         "(integer serial numbers or datetime64; scalars and lists are "
+         "accepted), with optional reference "
+         "period arrays (serial 0 is the null date). Computed without the GIL.")
+
+    .def("_sameConventions", &sameConventions, py::arg("other"),
+         "Returns True if other counts days as this day counter does; used "
+         "to check that a pickled day counter can be rebuilt from its name.")
+
     .def(py::self == py::self)
     .def(py::self != py::self)
 
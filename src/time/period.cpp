@@ -97,6 +97,15 @@ void ql_time::period(py::module_& m) {
             boost::hash_combine(seed, per.units());
             return seed;
         })
+
+        // Pickle support
+        .def(py::pickle(
+            [](const Period& p) {
+                return py::make_tuple(p.length(), p.units());
+            },
+            [](const py::tuple& state) {
+                return Period(state[0].cast<Integer>(), state[1].cast<TimeUnit>());
+            }))
         ;
 
     // Free functions (global)
@@ -117,6 +117,40 @@ void ql_time::schedule(py::module_ &m) {
         .def("until", &Schedule::until)
         ;
 
+    // Pickle support: rebuilt from the (already adjusted) dates and conventions
+    pyClassSchedule
+        .def(py::pickle(
+            [](const Schedule& s) {
+                py::object terminationConvention = py::none();
+                py::object tenor = py::none();
+                py::object rule = py::none();
+                py::object endOfMonth = py::none();
+                if (s.hasTerminationDateBusinessDayConvention())
+                    terminationConvention = py::cast(s.terminationDateBusinessDayConvention());
+                if (s.hasTenor())
+                    tenor = py::cast(s.tenor());
+                if (s.hasRule())
+                    rule = py::cast(s.rule());
+                if (s.hasEndOfMonth())
+                    endOfMonth = py::cast(s.endOfMonth());
+                return py::make_tuple(
+                    s.dates(), s.calendar(), s.businessDayConvention(),
+                    terminationConvention, tenor, rule, endOfMonth,
+                    s.hasIsRegular() ? s.isRegular() : std::vector<bool>{});
+            },
+            [](const py::tuple& state) {
+                return Schedule(
+                    state[0].cast<std::vector<Date>>(),
+                    state[1].cast<Calendar>(),
+                    state[2].cast<BusinessDayConvention>(),
+                    state[3].cast<ext::optional<BusinessDayConvention>>(),
+                    state[4].cast<ext::optional<Period>>(),
+                    state[5].cast<ext::optional<DateGeneration::Rule>>(),
+                    state[6].cast<ext::optional<bool>>(),
+                    state[7].cast<std::vector<bool>>());
+            }))
+        ;
+
     // MakeSchedule - fluent interface for building schedules
     py::class_<MakeSchedule>(m, "MakeSchedule",
         "Helper class providing a fluent interface for Schedule construction.")
@@ -4,6 +4,7 @@ Tests for cashflows module.
 Corresponds to src/cashflows/*.cpp bindings.
 """
 
+import numpy as np
 import pytest
 
 import pyquantlib as ql
@@ -2313,3 +2314,248 @@ def test_averagebmaleg_construction():
            .withPaymentDayCounter(ql.Actual365Fixed())
            .leg())
     assert len(leg) == 4  # quarterly over 1 year
+
+
+# =============================================================================
+# leg_to_arrays
+# =============================================================================
+
+
+def test_leg_to_arrays_fixed(leg_data):
+    """Test leg_to_arrays columns for a fixed-rate leg."""
+    leg = (ql.FixedRateLeg(leg_data["schedule"])
+           .withNotionals(leg_data["nominal"])
+           .withCouponRates(leg_data["rate"], leg_data["day_counter"])
+           .build())
+    cols = ql.leg_to_arrays(leg)
+
+    assert "discount" not in cols
+    assert cols["date"].dtype == np.dtype("datetime64[D]")
+    assert list(cols["date"]) == list(ql.dates_to_numpy([cf.date() for cf in leg]))
+    assert cols["amount"] == pytest.approx([cf.amount() for cf in leg])
+    assert cols["nominal"] == pytest.approx([leg_data["nominal"]] * len(leg))
+    assert cols["rate"] == pytest.approx([leg_data["rate"]] * len(leg))
+    assert cols["accrualStartDate"][0] == np.datetime64("2022-01-15")
+    assert np.isnat(cols["fixingDate"]).all()
+    assert np.isnan(cols["spread"]).all()
+
+
+def test_leg_to_arrays_floating_with_curve(ibor_data):
+    """Test leg_to_arrays for an Ibor leg with discount factors."""
+    # Forward-starting schedule, so no past fixings are needed
+    calendar = ibor_data["calendar"]
+    start = calendar.advance(ibor_data["today"], ql.Period("6M"))
+    schedule = ql.Schedule(
+        start, calendar.advance(start, ql.Period("2Y")), ql.Period("6M"),
+        calendar, ql.ModifiedFollowing, ql.ModifiedFollowing,
+        ql.DateGeneration.Forward, False
+    )
+    leg = (ql.IborLeg(schedule, ibor_data["index"])
+           .withNotionals(ibor_data["nominal"])
+           .withSpreads(0.001)
+           .withGearings(1.5)
+           .build())
+    curve = ql.FlatForward(ql.Date(15, ql.May, 2025), 0.02, ql.Actual365Fixed())
+    cols = ql.leg_to_arrays(leg, curve)
+
+    assert cols["amount"] == pytest.approx([cf.amount() for cf in leg])
+    assert cols["spread"] == pytest.approx([0.001] * len(leg))
+    assert cols["gearing"] == pytest.approx([1.5] * len(leg))
+    fixings = ql.dates_from_numpy(cols["fixingDate"])
+    assert fixings == [cf.fixingDate() for cf in leg]
+    assert cols["discount"] == pytest.approx([curve.discount(cf.date()) for cf in leg])
+
+
+def test_leg_to_arrays_missing_fixing(ibor_data):
+    """Test leg_to_arrays reports NaN for a coupon with a missing fixing."""
+    leg = (ql.IborLeg(ibor_data["schedule"], ibor_data["index"])
+           .withNotionals(ibor_data["nominal"])
+           .build())
+    cols = ql.leg_to_arrays(leg)
+
+    # The first coupon fixed two business days before today
+    assert np.isnan(cols["amount"][0])
+    assert np.isnan(cols["rate"][0])
+    assert cols["amount"][1:] == pytest.approx([cf.amount() for cf in list(leg)[1:]])
+
+
+def test_leg_to_arrays_forecast_error(ibor_data):
+    """Test leg_to_arrays raises errors other than missing fixings."""
+    calendar = ibor_data["calendar"]
+    start = calendar.advance(ibor_data["today"], ql.Period("6M"))
+    schedule = ql.Schedule(
+        start, calendar.advance(start, ql.Period("1Y")), ql.Period("6M"),
+        calendar, ql.ModifiedFollowing, ql.ModifiedFollowing,
+        ql.DateGeneration.Forward, False
+    )
+    # No forwarding curve, so future coupons cannot be forecast
+    leg = (ql.IborLeg(schedule, ql.Euribor6M())
+           .withNotionals(ibor_data["nominal"])
+           .build())
+    with pytest.raises(ql.Error):
+        ql.leg_to_arrays(leg)
+
+
+def test_leg_to_arrays_bond():
+    """Test leg_to_arrays on a bond includes the redemption."""
+    schedule = ql.MakeSchedule(
+        effectiveDate=ql.Date(15, ql.January, 2025),
+        terminationDate=ql.Date(15, ql.January, 2030),
+        tenor=ql.Period(1, ql.Years),
+        calendar=ql.TARGET(),
+    )
+    bond = ql.FixedRateBond(2, 100.0, schedule, [0.04], ql.Actual365Fixed())
+    cols = ql.leg_to_arrays(bond)
+
+    assert len(cols["amount"]) == len(bond.cashflows())
+    assert cols["amount"][-1] == pytest.approx(100.0)
+    assert np.isnan(cols["rate"][-1])
+    assert np.isnat(cols["accrualStartDate"][-1])
+
+
+# =============================================================================
+# CashFlows
+# =============================================================================
+
+
+@pytest.fixture
+def cashflows_env():
+    """Fixed-rate legs with different coupons and a flat curve."""
+    original_date = ql.Settings.instance().evaluationDate
+    today = ql.Date(15, ql.January, 2025)
+    ql.Settings.instance().evaluationDate = today
+
+    schedule = ql.MakeSchedule(
+        effectiveDate=today,
+        terminationDate=ql.Date(15, ql.January, 2030),
+        tenor=ql.Period(1, ql.Years),
+        calendar=ql.TARGET(),
+    )
+    dc = ql.Actual365Fixed()
+    legs = [
+        ql.FixedRateLeg(schedule)
+        .withNotionals(100.0)
+        .withCouponRates(rate, dc)
+        .build()
+        for rate in (0.02, 0.03, 0.04, 0.05, 0.06)
+    ]
+    yield {
+        "legs": legs,
+        "curve": ql.FlatForward(today, 0.04, dc),
+        "day_counter": dc,
+    }
+
+    ql.Settings.instance().evaluationDate = original_date
+
+
+def test_cashflows_npv_yield_roundtrip(cashflows_env):
+    """Test CashFlows.yieldRate inverts CashFlows.npv at a flat yield."""
+    leg = cashflows_env["legs"][2]
+    dc = cashflows_env["day_counter"]
+    npv = ql.CashFlows.npv(leg, 0.035, dc, ql.Compounded, ql.Annual, True)
+    y = ql.CashFlows.yieldRate(leg, npv, dc, ql.Compounded, ql.Annual, True)
+    assert y == pytest.approx(0.035, abs=1e-8)
+
+
+def test_cashflows_analytics_matches_scalar(cashflows_env):
+    """Test CashFlows.analytics against the scalar functions."""
+    legs, curve = cashflows_env["legs"], cashflows_env["curve"]
+    result = ql.CashFlows.analytics(legs, curve)
+
+    assert result["npv"] == pytest.approx(
+        [ql.CashFlows.npv(leg, curve, True) for leg in legs])
+    assert result["bps"] == pytest.approx(
+        [ql.CashFlows.bps(leg, curve, True) for leg in legs])
+    assert result["accruedAmount"] == pytest.approx(
+        [ql.CashFlows.accruedAmount(leg, True) for leg in legs])
+
+
+def test_cashflows_yieldanalytics(cashflows_env):
+    """Test CashFlows.yieldAnalytics with one yield per leg."""
+    legs, dc = cashflows_env["legs"], cashflows_env["day_counter"]
+    yields = np.linspace(0.02, 0.06, len(legs))
+    result = ql.CashFlows.yieldAnalytics(
+        legs, yields, dc, ql.Compounded, ql.Annual)
+
+    for i, leg in enumerate(legs):
+        args = (yields[i], dc, ql.Compounded, ql.Annual)
+        assert result["npv"][i] == pytest.approx(
+            ql.CashFlows.npv(leg, *args, True))
+        assert result["modifiedDuration"][i] == pytest.approx(
+            ql.CashFlows.duration(leg, *args, ql.DurationType.Modified, True))
+        assert result["macaulayDuration"][i] == pytest.approx(
+            ql.CashFlows.duration(leg, *args, ql.DurationType.Macaulay, True))
+        assert result["convexity"][i] == pytest.approx(
+            ql.CashFlows.convexity(leg, *args, True))
+
+
+def test_cashflows_yieldanalytics_macaulay_nan(cashflows_env):
+    """Test Macaulay duration is NaN for continuous compounding."""
+    result = ql.CashFlows.yieldAnalytics(
+        cashflows_env["legs"], 0.04, cashflows_env["day_counter"],
+        ql.Continuous, ql.Annual)
+    assert np.isnan(result["macaulayDuration"]).all()
+    assert np.isfinite(result["modifiedDuration"]).all()
+
+
+def test_cashflows_yieldanalytics_bad_length(cashflows_env):
+    """Test a yields array of the wrong length is rejected."""
+    with pytest.raises(ValueError, match="yields"):
+        ql.CashFlows.yieldAnalytics(
+            cashflows_env["legs"], np.array([0.01, 0.02]),
+            cashflows_env["day_counter"], ql.Compounded, ql.Annual)
+
+
+def test_cashflows_analytics_threads(cashflows_env):
+    """Test threaded batch analytics match the serial results."""
+    legs, curve = cashflows_env["legs"], cashflows_env["curve"]
+    serial = ql.CashFlows.analytics(legs, curve)
+    threaded = ql.CashFlows.analytics(legs, curve, nThreads=2)
+    for key in serial:
+        np.testing.assert_array_equal(serial[key], threaded[key])
+
+
+def test_cashflows_analytics_threads_floating(ibor_data):
+    """Test threaded analytics on Ibor legs sharing a pricer match the serial ones."""
+    calendar = ibor_data["calendar"]
+    start = calendar.advance(ibor_data["today"], ql.Period("6M"))
+    legs = []
+    for spread in (0.0, 0.001, 0.002, 0.003):
+        schedule = ql.Schedule(
+            start, calendar.advance(start, ql.Period("3Y")), ql.Period("6M"),
+            calendar, ql.ModifiedFollowing, ql.ModifiedFollowing,
+            ql.DateGeneration.Forward, False
+        )
+        legs.append(ql.IborLeg(schedule, ibor_data["index"])
+                    .withNotionals(100.0)
+                    .withSpreads(spread)
+                    .build())
+    curve = ibor_data["rate_curve"]
+    threaded = ql.CashFlows.analytics(legs, curve, nThreads=4)  # coupons not yet fixed
+    serial = ql.CashFlows.analytics(legs, curve)
+    for key in serial:
+        np.testing.assert_array_equal(serial[key], threaded[key])
+
+
+def test_cashflows_yieldrates(cashflows_env):
+    """Test CashFlows.yieldRates round-trips batch NPVs."""
+    legs, dc = cashflows_env["legs"], cashflows_env["day_counter"]
+    yields = np.linspace(0.01, 0.05, len(legs))
+    npvs = ql.CashFlows.yieldAnalytics(
+        legs, yields, dc, ql.Compounded, ql.Annual)["npv"]
+
+    solved, failed = ql.CashFlows.yieldRates(
+        legs, npvs, dc, ql.Compounded, ql.Annual, nThreads=2)
+    assert not failed.any()
+    assert solved == pytest.approx(yields, abs=1e-8)
+
+
+def test_cashflows_yieldrates_failure(cashflows_env):
+    """Test an unreachable NPV is reported as NaN and flagged."""
+    legs, dc = cashflows_env["legs"], cashflows_env["day_counter"]
+    npvs = np.full(len(legs), 100.0)
+    npvs[0] = -1.0
+    solved, failed = ql.CashFlows.yieldRates(
+        legs, npvs, dc, ql.Compounded, ql.Annual)
+    assert failed.tolist() == [True, False, False, False, False]
+    assert np.isnan(solved[0])
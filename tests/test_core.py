@@ -5,6 +5,7 @@ Corresponds to src/core/*.cpp bindings.
 """
 
 import math
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -75,6 +76,68 @@ def test_settings_enforces_todays_historic_fixings():
     assert settings.enforcesTodaysHistoricFixings is False
 
 
+def test_saved_settings_restores_on_exit(evaluation_date):
+    """SavedSettings restores the evaluation date when the block exits."""
+    with ql.SavedSettings():
+        ql.Settings.evaluationDate = ql.Date(1, 1, 2030)
+        assert ql.Settings.evaluationDate == ql.Date(1, 1, 2030)
+    assert ql.Settings.evaluationDate == evaluation_date
+
+
+def test_settings_context(evaluation_date):
+    """settings_context applies settings and restores them on exit."""
+    ql.Settings.includeReferenceDateEvents = False
+    other = ql.Date(14, 5, 2025)
+
+    with ql.settings_context(evaluationDate=other, includeReferenceDateEvents=True):
+        assert ql.Settings.evaluationDate == other
+        assert ql.Settings.includeReferenceDateEvents is True
+
+    assert ql.Settings.evaluationDate == evaluation_date
+    assert ql.Settings.includeReferenceDateEvents is False
+
+
+def test_settings_context_restores_on_error(evaluation_date):
+    """settings_context restores settings when the block raises."""
+    with pytest.raises(ZeroDivisionError):
+        with ql.settings_context(evaluationDate=ql.Date(1, 1, 2030)):
+            1 / 0
+    assert ql.Settings.evaluationDate == evaluation_date
+
+
+def test_settings_context_none_leaves_unchanged(evaluation_date):
+    """Arguments left as None do not touch the settings."""
+    with ql.settings_context():
+        assert ql.Settings.evaluationDate == evaluation_date
+
+
+def test_settings_context_keyword_only(evaluation_date):
+    """SettingsContext takes its settings as keywords only."""
+    with pytest.raises(TypeError):
+        ql.SettingsContext(ql.Date(1, 1, 2030), True)
+    with ql.SettingsContext(evaluationDate=ql.Date(1, 1, 2030)):
+        assert ql.Settings.evaluationDate == ql.Date(1, 1, 2030)
+    assert ql.Settings.evaluationDate == evaluation_date
+
+
+@pytest.mark.skipif(not ql.QL_ENABLE_SESSIONS, reason="QuantLib built without sessions")
+def test_settings_context_per_thread(evaluation_date):
+    """With sessions, each thread prices under its own evaluation date."""
+    dates = [evaluation_date - 1, evaluation_date, evaluation_date + 1]
+
+    def discount(date):
+        with ql.settings_context(evaluationDate=date):
+            curve = ql.FlatForward(0, ql.TARGET(), 0.05, ql.Actual365Fixed())
+            return curve.referenceDate(), curve.discount(ql.Date(15, 5, 2026))
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = list(pool.map(discount, dates))
+
+    assert [r[0] for r in results] == dates
+    assert results[0][1] < results[1][1] < results[2][1]
+    assert ql.Settings.evaluationDate == evaluation_date
+
+
 # =============================================================================
 # Instrument
 # =============================================================================
@@ -99,6 +162,58 @@ def test_instrument_results_class():
     assert results.value == 0.0
 
 
+def test_instrument_npv_from_threads(evaluation_date, bsm_process):
+    """NPV releases the GIL and gives the same result from worker threads."""
+    maturity = evaluation_date + ql.Period(1, ql.Years)
+    strikes = [80.0 + 5.0 * i for i in range(9)]
+
+    # Engines hold per-calculation state, so each task builds its own
+    def price(strike):
+        option = ql.VanillaOption(
+            ql.PlainVanillaPayoff(ql.OptionType.Put, strike),
+            ql.AmericanExercise(evaluation_date, maturity),
+        )
+        option.setPricingEngine(ql.FdBlackScholesVanillaEngine(bsm_process, 50, 100))
+        return option.NPV()
+
+    expected = [price(k) for k in strikes]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(price, strikes))
+
+    assert results == pytest.approx(expected, rel=1e-12)
+
+
+def test_instrument_npv_python_quote_from_threads(evaluation_date, flat_rate_curve,
+                                                  flat_dividend_curve, flat_vol_surface):
+    """Python callbacks re-acquire the GIL inside a GIL-free NPV."""
+    maturity = evaluation_date + ql.Period(1, ql.Years)
+
+    def price(spot):
+        base_quote = ql.SimpleQuote(spot)
+        quote = ql.DerivedQuote(ql.QuoteHandle(base_quote), lambda x: x * 1.0)
+        process = ql.BlackScholesMertonProcess(
+            ql.QuoteHandle(quote),
+            ql.YieldTermStructureHandle(flat_dividend_curve),
+            ql.YieldTermStructureHandle(flat_rate_curve),
+            ql.BlackVolTermStructureHandle(flat_vol_surface),
+        )
+        option = ql.VanillaOption(
+            ql.PlainVanillaPayoff(ql.OptionType.Call, 100.0),
+            ql.EuropeanExercise(maturity),
+        )
+        option.setPricingEngine(ql.AnalyticEuropeanEngine(process))
+        return option.NPV()
+
+    spots = [90.0, 95.0, 100.0, 105.0, 110.0]
+    expected = [price(s) for s in spots]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(price, spots))
+
+    assert results == pytest.approx(expected, rel=1e-12)
+
+
 # =============================================================================
 # Observable / Observer
 # =============================================================================
@@ -207,6 +322,59 @@ def test_observable_constructor():
     obs.notifyObservers()  # Should not raise
 
 
+def test_observablesettings_deferred_updates():
+    """Test deferred notifications reach each observer once."""
+    settings = ql.ObservableSettings.instance()
+    observable = ql.Observable()
+    observer = PyObserver()
+    observer.registerWith(observable)
+
+    settings.disableUpdates(True)
+    try:
+        assert not settings.updatesEnabled()
+        assert settings.updatesDeferred()
+        observable.notifyObservers()
+        observable.notifyObservers()
+        assert observer.notifications_count == 0
+    finally:
+        settings.enableUpdates()
+
+    assert settings.updatesEnabled()
+    assert observer.notifications_count == 1
+
+
+def test_batch_updates_context():
+    """Test batch_updates defers notifications until exit."""
+    observable = ql.Observable()
+    observer = PyObserver()
+    observer.registerWith(observable)
+
+    with ql.batch_updates():
+        with ql.batch_updates():
+            observable.notifyObservers()
+        assert observer.notifications_count == 0
+        assert not ql.ObservableSettings.instance().updatesEnabled()
+        observable.notifyObservers()
+
+    assert ql.ObservableSettings.instance().updatesEnabled()
+    assert observer.notifications_count == 1
+
+
+def test_batch_updates_reenables_on_error():
+    """Test batch_updates re-enables updates when the block raises."""
+    observable = ql.Observable()
+    observer = PyObserver()
+    observer.registerWith(observable)
+
+    with pytest.raises(RuntimeError):
+        with ql.batch_updates():
+            observable.notifyObservers()
+            raise RuntimeError("boom")
+
+    assert ql.ObservableSettings.instance().updatesEnabled()
+    assert observer.notifications_count == 1
+
+
 # =============================================================================
 # LazyObject
 # =============================================================================
@@ -4,6 +4,8 @@ Tests for currencies module.
 Corresponds to src/currencies/*.cpp bindings.
 """
 
+import pickle
+
 import pytest
 
 import pyquantlib as ql
@@ -306,3 +308,16 @@ def test_money_cross_currency_close_with_conversion(money_env):
 
     m_usd_different = ql.Money(110.1, usd)
     assert not ql.close(m_eur, m_usd_different)
+
+
+# =============================================================================
+# Pickle
+# =============================================================================
+
+
+def test_currency_pickle():
+    """Test currencies pickle round-trip by ISO code."""
+    for ccy in (ql.EURCurrency(), ql.USDCurrency(), ql.Currency()):
+        restored = pickle.loads(pickle.dumps(ccy))
+        assert restored == ccy
+        assert restored.empty() == ccy.empty()
@@ -4,6 +4,8 @@ Tests for Python extensions.
 Corresponds to pyquantlib/extensions/*.py.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 import pyquantlib as ql
@@ -77,6 +79,29 @@ def test_pricing_integration(market_setup):
     assert npv == pytest.approx(expected_npv, rel=1e-6)
 
 
+def test_pricing_from_threads(market_setup):
+    """Python engine is re-entered under the GIL from GIL-free NPV calls."""
+    today, make_process = market_setup
+    p1 = make_process(100, 0.3)
+    p2 = make_process(100, 0.2)
+    maturity = today + ql.Period(6, ql.Months)
+
+    def price(strike):
+        payoff = ql.SpreadBasketPayoff(ql.PlainVanillaPayoff(ql.OptionType.Call, strike))
+        option = ql.BasketOption(payoff, ql.EuropeanExercise(maturity))
+        engine = ModifiedKirkEngine(p1, p2, 0.9)
+        option.setPricingEngine(engine)
+        return option.NPV()
+
+    strikes = [0.0, 2.5, 5.0, 7.5, 10.0]
+    expected = [price(k) for k in strikes]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(price, strikes))
+
+    assert results == pytest.approx(expected, rel=1e-12)
+
+
 def test_static_methods():
     """Static helper methods work."""
     vol = ModifiedKirkEngine.kirk_volatility(100, 100, 5, 0.3, 0.2, 0.9)
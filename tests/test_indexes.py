@@ -4,6 +4,8 @@ Tests for indexes module.
 Corresponds to src/indexes/*.cpp bindings.
 """
 
+import pickle
+
 import pytest
 
 import pyquantlib as ql
@@ -999,3 +1001,43 @@ def test_swapspreadindex_accessors():
     ssi = ql.SwapSpreadIndex("CMS2s10s", idx1, idx2)
     assert ssi.swapIndex1() is not None
     assert ssi.swapIndex2() is not None
+
+
+# =============================================================================
+# Pickle
+# =============================================================================
+
+
+def test_iborindex_pickle():
+    """Test IborIndex pickles its conventions."""
+    index = ql.IborIndex(
+        "TestIbor", ql.Period(3, ql.Months), 2, ql.EURCurrency(), ql.TARGET(),
+        ql.ModifiedFollowing, True, ql.Actual360(),
+    )
+    restored = pickle.loads(pickle.dumps(index))
+    assert restored.name() == index.name()
+    assert restored.fixingDays() == 2
+    assert restored.currency() == ql.EURCurrency()
+    assert restored.fixingCalendar() == ql.TARGET()
+    assert restored.businessDayConvention() == ql.ModifiedFollowing
+    assert restored.endOfMonth() is True
+    assert restored.dayCounter() == ql.Actual360()
+    assert restored.forwardingTermStructure().empty()
+
+
+def test_iborindex_pickle_with_curve(yield_curve):
+    """Test a linked IborIndex pickles a snapshot of its forwarding curve."""
+    index = ql.Euribor6M(yield_curve)
+    restored = pickle.loads(pickle.dumps(index))
+    assert restored.name() == index.name()
+
+    fixing_date = ql.Date(15, ql.December, 2025)
+    assert restored.fixing(fixing_date) == pytest.approx(index.fixing(fixing_date))
+
+
+def test_overnightindex_pickle_raises():
+    """Test overnight indexes refuse to pickle as an IborIndex."""
+    index = ql.OvernightIndex(
+        "TestON", 0, ql.EURCurrency(), ql.TARGET(), ql.Actual360())
+    with pytest.raises(TypeError):
+        pickle.dumps(index)
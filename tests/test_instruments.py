@@ -4,6 +4,8 @@ Tests for instruments module.
 Corresponds to src/instruments/*.cpp bindings.
 """
 
+import pickle
+
 import pytest
 
 import pyquantlib as ql
@@ -4140,3 +4142,60 @@ def test_twoassetbarrieroption_construction():
         ql.BarrierType.DownOut, 80.0, payoff, exercise,
     )
     assert option is not None
+
+
+# =============================================================================
+# Pickle
+# =============================================================================
+
+
+def test_payoff_pickle():
+    """Test striked payoffs pickle round-trip."""
+    for payoff in (ql.PlainVanillaPayoff(ql.Put, 95.0),
+                   ql.CashOrNothingPayoff(ql.Call, 100.0, 10.0)):
+        restored = pickle.loads(pickle.dumps(payoff))
+        assert type(restored) is type(payoff)
+        assert restored.optionType() == payoff.optionType()
+        assert restored.strike() == pytest.approx(payoff.strike())
+        assert restored(110.0) == pytest.approx(payoff(110.0))
+
+
+def test_exercise_pickle():
+    """Test exercises pickle round-trip."""
+    european = ql.EuropeanExercise(ql.Date(15, 1, 2026))
+    assert pickle.loads(pickle.dumps(european)).lastDate() == ql.Date(15, 1, 2026)
+
+    dates = [ql.Date(15, 7, 2025), ql.Date(15, 1, 2026)]
+    bermudan = pickle.loads(pickle.dumps(ql.BermudanExercise(dates)))
+    assert list(bermudan.dates()) == dates
+
+
+def test_vanillaoption_pickle(option_market_env):
+    """Test VanillaOption pickles without its engine and reprices the same."""
+    payoff = ql.PlainVanillaPayoff(ql.OptionType.Call, 100.0)
+    exercise = ql.EuropeanExercise(ql.Date(20, 2, 2026))
+    option = ql.VanillaOption(payoff, exercise)
+    option.setPricingEngine(ql.AnalyticEuropeanEngine(option_market_env["process"]))
+
+    restored = pickle.loads(pickle.dumps(option))
+    restored.setPricingEngine(ql.AnalyticEuropeanEngine(option_market_env["process"]))
+    assert restored.NPV() == pytest.approx(option.NPV())
+
+
+def test_vanillaswap_pickle(swap_env):
+    """Test VanillaSwap pickles its terms and index and reprices the same."""
+    swap = ql.MakeVanillaSwap(
+        ql.Period(5, ql.Years), swap_env["euribor"], 0.05,
+        forwardStart=ql.Period(1, ql.Years),
+    )
+    restored = pickle.loads(pickle.dumps(swap))
+    assert type(restored) is ql.VanillaSwap
+    assert restored.type() == swap.type()
+    assert restored.fixedRate() == swap.fixedRate()
+    assert list(restored.fixedSchedule().dates()) == list(swap.fixedSchedule().dates())
+    assert restored.iborIndex().name() == swap.iborIndex().name()
+
+    for s in (swap, restored):
+        s.setPricingEngine(ql.DiscountingSwapEngine(swap_env["flat_curve"]))
+    assert restored.NPV() == pytest.approx(swap.NPV())
+    assert restored.fairRate() == pytest.approx(swap.fairRate())
@@ -4,6 +4,8 @@ Tests for bond subtype bindings.
 Corresponds to src/instruments/bonds/*.cpp bindings.
 """
 
+import pickle
+
 import pytest
 
 import pyquantlib as ql
@@ -981,3 +983,51 @@ def test_amortizingcmsratebond_construction():
     )
     assert bond is not None
     assert isinstance(bond, ql.Bond)
+
+
+# =============================================================================
+# Pickle
+# =============================================================================
+
+
+def test_zerocouponbond_pickle(bond_env):
+    """Test ZeroCouponBond pickles without its engine and reprices the same."""
+    bond = ql.ZeroCouponBond(
+        2, bond_env["calendar"], 100.0, bond_env["maturity_date"],
+        ql.Following, 101.0, bond_env["issue_date"]
+    )
+    restored = pickle.loads(pickle.dumps(bond))
+    assert type(restored) is ql.ZeroCouponBond
+    assert restored.maturityDate() == bond.maturityDate()
+    assert restored.redemption().amount() == pytest.approx(101.0)
+
+    for b in (bond, restored):
+        b.setPricingEngine(ql.DiscountingBondEngine(bond_env["curve_handle"]))
+    assert restored.NPV() == pytest.approx(bond.NPV())
+
+
+def test_fixedratebond_pickle(bond_env):
+    """Test FixedRateBond pickles its schedule and conventions."""
+    bond = ql.FixedRateBond(
+        2, 100.0, bond_env["schedule"], [0.05, 0.045],
+        ql.Thirty360(ql.Thirty360.BondBasis),
+        paymentConvention=ql.ModifiedFollowing,
+        issueDate=bond_env["issue_date"],
+        exCouponPeriod=ql.Period(7, ql.Days),
+        exCouponCalendar=bond_env["calendar"],
+    )
+    restored = pickle.loads(pickle.dumps(bond))
+    assert type(restored) is ql.FixedRateBond
+    assert restored.frequency() == bond.frequency()
+    assert restored.dayCounter() == bond.dayCounter()
+
+    original = bond.cashflows()
+    copied = restored.cashflows()
+    assert len(copied) == len(original)
+    for cf, other in zip(original, copied):
+        assert other.date() == cf.date()
+        assert other.amount() == pytest.approx(cf.amount())
+
+    for b in (bond, restored):
+        b.setPricingEngine(ql.DiscountingBondEngine(bond_env["curve_handle"]))
+    assert restored.cleanPrice() == pytest.approx(bond.cleanPrice())
@@ -4,6 +4,7 @@ Tests for math module.
 Corresponds to src/math/*.cpp bindings.
 """
 
+import pickle
 import math
 
 import numpy as np
@@ -836,6 +837,124 @@ def test_interpolation_isinstance():
     assert isinstance(interp, ql.base.Interpolation)
 
 
+@pytest.mark.parametrize("cls", [
+    ql.LinearInterpolation,
+    ql.LogLinearInterpolation,
+    ql.BackwardFlatInterpolation,
+    ql.ForwardFlatInterpolation,
+    ql.CubicNaturalSpline,
+    ql.MonotonicCubicNaturalSpline,
+    ql.LogCubicNaturalSpline,
+    ql.KrugerLogCubic,
+])
+def test_interpolation_array_evaluation(cls):
+    """Test array overloads match the scalar methods."""
+    x = [0.5, 1.0, 2.0, 3.0, 5.0]
+    y = [0.99, 0.97, 0.93, 0.89, 0.81]
+    interp = cls(x, y)
+    points = np.linspace(0.5, 5.0, 37)
+
+    for name in ["__call__", "derivative", "secondDerivative", "primitive"]:
+        method = getattr(interp, name)
+        try:
+            expected = [method(float(p)) for p in points]
+        except ql.Error:
+            # e.g. primitive of log interpolations is not implemented
+            with pytest.raises(ql.Error):
+                method(points)
+            continue
+        result = method(points)
+        assert result.shape == points.shape
+        assert_array_almost_equal(result, expected, decimal=12)
+
+
+def test_interpolation_array_out_and_shape():
+    """Test array overloads keep the input shape and fill out buffers."""
+    interp = ql.CubicNaturalSpline([0.0, 1.0, 2.0, 3.0], [0.0, 1.0, 4.0, 9.0])
+    points = np.array([[0.25, 0.5], [1.5, 2.75]])
+    out = np.empty_like(points)
+    result = interp(points, out=out)
+    assert result is out
+    assert out[1, 0] == pytest.approx(interp(1.5))
+
+    # Lists are converted; unsorted input is fine
+    assert_array_almost_equal(interp([2.75, 0.25]), [interp(2.75), interp(0.25)])
+
+
+def test_interpolation_array_extrapolation():
+    """Test array overloads check the range once per call."""
+    interp = ql.LinearInterpolation([1.0, 2.0, 3.0], [10.0, 20.0, 30.0])
+    out = np.zeros(3)
+    with pytest.raises(ql.Error, match="extrapolation"):
+        interp(np.array([1.5, 3.5, 2.0]), out=out)
+    assert_array_equal(out, 0.0)
+
+    assert_array_almost_equal(
+        interp(np.array([0.0, 4.0]), True), [0.0, 40.0])
+    interp.enableExtrapolation()
+    assert_array_almost_equal(interp.derivative(np.array([4.0])), [10.0])
+
+
+# =============================================================================
+# Interpolation - Shared Buffers
+# =============================================================================
+
+
+@pytest.mark.parametrize("cls", [
+    ql.LinearInterpolation,
+    ql.LogLinearInterpolation,
+    ql.CubicNaturalSpline,
+    ql.MonotonicCubicNaturalSpline,
+    ql.CubicInterpolation,
+])
+def test_interpolation_shared_buffers_update(cls):
+    """Test copy=False interpolations follow in-place writes after update()."""
+    x = np.array([0.5, 1.0, 2.0, 3.0, 5.0])
+    y = np.array([0.99, 0.97, 0.93, 0.89, 0.81])
+    interp = cls(x, y, copy=False)
+    points = np.linspace(0.5, 5.0, 19)
+    assert_array_almost_equal(interp(points), cls(x.copy(), y.copy())(points))
+
+    y[2] = 0.95
+    y *= 0.99
+    interp.update()
+    assert_array_almost_equal(interp(points), cls(x, y.copy())(points), decimal=14)
+
+
+def test_interpolation_shared_buffers_lifetime():
+    """Test copy=False interpolations keep their arrays alive."""
+    def create_interp():
+        x = np.array([1.0, 2.0, 3.0])
+        y = np.array([10.0, 20.0, 30.0])
+        return ql.LinearInterpolation(x, y, copy=False)
+
+    interp = create_interp()
+    assert interp(1.5) == pytest.approx(15.0)
+
+
+def test_interpolation_copy_true():
+    """Test copy=True interpolations do not see later writes."""
+    x = np.array([1.0, 2.0, 3.0])
+    y = np.array([10.0, 20.0, 30.0])
+    interp = ql.LinearInterpolation(x, y, copy=True)
+    y[1] = 0.0
+    interp.update()
+    assert interp(2.0) == pytest.approx(20.0)
+
+
+def test_interpolation_shared_buffers_validation():
+    """Test copy=False rejects inputs that would need a copy."""
+    x = np.array([1.0, 2.0, 3.0])
+    with pytest.raises(TypeError, match="float64"):
+        ql.LinearInterpolation([1.0, 2.0, 3.0], x, copy=False)
+    with pytest.raises(TypeError, match="float64"):
+        ql.LinearInterpolation(x, np.array([1, 2, 3]), copy=False)
+    with pytest.raises(ValueError, match="contiguous"):
+        ql.LinearInterpolation(x, np.arange(6.0)[::2], copy=False)
+    with pytest.raises(ql.Error, match="same size"):
+        ql.LinearInterpolation(x, np.zeros(2), copy=False)
+
+
 # =============================================================================
 # LinearInterpolation
 # =============================================================================
@@ -1291,3 +1410,25 @@ def test_adaptiverungekutta_nd_system():
     result = rk(lambda x, y: [y[1], -y[0]], [1.0, 0.0], 0.0, math.pi)
     assert result[0] == pytest.approx(-1.0, abs=1e-6)
     assert result[1] == pytest.approx(0.0, abs=1e-6)
+
+
+# =============================================================================
+# Pickle
+# =============================================================================
+
+
+def test_array_pickle():
+    """Test Array pickle round-trip."""
+    a = ql.Array([1.0, 2.5, -3.0])
+    restored = pickle.loads(pickle.dumps(a))
+    assert_array_equal(np.array(restored), np.array(a))
+    assert_array_equal(np.array(pickle.loads(pickle.dumps(ql.Array()))), [])
+
+
+def test_matrix_pickle():
+    """Test Matrix pickle round-trip."""
+    m = ql.Matrix([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    restored = pickle.loads(pickle.dumps(m))
+    assert restored.rows() == 2
+    assert restored.columns() == 3
+    assert_array_equal(np.array(restored), np.array(m))
@@ -6,6 +6,7 @@ Corresponds to src/math/distributions/*.cpp bindings.
 
 import math
 
+import numpy as np
 import pytest
 
 import pyquantlib as ql
@@ -47,6 +48,16 @@ def test_normaldistribution_derivative():
     assert n.derivative(1.0) < 0.0
 
 
+def test_normaldistribution_array():
+    """Test NormalDistribution over arrays matches the scalar call."""
+    n = ql.NormalDistribution(1.0, 2.0)
+    x = np.linspace(-3.0, 3.0, 13).reshape(13, 1)
+
+    np.testing.assert_allclose(n(x), [[n(v)] for v in x.ravel()], rtol=1e-15)
+    np.testing.assert_allclose(n.derivative(x), [[n.derivative(v)] for v in x.ravel()],
+                               rtol=1e-15)
+
+
 # =============================================================================
 # CumulativeNormalDistribution
 # =============================================================================
@@ -84,6 +95,28 @@ def test_cumulativenormal_derivative():
         assert cdf.derivative(x) == pytest.approx(pdf(x), rel=1e-10)
 
 
+def test_cumulativenormal_array_in_place():
+    """Test CDF over an array, written in place through out."""
+    cdf = ql.CumulativeNormalDistribution()
+    x = np.array([-2.0, -1.0, 0.0, 1.0, 2.0])
+    expected = [cdf(v) for v in x]
+
+    result = cdf(x, out=x)
+
+    assert result is x
+    np.testing.assert_allclose(x, expected, rtol=1e-15)
+
+
+def test_cumulativenormal_array_non_contiguous():
+    """Test CDF accepts strided input and lists."""
+    cdf = ql.CumulativeNormalDistribution()
+    x = np.linspace(-1.0, 1.0, 10)[::3]
+
+    np.testing.assert_allclose(cdf(x), [cdf(v) for v in x], rtol=1e-15)
+    np.testing.assert_allclose(cdf.derivative([0.0, 1.0]),
+                               [cdf.derivative(0.0), cdf.derivative(1.0)], rtol=1e-15)
+
+
 # =============================================================================
 # InverseCumulativeNormal
 # =============================================================================
@@ -116,6 +149,17 @@ def test_inversecumulativenormal_custom_params():
     assert inv(0.5) == pytest.approx(5.0, abs=1e-10)
 
 
+def test_inversecumulativenormal_array_roundtrip():
+    """Test inverse CDF over an array inverts the CDF."""
+    cdf = ql.CumulativeNormalDistribution()
+    inv = ql.InverseCumulativeNormal()
+    x = np.linspace(-3.0, 3.0, 25)
+
+    np.testing.assert_allclose(inv(cdf(x)), x, atol=1e-8)
+    np.testing.assert_allclose(ql.InverseCumulativeNormal.standard_value(cdf(x)), x,
+                               atol=1e-8)
+
+
 # =============================================================================
 # BivariateCumulativeNormalDistribution
 # =============================================================================
@@ -142,3 +186,16 @@ def test_bivariate_symmetry():
     """Test that bivariate CDF is symmetric in arguments for symmetric rho."""
     bvn = ql.BivariateCumulativeNormalDistribution(0.5)
     assert bvn(1.0, 2.0) == pytest.approx(bvn(2.0, 1.0), rel=1e-10)
+
+
+def test_bivariate_array():
+    """Test bivariate CDF broadcasts its two array arguments."""
+    bvn = ql.BivariateCumulativeNormalDistribution(0.3)
+    x = np.array([-1.0, 0.0, 1.0])
+    y = np.array([[0.5], [2.0]])
+
+    result = bvn(x, y)
+
+    assert result.shape == (2, 3)
+    expected = [[bvn(a, b) for a in x] for b in y.ravel()]
+    np.testing.assert_allclose(result, expected, rtol=1e-15)
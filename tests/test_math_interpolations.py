@@ -224,6 +224,76 @@ def test_bicubicspline_data_lifetime():
     assert interp(1.0, 1.0) == pytest.approx(1.0)
 
 
+# ---------------------------------------------------------------------------
+# Interpolation2D batch evaluation
+# ---------------------------------------------------------------------------
+
+def _surface(cls):
+    x = [0.0, 1.0, 2.0, 3.0]
+    y = [0.0, 0.5, 1.0]
+    z = ql.Matrix([[xi * xi + 2.0 * yi for xi in x] for yi in y])
+    return cls(x, y, z)
+
+
+@pytest.mark.parametrize("cls", [ql.BilinearInterpolation, ql.BicubicSpline])
+def test_interpolation2d_evaluate_grid(cls):
+    interp = _surface(cls)
+    xs = np.linspace(0.0, 3.0, 7)
+    ys = np.linspace(0.0, 1.0, 5)
+
+    grid = interp.evaluateGrid(xs, ys)
+    assert grid.shape == (len(ys), len(xs))
+    for i, y in enumerate(ys):
+        for j, x in enumerate(xs):
+            assert grid[i, j] == pytest.approx(interp(x, y), rel=1e-14)
+
+    # On the nodes the grid reproduces zData
+    nodes = interp.evaluateGrid(interp.xValues(), interp.yValues())
+    assert nodes == pytest.approx(np.array(interp.zData()))
+
+
+@pytest.mark.parametrize("cls", [ql.BilinearInterpolation, ql.BicubicSpline])
+def test_interpolation2d_evaluate_points(cls):
+    interp = _surface(cls)
+    xs = np.array([0.25, 1.5, 2.75])
+    ys = np.array([0.1, 0.9, 0.5])
+
+    values = interp.evaluatePoints(xs, ys)
+    assert values == pytest.approx([interp(x, y) for x, y in zip(xs, ys)])
+
+    # ys broadcasts against xs
+    row = interp.evaluatePoints(xs, 0.5)
+    assert row == pytest.approx([interp(x, 0.5) for x in xs])
+
+
+def test_interpolation2d_out_buffer():
+    interp = _surface(ql.BicubicSpline)
+    xs = np.linspace(0.0, 3.0, 4)
+    ys = np.linspace(0.0, 1.0, 3)
+    out = np.empty((3, 4))
+    assert interp.evaluateGrid(xs, ys, out=out) is out
+    assert out == pytest.approx(np.array(interp.zData()))
+
+    points = np.empty(4)
+    assert interp.evaluatePoints(xs, 0.0, out=points) is points
+
+    with pytest.raises(ValueError, match="shape"):
+        interp.evaluateGrid(xs, ys, out=np.empty((4, 3)))
+
+
+def test_interpolation2d_batch_extrapolation():
+    interp = _surface(ql.BilinearInterpolation)
+    out = np.zeros(2)
+    with pytest.raises(ql.Error, match="extrapolation"):
+        interp.evaluatePoints([1.0, 4.0], [0.5, 0.5], out=out)
+    assert (out == 0.0).all()
+    with pytest.raises(ql.Error, match="extrapolation"):
+        interp.evaluateGrid([1.0], [-0.5, 0.5])
+
+    values = interp.evaluatePoints([4.0], [0.5], True)
+    assert values[0] == pytest.approx(interp(4.0, 0.5, True))
+
+
 # ---------------------------------------------------------------------------
 # ChebyshevInterpolation
 # ---------------------------------------------------------------------------
@@ -4,6 +4,7 @@ Tests for math/randomnumbers module.
 Corresponds to src/math/randomnumbers/*.cpp bindings.
 """
 
+import numpy as np
 import pytest
 
 import pyquantlib as ql
@@ -62,6 +63,21 @@ def test_mt_reproducibility():
         assert rng1.nextReal() == rng2.nextReal()
 
 
+def test_mt_next_batch():
+    """Test nextBatch and fill continue the nextReal stream."""
+    rng1 = ql.MersenneTwisterUniformRng(123)
+    rng2 = ql.MersenneTwisterUniformRng(123)
+    expected = [rng2.nextReal() for _ in range(10)]
+
+    batch = rng1.nextBatch(4)
+    out = np.empty((2, 3))
+    result = rng1.fill(out)
+
+    assert result is out
+    np.testing.assert_array_equal(batch, expected[:4])
+    np.testing.assert_array_equal(out.ravel(), expected[4:])
+
+
 # =============================================================================
 # SobolRsg
 # =============================================================================
@@ -139,6 +155,33 @@ def test_sobol_uniformity():
             assert 0.0 <= v <= 1.0
 
 
+def test_sobol_next_batch():
+    """Test nextBatch rows match successive nextSequence calls."""
+    sobol1 = ql.SobolRsg(3, 0)
+    sobol2 = ql.SobolRsg(3, 0)
+
+    batch = sobol1.nextBatch(8)
+
+    assert batch.shape == (8, 3)
+    for row in batch:
+        assert list(row) == sobol2.nextSequence().value
+
+
+def test_sobol_fill():
+    """Test fill writes into a caller-supplied buffer and checks its shape."""
+    sobol = ql.SobolRsg(3, 0)
+    sobol.skipTo(5)
+    out = np.empty((2, 3))
+
+    sobol.fill(out)
+
+    assert out[0] == pytest.approx([0.625, 0.125, 0.375], rel=1e-10)
+    with pytest.raises(ValueError, match="shape"):
+        sobol.fill(np.empty((2, 4)))
+    with pytest.raises(TypeError):
+        sobol.fill(np.empty((2, 3), dtype=np.float32))
+
+
 # =============================================================================
 # HaltonRsg
 # =============================================================================
@@ -228,6 +271,18 @@ def test_burley2020sobol_differs_from_sobol():
     assert s1.value != pytest.approx(b1.value, abs=1e-6)
 
 
+def test_burley2020sobol_next_batch():
+    """Test Burley2020 Sobol nextBatch matches nextSequence."""
+    rsg1 = ql.Burley2020SobolRsg(4)
+    rsg2 = ql.Burley2020SobolRsg(4)
+
+    batch = rsg1.nextBatch(16)
+
+    assert batch.shape == (16, 4)
+    np.testing.assert_array_equal(
+        batch, [rsg2.nextSequence().value for _ in range(16)])
+
+
 # =============================================================================
 # BoxMullerGaussianRng
 # =============================================================================
@@ -434,6 +489,18 @@ def test_gaussian_ldsg_with_direction_integers():
     assert seq.weight == 1.0
 
 
+def test_gaussian_ldsg_next_batch():
+    """Test GaussianLDSG nextBatch starts from the Sobol midpoint."""
+    rsg = ql.GaussianLowDiscrepancySequenceGenerator(3, 0)
+
+    batch = rsg.nextBatch(2)
+
+    assert batch[0] == pytest.approx([0.0, 0.0, 0.0], abs=1e-10)
+    assert batch[1] == pytest.approx(
+        [0.6744897502234225, -0.6744897502234225, 0.6744897502234225],
+        rel=1e-10)
+
+
 # =============================================================================
 # SobolBrownianBridgeRsg
 # =============================================================================
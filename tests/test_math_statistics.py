@@ -4,6 +4,9 @@ Tests for statistics classes.
 Corresponds to src/math/statistics/*.cpp bindings.
 """
 
+import pickle
+
+import numpy as np
 import pytest
 import pyquantlib as ql
 
@@ -118,6 +121,44 @@ def test_statistics_sort():
     assert stats.percentile(0.5) == pytest.approx(2.0)
 
 
+def test_statistics_add_array():
+    """Test add with a NumPy array and per-sample weights."""
+    values = np.array([10.0, 20.0, 30.0])
+    stats = ql.Statistics()
+    stats.add(values, np.array([1.0, 2.0, 3.0]))
+
+    assert stats.samples() == 3
+    assert stats.weightSum() == pytest.approx(6.0)
+    assert stats.mean() == pytest.approx(23.333333333333332)
+
+
+def test_statistics_merge():
+    """Test merge gives the statistics of the combined data."""
+    data = np.random.default_rng(1).normal(size=1000)
+    a, b, full = ql.Statistics(), ql.Statistics(), ql.Statistics()
+    a.add(data[:400])
+    b.add(data[400:])
+    full.add(data)
+    a.merge(b)
+
+    assert a.samples() == 1000
+    assert a.mean() == pytest.approx(full.mean(), rel=1e-12)
+    assert a.variance() == pytest.approx(full.variance(), rel=1e-12)
+    assert a.percentile(0.95) == pytest.approx(full.percentile(0.95))
+
+
+def test_statistics_pickle():
+    """Test Statistics pickle round-trip."""
+    stats = ql.Statistics()
+    stats.add([1.0, 2.0, 3.0, 4.0], [1.0, 1.0, 2.0, 2.0])
+    restored = pickle.loads(pickle.dumps(stats))
+
+    assert restored.samples() == 4
+    assert restored.weightSum() == pytest.approx(6.0)
+    assert restored.mean() == pytest.approx(stats.mean())
+    assert restored.percentile(0.5) == pytest.approx(stats.percentile(0.5))
+
+
 # =============================================================================
 # IncrementalStatistics
 # =============================================================================
@@ -184,6 +225,75 @@ def test_incrementalstatistics_reset():
     assert stats.samples() == 0
 
 
+def test_incrementalstatistics_add_array():
+    """Test add with a NumPy array matches adding one value at a time."""
+    rng = np.random.default_rng(2)
+    values = rng.normal(size=500)
+    weights = rng.uniform(0.5, 2.0, size=500)
+    batch, single = ql.IncrementalStatistics(), ql.IncrementalStatistics()
+    batch.add(values, weights)
+    for x, w in zip(values, weights):
+        single.add(float(x), float(w))
+
+    assert batch.samples() == 500
+    assert batch.weightSum() == pytest.approx(single.weightSum(), rel=1e-12)
+    assert batch.mean() == pytest.approx(single.mean(), rel=1e-12)
+    assert batch.variance() == pytest.approx(single.variance(), rel=1e-12)
+    assert batch.skewness() == pytest.approx(single.skewness(), rel=1e-10)
+    assert batch.kurtosis() == pytest.approx(single.kurtosis(), rel=1e-10)
+
+
+def test_incrementalstatistics_add_array_errors():
+    """Test add rejects 2-D arrays and negative weights before adding."""
+    stats = ql.IncrementalStatistics()
+    with pytest.raises(ValueError):
+        stats.add(np.ones((2, 2)))
+    with pytest.raises(ValueError):
+        stats.add(np.array([1.0, 2.0]), np.array([1.0, -1.0]))
+    assert stats.samples() == 0
+
+
+def test_incrementalstatistics_merge():
+    """Test merge gives the moments of the combined weighted data."""
+    rng = np.random.default_rng(3)
+    values = rng.normal(0.5, 2.0, size=3000)
+    weights = rng.uniform(0.0, 2.0, size=3000)
+    full = ql.IncrementalStatistics()
+    full.add(values, weights)
+    merged = ql.IncrementalStatistics()
+    for shard in range(3):
+        part = ql.IncrementalStatistics()
+        part.add(values[shard::3], weights[shard::3])
+        merged.merge(part)
+
+    assert merged.samples() == full.samples()
+    assert merged.weightSum() == pytest.approx(full.weightSum(), rel=1e-12)
+    assert merged.mean() == pytest.approx(full.mean(), rel=1e-12)
+    assert merged.variance() == pytest.approx(full.variance(), rel=1e-12)
+    assert merged.skewness() == pytest.approx(full.skewness(), rel=1e-9)
+    assert merged.kurtosis() == pytest.approx(full.kurtosis(), rel=1e-9)
+    assert merged.min() == full.min()
+    assert merged.max() == full.max()
+    assert merged.downsideSamples() == full.downsideSamples()
+    assert merged.downsideVariance() == pytest.approx(full.downsideVariance(), rel=1e-12)
+
+
+def test_incrementalstatistics_pickle():
+    """Test IncrementalStatistics pickle round-trip."""
+    stats = ql.IncrementalStatistics()
+    stats.add(np.array([-2.0, -1.0, 0.0, 1.0, 3.0, 5.0]))
+    restored = pickle.loads(pickle.dumps(stats))
+
+    assert restored.samples() == 6
+    assert restored.mean() == stats.mean()
+    assert restored.kurtosis() == stats.kurtosis()
+    assert restored.downsideVariance() == stats.downsideVariance()
+
+    restored.add(7.0)
+    assert restored.samples() == 7
+    assert stats.samples() == 6
+
+
 # =============================================================================
 # SequenceStatistics
 # =============================================================================
@@ -272,3 +382,53 @@ def test_sequencestatistics_reset():
     stats.reset(3)
     assert stats.size() == 3
     assert stats.samples() == 0
+
+
+def test_sequencestatistics_add_array():
+    """Test add with a 2-D array matches adding one row at a time."""
+    samples = np.random.default_rng(4).normal(size=(200, 3))
+    batch, single = ql.SequenceStatistics(), ql.SequenceStatistics()
+    batch.add(samples, 2.0)
+    for row in samples:
+        single.add(list(row), 2.0)
+
+    assert batch.size() == 3
+    assert batch.samples() == 200
+    assert batch.weightSum() == pytest.approx(400.0)
+    np.testing.assert_allclose(batch.mean(), single.mean(), rtol=1e-12)
+    np.testing.assert_allclose(np.array(batch.covariance()),
+                               np.array(single.covariance()), rtol=1e-12)
+
+
+def test_sequencestatistics_merge():
+    """Test merge after percentile queries matches a single accumulator."""
+    samples = np.random.default_rng(5).normal(size=(1000, 2))
+    a, b, full = ql.SequenceStatistics(), ql.SequenceStatistics(), ql.SequenceStatistics()
+    a.add(samples[:600])
+    b.add(samples[600:])
+    full.add(samples)
+    b.percentile(0.5)  # sorts the samples of each dimension
+    a.merge(b)
+
+    assert a.samples() == 1000
+    np.testing.assert_allclose(a.mean(), full.mean(), rtol=1e-12)
+    np.testing.assert_allclose(np.array(a.covariance()),
+                               np.array(full.covariance()), rtol=1e-10)
+    np.testing.assert_allclose(a.percentile(0.9), full.percentile(0.9))
+
+    with pytest.raises(ql.Error):
+        a.merge(ql.SequenceStatistics(3))
+
+
+def test_sequencestatistics_pickle():
+    """Test SequenceStatistics pickle round-trip."""
+    stats = ql.SequenceStatistics(2)
+    stats.add(np.array([[1.0, 10.0], [2.0, 25.0], [3.0, 30.0]]), [1.0, 2.0, 1.0])
+    restored = pickle.loads(pickle.dumps(stats))
+
+    assert restored.size() == 2
+    assert restored.samples() == 3
+    assert restored.weightSum() == pytest.approx(4.0)
+    np.testing.assert_allclose(restored.mean(), stats.mean())
+    np.testing.assert_allclose(np.array(restored.covariance()),
+                               np.array(stats.covariance()))
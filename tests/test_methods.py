@@ -6,6 +6,7 @@ Corresponds to src/methods/*.cpp bindings.
 
 import math
 
+import numpy as np
 import pytest
 
 import pyquantlib as ql
@@ -503,6 +504,31 @@ def test_path_repr():
     assert "length=11" in repr(p)
 
 
+def test_path_values_view():
+    """Test Path.values is a writeable view of the path data."""
+    grid = ql.TimeGrid(1.0, 4)
+    p = ql.Path(grid, ql.Array([100.0, 101.0, 99.0, 102.0, 103.0]))
+    values = p.values
+    assert isinstance(values, np.ndarray)
+    assert values.dtype == np.float64
+    np.testing.assert_array_equal(values, [100.0, 101.0, 99.0, 102.0, 103.0])
+
+    values *= 2.0
+    assert p[2] == pytest.approx(198.0)
+    assert np.shares_memory(np.asarray(p), values)
+    np.testing.assert_array_equal(p.times, [0.0, 0.25, 0.5, 0.75, 1.0])
+    assert not p.times.flags.writeable
+
+
+def test_path_values_keep_path_alive():
+    """Test a values view outlives the Python reference to its path."""
+    def make_values():
+        return ql.Path(ql.TimeGrid(1.0, 2), ql.Array([1.0, 2.0, 3.0])).values
+
+    values = make_values()
+    np.testing.assert_array_equal(values, [1.0, 2.0, 3.0])
+
+
 # =============================================================================
 # MultiPath
 # =============================================================================
@@ -556,6 +582,21 @@ def test_multipath_repr():
     assert "pathSize=6" in r
 
 
+def test_multipath_row_views():
+    """Test asset rows of a MultiPath expose views into its storage."""
+    grid = ql.TimeGrid(1.0, 5)
+    mp = ql.MultiPath(2, grid)
+    row = mp[1].values
+    row[:] = np.arange(6.0)
+    assert mp[1][5] == pytest.approx(5.0)
+    assert mp[0].values.shape == (6,)
+
+    # Stacking the rows gives the (assets, steps) matrix
+    stacked = np.vstack([mp[j].values for j in range(len(mp))])
+    assert stacked.shape == (2, 6)
+    np.testing.assert_array_equal(stacked[1], np.arange(6.0))
+
+
 # =============================================================================
 # SamplePath / SampleMultiPath
 # =============================================================================
@@ -861,6 +902,47 @@ def test_gaussian_path_generator_deterministic(bsm_process):
         assert p1[i] == pytest.approx(p2[i])
 
 
+def test_gaussian_path_generator_generate(bsm_process):
+    """Test generate returns the same paths as repeated next() calls."""
+    def make_gen():
+        rng = ql.UniformRandomSequenceGenerator(
+            10, ql.MersenneTwisterUniformRng(42)
+        )
+        gsg = ql.GaussianRandomSequenceGenerator(rng)
+        return ql.GaussianPathGenerator(bsm_process, 1.0, 10, gsg, False)
+
+    values, weights = make_gen().generate(5)
+
+    assert values.shape == (5, 11)
+    np.testing.assert_array_equal(weights, 1.0)
+    gen = make_gen()
+    for row in values:
+        path = gen.next().value
+        np.testing.assert_array_equal(row, [path[i] for i in range(11)])
+
+
+def test_gaussian_path_generator_generate_antithetic(bsm_process):
+    """Test generate interleaves antithetic paths into a caller buffer."""
+    def make_gen():
+        rng = ql.UniformRandomSequenceGenerator(
+            10, ql.MersenneTwisterUniformRng(42)
+        )
+        gsg = ql.GaussianRandomSequenceGenerator(rng)
+        return ql.GaussianPathGenerator(bsm_process, 1.0, 10, gsg, False)
+
+    out = np.empty((6, 11))
+    values, weights = make_gen().generate(3, antithetic=True, out=out)
+
+    assert values is out
+    assert weights.shape == (6,)
+    gen = make_gen()
+    for i in range(3):
+        assert out[2 * i, -1] == pytest.approx(gen.next().value.back())
+        assert out[2 * i + 1, -1] == pytest.approx(gen.antithetic().value.back())
+    with pytest.raises(ValueError, match="shape"):
+        make_gen().generate(4, out=out)
+
+
 # =============================================================================
 # GaussianSobolPathGenerator
 # =============================================================================
@@ -896,6 +978,18 @@ def test_gaussian_sobol_path_generator_with_bridge(bsm_process):
     assert sample.value.front() == pytest.approx(100.0)
 
 
+def test_gaussian_sobol_path_generator_generate(bsm_process):
+    """Test GaussianSobolPathGenerator generate shape and first column."""
+    gsg = ql.GaussianLowDiscrepancySequenceGenerator(ql.SobolRsg(10))
+    gen = ql.GaussianSobolPathGenerator(bsm_process, 1.0, 10, gsg, True)
+
+    values, weights = gen.generate(64)
+
+    assert values.shape == (64, 11)
+    np.testing.assert_allclose(values[:, 0], 100.0)
+    assert np.all(values > 0.0)
+
+
 # =============================================================================
 # GaussianMultiPathGenerator
 # =============================================================================
@@ -958,6 +1052,68 @@ def test_gaussian_multipath_generator_antithetic(heston_process):
     )
 
 
+def test_gaussian_multipath_generator_generate(heston_process):
+    """Test GaussianMultiPathGenerator generate returns paths x assets x steps."""
+    time_steps = 10
+    grid = ql.TimeGrid(1.0, time_steps)
+    dim = heston_process.factors() * time_steps
+
+    def make_gen():
+        rng = ql.UniformRandomSequenceGenerator(
+            dim, ql.MersenneTwisterUniformRng(42)
+        )
+        gsg = ql.GaussianRandomSequenceGenerator(rng)
+        return ql.GaussianMultiPathGenerator(heston_process, grid, gsg)
+
+    values, weights = make_gen().generate(4, antithetic=True)
+
+    assert values.shape == (8, heston_process.size(), 11)
+    assert weights.shape == (8,)
+    gen = make_gen()
+    sample = gen.next().value
+    anti = gen.antithetic().value
+    assert values[0, 0, -1] == pytest.approx(sample[0].back())
+    assert values[0, 1, -1] == pytest.approx(sample[1].back())
+    assert values[1, 0, -1] == pytest.approx(anti[0].back())
+
+
+
+def test_gaussian_multipath_generator_generate_bad_out(heston_process):
+    """Test a wrong out buffer raises without advancing the generator."""
+    time_steps = 10
+    grid = ql.TimeGrid(1.0, time_steps)
+    dim = heston_process.factors() * time_steps
+
+    def make_gen():
+        rng = ql.UniformRandomSequenceGenerator(
+            dim, ql.MersenneTwisterUniformRng(42)
+        )
+        gsg = ql.GaussianRandomSequenceGenerator(rng)
+        return ql.GaussianMultiPathGenerator(heston_process, grid, gsg)
+
+    gen = make_gen()
+    with pytest.raises(ValueError):
+        gen.generate(2, out=np.empty((2, heston_process.size(), 5)))
+    values, _ = gen.generate(2)
+    expected, _ = make_gen().generate(2)
+    np.testing.assert_array_equal(values, expected)
+
+
+def test_gaussian_multipath_generator_generate_zero(heston_process):
+    """Test generating zero multi-paths returns empty arrays."""
+    time_steps = 10
+    grid = ql.TimeGrid(1.0, time_steps)
+    dim = heston_process.factors() * time_steps
+    rng = ql.UniformRandomSequenceGenerator(
+        dim, ql.MersenneTwisterUniformRng(42)
+    )
+    gsg = ql.GaussianRandomSequenceGenerator(rng)
+    gen = ql.GaussianMultiPathGenerator(heston_process, grid, gsg)
+
+    values, weights = gen.generate(0)
+    assert values.shape == (0, heston_process.size(), 11)
+    assert weights.shape == (0,)
+
 # =============================================================================
 # GaussianSobolMultiPathGenerator
 # =============================================================================
@@ -4,6 +4,7 @@ Tests for pricing engines module.
 Corresponds to src/pricingengines/*.cpp bindings.
 """
 
+import numpy as np
 import pytest
 
 import pyquantlib as ql
@@ -100,6 +101,75 @@ def test_bachelier_stddev_derivative():
     assert vega == pytest.approx(0.3989422804014327, rel=1e-10)
 
 
+# --- Vectorized Black / Bachelier ---
+
+
+def test_black_formula_array():
+    """blackFormula accepts arrays and matches the scalar formula."""
+    strikes = np.linspace(80.0, 120.0, 9)
+    prices = ql.blackFormula(ql.OptionType.Call, strikes, 100.0, 0.2, 0.95)
+    assert isinstance(prices, np.ndarray)
+    assert prices.shape == strikes.shape
+    expected = [ql.blackFormula(ql.OptionType.Call, k, 100.0, 0.2, 0.95) for k in strikes]
+    np.testing.assert_allclose(prices, expected, rtol=1e-14)
+
+
+def test_black_formula_array_broadcast():
+    """Inputs broadcast, including per-element option types."""
+    strikes = np.array([90.0, 100.0, 110.0])
+    std_devs = np.array([[0.1], [0.2]])
+    types = np.array([1, -1, 1])
+    prices = ql.blackFormula(types, strikes, 100.0, std_devs)
+    assert prices.shape == (2, 3)
+    assert prices[1, 1] == pytest.approx(
+        ql.blackFormula(ql.OptionType.Put, 100.0, 100.0, 0.2), rel=1e-14)
+
+
+def test_black_formula_array_out():
+    """Results can be written into a preallocated buffer."""
+    strikes = np.linspace(80.0, 120.0, 5)
+    out = np.empty(5)
+    result = ql.blackFormula(ql.OptionType.Put, strikes, 100.0, 0.2, out=out)
+    assert result is out
+    assert out[2] == pytest.approx(ql.blackFormula(ql.OptionType.Put, 100.0, 100.0, 0.2))
+
+    with pytest.raises(ValueError):
+        ql.blackFormula(ql.OptionType.Put, strikes, 100.0, 0.2, out=np.empty(4))
+
+
+def test_black_formula_array_invalid_type():
+    """Option types other than 1 / -1 are rejected."""
+    with pytest.raises(ValueError):
+        ql.blackFormula(np.array([1, 0]), 100.0, 100.0, 0.2)
+
+
+def test_black_implied_stddev_array():
+    """Implied stdDev round-trips over arrays and flags failed solves."""
+    strikes = np.array([90.0, 100.0, 110.0, 100.0])
+    std_devs = np.array([0.15, 0.2, 0.25, 0.2])
+    prices = ql.blackFormula(ql.OptionType.Call, strikes, 100.0, std_devs)
+    prices[3] = -1.0  # below intrinsic: no solution
+
+    implied, failed = ql.blackFormulaImpliedStdDev(ql.OptionType.Call, strikes, 100.0, prices)
+    assert failed.dtype == np.bool_
+    assert failed.tolist() == [False, False, False, True]
+    np.testing.assert_allclose(implied[:3], std_devs[:3], rtol=1e-6)
+    assert np.isnan(implied[3])
+
+
+def test_bachelier_formula_array():
+    """bachelierBlackFormula and its implied vol work over arrays."""
+    strikes = np.array([95.0, 100.0, 105.0])
+    prices = ql.bachelierBlackFormula(ql.OptionType.Call, strikes, 100.0, 10.0)
+    expected = [ql.bachelierBlackFormula(ql.OptionType.Call, k, 100.0, 10.0) for k in strikes]
+    np.testing.assert_allclose(prices, expected, rtol=1e-14)
+
+    vols, failed = ql.bachelierBlackFormulaImpliedVol(
+        ql.OptionType.Call, strikes, 100.0, 1.0, prices)
+    assert not failed.any()
+    np.testing.assert_allclose(vols, 10.0, rtol=1e-10)
+
+
 # ---------------------------------------------------------------------------
 # YoY inflation cap/floor engines
 # ---------------------------------------------------------------------------
@@ -260,6 +260,26 @@ def test_mcbarrierengine_lowdiscrepancy(barrier_engine_env):
     assert opt.NPV() > 0.0
 
 
+def test_mcbarrierengine_threads(barrier_engine_env):
+    """Test MCBarrierEngine with nThreads is reproducible and consistent."""
+    payoff = barrier_engine_env["payoff"]
+    exercise = barrier_engine_env["exercise"]
+    process = barrier_engine_env["process"]
+
+    opt = ql.BarrierOption(
+        ql.BarrierType.DownOut, 80.0, 0.0, payoff, exercise,
+    )
+    npvs = []
+    for _ in range(2):
+        opt.setPricingEngine(ql.MCBarrierEngine(
+            process, timeSteps=50, requiredSamples=10000, seed=42, nThreads=4,
+        ))
+        npvs.append(opt.NPV())
+
+    assert npvs[0] == npvs[1]
+    assert npvs[0] == pytest.approx(9.246989568419083, abs=4.0 * opt.errorEstimate())
+
+
 # =============================================================================
 # MCDoubleBarrierEngine
 # =============================================================================
@@ -534,6 +534,51 @@ def test_mcldeuropeanbasketengine(market_data):
     assert option.NPV() == pytest.approx(4.297040981007655, rel=1e-4)
 
 
+def test_mcldeuropeanbasketengine_threads(market_data):
+    """Test MCLDEuropeanBasketEngine with nThreads matches the serial run."""
+    today, dc, cal = market_data["today"], market_data["dc"], market_data["cal"]
+    rate_handle, div_handle = market_data["rate_handle"], market_data["div_handle"]
+
+    process1 = make_bs_process(100.0, 0.20, rate_handle, div_handle, today, cal, dc)
+    process2 = make_bs_process(96.0, 0.20, rate_handle, div_handle, today, cal, dc)
+
+    correlation = ql.Matrix(2, 2)
+    correlation[0][0] = 1.0
+    correlation[0][1] = 0.75
+    correlation[1][0] = 0.75
+    correlation[1][1] = 1.0
+    process_array = ql.StochasticProcessArray([process1, process2], correlation)
+
+    payoff = ql.PlainVanillaPayoff(ql.OptionType.Call, 3.0)
+    option = ql.BasketOption(
+        ql.SpreadBasketPayoff(payoff), ql.EuropeanExercise(ql.Date(15, 7, 2025))
+    )
+    option.setPricingEngine(ql.MCLDEuropeanBasketEngine(
+        process_array, timeSteps=10, requiredSamples=1024, seed=42,
+    ))
+    serial = option.NPV()
+
+    option.setPricingEngine(ql.MCLDEuropeanBasketEngine(
+        process_array, timeSteps=10, requiredSamples=1024, seed=42, nThreads=4,
+    ))
+    assert option.NPV() == pytest.approx(serial, rel=1e-10)
+
+
+def test_mcldeuropeanbasketengine_threads_unsupported_process(market_data):
+    """Test nThreads > 1 is refused for processes that cannot be warmed up."""
+    correlation = ql.Matrix(2, 2)
+    correlation[0][0] = correlation[1][1] = 1.0
+    process_array = ql.StochasticProcessArray(
+        [ql.GeometricBrownianMotionProcess(100.0, 0.03, 0.2),
+         ql.GeometricBrownianMotionProcess(96.0, 0.03, 0.2)],
+        correlation,
+    )
+    with pytest.raises(ql.Error, match="not supported for this process"):
+        ql.MCLDEuropeanBasketEngine(
+            process_array, timeSteps=10, requiredSamples=1024, seed=42, nThreads=4,
+        )
+
+
 # =============================================================================
 # ChoiBasketEngine
 # =============================================================================
@@ -4,6 +4,7 @@ Tests for bond pricing engine bindings.
 Corresponds to src/pricingengines/bond/*.cpp bindings.
 """
 
+import numpy as np
 import pytest
 
 import pyquantlib as ql
@@ -249,6 +250,158 @@ def test_bondfunctions_zspread(bond_env):
     assert abs(z) < 0.001
 
 
+def _bond_ladder(bond_env, coupons=(0.02, 0.03, 0.04, 0.05, 0.06)):
+    return [
+        ql.FixedRateBond(2, 100.0, bond_env["schedule"], [c],
+                         ql.Thirty360(ql.Thirty360.BondBasis))
+        for c in coupons
+    ]
+
+
+def test_bondfunctions_analytics(bond_env):
+    """Test BondFunctions.analytics against the scalar functions."""
+    bonds = _bond_ladder(bond_env)
+    curve = bond_env["flat_curve"]
+    result = ql.BondFunctions.analytics(bonds, curve)
+
+    assert result["cleanPrice"] == pytest.approx(
+        [ql.BondFunctions.cleanPrice(b, curve) for b in bonds])
+    assert result["dirtyPrice"] == pytest.approx(
+        [ql.BondFunctions.dirtyPrice(b, curve) for b in bonds])
+    assert result["bps"] == pytest.approx(
+        [ql.BondFunctions.bps(b, curve) for b in bonds])
+
+    threaded = ql.BondFunctions.analytics(bonds, curve, nThreads=3)
+    for key in result:
+        np.testing.assert_array_equal(result[key], threaded[key])
+
+
+def test_bondfunctions_yieldanalytics(bond_env):
+    """Test BondFunctions.yieldAnalytics with one yield per bond."""
+    bonds = _bond_ladder(bond_env)
+    dc = ql.Actual365Fixed()
+    yields = np.linspace(0.03, 0.05, len(bonds))
+    result = ql.BondFunctions.yieldAnalytics(
+        bonds, yields, dc, ql.Compounded, ql.Annual)
+
+    for i, bond in enumerate(bonds):
+        args = (yields[i], dc, ql.Compounded, ql.Annual)
+        assert result["cleanPrice"][i] == pytest.approx(
+            ql.BondFunctions.cleanPriceFromYield(bond, *args))
+        assert result["basisPointValue"][i] == pytest.approx(
+            ql.BondFunctions.basisPointValue(bond, *args))
+        assert result["modifiedDuration"][i] == pytest.approx(
+            ql.BondFunctions.duration(bond, *args, ql.DurationType.Modified))
+        assert result["macaulayDuration"][i] == pytest.approx(
+            ql.BondFunctions.duration(bond, *args, ql.DurationType.Macaulay))
+        assert result["convexity"][i] == pytest.approx(
+            ql.BondFunctions.convexity(bond, *args))
+
+
+def test_bondfunctions_yields_matches_scalar(bond_env):
+    """Test BondFunctions.yields against BondFunctions.bondYield."""
+    bonds = _bond_ladder(bond_env)
+    dc = ql.Actual365Fixed()
+    prices = np.array([95.0, 98.5, 100.0, 103.25, 107.0])
+    yields, failed = ql.BondFunctions.yields(
+        bonds, prices, dc, ql.Compounded, ql.Annual)
+
+    assert not failed.any()
+    for bond, price, y in zip(bonds, prices, yields):
+        expected = ql.BondFunctions.bondYield(
+            bond, ql.BondPrice(price, ql.BondPriceType.Clean),
+            dc, ql.Compounded, ql.Annual)
+        assert y == pytest.approx(expected, abs=1e-8)
+
+
+def test_bondfunctions_cleanprices_roundtrip(bond_env):
+    """Test BondFunctions.cleanPrices inverts BondFunctions.yields."""
+    bonds = _bond_ladder(bond_env)
+    dc = ql.Actual365Fixed()
+    yields = np.linspace(0.01, 0.07, len(bonds))
+    prices = ql.BondFunctions.cleanPrices(
+        bonds, yields, dc, ql.Compounded, ql.Semiannual)
+
+    for bond, y, price in zip(bonds, yields, prices):
+        assert price == pytest.approx(ql.BondFunctions.cleanPriceFromYield(
+            bond, y, dc, ql.Compounded, ql.Semiannual), abs=1e-10)
+
+    solved, failed = ql.BondFunctions.yields(
+        bonds, prices, dc, ql.Compounded, ql.Semiannual, nThreads=2)
+    assert not failed.any()
+    assert solved == pytest.approx(yields, abs=1e-8)
+
+
+@pytest.mark.parametrize("compounding", [ql.Simple, ql.Continuous,
+                                         ql.SimpleThenCompounded])
+def test_bondfunctions_cleanprices_compounding(bond_env, compounding):
+    """Test cached pricing for other compounding conventions."""
+    bonds = _bond_ladder(bond_env)
+    dc = ql.Actual365Fixed()
+    prices = ql.BondFunctions.cleanPrices(bonds, 0.045, dc, compounding, ql.Annual)
+    expected = [ql.BondFunctions.cleanPriceFromYield(
+        b, 0.045, dc, compounding, ql.Annual) for b in bonds]
+    assert prices == pytest.approx(expected, abs=1e-10)
+
+
+def test_bondfunctions_yields_follow_evaluation_date(bond_env):
+    """Test cached cash flows are rebuilt when the evaluation date moves."""
+    bonds = _bond_ladder(bond_env)
+    dc = ql.Actual365Fixed()
+    before = ql.BondFunctions.cleanPrices(bonds, 0.04, dc, ql.Compounded, ql.Annual)
+
+    ql.Settings.instance().evaluationDate = ql.Date(15, ql.July, 2026)
+    try:
+        after = ql.BondFunctions.cleanPrices(
+            bonds, 0.04, dc, ql.Compounded, ql.Annual)
+        expected = [ql.BondFunctions.cleanPriceFromYield(
+            b, 0.04, dc, ql.Compounded, ql.Annual) for b in bonds]
+    finally:
+        ql.Settings.instance().evaluationDate = bond_env["today"]
+
+    assert after == pytest.approx(expected, abs=1e-10)
+    assert not np.allclose(before, after)
+
+
+def test_bondfunctions_yields_failure(bond_env):
+    """Test an unreachable price is reported as NaN and flagged."""
+    bonds = _bond_ladder(bond_env)
+    prices = np.full(len(bonds), 100.0)
+    prices[1] = -50.0
+    yields, failed = ql.BondFunctions.yields(
+        bonds, prices, ql.Actual365Fixed(), ql.Compounded, ql.Annual)
+    assert failed.tolist() == [False, True, False, False, False]
+    assert np.isnan(yields[1])
+
+
+def test_bondfunctions_yields_matured_bond(bond_env):
+    """Test a matured bond is NaN in the batch instead of failing it."""
+    matured = ql.ZeroCouponBond(
+        2, bond_env["calendar"], 100.0, ql.Date(15, ql.June, 2024),
+        ql.Following, 100.0, ql.Date(15, ql.June, 2020)
+    )
+    bonds = _bond_ladder(bond_env, coupons=(0.03, 0.05))
+    bonds.insert(1, matured)
+    dc = ql.Actual365Fixed()
+
+    yields, failed = ql.BondFunctions.yields(
+        bonds, 100.0, dc, ql.Compounded, ql.Annual, nThreads=2)
+    assert failed.tolist() == [False, True, False]
+    assert np.isnan(yields[1])
+
+    prices = ql.BondFunctions.cleanPrices(bonds, 0.04, dc, ql.Compounded, ql.Annual)
+    assert np.isnan(prices[1])
+    assert np.isfinite(prices[[0, 2]]).all()
+
+
+def test_bondfunctions_yields_raise_other_errors(bond_env):
+    """Test errors other than a non-tradable bond are raised, not flagged."""
+    bonds = _bond_ladder(bond_env)
+    with pytest.raises(ql.Error, match="bond 0"):
+        ql.BondFunctions.yields(
+            bonds, 100.0, ql.DayCounter(), ql.Compounded, ql.Annual)
+
+
 # =============================================================================
 # BinomialConvertibleEngine
 # =============================================================================
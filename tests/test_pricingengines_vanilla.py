@@ -352,6 +352,15 @@ def test_mc_american_lowdiscrepancy(american_env):
     assert 3.5 < npv < 5.5
 
 
+def test_mc_american_rejects_threads(american_env):
+    """Test Longstaff-Schwartz engines refuse nThreads > 1."""
+    with pytest.raises(ql.Error, match="Longstaff-Schwartz"):
+        ql.MCAmericanEngine(
+            american_env["process"], rngType="lowdiscrepancy", timeSteps=50,
+            requiredSamples=4096, calibrationSamples=2048, seed=42, nThreads=4,
+        )
+
+
 def test_mc_american_invalid_rng(american_env):
     """Test error handling for invalid RNG type."""
     with pytest.raises(RuntimeError, match="Unsupported RNG type"):
@@ -565,6 +574,80 @@ def test_mc_european_seed_reproducibility(mc_env):
     assert option1.NPV() == pytest.approx(option2.NPV(), abs=1e-10)
 
 
+def test_mc_european_threads_reproducible(mc_env):
+    """Test multi-threaded MC gives the same price for the same seed."""
+    option = mc_env["option"]
+
+    npvs = []
+    for _ in range(2):
+        option.setPricingEngine(ql.MCEuropeanEngine(
+            mc_env["process"], "pseudorandom", timeSteps=1,
+            requiredSamples=20000, seed=42, nThreads=4,
+        ))
+        npvs.append(option.NPV())
+
+    assert npvs[0] == npvs[1]
+
+
+def test_mc_european_threads_vs_analytic(mc_env):
+    """Test multi-threaded MC agrees with the analytic price."""
+    option = mc_env["option"]
+    option.setPricingEngine(ql.AnalyticEuropeanEngine(mc_env["process"]))
+    expected = option.NPV()
+
+    option.setPricingEngine(ql.MCEuropeanEngine(
+        mc_env["process"], "pseudorandom", timeSteps=1,
+        requiredSamples=40000, seed=42, nThreads=4,
+    ))
+    npv = option.NPV()
+    error = option.errorEstimate()
+
+    assert 0.0 < error < 0.1
+    assert npv == pytest.approx(expected, abs=4.0 * error)
+
+
+def test_mc_european_threads_tolerance(mc_env):
+    """Test tolerance stopping applies to the merged estimate."""
+    option = mc_env["option"]
+    option.setPricingEngine(ql.MCEuropeanEngine(
+        mc_env["process"], "pseudorandom", timeSteps=1,
+        requiredTolerance=0.05, seed=42, nThreads=4,
+    ))
+    option.NPV()
+
+    assert option.errorEstimate() < 0.06
+
+
+def test_mc_european_threads_lowdiscrepancy(mc_env):
+    """Test multi-threaded Sobol MC splits the sequence into blocks."""
+    option = mc_env["option"]
+    option.setPricingEngine(ql.MCEuropeanEngine(
+        mc_env["process"], "lowdiscrepancy", timeSteps=1,
+        requiredSamples=10000, seed=12345,
+    ))
+    serial = option.NPV()
+
+    option.setPricingEngine(ql.MCEuropeanEngine(
+        mc_env["process"], "lowdiscrepancy", timeSteps=1,
+        requiredSamples=10000, seed=12345, nThreads=4,
+    ))
+
+    assert option.NPV() == pytest.approx(serial, rel=1e-10)
+
+
+def test_mc_european_threads_requires_samples(mc_env):
+    """Test nThreads > 1 requires a sample count or tolerance."""
+    with pytest.raises(RuntimeError, match="requiredSamples or requiredTolerance"):
+        ql.MCEuropeanEngine(
+            mc_env["process"], "pseudorandom", timeSteps=1, nThreads=2
+        )
+    with pytest.raises(RuntimeError, match="at least nThreads"):
+        ql.MCEuropeanEngine(
+            mc_env["process"], "pseudorandom", timeSteps=1,
+            requiredSamples=2, nThreads=4,
+        )
+
+
 # =============================================================================
 # QdFpAmericanEngine
 # =============================================================================
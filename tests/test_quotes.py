@@ -4,6 +4,9 @@ Tests for quotes module.
 Corresponds to src/quotes/*.cpp bindings.
 """
 
+import pickle
+
+import numpy as np
 import pytest
 
 import pyquantlib as ql
@@ -346,3 +349,70 @@ def test_compositequote_error_wrong_arity():
 
     with pytest.raises(TypeError):
         composite.value()
+
+
+# =============================================================================
+# Batched updates
+# =============================================================================
+
+
+def test_set_quote_values():
+    """Test set_quote_values notifies a shared observer once."""
+    quotes = [ql.SimpleQuote(1.0) for _ in range(5)]
+    observer = QuoteObserver()
+    for q in quotes:
+        observer.registerWith(q)
+
+    ql.set_quote_values(quotes, np.arange(5.0) + 2.0)
+
+    assert [q.value() for q in quotes] == [2.0, 3.0, 4.0, 5.0, 6.0]
+    assert observer.update_count == 1
+    assert ql.ObservableSettings.instance().updatesEnabled()
+
+
+def test_set_quote_values_scalar():
+    """Test set_quote_values with one value for all quotes."""
+    quotes = [ql.SimpleQuote(1.0) for _ in range(3)]
+    ql.set_quote_values(quotes, 0.5)
+    assert [q.value() for q in quotes] == [0.5, 0.5, 0.5]
+
+
+def test_set_quote_values_length_mismatch():
+    """Test set_quote_values rejects a value array of the wrong length."""
+    quotes = [ql.SimpleQuote(1.0) for _ in range(3)]
+    with pytest.raises(ValueError, match="values"):
+        ql.set_quote_values(quotes, [1.0, 2.0])
+    assert [q.value() for q in quotes] == [1.0, 1.0, 1.0]
+
+
+def test_batch_updates_handle():
+    """Test repeated changes inside batch_updates reach a handle once."""
+    quote = ql.SimpleQuote(1.0)
+    handle = ql.QuoteHandle(quote)
+    observer = QuoteObserver()
+    observer.registerWith(handle)
+
+    with ql.batch_updates():
+        for value in (2.0, 3.0, 4.0):
+            quote.setValue(value)
+        assert observer.update_count == 0
+
+    assert observer.update_count == 1
+    assert handle.value() == 4.0
+
+
+# =============================================================================
+# Pickle
+# =============================================================================
+
+
+def test_simplequote_pickle():
+    """Test SimpleQuote pickle round-trip."""
+    restored = pickle.loads(pickle.dumps(ql.SimpleQuote(42.5)))
+    assert restored.value() == pytest.approx(42.5)
+
+
+def test_simplequote_pickle_invalid():
+    """Test an unset SimpleQuote stays invalid after pickling."""
+    restored = pickle.loads(pickle.dumps(ql.SimpleQuote()))
+    assert not restored.isValid()
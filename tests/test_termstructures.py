@@ -6,6 +6,7 @@ Corresponds to src/termstructures/*.cpp bindings (excluding volatility).
 
 import math
 
+import numpy as np
 import pytest
 
 import pyquantlib as ql
@@ -387,6 +388,89 @@ def test_flatforward_hidden_handle_settlement_days():
     assert ff.compounding() == ql.Compounded
 
 
+# =============================================================================
+# YieldTermStructure array evaluation
+# =============================================================================
+
+
+def test_yieldtermstructure_discount_times_array():
+    """Test discount over a float array of times matches the scalar call."""
+    ff = ql.FlatForward(ql.Date(15, 6, 2024), 0.05, ql.Actual365Fixed())
+    times = np.array([[0.0, 0.5], [1.0, 10.0]])
+
+    result = ff.discount(times)
+
+    assert result.shape == (2, 2)
+    np.testing.assert_allclose(result, np.exp(-0.05 * times), rtol=1e-12)
+
+
+def test_yieldtermstructure_discount_dates_array():
+    """Test discount over date serials and datetime64 matches Date calls."""
+    today = ql.Date(15, 6, 2024)
+    ff = ql.FlatForward(today, 0.05, ql.Actual365Fixed())
+    dates = [today + ql.Period(n, ql.Months) for n in (1, 6, 18)]
+    expected = [ff.discount(d) for d in dates]
+
+    serials = np.array([d.serialNumber() for d in dates])
+    np.testing.assert_allclose(ff.discount(serials), expected, rtol=1e-12)
+
+    datetimes = np.array(["2024-07-15", "2024-12-15", "2025-12-15"],
+                         dtype="datetime64[D]")
+    np.testing.assert_allclose(ff.discount(datetimes), expected, rtol=1e-12)
+
+
+def test_yieldtermstructure_zero_rate_array():
+    """Test zeroRate over arrays of times and dates."""
+    today = ql.Date(15, 6, 2024)
+    dc = ql.Actual365Fixed()
+    ff = ql.FlatForward(today, 0.05, dc, ql.Compounded, ql.Semiannual)
+
+    rates = ff.zeroRate(np.array([0.5, 1.0, 2.0]), ql.Compounded, ql.Semiannual)
+    np.testing.assert_allclose(rates, 0.05, rtol=1e-12)
+
+    dates = [today + ql.Period(n, ql.Years) for n in (1, 2, 5)]
+    serials = np.array([d.serialNumber() for d in dates])
+    rates = ff.zeroRate(serials, dc, ql.Continuous)
+    expected = [ff.zeroRate(d, dc, ql.Continuous).rate() for d in dates]
+    np.testing.assert_allclose(rates, expected, rtol=1e-12)
+
+
+def test_yieldtermstructure_forward_rate_array():
+    """Test forwardRate broadcasts its two arrays and writes into out."""
+    today = ql.Date(15, 6, 2024)
+    ff = ql.FlatForward(today, 0.05, ql.Actual365Fixed())
+    start = np.array([0.0, 1.0, 2.0])
+    out = np.empty(3)
+
+    result = ff.forwardRate(start, start + 0.25, ql.Continuous, out=out)
+
+    assert result is out
+    np.testing.assert_allclose(out, 0.05, rtol=1e-10)
+
+
+def test_yieldtermstructure_array_extrapolation():
+    """Test the range check is applied to the whole batch."""
+    today = ql.Date(15, 6, 2024)
+    dc = ql.Actual365Fixed()
+    curve = ql.ZeroCurve(
+        [today, today + ql.Period(1, ql.Years), today + ql.Period(2, ql.Years)],
+        [0.03, 0.035, 0.04],
+        dc,
+    )
+    times = np.array([0.5, 1.5, 3.0])
+
+    out = np.full(3, -1.0)
+    with pytest.raises(RuntimeError, match="past max curve time"):
+        curve.discount(times, out=out)
+    assert (out == -1.0).all()
+
+    with pytest.raises(RuntimeError, match="negative time"):
+        curve.discount(np.array([-0.5, 0.5]))
+
+    result = curve.discount(times, True)
+    assert result[2] == pytest.approx(curve.discount(3.0, True))
+
+
 # =============================================================================
 # InflationTermStructure ABC
 # =============================================================================
@@ -6,6 +6,7 @@ Corresponds to src/termstructures/volatility/*.cpp bindings.
 
 import datetime
 
+import numpy as np
 import pytest
 
 import pyquantlib as ql
@@ -717,6 +718,60 @@ def test_blackvariancesurface_in_handle(vol_surface_data):
     assert vol == pytest.approx(0.20)
 
 
+def test_blackvariancesurface_blackvol_grid(vol_surface_data):
+    """Test blackVolGrid and blackVarianceGrid match scalar queries."""
+    data = vol_surface_data
+    ql.Settings.instance().evaluationDate = data['ref_date']
+
+    surface = ql.BlackVarianceSurface(
+        data['ref_date'],
+        data['calendar'],
+        data['dates'],
+        data['strikes'],
+        data['vol_matrix'],
+        data['dc']
+    )
+
+    times = np.linspace(0.3, 2.0, 7)
+    strikes = np.linspace(85.0, 115.0, 5)
+    grid = surface.blackVolGrid(times, strikes)
+
+    assert grid.shape == (7, 5)
+    expected = [[surface.blackVol(t, k) for k in strikes] for t in times]
+    np.testing.assert_allclose(grid, expected, rtol=1e-14)
+
+    variances = surface.blackVarianceGrid(times, strikes)
+    np.testing.assert_allclose(variances, grid**2 * times[:, None], rtol=1e-12)
+
+
+def test_blackvariancesurface_blackvol_points(vol_surface_data):
+    """Test blackVol over paired (time, strike) arrays with an out buffer."""
+    data = vol_surface_data
+    ql.Settings.instance().evaluationDate = data['ref_date']
+
+    surface = ql.BlackVarianceSurface(
+        data['ref_date'],
+        data['calendar'],
+        data['dates'],
+        data['strikes'],
+        data['vol_matrix'],
+        data['dc']
+    )
+
+    times = np.array([0.5, 1.0, 1.5])
+    strikes = np.array([90.0, 100.0, 110.0])
+    out = np.empty(3)
+
+    result = surface.blackVol(times, strikes, out=out)
+
+    assert result is out
+    expected = [surface.blackVol(t, k) for t, k in zip(times, strikes)]
+    np.testing.assert_allclose(out, expected, rtol=1e-14)
+
+    with pytest.raises(RuntimeError):
+        surface.blackVolGrid(times, np.array([50.0]))
+
+
 # =============================================================================
 # LocalVolTermStructure (ABC)
 # =============================================================================
@@ -1230,6 +1285,29 @@ def test_localvolsurface_hidden_handles_with_fixed_value():
     assert lvs.localVol(1.0, 100.0) == pytest.approx(0.20)
 
 
+def test_localvolsurface_localvol_grid():
+    """Test localVolGrid and paired localVol match scalar queries."""
+    ref_date = ql.Date(15, 6, 2024)
+    ql.Settings.instance().evaluationDate = ref_date
+    dc = ql.Actual365Fixed()
+
+    risk_free = ql.FlatForward(ref_date, 0.05, dc)
+    dividend = ql.FlatForward(ref_date, 0.02, dc)
+    black_vol = ql.BlackConstantVol(ref_date, ql.TARGET(), 0.20, dc)
+    lvs = ql.LocalVolSurface(black_vol, risk_free, dividend, 100.0)
+
+    times = np.array([0.25, 1.0, 2.0])
+    levels = np.array([80.0, 100.0, 120.0, 140.0])
+
+    grid = lvs.localVolGrid(times, levels)
+    assert grid.shape == (3, 4)
+    np.testing.assert_allclose(grid, 0.20, rtol=1e-6)
+
+    points = lvs.localVol(times, levels[:3])
+    expected = [lvs.localVol(t, s) for t, s in zip(times, levels[:3])]
+    np.testing.assert_allclose(points, expected, rtol=1e-14)
+
+
 # =============================================================================
 # FixedLocalVolSurface
 # =============================================================================
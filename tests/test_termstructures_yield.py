@@ -4,6 +4,9 @@ Tests for yield term structure bindings.
 Corresponds to src/termstructures/yield/*.cpp bindings.
 """
 
+import pickle
+
+import numpy as np
 import pytest
 
 import pyquantlib as ql
@@ -485,6 +488,21 @@ def test_piecewise_loglinear_discount_nodes(curve_env):
     dates = curve.dates()
     assert len(dates) == len(nodes)
 
+
+def test_piecewise_dates_numpy(curve_env):
+    """Test piecewise curve dates() with a dtype returns an array."""
+    helpers = _build_helpers(
+        curve_env["today"], curve_env["calendar"], curve_env["euribor6m"]
+    )
+    curve = ql.PiecewiseLogLinearDiscount(
+        curve_env["today"], helpers, curve_env["day_counter"]
+    )
+
+    arr = curve.dates(dtype="datetime64[D]")
+    assert arr.dtype == np.dtype("datetime64[D]")
+    assert list(arr) == list(ql.dates_to_numpy(curve.dates()))
+    assert list(curve.dates(dtype="int64")) == [d.serialNumber() for d in curve.dates()]
+
     times = curve.times()
     assert len(times) == len(nodes)
     assert times[0] == pytest.approx(0.0)
@@ -673,6 +691,183 @@ def test_piecewise_with_fra_helpers(curve_env):
     assert curve.discount(curve_env["today"]) == pytest.approx(1.0)
 
 
+def _quoted_swap_helpers(curve_env):
+    """Swap helpers on SimpleQuotes, in pillar order."""
+    tenors = [1, 2, 3, 5, 7, 10]
+    quotes = [ql.SimpleQuote(0.035 + 0.001 * i) for i in range(len(tenors))]
+    helpers = [
+        ql.SwapRateHelper(
+            ql.QuoteHandle(q), ql.Period(n, ql.Years), curve_env["calendar"],
+            ql.Annual, ql.Unadjusted, ql.Thirty360(ql.Thirty360.BondBasis),
+            curve_env["euribor6m"],
+        )
+        for q, n in zip(quotes, tenors)
+    ]
+    return quotes, helpers
+
+
+def test_piecewise_incremental_bootstrap(curve_env):
+    """Test an incremental rebuild matches a full one and solves fewer pillars."""
+    full_quotes, full_helpers = _quoted_swap_helpers(curve_env)
+    quotes, helpers = _quoted_swap_helpers(curve_env)
+    full = ql.PiecewiseLogLinearDiscount(
+        curve_env["today"], full_helpers, curve_env["day_counter"])
+    incremental = ql.PiecewiseLogLinearDiscount(
+        curve_env["today"], helpers, curve_env["day_counter"], incremental=True)
+    assert incremental.firstBootstrappedPillar() == 1
+    full_iterations = incremental.solverIterations()
+    assert full_iterations > 0
+    assert incremental.data() == pytest.approx(full.data(), rel=1e-10)
+
+    # 5Y swap
+    full_quotes[3].setValue(0.0395)
+    quotes[3].setValue(0.0395)
+
+    assert incremental.firstBootstrappedPillar() == 4
+    assert incremental.solverIterations() < full_iterations
+    assert incremental.data() == pytest.approx(full.data(), rel=1e-10)
+
+
+def test_piecewise_bootstrap_stats_need_incremental(curve_env):
+    """Test curves built without incremental=True keep no bootstrap statistics."""
+    _, helpers = _quoted_swap_helpers(curve_env)
+    curve = ql.PiecewiseLogLinearDiscount(
+        curve_env["today"], helpers, curve_env["day_counter"])
+    assert len(curve.data()) == len(helpers) + 1
+    with pytest.raises(ql.Error, match="incremental=True"):
+        curve.solverIterations()
+
+
+def test_piecewise_incremental_full_rebuild_on_other_changes(curve_env):
+    """Test non-quote changes make an incremental curve solve every pillar."""
+    quotes, helpers = _quoted_swap_helpers(curve_env)
+    curve = ql.PiecewiseLinearZero(
+        curve_env["today"], helpers, curve_env["day_counter"], incremental=True)
+    curve.nodes()
+
+    ql.Settings.instance().evaluationDate = curve_env["today"] + 1
+    try:
+        quotes[4].setValue(0.04)
+        assert curve.firstBootstrappedPillar() == 1
+    finally:
+        ql.Settings.instance().evaluationDate = curve_env["today"]
+
+
+def test_piecewise_incremental_retry_after_bad_guess(curve_env):
+    """Test a rebuild that fails from the previous nodes is retried from scratch."""
+    quotes, helpers = _quoted_swap_helpers(curve_env)
+    curve = ql.PiecewiseLogLinearDiscount(
+        curve_env["today"], helpers, curve_env["day_counter"], incremental=True)
+    curve.nodes()
+
+    # The new 10Y discount factor is below the solver bounds derived from
+    # the previous nodes, so the first attempt fails.
+    quotes[-1].setValue(0.12)
+    assert curve.discount(10.0) < 0.5 * min(curve.data()[:-1])
+    assert curve.firstBootstrappedPillar() == 1
+
+    fresh_quotes, fresh_helpers = _quoted_swap_helpers(curve_env)
+    fresh_quotes[-1].setValue(0.12)
+    fresh = ql.PiecewiseLogLinearDiscount(
+        curve_env["today"], fresh_helpers, curve_env["day_counter"])
+    assert curve.data() == pytest.approx(fresh.data(), rel=1e-10)
+
+
+def test_piecewise_incremental_global_interpolation(curve_env):
+    """Test incremental mode falls back to a full bootstrap for cubic curves."""
+    quotes, helpers = _quoted_swap_helpers(curve_env)
+    curve = ql.PiecewiseCubicZero(
+        curve_env["today"], helpers, curve_env["day_counter"], incremental=True)
+    curve.nodes()
+    quotes[-1].setValue(0.045)
+    assert curve.firstBootstrappedPillar() == 1
+
+
+# =============================================================================
+# BucketedSensitivity
+# =============================================================================
+
+
+def _bumped_bond_book(curve_env, curve):
+    """Fixed-rate bonds priced off the given curve."""
+    engine = ql.DiscountingBondEngine(ql.YieldTermStructureHandle(curve))
+    bonds = []
+    for years, rate in [(2, 0.03), (4, 0.035), (8, 0.04)]:
+        schedule = ql.MakeSchedule(
+            effectiveDate=curve_env["today"],
+            terminationDate=curve_env["today"] + ql.Period(years, ql.Years),
+            tenor=ql.Period(1, ql.Years),
+            calendar=curve_env["calendar"],
+        )
+        bond = ql.FixedRateBond(0, 100.0, schedule, [rate], ql.Actual365Fixed())
+        bond.setPricingEngine(engine)
+        bonds.append(bond)
+    return bonds
+
+
+@pytest.mark.parametrize("make_curve", [
+    lambda env, helpers: ql.PiecewiseLogLinearDiscount(
+        env["today"], helpers, env["day_counter"]),
+    lambda env, helpers: ql.PiecewiseLogLinearDiscountGlobal(
+        env["today"], helpers, env["day_counter"], accuracy=1e-12),
+], ids=["iterative", "global"])
+def test_bucketed_sensitivity_matches_manual_bumps(curve_env, make_curve):
+    """Test the Jacobian matches bumping each quote by hand."""
+    quotes, helpers = _quoted_swap_helpers(curve_env)
+    curve = make_curve(curve_env, helpers)
+    curve.enableExtrapolation()
+    bonds = _bumped_bond_book(curve_env, curve)
+    bump = 1e-4
+
+    sensitivity = ql.BucketedSensitivity(bonds, curve, quotes, bump)
+    jacobian = sensitivity.jacobian()
+    assert jacobian.shape == (len(bonds), len(quotes))
+    assert sensitivity.size1() == len(bonds)
+    assert sensitivity.size2() == len(quotes)
+
+    base = np.array([b.NPV() for b in bonds])
+    assert sensitivity.baseValues() == pytest.approx(base)
+    expected = np.empty_like(jacobian)
+    for j, q in enumerate(quotes):
+        value = q.value()
+        q.setValue(value + bump)
+        expected[:, j] = (np.array([b.NPV() for b in bonds]) - base) / bump
+        q.setValue(value)
+    assert jacobian == pytest.approx(expected, rel=1e-8, abs=1e-8)
+
+    # The 2Y bond does not depend on quotes beyond the 3Y pillar
+    assert jacobian[0, 3:] == pytest.approx(0.0, abs=1e-8)
+    assert (jacobian.sum(axis=1) < 0.0).all()
+
+
+def test_bucketed_sensitivity_restores_quotes(curve_env):
+    """Test quotes and prices are restored after the bumps."""
+    quotes, helpers = _quoted_swap_helpers(curve_env)
+    curve = ql.PiecewiseLogLinearDiscount(
+        curve_env["today"], helpers, curve_env["day_counter"])
+    curve.enableExtrapolation()
+    bonds = _bumped_bond_book(curve_env, curve)
+    values = [q.value() for q in quotes]
+    npvs = [b.NPV() for b in bonds]
+
+    forward = ql.BucketedSensitivity(bonds, curve, quotes).jacobian()
+    centered = ql.BucketedSensitivity(
+        bonds, curve, quotes, centered=True).jacobian()
+
+    assert [q.value() for q in quotes] == values
+    assert [b.NPV() for b in bonds] == pytest.approx(npvs, rel=1e-12)
+    assert centered == pytest.approx(forward, rel=1e-3, abs=1e-6)
+
+
+def test_bucketed_sensitivity_zero_bump(curve_env):
+    """Test a zero bump is rejected."""
+    quotes, helpers = _quoted_swap_helpers(curve_env)
+    curve = ql.PiecewiseLogLinearDiscount(
+        curve_env["today"], helpers, curve_env["day_counter"])
+    with pytest.raises(ql.Error, match="bump"):
+        ql.BucketedSensitivity([], curve, quotes, 0.0)
+
+
 # =============================================================================
 # ZeroCurve
 # =============================================================================
@@ -799,12 +994,22 @@ def test_discountcurve_data_access(curve_data):
         curve_data["dates"], dfs, curve_data["day_counter"]
     )
     assert len(curve.dates()) == 6
+    assert list(curve.dates(dtype="int32")) == [d.serialNumber() for d in curve_data["dates"]]
     assert len(curve.discounts()) == 6
     assert curve.discounts()[0] == pytest.approx(1.0)
     nodes = curve.nodes()
     assert len(nodes) == 6
 
 
+def test_discountcurve_from_datetime64(curve_data):
+    """Test DiscountCurve accepts a datetime64 array of dates."""
+    dfs = [1.0, 0.992, 0.983, 0.965, 0.927, 0.835]
+    curve = ql.DiscountCurve(
+        ql.dates_to_numpy(curve_data["dates"]), dfs, curve_data["day_counter"]
+    )
+    assert list(curve.dates()) == list(curve_data["dates"])
+
+
 def test_discountcurve_interpolation(curve_data):
     """Test DiscountCurve discount factor interpolation."""
     dfs = [1.0, 0.992, 0.983, 0.965, 0.927, 0.835]
@@ -1757,3 +1962,213 @@ def test_multicurve_bootstrapped_and_spreaded():
     assert dois == pytest.approx(0.906984561259, rel=1e-6)
 
     ql.Settings.instance().evaluationDate = original_date
+
+
+# =============================================================================
+# CurveBuilder
+# =============================================================================
+
+
+def _curve_book(curve_env):
+    """Two independent curves and one discounted on the first."""
+    _, helpers_a = _quoted_swap_helpers(curve_env)
+    _, helpers_b = _quoted_swap_helpers(curve_env)
+    curve_a = ql.PiecewiseLogLinearDiscount(
+        curve_env["today"], helpers_a, curve_env["day_counter"])
+    curve_b = ql.PiecewiseLinearZero(
+        curve_env["today"], helpers_b, curve_env["day_counter"])
+    discounting = ql.YieldTermStructureHandle(curve_a)
+    helpers_c = [
+        ql.SwapRateHelper(
+            ql.QuoteHandle(ql.SimpleQuote(0.036 + 0.001 * i)),
+            ql.Period(n, ql.Years), curve_env["calendar"], ql.Annual,
+            ql.Unadjusted, ql.Thirty360(ql.Thirty360.BondBasis),
+            curve_env["euribor6m"], ql.QuoteHandle(), ql.Period(0, ql.Days),
+            discounting)
+        for i, n in enumerate([1, 2, 3, 5, 7, 10])
+    ]
+    curve_c = ql.PiecewiseLogLinearDiscount(
+        curve_env["today"], helpers_c, curve_env["day_counter"])
+    return curve_a, curve_b, curve_c
+
+
+@pytest.mark.parametrize("n_threads", [1, 3])
+def test_curvebuilder_build(curve_env, n_threads):
+    """Test CurveBuilder builds curves in dependency order."""
+    curve_a, curve_b, curve_c = _curve_book(curve_env)
+    builder = ql.CurveBuilder()
+    builder.add("A", curve_a)
+    builder.add("B", curve_b)
+    builder.add("C", curve_c, dependsOn=["A"])
+
+    assert len(builder) == 3
+    assert builder.names() == ["A", "B", "C"]
+    assert builder.dependencies("C") == ["A"]
+    assert builder.levels() == [["A", "B"], ["C"]]
+
+    times = builder.build(nThreads=n_threads)
+    assert set(times) == {"A", "B", "C"}
+    assert all(t >= 0.0 for t in times.values())
+    assert builder.buildTimes() == times
+
+    ref_a, ref_b, ref_c = _curve_book(curve_env)
+    assert curve_a.data() == pytest.approx(ref_a.data(), rel=1e-12)
+    assert curve_b.data() == pytest.approx(ref_b.data(), rel=1e-12)
+    assert curve_c.data() == pytest.approx(ref_c.data(), rel=1e-12)
+
+
+def test_curvebuilder_multicurve_handle():
+    """Test a MultiCurve external handle can be added to a CurveBuilder."""
+    original_date = ql.Settings.instance().evaluationDate
+    today = ql.Date(23, ql.October, 2025)
+    ql.Settings.instance().evaluationDate = today
+    try:
+        internal = ql.RelinkableYieldTermStructureHandle()
+        euribor3m = ql.Euribor3M(internal)
+        q = ql.QuoteHandle(ql.SimpleQuote(0.03))
+        helpers = [ql.FraRateHelper(q, i, euribor3m) for i in range(1, 10)]
+        curve = ql.PiecewiseLogLinearDiscountGlobal(
+            today, helpers, ql.Actual360(), accuracy=1e-10)
+        mc = ql.MultiCurve(1e-10)
+        external = mc.addBootstrappedCurve(internal, curve)
+
+        builder = ql.CurveBuilder()
+        builder.add("EUR3M", external)
+        builder.build(nThreads=2)
+        assert builder.curve("EUR3M").discount(today) == pytest.approx(1.0)
+        assert len(curve.nodes()) > 0
+    finally:
+        ql.Settings.instance().evaluationDate = original_date
+
+
+def test_curvebuilder_undeclared_dependency(curve_env):
+    """Test CurveBuilder.add(check=True) rejects curves reading a curve not in dependsOn."""
+    curve_a, curve_b, curve_c = _curve_book(curve_env)
+    builder = ql.CurveBuilder()
+    builder.add("A", curve_a)
+    builder.add("B", curve_b)
+    with pytest.raises(ql.Error, match="reads curve 'A', which is missing"):
+        builder.add("C", curve_c, dependsOn=["B"], check=True)
+    assert builder.names() == ["A", "B"]
+    builder.add("C", curve_c, dependsOn=["A"], check=True)
+
+    builder = ql.CurveBuilder()
+    builder.add("C", curve_c)
+    with pytest.raises(ql.Error, match="curve 'C' reads curve 'A'"):
+        builder.add("A", curve_a, check=True)
+
+    with ql.batch_updates():
+        with pytest.raises(ql.Error, match="while updates are disabled"):
+            builder.add("B", curve_b, check=True)
+
+
+def test_curvebuilder_trusts_dependson(curve_env):
+    """Test CurveBuilder.add leaves built curves alone unless asked to check."""
+    curve_a, curve_b, curve_c = _curve_book(curve_env)
+    builder = ql.CurveBuilder()
+    builder.add("A", curve_a)
+    builder.add("B", curve_b)
+    builder.build()
+
+    class Watch(ql.base.Observer):
+        notified = False
+
+        def update(self):
+            self.notified = True
+
+    watch = Watch()
+    watch.registerWith(curve_a)
+    builder.add("C", curve_c, dependsOn=["B"])
+    assert not watch.notified
+    assert builder.dependencies("C") == ["B"]
+
+
+def test_curvebuilder_errors(curve_env):
+    """Test CurveBuilder rejects unknown dependencies and reports failures."""
+    curve_a, _, _ = _curve_book(curve_env)
+    builder = ql.CurveBuilder()
+    with pytest.raises(ql.Error, match="must be added first"):
+        builder.add("C", curve_a, dependsOn=["A"])
+    builder.add("A", curve_a)
+    with pytest.raises(ql.Error, match="already added"):
+        builder.add("A", curve_a)
+
+    quote = ql.SimpleQuote()
+    helper = ql.DepositRateHelper(ql.QuoteHandle(quote), curve_env["euribor6m"])
+    broken = ql.PiecewiseLogLinearDiscount(
+        curve_env["today"], [helper], curve_env["day_counter"])
+    builder.add("broken", broken)
+    with pytest.raises(ql.Error, match="building curve 'broken'"):
+        builder.build(nThreads=2)
+
+
+# =============================================================================
+# Pickle
+# =============================================================================
+
+
+def test_flatforward_pickle(curve_env):
+    """Test FlatForward pickle round-trip."""
+    restored = pickle.loads(pickle.dumps(curve_env["flat_curve"]))
+    d = curve_env["today"] + ql.Period(3, ql.Years)
+    assert restored.referenceDate() == curve_env["today"]
+    assert restored.discount(d) == pytest.approx(curve_env["flat_curve"].discount(d))
+
+
+def test_flatforward_pickle_moving(curve_env):
+    """Test a settlement-days FlatForward stays a moving curve after pickling."""
+    curve = ql.FlatForward(2, curve_env["calendar"], 0.03, curve_env["day_counter"])
+    curve.enableExtrapolation()
+    restored = pickle.loads(pickle.dumps(curve))
+    assert restored.settlementDays() == 2
+    assert restored.calendar().name() == curve_env["calendar"].name()
+    assert restored.allowsExtrapolation()
+
+    ql.Settings.instance().evaluationDate = curve_env["today"] + 7
+    try:
+        assert restored.referenceDate() == curve.referenceDate()
+    finally:
+        ql.Settings.instance().evaluationDate = curve_env["today"]
+
+
+def test_zerocurve_pickle(curve_data):
+    """Test ZeroCurve pickle round-trip."""
+    curve = ql.ZeroCurve(
+        curve_data["dates"], curve_data["zero_rates"], curve_data["day_counter"]
+    )
+    restored = pickle.loads(pickle.dumps(curve))
+    assert list(restored.dates()) == list(curve.dates())
+    assert not restored.allowsExtrapolation()
+    curve.enableExtrapolation()
+    assert pickle.loads(pickle.dumps(curve)).allowsExtrapolation()
+    for d in curve_data["dates"]:
+        assert restored.discount(d) == pytest.approx(curve.discount(d))
+
+
+def test_piecewise_pickle_snapshot(curve_env):
+    """Test a bootstrapped curve pickles as an interpolated curve on its nodes."""
+    helpers = _build_helpers(
+        curve_env["today"], curve_env["calendar"], curve_env["euribor6m"]
+    )
+    curve = ql.PiecewiseLogLinearDiscount(
+        curve_env["today"], helpers, curve_env["day_counter"]
+    )
+    curve.enableExtrapolation()
+    restored = pickle.loads(pickle.dumps(curve))
+    assert isinstance(restored, ql.DiscountCurve)
+    assert restored.allowsExtrapolation()
+    for years in (1, 5, 10, 20):
+        d = curve_env["today"] + ql.Period(years, ql.Years)
+        assert restored.discount(d) == pytest.approx(curve.discount(d), rel=1e-12)
+
+
+def test_piecewise_pickle_unsupported(curve_env):
+    """Test curves without an interpolated counterpart refuse to pickle."""
+    helpers = _build_helpers(
+        curve_env["today"], curve_env["calendar"], curve_env["euribor6m"]
+    )
+    curve = ql.PiecewiseCubicZero(
+        curve_env["today"], helpers, curve_env["day_counter"]
+    )
+    with pytest.raises(TypeError, match="cannot pickle"):
+        pickle.dumps(curve)
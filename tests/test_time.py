@@ -4,6 +4,9 @@ Tests for time module.
 Corresponds to src/time/*.cpp bindings.
 """
 
+import pickle
+
+import numpy as np
 import pytest
 from datetime import date, datetime
 
@@ -145,6 +148,58 @@ def test_date_from_datetime_datetime():
     assert ql_date.dayOfMonth() == 15
 
 
+def test_dates_to_numpy():
+    """Test dates_to_numpy converts a list of dates to datetime64[D]."""
+    dates = [ql.Date(1, ql.January, 1970), ql.Date(15, ql.March, 2025), ql.Date()]
+    arr = ql.dates_to_numpy(dates)
+    assert arr.dtype == np.dtype("datetime64[D]")
+    assert arr[0] == np.datetime64("1970-01-01")
+    assert arr[1] == np.datetime64("2025-03-15")
+    assert np.isnat(arr[2])
+
+
+def test_dates_to_numpy_serials():
+    """Test dates_to_numpy with an integer dtype returns serial numbers."""
+    dates = [ql.Date(15, ql.March, 2025), ql.Date(16, ql.March, 2025)]
+    arr = ql.dates_to_numpy(dates, dtype="int32")
+    assert arr.dtype == np.int32
+    assert list(arr) == [d.serialNumber() for d in dates]
+
+
+def test_dates_to_numpy_schedule():
+    """Test dates_to_numpy reads a Schedule directly."""
+    schedule = ql.MakeSchedule(
+        effectiveDate=ql.Date(15, ql.January, 2025),
+        terminationDate=ql.Date(15, ql.January, 2030),
+        tenor=ql.Period(6, ql.Months),
+        calendar=ql.TARGET(),
+    )
+    arr = ql.dates_to_numpy(schedule, dtype="int64")
+    assert list(arr) == [d.serialNumber() for d in schedule.dates()]
+
+
+def test_dates_from_numpy():
+    """Test dates_from_numpy round-trips datetime64 and serial arrays."""
+    arr = np.array(["2025-03-15", "NaT", "1999-12-31"], dtype="datetime64[D]")
+    dates = ql.dates_from_numpy(arr)
+    assert dates == [ql.Date(15, ql.March, 2025), ql.Date(), ql.Date(31, ql.December, 1999)]
+
+    serials = np.array([45731, 0], dtype=np.int32)
+    assert ql.dates_from_numpy(serials) == [ql.Date(45731), ql.Date()]
+
+    roundtrip = ql.dates_from_numpy(ql.dates_to_numpy(dates))
+    assert roundtrip == dates
+
+
+def test_date_list_arguments_accept_arrays():
+    """Test functions taking a list of dates accept datetime64 and serial arrays."""
+    dates = [ql.Date(15, ql.January, 2025), ql.Date(15, ql.July, 2025),
+             ql.Date(15, ql.January, 2026)]
+    for arr in (ql.dates_to_numpy(dates), ql.dates_to_numpy(dates, dtype="int32")):
+        schedule = ql.Schedule(arr)
+        assert list(schedule.dates()) == dates
+
+
 # =============================================================================
 # Calendar
 # =============================================================================
@@ -254,6 +309,25 @@ def test_calendar_business_days_and_holiday_list():
         assert calendar.isBusinessDay(d)
 
 
+def test_calendar_day_lists_numpy():
+    """Test holidayList and businessDayList with a dtype return arrays."""
+    calendar = ql.TARGET()
+    start = ql.Date(1, ql.January, 2025)
+    end = ql.Date(31, ql.December, 2025)
+
+    holidays = calendar.holidayList(start, end, True, dtype="datetime64[D]")
+    assert holidays.dtype == np.dtype("datetime64[D]")
+    assert list(holidays) == list(
+        ql.dates_to_numpy(calendar.holidayList(start, end, True))
+    )
+
+    business_days = calendar.businessDayList(start, end, dtype="int32")
+    assert business_days.dtype == np.int32
+    assert list(business_days) == [
+        d.serialNumber() for d in calendar.businessDayList(start, end)
+    ]
+
+
 def test_calendar_business_days_between():
     """Test Calendar.businessDaysBetween."""
     calendar = ql.TARGET()
@@ -312,6 +386,90 @@ def test_calendar_bespoke_reset():
     assert not calendar.isHoliday(test_date)
 
 
+def _serials(dates):
+    return np.array([d.serialNumber() for d in dates], dtype=np.int64)
+
+
+def test_calendar_isbusinessday_array():
+    """Test isBusinessDay over an array matches the scalar method."""
+    cal = ql.TARGET()
+    dates = [ql.Date(1, ql.January, 2025) + i for i in range(400)]
+    mask = cal.isBusinessDay(_serials(dates))
+    assert mask.dtype == np.bool_
+    assert list(mask) == [cal.isBusinessDay(d) for d in dates]
+
+
+def test_calendar_adjust_array_datetime64():
+    """Test adjust over datetime64 dates returns datetime64 dates."""
+    cal = ql.TARGET()
+    dates = np.arange("2025-03-01", "2025-06-01", dtype="datetime64[D]")
+    adjusted = cal.adjust(dates, ql.ModifiedFollowing)
+    assert adjusted.dtype == np.dtype("datetime64[D]")
+    for d, a in zip(dates, adjusted):
+        expected = cal.adjust(ql.Date(d.item()), ql.ModifiedFollowing)
+        assert ql.Date(a.item()) == expected
+
+
+def test_calendar_advance_array():
+    """Test advance over an array matches the scalar method."""
+    cal = ql.UnitedStates(ql.UnitedStates.NYSE)
+    dates = [ql.Date(15, ql.December, 2024) + i for i in range(60)]
+    serials = _serials(dates)
+    for args in ((2, ql.Days), (-3, ql.Days), (ql.Period(1, ql.Months),)):
+        result = cal.advance(serials, *args, ql.ModifiedFollowing, True)
+        expected = [cal.advance(d, *args, ql.ModifiedFollowing, True) for d in dates]
+        assert list(result) == [d.serialNumber() for d in expected]
+
+
+def test_calendar_businessdaysbetween_array():
+    """Test businessDaysBetween broadcasts and matches the scalar method."""
+    cal = ql.TARGET()
+    start = ql.Date(2, ql.January, 2025)
+    ends = [start + i for i in range(-10, 40, 3)]
+    counts = cal.businessDaysBetween(start.serialNumber(), _serials(ends), True, True)
+    assert counts.dtype == np.int64
+    assert list(counts) == [cal.businessDaysBetween(start, d, True, True) for d in ends]
+
+
+def test_calendar_array_joint_and_added_holidays():
+    """Test the cached business days follow joint calendars and holiday changes."""
+    cal = ql.JointCalendar(ql.TARGET(), ql.UnitedStates(ql.UnitedStates.NYSE))
+    july4 = ql.Date(4, ql.July, 2025).serialNumber()
+    assert not cal.isBusinessDay(np.array([july4]))[0]
+
+    target = ql.TARGET()
+    may15 = ql.Date(15, ql.May, 2025)
+    assert target.isBusinessDay(np.array([may15.serialNumber()]))[0]
+    target.addHoliday(may15)
+    try:
+        assert not target.isBusinessDay(np.array([may15.serialNumber()]))[0]
+    finally:
+        target.removeHoliday(may15)
+
+
+def test_calendar_array_bespoke_same_name():
+    """Test bespoke calendars sharing a name keep separate business days."""
+    desk_a = ql.BespokeCalendar("desk")
+    desk_b = ql.BespokeCalendar("desk")
+    wednesday = ql.Date(14, ql.May, 2025)
+    desk_a.addHoliday(wednesday)
+    serials = np.array([wednesday.serialNumber(), wednesday.serialNumber() + 1])
+
+    assert list(desk_a.isBusinessDay(serials)) == [False, True]
+    assert list(desk_b.isBusinessDay(serials)) == [True, True]
+    assert desk_a.businessDaysBetween(serials[0] - 1, serials[1], True, True) == 2
+    assert desk_b.businessDaysBetween(serials[0] - 1, serials[1], True, True) == 3
+
+
+def test_calendar_array_invalid_dates():
+    """Test array overloads reject float arrays and out-of-range serials."""
+    cal = ql.TARGET()
+    with pytest.raises(TypeError):
+        cal.isBusinessDay(np.array([45000.5]))
+    with pytest.raises(ql.Error, match="outside allowed range"):
+        cal.adjust(np.array([10], dtype=np.int64))
+
+
 # =============================================================================
 # DayCounter
 # =============================================================================
@@ -374,6 +532,40 @@ def test_daycounter_variants():
     assert dc_30_360 != dc_actual_360
 
 
+def test_daycounter_yearfractions():
+    """Test yearFractions over arrays matches yearFraction."""
+    starts = [ql.Date(31, ql.January, 2024) + 17 * i for i in range(40)]
+    ends = [d + ql.Period(7, ql.Months) for d in starts]
+    for dc in (ql.Actual365Fixed(), ql.Actual360(),
+               ql.Thirty360(ql.Thirty360.BondBasis),
+               ql.Thirty360(ql.Thirty360.European),
+               ql.ActualActual(ql.ActualActual.ISDA)):
+        yfs = dc.yearFractions(_serials(starts), _serials(ends))
+        assert yfs.dtype == np.float64
+        expected = [dc.yearFraction(a, b) for a, b in zip(starts, ends)]
+        assert yfs == pytest.approx(expected, rel=1e-14)
+
+
+def test_daycounter_yearfractions_reference_periods():
+    """Test yearFractions with reference periods and datetime64 inputs."""
+    dc = ql.ActualActual(ql.ActualActual.ISMA)
+    starts = np.array(["2024-01-15", "2024-07-15"], dtype="datetime64[D]")
+    ends = np.array(["2024-07-15", "2025-01-15"], dtype="datetime64[D]")
+    yfs = dc.yearFractions(starts, ends, starts, ends)
+    assert yfs == pytest.approx([0.5, 0.5])
+
+
+def test_daycounter_yearfractions_broadcast_out():
+    """Test yearFractions broadcasts a scalar start and fills out=."""
+    dc = ql.Actual360()
+    start = ql.Date(1, ql.March, 2025)
+    ends = np.array([start.serialNumber() + n for n in (30, 90, 180)])
+    out = np.empty(3)
+    result = dc.yearFractions(start.serialNumber(), ends, out=out)
+    assert result is out
+    assert out == pytest.approx([30 / 360, 90 / 360, 180 / 360])
+
+
 # =============================================================================
 # Period
 # =============================================================================
@@ -870,6 +1062,22 @@ def test_timegrid_utility_methods():
     assert grid.closestTime(0.6) == pytest.approx(0.5)
 
 
+def test_timegrid_numpy_views():
+    """Test TimeGrid exposes its times as a read-only NumPy view."""
+    grid = ql.TimeGrid([0.5, 1.0, 1.5], 6)
+    times = grid.times
+    assert times.dtype == np.float64
+    np.testing.assert_array_equal(times, list(grid))
+    assert not times.flags.writeable
+    with pytest.raises(ValueError):
+        times[0] = 1.0
+
+    buffered = np.asarray(grid)
+    assert np.shares_memory(buffered, times)
+    np.testing.assert_allclose(np.diff(times), [grid.dt(i) for i in range(len(grid) - 1)])
+    assert ql.TimeGrid().times.shape == (0,)
+
+
 # =============================================================================
 # Schedule
 # =============================================================================
@@ -1212,3 +1420,99 @@ def test_makeschedule_kwargs_bad_kwarg():
             terminationDate=ql.Date(1, 1, 2026),
             bogusKwarg=42,
         )
+
+
+# =============================================================================
+# Pickle
+# =============================================================================
+
+
+def _roundtrip(obj):
+    return pickle.loads(pickle.dumps(obj))
+
+
+def test_date_pickle():
+    """Test Date pickle round-trip, including the null date."""
+    d = ql.Date(15, ql.March, 2025)
+    assert _roundtrip(d) == d
+    assert _roundtrip(ql.Date()) == ql.Date()
+
+
+def test_period_pickle():
+    """Test Period pickle round-trip."""
+    p = ql.Period(6, ql.Months)
+    restored = _roundtrip(p)
+    assert restored.length() == 6
+    assert restored.units() == ql.Months
+
+
+def test_calendar_pickle():
+    """Test calendars are restored by name with their market."""
+    for cal in (ql.TARGET(), ql.UnitedStates(ql.UnitedStates.NYSE),
+                ql.UnitedKingdom(), ql.NullCalendar()):
+        restored = _roundtrip(cal)
+        assert type(restored) is type(cal)
+        assert restored.name() == cal.name()
+
+
+def test_calendar_pickle_added_holidays():
+    """Test added and removed holidays survive pickling."""
+    cal = ql.TARGET()
+    cal.addHoliday(ql.Date(15, ql.May, 2025))
+    cal.removeHoliday(ql.Date(25, ql.December, 2025))
+    restored = _roundtrip(cal)
+    assert not restored.isBusinessDay(ql.Date(15, ql.May, 2025))
+    assert restored.isBusinessDay(ql.Date(25, ql.December, 2025))
+    cal.resetAddedAndRemovedHolidays()
+
+
+def test_calendar_pickle_joint():
+    """Test JointCalendar pickle round-trip."""
+    cal = ql.JointCalendar(ql.TARGET(), ql.UnitedStates(ql.UnitedStates.NYSE))
+    restored = _roundtrip(cal)
+    assert restored.name() == cal.name()
+    # Independence Day: NYSE holiday, TARGET business day
+    assert not restored.isBusinessDay(ql.Date(4, ql.July, 2025))
+
+
+def test_calendar_pickle_bespoke():
+    """Test BespokeCalendar keeps its weekend days."""
+    cal = ql.BespokeCalendar("custom")
+    cal.addWeekend(ql.Friday)
+    restored = _roundtrip(cal)
+    assert restored.name() == "custom"
+    assert restored.isWeekend(ql.Friday)
+    assert not restored.isWeekend(ql.Saturday)
+
+
+def test_daycounter_pickle():
+    """Test day counters are restored by name."""
+    for dc in (ql.Actual360(), ql.Actual365Fixed(),
+               ql.Thirty360(ql.Thirty360.BondBasis),
+               ql.ActualActual(ql.ActualActual.ISDA),
+               ql.Business252(ql.Brazil())):
+        restored = _roundtrip(dc)
+        assert restored.name() == dc.name()
+        d1, d2 = ql.Date(15, ql.January, 2025), ql.Date(15, ql.July, 2025)
+        assert restored.yearFraction(d1, d2) == pytest.approx(dc.yearFraction(d1, d2))
+
+
+def test_daycounter_pickle_unrecoverable():
+    """Test day counters that cannot be rebuilt from their name refuse to pickle."""
+    dc = ql.Business252(ql.BespokeCalendar("Custom"))
+    with pytest.raises(TypeError, match="cannot pickle day counter"):
+        pickle.dumps(dc)
+
+
+def test_schedule_pickle():
+    """Test Schedule pickle round-trip."""
+    schedule = ql.Schedule(
+        ql.Date(15, ql.January, 2025), ql.Date(15, ql.January, 2027),
+        ql.Period(6, ql.Months), ql.TARGET(), ql.ModifiedFollowing,
+        ql.ModifiedFollowing, ql.DateGeneration.Forward, False,
+    )
+    restored = _roundtrip(schedule)
+    assert list(restored.dates()) == list(schedule.dates())
+    assert restored.calendar().name() == schedule.calendar().name()
+    assert restored.tenor() == schedule.tenor()
+    assert restored.rule() == ql.DateGeneration.Forward